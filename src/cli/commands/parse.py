@@ -7,7 +7,7 @@ import sys
 from pathlib import Path
 
 from src.parsing.config import load_parsing_config
-from src.parsing.runner import parse_single_target, scan_and_parse
+from src.parsing.runner import DEFAULT_DOCUMENT_TIMEOUT, parse_single_target, scan_and_parse
 from src.parsing.storage import ParseStorage
 
 
@@ -32,6 +32,9 @@ def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
     
     # parse scan
     _register_scan_command(subcommand_parsers)
+    
+    # parse migrate-manifest
+    _register_migrate_manifest_command(subcommand_parsers)
 
 
 def _register_pdf_command(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
@@ -181,6 +184,26 @@ def _register_scan_command(subparsers: argparse._SubParsersAction[argparse.Argum
         action="store_true",
         help="Reprocess files even if already parsed.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used for parsing (default: 1).",
+    )
+    parser.add_argument(
+        "--document-timeout",
+        type=float,
+        default=DEFAULT_DOCUMENT_TIMEOUT,
+        help=(
+            "Seconds a single document may take when --workers > 1 "
+            f"(default: {DEFAULT_DOCUMENT_TIMEOUT:g})."
+        ),
+    )
+    parser.add_argument(
+        "--memory-limit-mb",
+        type=int,
+        help="Memory headroom per worker process when --workers > 1.",
+    )
     parser.add_argument(
         "--clear-config-suffixes",
         action="store_true",
@@ -199,6 +222,36 @@ def _register_scan_command(subparsers: argparse._SubParsersAction[argparse.Argum
     parser.set_defaults(func=parse_scan_cli, command="parse", parse_command="scan")
 
 
+def _register_migrate_manifest_command(
+    subparsers: argparse._SubParsersAction[argparse.ArgumentParser],
+) -> None:
+    """Register 'parse migrate-manifest' command."""
+    parser = subparsers.add_parser(
+        "migrate-manifest",
+        help="Move raw HTML out of the parse manifest into compressed sidecar files.",
+    )
+    parser.add_argument(
+        "--output-root",
+        type=Path,
+        help="Override directory containing the parse manifest.",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        help="Path to parsing configuration file.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be migrated without writing anything.",
+    )
+    parser.set_defaults(
+        func=parse_migrate_manifest_cli,
+        command="parse",
+        parse_command="migrate-manifest",
+    )
+
+
 def parse_pdf_cli(args: argparse.Namespace) -> int:
     """Execute PDF parsing."""
     return _parse_files_cli(args, expected_parser="pdf")
@@ -228,7 +281,7 @@ def _parse_files_cli(
         if args.output_root:
             config.output_root = Path(args.output_root).expanduser().resolve()
             
-        storage = ParseStorage(config.output_root)
+        storage = ParseStorage(config.output_root, manifest_backend=config.manifest_backend)
     except (FileNotFoundError, ValueError) as exc:
         print(f"Configuration error: {exc}", file=sys.stderr)
         return 1
@@ -323,7 +376,7 @@ def parse_scan_cli(args: argparse.Namespace) -> int:
         
         recursive = args.recursive if args.recursive is not None else config.scan.recursive
         
-        storage = ParseStorage(config.output_root)
+        storage = ParseStorage(config.output_root, manifest_backend=config.manifest_backend)
     except (FileNotFoundError, ValueError) as exc:
         print(f"Configuration error: {exc}", file=sys.stderr)
         return 1
@@ -346,6 +399,9 @@ def parse_scan_cli(args: argparse.Namespace) -> int:
             limit=args.limit,
             include_patterns=include_patterns,
             exclude_patterns=exclude_patterns,
+            workers=args.workers,
+            document_timeout=args.document_timeout,
+            memory_limit_mb=args.memory_limit_mb,
         )
     except Exception as exc:
         print(f"Scan failed: {exc}", file=sys.stderr)
@@ -389,3 +445,33 @@ def parse_scan_cli(args: argparse.Namespace) -> int:
     print(f"\nSummary: {success_count} succeeded, {skip_count} skipped, {fail_count} failed")
     
     return 1 if fail_count > 0 else 0
+
+
+def parse_migrate_manifest_cli(args: argparse.Namespace) -> int:
+    """Slim an existing manifest by moving inline raw HTML to sidecars."""
+    try:
+        config = load_parsing_config(args.config)
+        if args.output_root:
+            config.output_root = Path(args.output_root).expanduser().resolve()
+        storage = ParseStorage(config.output_root, manifest_backend=config.manifest_backend)
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"Configuration error: {exc}", file=sys.stderr)
+        return 1
+    
+    result = storage.migrate_raw_html(dry_run=args.dry_run)
+    
+    if not result.entries_migrated:
+        print(f"Manifest {storage.manifest_path} has no inline raw HTML; nothing to do.")
+        return 0
+    
+    verb = "Would move" if args.dry_run else "Moved"
+    print(
+        f"{verb} raw HTML for {result.entries_migrated} entries "
+        f"({result.html_bytes_moved:,} bytes) out of {storage.manifest_path}"
+    )
+    if not args.dry_run:
+        print(
+            f"Manifest size: {result.manifest_bytes_before:,} -> "
+            f"{result.manifest_bytes_after:,} bytes"
+        )
+    return 0
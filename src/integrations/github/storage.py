@@ -23,6 +23,7 @@ Example:
 from __future__ import annotations
 
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -78,6 +79,8 @@ class GitHubStorageClient:
         self.pr_branch_prefix = pr_branch_prefix
         self._pr_branch: str | None = None
         self._pr_number: int | None = None
+        # Each commit moves a branch head; concurrent crawl workers take turns
+        self._commit_lock = threading.RLock()
 
     def commit_file(
         self,
@@ -103,15 +106,16 @@ class GitHubStorageClient:
         if path_str.startswith("/"):
             path_str = path_str[1:]
 
-        return commit_file(
-            token=self.token,
-            repository=self.repository,
-            path=path_str,
-            content=content,
-            message=message,
-            branch=self.branch,
-            api_url=self.api_url,
-        )
+        with self._commit_lock:
+            return commit_file(
+                token=self.token,
+                repository=self.repository,
+                path=path_str,
+                content=content,
+                message=message,
+                branch=self.branch,
+                api_url=self.api_url,
+            )
 
     def commit_files_batch(
         self,
@@ -145,19 +149,20 @@ class GitHubStorageClient:
                 path_str = path_str[1:]
             normalized_files.append((path_str, content))
 
-        # Determine target branch
-        target_branch = self.branch
-        if use_pr_branch:
-            target_branch = self.ensure_pr_branch()
-
-        return commit_files_batch(
-            token=self.token,
-            repository=self.repository,
-            files=normalized_files,
-            message=message,
-            branch=target_branch,
-            api_url=self.api_url,
-        )
+        with self._commit_lock:
+            # Determine target branch
+            target_branch = self.branch
+            if use_pr_branch:
+                target_branch = self.ensure_pr_branch()
+
+            return commit_files_batch(
+                token=self.token,
+                repository=self.repository,
+                files=normalized_files,
+                message=message,
+                branch=target_branch,
+                api_url=self.api_url,
+            )
 
     def ensure_pr_branch(self, timestamp_suffix: str | None = None) -> str:
         """Ensure a PR branch exists for content commits.
@@ -210,22 +215,22 @@ class GitHubStorageClient:
         Returns:
             Dictionary containing the GitHub API response with commit details.
         """
-        pr_branch = self.ensure_pr_branch(timestamp_suffix)
-
         # Normalize path
         path_str = str(path)
         if path_str.startswith("/"):
             path_str = path_str[1:]
 
-        return commit_file(
-            token=self.token,
-            repository=self.repository,
-            path=path_str,
-            content=content,
-            message=message,
-            branch=pr_branch,
-            api_url=self.api_url,
-        )
+        with self._commit_lock:
+            pr_branch = self.ensure_pr_branch(timestamp_suffix)
+            return commit_file(
+                token=self.token,
+                repository=self.repository,
+                path=path_str,
+                content=content,
+                message=message,
+                branch=pr_branch,
+                api_url=self.api_url,
+            )
 
     def create_content_pr(
         self,
@@ -0,0 +1,250 @@
+"""Append-only journal of crawl events.
+
+Saving a :class:`~src.knowledge.crawl_state.CrawlState` rewrites the whole
+state JSON and frontier overflow file, so saving every few pages makes a
+crawl quadratic in its size. Instead, the crawler appends one JSON line per
+processed page to ``crawl_journal.jsonl`` next to the state snapshot and
+only rewrites the snapshot (compaction) at the end of a run or once the
+journal grows past a size threshold.
+
+Each record describes one frontier pop and its outcome:
+
+``popped``
+    The URL was taken off the frontier and dropped (already visited).
+``visited`` / ``skipped`` / ``failed``
+    The URL was popped and marked visited; ``visited`` records also carry
+    the page's depth, the in-scope links that were enqueued one level
+    deeper, and the link counts.
+
+Keeping the pop and its outcome in one line means a torn final line can
+never drop a URL from the frontier without marking it visited. Records are
+numbered from the snapshot's ``journal_seq``; replay skips records the
+snapshot already contains, so a crash between writing the snapshot and
+removing the journal is harmless. Appends are flushed to the OS at once and
+fsynced every ``sync_every`` records, so a killed process loses nothing and
+a power loss at most the unsynced tail.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import weakref
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from .crawl_state import CrawlState
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "crawl_journal.jsonl"
+
+# fsync after this many records
+DEFAULT_SYNC_EVERY = 10
+
+# Fold the journal into the snapshot once it reaches this size
+DEFAULT_COMPACT_BYTES = 4 * 1024 * 1024
+
+RECORD_OPS = ("popped", "visited", "skipped", "failed")
+
+
+def apply_record(state: "CrawlState", record: dict[str, Any]) -> None:
+    """Apply one journal record to ``state``.
+
+    The crawler applies records through :meth:`CrawlJournal.append` as it
+    goes, and replay applies the same records on resume, so both paths
+    produce the same state.
+    """
+    popped = record.get("popped", record["url"])
+    state.frontier.discard(popped)
+
+    op = record["op"]
+    if op == "popped":
+        return
+
+    depth = record.get("depth", 0) + 1
+    for link in record.get("enqueued", ()):
+        if state.add_to_frontier(link, depth=depth, discovered_from=record["url"]):
+            state.in_scope_count += 1
+    state.discovered_count += record.get("discovered", 0)
+    state.out_of_scope_count += record.get("out_of_scope", 0)
+
+    if op == "skipped":
+        state.skipped_count += 1
+    elif op == "failed":
+        state.failed_count += 1
+    state.mark_url_visited(record["url"])
+
+
+def make_record(
+    op: str,
+    url: str,
+    *,
+    popped: str | None = None,
+    depth: int = 0,
+    enqueued: Iterable[str] = (),
+    discovered: int = 0,
+    out_of_scope: int = 0,
+) -> dict[str, Any]:
+    """Build a journal record.
+
+    Args:
+        op: One of :data:`RECORD_OPS`
+        url: The normalized URL the outcome applies to
+        popped: The URL as it was queued, if normalization changed it
+        depth: Link depth of the page; its links are queued one deeper
+        enqueued: In-scope links found on the page
+        discovered: Total links found on the page
+        out_of_scope: Links rejected by the scope filter
+    """
+    if op not in RECORD_OPS:
+        raise ValueError(f"Invalid journal op: {op}. Must be one of {RECORD_OPS}")
+    record: dict[str, Any] = {"op": op, "url": url}
+    if popped is not None and popped != url:
+        record["popped"] = popped
+    if depth:
+        record["depth"] = depth
+    enqueued = list(enqueued)
+    if enqueued:
+        record["enqueued"] = enqueued
+    if discovered:
+        record["discovered"] = discovered
+    if out_of_scope:
+        record["out_of_scope"] = out_of_scope
+    return record
+
+
+class CrawlJournal:
+    """Append-only event log for one crawl's state snapshot.
+
+    Args:
+        path: Location of the journal file.
+        sync_every: fsync after this many records (0 leaves it to the OS).
+        compact_bytes: Journal size at which compaction is due.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        sync_every: int = DEFAULT_SYNC_EVERY,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+    ) -> None:
+        self.path = path
+        self.sync_every = max(sync_every, 0)
+        self.compact_bytes = max(compact_bytes, 1)
+        self.records = 0
+        self.size = path.stat().st_size if path.exists() else 0
+        self._unsynced = 0
+        self._handle: IO[bytes] | None = None
+        self._finalizer: weakref.finalize | None = None
+
+    def replay(self, state: "CrawlState") -> int:
+        """Apply records newer than the snapshot to ``state``.
+
+        Returns:
+            Number of records applied
+        """
+        if not self.path.exists():
+            return 0
+
+        applied = 0
+        good_offset = 0
+        with self.path.open("rb") as handle:
+            for raw_line in handle:
+                if not raw_line.endswith(b"\n"):
+                    logger.warning("Ignoring torn record at end of %s", self.path)
+                    break
+                good_offset += len(raw_line)
+                try:
+                    record = json.loads(raw_line)
+                    seq = record["seq"]
+                except (ValueError, KeyError, TypeError) as exc:
+                    logger.warning("Skipping unreadable record in %s: %s", self.path, exc)
+                    continue
+                if seq <= state.journal_seq:
+                    continue
+                if seq != state.journal_seq + 1:
+                    # The snapshot is older than the journal's start, e.g.
+                    # when compaction committed it elsewhere; the records
+                    # cannot be applied without the missing ones
+                    logger.warning(
+                        "Discarding journal %s: it starts at %d but the snapshot is at %d",
+                        self.path,
+                        seq,
+                        state.journal_seq,
+                    )
+                    good_offset = 0
+                    break
+                apply_record(state, record)
+                state.journal_seq = seq
+                applied += 1
+
+        if good_offset < self.path.stat().st_size:
+            with self.path.open("r+b") as handle:
+                handle.truncate(good_offset)
+        self.size = good_offset
+        self.records = applied
+        return applied
+
+    def append(self, state: "CrawlState", record: dict[str, Any]) -> None:
+        """Apply ``record`` to ``state`` and append it to the journal."""
+        apply_record(state, record)
+        state.journal_seq += 1
+        line = json.dumps({"seq": state.journal_seq, **record}, separators=(",", ":"))
+        data = line.encode("utf-8") + b"\n"
+
+        handle = self._open()
+        handle.write(data)
+        handle.flush()
+        self.size += len(data)
+        self.records += 1
+        self._unsynced += 1
+        if self.sync_every and self._unsynced >= self.sync_every:
+            self.sync()
+
+    def needs_compaction(self) -> bool:
+        """Return True once the journal has outgrown its threshold."""
+        return self.size >= self.compact_bytes
+
+    def sync(self) -> None:
+        """Force appended records to stable storage."""
+        if self._handle is not None:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        self._unsynced = 0
+
+    def reset(self) -> None:
+        """Discard the journal after its records were saved in a snapshot."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self.records = 0
+        self.size = 0
+        self._unsynced = 0
+
+    def close(self) -> None:
+        """Close the append handle, if open."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._handle = None
+
+    def _open(self) -> IO[bytes]:
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("ab")
+            self._finalizer = weakref.finalize(self, self._handle.close)
+        return self._handle
+
+
+__all__ = [
+    "DEFAULT_COMPACT_BYTES",
+    "DEFAULT_SYNC_EVERY",
+    "JOURNAL_FILENAME",
+    "RECORD_OPS",
+    "CrawlJournal",
+    "apply_record",
+    "make_record",
+]
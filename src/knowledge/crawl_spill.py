@@ -0,0 +1,229 @@
+"""Segmented on-disk queue for crawl frontier entries.
+
+A large site can queue far more URLs than are worth holding in memory. The
+:class:`~src.knowledge.crawl_state.CrawlFrontier` keeps a bounded window of
+entries in memory and spills the rest to a :class:`FrontierSpill`: a FIFO of
+JSON lines split across numbered, fixed-size segment files in a
+``frontier/`` directory next to the state snapshot.
+
+Segments are append-only. New entries go to the tail segment, and a head
+pointer (segment number and byte offset) marks the next entry to read, so
+refilling the window reads a few lines rather than the whole queue. The
+pointers are saved in the state snapshot, which therefore costs the same
+however long the queue grows. Segments behind the head are only deleted
+by :meth:`FrontierSpill.checkpoint` once a snapshot no longer refers to
+them, and restoring truncates anything past the snapshot's tail; entries
+spilled after the snapshot are spilled again when the crawl journal is
+replayed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import weakref
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+SPILL_DIRNAME = "frontier"
+
+# Entries per segment file
+DEFAULT_SEGMENT_SIZE = 5000
+
+
+class FrontierSpill:
+    """FIFO of serialized frontier entries stored in segment files.
+
+    Args:
+        directory: Directory holding the segment files.
+        segment_size: Entries written to a segment before starting the next.
+    """
+
+    def __init__(self, directory: Path, *, segment_size: int = DEFAULT_SEGMENT_SIZE) -> None:
+        self.directory = directory
+        self.segment_size = max(segment_size, 1)
+        self.head_segment = 0
+        self.head_offset = 0
+        self.tail_segment = 0
+        self.tail_records = 0
+        self.tail_bytes = 0
+        self.length = 0
+        self._dirty: set[int] = set()
+        self._writer: IO[bytes] | None = None
+        self._finalizer: weakref.finalize | None = None
+
+    @classmethod
+    def restore(cls, directory: Path, data: dict[str, Any] | None = None) -> "FrontierSpill":
+        """Open a spill at the position recorded by :meth:`to_dict`.
+
+        Segment data written after that position, and segments the head
+        had already passed, are removed.
+        """
+        data = data or {}
+        spill = cls(directory, segment_size=data.get("segment_size", DEFAULT_SEGMENT_SIZE))
+        spill.head_segment, spill.head_offset = data.get("head", (0, 0))
+        spill.tail_segment, spill.tail_records, spill.tail_bytes = data.get("tail", (0, 0, 0))
+        spill.length = data.get("length", 0)
+
+        for number, path in spill._segments():
+            if number < spill.head_segment or number > spill.tail_segment:
+                path.unlink()
+            elif number == spill.tail_segment and path.stat().st_size > spill.tail_bytes:
+                with path.open("r+b") as handle:
+                    handle.truncate(spill.tail_bytes)
+        if spill.length and not spill._segment_path(spill.head_segment).exists():
+            logger.warning("Frontier spill in %s is missing segments; dropping it", directory)
+            spill.clear()
+        return spill
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the queue pointers (not the entries)."""
+        return {
+            "segment_size": self.segment_size,
+            "head": [self.head_segment, self.head_offset],
+            "tail": [self.tail_segment, self.tail_records, self.tail_bytes],
+            "length": self.length,
+        }
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Append one entry to the tail segment."""
+        if self.tail_records >= self.segment_size:
+            self._close_writer()
+            self.tail_segment += 1
+            self.tail_records = 0
+            self.tail_bytes = 0
+        data = json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+        self._open_writer().write(data)
+        self.tail_records += 1
+        self.tail_bytes += len(data)
+        self.length += 1
+        self._dirty.add(self.tail_segment)
+
+    def extend(self, records: Iterable[dict[str, Any]]) -> None:
+        """Append several entries."""
+        for record in records:
+            self.append(record)
+
+    def take(self, limit: int) -> List[dict[str, Any]]:
+        """Remove and return up to ``limit`` entries from the head."""
+        taken: List[dict[str, Any]] = []
+        if self._writer is not None:
+            self._writer.flush()
+        while len(taken) < limit and self.length:
+            path = self._segment_path(self.head_segment)
+            with path.open("rb") as handle:
+                handle.seek(self.head_offset)
+                while len(taken) < limit and self.length:
+                    line = handle.readline()
+                    if not line:
+                        break
+                    self.head_offset += len(line)
+                    self.length -= 1
+                    taken.append(json.loads(line))
+            if len(taken) < limit and self.length:
+                # Head segment exhausted; it is deleted at the next checkpoint
+                if self.head_segment >= self.tail_segment:
+                    logger.warning(
+                        "Frontier spill in %s ended early; dropping %d entries",
+                        self.directory,
+                        self.length,
+                    )
+                    self.length = 0
+                    break
+                self.head_segment += 1
+                self.head_offset = 0
+        return taken
+
+    def scan(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the queued entries without removing them."""
+        if self._writer is not None:
+            self._writer.flush()
+        remaining = self.length
+        number, offset = self.head_segment, self.head_offset
+        while remaining and number <= self.tail_segment:
+            path = self._segment_path(number)
+            if path.exists():
+                with path.open("rb") as handle:
+                    handle.seek(offset)
+                    for line in handle:
+                        yield json.loads(line)
+                        remaining -= 1
+                        if not remaining:
+                            return
+            number, offset = number + 1, 0
+
+    def clear(self) -> None:
+        """Drop all queued entries; their segments go at the next checkpoint."""
+        self._close_writer()
+        self.tail_segment += 1
+        self.tail_records = 0
+        self.tail_bytes = 0
+        self.head_segment = self.tail_segment
+        self.head_offset = 0
+        self.length = 0
+
+    def sync(self) -> None:
+        """Force appended entries to stable storage."""
+        if self._writer is not None:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+
+    def dirty_segments(self) -> List[Path]:
+        """Return live segments appended to since the last checkpoint."""
+        return [
+            self._segment_path(number)
+            for number in sorted(self._dirty)
+            if number >= self.head_segment and self._segment_path(number).exists()
+        ]
+
+    def checkpoint(self) -> None:
+        """Delete consumed segments once a snapshot past them is saved."""
+        for number, path in self._segments():
+            if number < self.head_segment:
+                path.unlink()
+        self._dirty.clear()
+
+    def close(self) -> None:
+        """Close the append handle, if open."""
+        self._close_writer()
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"{number:06d}.jsonl"
+
+    def _segments(self) -> List[tuple[int, Path]]:
+        if not self.directory.exists():
+            return []
+        return sorted(
+            (int(path.stem), path)
+            for path in self.directory.glob("*.jsonl")
+            if path.stem.isdigit()
+        )
+
+    def _open_writer(self) -> IO[bytes]:
+        if self._writer is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._writer = self._segment_path(self.tail_segment).open("ab")
+            self._finalizer = weakref.finalize(self, self._writer.close)
+        return self._writer
+
+    def _close_writer(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._writer = None
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __bool__(self) -> bool:
+        return self.length > 0
+
+
+__all__ = [
+    "DEFAULT_SEGMENT_SIZE",
+    "SPILL_DIRNAME",
+    "FrontierSpill",
+]
@@ -13,19 +13,36 @@ exit, and continue later from where they left off.
 
 from __future__ import annotations
 
+import base64
 import hashlib
+import heapq
 import json
+import logging
+import sys
+from array import array
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Set
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Set
+from urllib.parse import parse_qsl, urlsplit
 
 from src import paths
 from src.parsing import utils
 
+from .crawl_journal import DEFAULT_COMPACT_BYTES, DEFAULT_SYNC_EVERY, JOURNAL_FILENAME, CrawlJournal
+from .crawl_spill import DEFAULT_SEGMENT_SIZE, SPILL_DIRNAME, FrontierSpill
+
 if TYPE_CHECKING:
     from src.integrations.github.storage import GitHubStorageClient
 
+logger = logging.getLogger(__name__)
+
+# Directory under crawls/ holding fetched robots.txt files, shared by sources
+ROBOTS_CACHE_DIRNAME = "robots"
+
 
 def _source_hash(url: str) -> str:
     """Generate a consistent hash for a source URL."""
@@ -37,13 +54,463 @@ def _url_hash(url: str) -> str:
     return hashlib.sha256(url.encode("utf-8")).hexdigest()
 
 
+# Frontier priority weights; see score_url
+DEPTH_WEIGHT = 1.0
+LISTING_PENALTY = 2.5
+QUERY_PENALTY = 1.0
+DOCUMENT_BONUS = 0.5
+
+# Path segments of listing pages (tags, archives, ...) rather than content
+_LISTING_SEGMENTS = frozenset({
+    "archive", "archives", "author", "authors", "categories", "category",
+    "feed", "label", "labels", "search", "tag", "tags",
+})
+_PAGINATION_SEGMENTS = frozenset({"p", "page"})
+_PAGINATION_PARAMS = frozenset({"offset", "p", "page", "paged", "pg", "start"})
+# Query parameters that re-present a page (sharing, printing, sorting, tracking)
+_VARIANT_PARAMS = frozenset({
+    "filter", "order", "print", "ref", "replytocom", "share", "sort",
+    "utm_campaign", "utm_medium", "utm_source",
+})
+_DOCUMENT_EXTENSIONS = frozenset({
+    ".doc", ".docx", ".htm", ".html", ".md", ".odt", ".pdf", ".rtf", ".txt",
+})
+
+
+def score_url(url: str, depth: int) -> float:
+    """Score a frontier URL; higher scores are crawled first.
+    
+    Every level of link depth costs ``DEPTH_WEIGHT``. Pagination, listing
+    pages (tags, categories, archives, feeds, search) and variants of a
+    page (share, print, sort and tracking parameters) cost
+    ``LISTING_PENALTY``, so they rank below content pages a couple of hops
+    deeper. Other query URLs cost ``QUERY_PENALTY``; URLs naming a
+    document file gain ``DOCUMENT_BONUS``.
+    """
+    parsed = urlsplit(url)
+    segments = parsed.path.lower().split("/")
+    
+    score = -DEPTH_WEIGHT * depth
+    listing = not _LISTING_SEGMENTS.isdisjoint(segments) or any(
+        segment in _PAGINATION_SEGMENTS and following.isdigit()
+        for segment, following in zip(segments, segments[1:])
+    )
+    if parsed.query and not listing:
+        params = {key.lower() for key, _ in parse_qsl(parsed.query, keep_blank_values=True)}
+        listing = not params.isdisjoint(_PAGINATION_PARAMS) or not params.isdisjoint(_VARIANT_PARAMS)
+    if listing:
+        score -= LISTING_PENALTY
+    elif parsed.query:
+        score -= QUERY_PENALTY
+    
+    last = segments[-1]
+    dot = last.rfind(".")
+    if dot > 0 and last[dot:] in _DOCUMENT_EXTENSIONS:
+        score += DOCUMENT_BONUS
+    return score
+
+
+@dataclass(slots=True)
+class FrontierEntry:
+    """A queued URL with the context used to prioritize it.
+    
+    Attributes:
+        url: The URL to visit
+        depth: Link depth from the source URL
+        score: Priority; filled in by the frontier's scorer when None
+        discovered_from: URL of the page that linked here
+    """
+    
+    url: str
+    depth: int = 0
+    score: float | None = None
+    discovered_from: str | None = None
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the entry to a dictionary."""
+        data: dict[str, Any] = {"url": self.url, "depth": self.depth, "score": self.score}
+        if self.discovered_from is not None:
+            data["discovered_from"] = self.discovered_from
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | str) -> "FrontierEntry":
+        """Deserialize an entry; bare URL strings come from older states."""
+        if isinstance(data, str):
+            return cls(url=data)
+        return cls(
+            url=data["url"],
+            depth=data.get("depth", 0),
+            score=data.get("score"),
+            discovered_from=data.get("discovered_from"),
+        )
+
+
+class CrawlFrontier:
+    """Priority queue of URLs with constant-time membership checks.
+    
+    Entries pop highest score first and, among equal scores, in insertion
+    order, so with a constant scorer the frontier is a plain FIFO. A heap
+    of ``(-score, seq, url)`` orders the entries and a dict keyed by URL
+    answers membership; discarded entries stay in the heap until they reach
+    the top. All mutation goes through this class to keep the two
+    structures consistent.
+    
+    Once a :class:`FrontierSpill` is attached, the heap becomes a window of
+    at most ``capacity`` entries. Entries queued while the window is full
+    are appended to the spill, and the window is topped up from the spill
+    in discovery order whenever it drains below a quarter full, so memory
+    stays bounded however many URLs are queued. Spilled URLs are tracked by
+    8-byte digests (see :class:`VisitedSet`) so they are not queued twice;
+    the digests are saved with the crawl state rather than rebuilt from the
+    spill. They are released whenever the spill drains, and at most
+    ``MAX_SPILLED_DIGESTS`` are kept. A URL spilled again after its digest
+    was released is dropped when it is topped up while still in the window,
+    and the crawler skips it on pop once it has been visited, so a released
+    digest costs a duplicate spill record rather than a duplicate fetch.
+    ``len()`` counts spilled entries; ``entries()`` and the other listing
+    methods only cover the window.
+    
+    Args:
+        urls: Initial URLs or entries
+        scorer: ``(url, depth) -> score``; defaults to :func:`score_url`
+    """
+    
+    __slots__ = ("_heap", "_entries", "_seq", "_scorer", "_spill", "_spilled", "_capacity")
+    
+    # Spilled-URL digests kept for deduplication (8 bytes each)
+    MAX_SPILLED_DIGESTS = 1_000_000
+    
+    def __init__(
+        self,
+        urls: Iterable[str | FrontierEntry] | None = None,
+        scorer: Callable[[str, int], float] | None = None,
+    ) -> None:
+        self._heap: List[tuple[float, int, str]] = []
+        self._entries: dict[str, tuple[int, FrontierEntry]] = {}
+        self._seq = 0
+        self._scorer = scorer
+        self._spill: FrontierSpill | None = None
+        self._spilled: VisitedSet | None = None
+        self._capacity = 0
+        if urls is not None:
+            self.extend(urls)
+    
+    @property
+    def spill(self) -> FrontierSpill | None:
+        """The on-disk queue behind the window, if one is attached."""
+        return self._spill
+    
+    @property
+    def spilled_digests(self) -> VisitedSet | None:
+        """Digests of spilled URLs, saved alongside the spill pointers."""
+        return self._spilled
+    
+    def attach_spill(
+        self,
+        spill: FrontierSpill,
+        capacity: int,
+        spilled: VisitedSet | None = None,
+    ) -> None:
+        """Bound the in-memory window, spilling further entries to ``spill``.
+        
+        Window entries beyond ``capacity`` are moved to the spill, lowest
+        priority last.
+        
+        Args:
+            spill: Queue that holds entries the window has no room for
+            capacity: Maximum entries kept in memory
+            spilled: Digests of the URLs in ``spill``, as saved with it.
+                When missing for a non-empty spill (states saved before the
+                digests were), they are rebuilt with one pass over its
+                live segments.
+        """
+        self._spill = spill
+        if spilled is None:
+            spilled = VisitedSet(_url_hash(data["url"]) for data in spill.scan())
+        self._spilled = spilled
+        self._capacity = max(capacity, 1)
+        if len(self._entries) > self._capacity:
+            overflow = self.entries(self._capacity)
+            for entry in overflow:
+                del self._entries[entry.url]
+                self._spill_entry(entry)
+            self._heap = [item for item in self._heap if self._is_live(item)]
+            heapq.heapify(self._heap)
+    
+    def _spill_entry(self, entry: FrontierEntry) -> None:
+        self._spill.append(entry.to_dict())
+        if len(self._spilled) >= self.MAX_SPILLED_DIGESTS:
+            self._spilled = VisitedSet()
+        self._spilled.add(_url_hash(entry.url))
+    
+    def _top_up(self) -> None:
+        """Refill the window from the spill once it is a quarter full."""
+        if not self._spill or len(self._entries) > self._capacity // 4:
+            return
+        for data in self._spill.take(max(self._capacity // 2 - len(self._entries), 1)):
+            entry = FrontierEntry.from_dict(data)
+            if entry.url not in self._entries:
+                self._seq += 1
+                self._entries[entry.url] = (self._seq, entry)
+                heapq.heappush(self._heap, (-entry.score, self._seq, entry.url))
+        if not self._spill:
+            # Everything spilled is now in the window or gone
+            self._spilled = VisitedSet()
+    
+    def push(self, entry: FrontierEntry) -> bool:
+        """Queue an entry, scoring it first if it has no score.
+        
+        Returns:
+            True if the entry was added, False if its URL was already queued
+        """
+        if entry.url in self._entries:
+            return False
+        if self._spilled is not None and _url_hash(entry.url) in self._spilled:
+            return False
+        if entry.score is None:
+            entry.score = (self._scorer or score_url)(entry.url, entry.depth)
+        if self._spill is not None and len(self._entries) >= self._capacity:
+            self._spill_entry(entry)
+            return True
+        self._seq += 1
+        self._entries[entry.url] = (self._seq, entry)
+        heapq.heappush(self._heap, (-entry.score, self._seq, entry.url))
+        return True
+    
+    def append(self, url: str, depth: int = 0, discovered_from: str | None = None) -> bool:
+        """Queue a URL.
+        
+        Returns:
+            True if the URL was added, False if it was already queued
+        """
+        return self.push(FrontierEntry(url=url, depth=depth, discovered_from=discovered_from))
+    
+    def extend(self, urls: Iterable[str | FrontierEntry]) -> int:
+        """Queue several URLs or entries, skipping ones already queued.
+        
+        Returns:
+            Number of URLs added
+        """
+        added = 0
+        for item in urls:
+            entry = item if isinstance(item, FrontierEntry) else FrontierEntry(url=item)
+            if self.push(entry):
+                added += 1
+        return added
+    
+    def pop(self) -> FrontierEntry:
+        """Remove and return the highest-priority entry.
+        
+        Raises:
+            IndexError: If the frontier is empty
+        """
+        if not self._entries:
+            self._top_up()
+        while self._heap:
+            _, seq, url = heapq.heappop(self._heap)
+            current = self._entries.get(url)
+            if current is not None and current[0] == seq:
+                del self._entries[url]
+                self._top_up()
+                return current[1]
+        raise IndexError("pop from an empty frontier")
+    
+    def discard(self, url: str) -> bool:
+        """Remove a URL wherever it is queued in the window.
+        
+        The window is topped up exactly as :meth:`pop` does, so replaying
+        a journal of discards rebuilds the same window and spill.
+        
+        Returns:
+            True if the URL was in the window
+        """
+        if url not in self._entries:
+            self._top_up()
+        if self._entries.pop(url, None) is None:
+            return False
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [item for item in self._heap if self._is_live(item)]
+            heapq.heapify(self._heap)
+        self._top_up()
+        return True
+    
+    def _is_live(self, item: tuple[float, int, str]) -> bool:
+        current = self._entries.get(item[2])
+        return current is not None and current[0] == item[1]
+    
+    def entries(self, start: int = 0, stop: int | None = None) -> List[FrontierEntry]:
+        """Return queued entries in pop order, sliced like a list."""
+        keyed = ((-entry.score, seq, entry) for seq, entry in self._entries.values())
+        if stop is None:
+            ordered = sorted(keyed)
+        else:
+            ordered = heapq.nsmallest(stop, keyed)
+        return [entry for _, _, entry in ordered[start:stop]]
+    
+    def head(self, limit: int) -> List[str]:
+        """Return up to ``limit`` URLs in pop order without removing them."""
+        return [entry.url for entry in self.entries(0, limit)]
+    
+    def tail(self, start: int) -> List[str]:
+        """Return the URLs from position ``start`` in pop order to the end."""
+        return [entry.url for entry in self.entries(start)]
+    
+    def clear(self) -> None:
+        """Remove all URLs from the frontier, including spilled ones."""
+        self._heap.clear()
+        self._entries.clear()
+        if self._spill is not None:
+            self._spill.clear()
+            self._spilled = VisitedSet()
+    
+    def to_list(self) -> List[str]:
+        """Return the queued URLs in pop order."""
+        return [entry.url for entry in self.entries()]
+    
+    def __contains__(self, url: object) -> bool:
+        if url in self._entries:
+            return True
+        return isinstance(url, str) and self._spilled is not None and _url_hash(url) in self._spilled
+    
+    def __len__(self) -> int:
+        return len(self._entries) + (len(self._spill) if self._spill is not None else 0)
+    
+    def __bool__(self) -> bool:
+        return bool(self._entries) or bool(self._spill)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_list())
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CrawlFrontier):
+            return len(self) == len(other) and self.entries() == other.entries()
+        if isinstance(other, (list, tuple, deque)):
+            return self.to_list() == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"CrawlFrontier({self.to_list()!r})"
+
+
+class VisitedSet:
+    """Compact set of visited URL hashes.
+    
+    Only the first ``digest_bytes`` bytes of each SHA-256 URL hash are kept,
+    as an unsigned integer. Most digests live in a sorted ``array('Q')`` at
+    8 bytes each; recent additions sit in a small set that is merged into
+    the array once it outgrows an eighth of it. Membership is a set lookup
+    plus a binary search. A 64-character hex string in a set costs about
+    20 times as much memory.
+    
+    Truncation means two URLs can share a digest, in which case the second
+    one is wrongly treated as visited and never fetched. With ``n`` URLs and
+    ``b = 8 * digest_bytes`` bits, the chance of any collision over a whole
+    crawl is about ``n**2 / 2**(b + 1)`` (see :meth:`collision_probability`).
+    For the default 8 bytes that is 3e-10 at 100k URLs and 3e-8 at 1M; each
+    byte removed multiplies it by 256.
+    """
+    
+    __slots__ = ("digest_bytes", "_sorted", "_recent")
+    
+    DEFAULT_DIGEST_BYTES = 8
+    MIN_DIGEST_BYTES = 4
+    
+    def __init__(
+        self,
+        url_hashes: Iterable[str] | None = None,
+        digest_bytes: int = DEFAULT_DIGEST_BYTES,
+    ) -> None:
+        if not self.MIN_DIGEST_BYTES <= digest_bytes <= 8:
+            raise ValueError(
+                f"digest_bytes must be between {self.MIN_DIGEST_BYTES} and 8, got {digest_bytes}"
+            )
+        self.digest_bytes = digest_bytes
+        self._sorted = array("Q")
+        self._recent: Set[int] = set()
+        if url_hashes is not None:
+            for url_hash in url_hashes:
+                self.add(url_hash)
+    
+    @staticmethod
+    def collision_probability(count: int, digest_bytes: int = DEFAULT_DIGEST_BYTES) -> float:
+        """Approximate chance that any two of ``count`` URLs share a digest."""
+        return min(1.0, count * (count - 1) / 2 ** (8 * digest_bytes + 1))
+    
+    def _digest(self, url_hash: str) -> int:
+        return int(url_hash[: 2 * self.digest_bytes], 16)
+    
+    def add(self, url_hash: str) -> bool:
+        """Add a hex URL hash.
+        
+        Returns:
+            True if it was added, False if it was already present
+        """
+        digest = self._digest(url_hash)
+        if digest in self._recent or self._in_sorted(digest):
+            return False
+        self._recent.add(digest)
+        if len(self._recent) > max(1024, len(self._sorted) // 8):
+            self._merge()
+        return True
+    
+    def _in_sorted(self, digest: int) -> bool:
+        index = bisect_left(self._sorted, digest)
+        return index < len(self._sorted) and self._sorted[index] == digest
+    
+    def _merge(self) -> None:
+        if self._recent:
+            self._sorted = array("Q", sorted(chain(self._sorted, self._recent)))
+            self._recent = set()
+    
+    def __contains__(self, url_hash: object) -> bool:
+        if not isinstance(url_hash, str):
+            return False
+        digest = self._digest(url_hash)
+        return digest in self._recent or self._in_sorted(digest)
+    
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._recent)
+    
+    def __sizeof__(self) -> int:
+        recent = sys.getsizeof(self._recent) + sum(sys.getsizeof(d) for d in self._recent)
+        return object.__sizeof__(self) + sys.getsizeof(self._sorted) + recent
+    
+    def __repr__(self) -> str:
+        return f"VisitedSet(<{len(self)} digests of {self.digest_bytes} bytes>)"
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize as little-endian base64 of the sorted digests."""
+        self._merge()
+        digests = self._sorted
+        if sys.byteorder == "big":
+            digests = array("Q", digests)
+            digests.byteswap()
+        return {
+            "digest_bytes": self.digest_bytes,
+            "count": len(digests),
+            "digests": base64.b64encode(digests.tobytes()).decode("ascii"),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "VisitedSet":
+        """Deserialize from :meth:`to_dict` output."""
+        visited = cls(digest_bytes=data.get("digest_bytes", cls.DEFAULT_DIGEST_BYTES))
+        digests = array("Q")
+        digests.frombytes(base64.b64decode(data.get("digests", "")))
+        if sys.byteorder == "big":
+            digests.byteswap()
+        visited._sorted = digests
+        return visited
+
+
 @dataclass
 class CrawlState:
     """Persistent state for a site-wide crawl.
     
     This dataclass tracks all state needed to resume a crawl across
-    workflow runs. The frontier is kept in memory (up to 1000 URLs),
-    with overflow written to a separate file.
+    workflow runs. Once saved, the frontier keeps a bounded window in
+    memory and spills the rest to segment files (see FrontierSpill).
     
     Attributes:
         source_url: The source URL defining the crawl boundary root
@@ -53,18 +520,21 @@ class CrawlState:
         started_at: When the crawl was first started
         last_activity: When the last page was processed
         completed_at: When the crawl finished (if completed)
-        frontier: Active queue of URLs to visit (max 1000 in memory)
-        frontier_overflow_count: Count of URLs in overflow file
+        frontier: Priority queue of URLs to visit (see CrawlFrontier)
+        frontier_overflow_count: Count of spilled URLs recorded in a snapshot
         visited_count: Total pages successfully fetched
-        visited_hashes: Set of URL hashes for deduplication
+        visited_hashes: Compact set of visited URL hashes for deduplication
         discovered_count: Total URLs found via link extraction
         in_scope_count: URLs that passed scope filter
         out_of_scope_count: URLs rejected by scope filter
         skipped_count: URLs skipped (robots.txt, patterns, etc.)
+        unchanged_count: Pages not refetched because their sitemap lastmod
+            is no later than their last fetch
         failed_count: Failed fetches
         max_pages: Safety limit for total pages
         max_depth: Maximum link depth from source URL
         exclude_patterns: fnmatch patterns to exclude URLs
+        journal_seq: Sequence number of the last journal record applied
         content_root: Path to content storage directory
         registry_path: Path to page registry file
     """
@@ -80,18 +550,19 @@ class CrawlState:
     completed_at: datetime | None = None
     
     # URL Frontier (URLs to visit)
-    frontier: List[str] = field(default_factory=list)
+    frontier: CrawlFrontier = field(default_factory=CrawlFrontier)
     frontier_overflow_count: int = 0
     
     # Visited tracking
     visited_count: int = 0
-    visited_hashes: Set[str] = field(default_factory=set)
+    visited_hashes: VisitedSet = field(default_factory=VisitedSet)
     
     # Statistics
     discovered_count: int = 0
     in_scope_count: int = 0
     out_of_scope_count: int = 0
     skipped_count: int = 0
+    unchanged_count: int = 0
     failed_count: int = 0
     
     # Configuration
@@ -99,10 +570,20 @@ class CrawlState:
     max_depth: int = 10
     exclude_patterns: List[str] = field(default_factory=list)
     
+    # Last crawl journal record folded into this state
+    journal_seq: int = 0
+    
     # Storage paths (relative to knowledge-graph root)
     content_root: str = ""
     registry_path: str = ""
     
+    def __post_init__(self) -> None:
+        """Coerce plain URL and hash sequences into their containers."""
+        if not isinstance(self.frontier, CrawlFrontier):
+            self.frontier = CrawlFrontier(self.frontier)
+        if not isinstance(self.visited_hashes, VisitedSet):
+            self.visited_hashes = VisitedSet(self.visited_hashes)
+    
     def to_dict(self) -> dict[str, Any]:
         """Serialize state to dictionary for JSON storage."""
         return {
@@ -113,18 +594,20 @@ class CrawlState:
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "last_activity": self.last_activity.isoformat() if self.last_activity else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "frontier": self.frontier,
+            "frontier": [entry.to_dict() for entry in self.frontier.entries()],
             "frontier_overflow_count": self.frontier_overflow_count,
             "visited_count": self.visited_count,
-            "visited_hashes": list(self.visited_hashes),
+            "visited": self.visited_hashes.to_dict(),
             "discovered_count": self.discovered_count,
             "in_scope_count": self.in_scope_count,
             "out_of_scope_count": self.out_of_scope_count,
             "skipped_count": self.skipped_count,
+            "unchanged_count": self.unchanged_count,
             "failed_count": self.failed_count,
             "max_pages": self.max_pages,
             "max_depth": self.max_depth,
             "exclude_patterns": self.exclude_patterns,
+            "journal_seq": self.journal_seq,
             "content_root": self.content_root,
             "registry_path": self.registry_path,
         }
@@ -144,6 +627,12 @@ class CrawlState:
         if data.get("completed_at"):
             completed_at = datetime.fromisoformat(data["completed_at"])
         
+        # States saved before the compact format list full hex hashes
+        if "visited" in data:
+            visited = VisitedSet.from_dict(data["visited"])
+        else:
+            visited = VisitedSet(data.get("visited_hashes", []))
+        
         return cls(
             source_url=data["source_url"],
             source_hash=data["source_hash"],
@@ -152,18 +641,20 @@ class CrawlState:
             started_at=started_at,
             last_activity=last_activity,
             completed_at=completed_at,
-            frontier=data.get("frontier", []),
+            frontier=CrawlFrontier(FrontierEntry.from_dict(item) for item in data.get("frontier", [])),
             frontier_overflow_count=data.get("frontier_overflow_count", 0),
             visited_count=data.get("visited_count", 0),
-            visited_hashes=set(data.get("visited_hashes", [])),
+            visited_hashes=visited,
             discovered_count=data.get("discovered_count", 0),
             in_scope_count=data.get("in_scope_count", 0),
             out_of_scope_count=data.get("out_of_scope_count", 0),
             skipped_count=data.get("skipped_count", 0),
+            unchanged_count=data.get("unchanged_count", 0),
             failed_count=data.get("failed_count", 0),
             max_pages=data.get("max_pages", 10000),
             max_depth=data.get("max_depth", 10),
             exclude_patterns=data.get("exclude_patterns", []),
+            journal_seq=data.get("journal_seq", 0),
             content_root=data.get("content_root", ""),
             registry_path=data.get("registry_path", ""),
         )
@@ -176,6 +667,7 @@ class CrawlState:
         max_pages: int = 10000,
         max_depth: int = 10,
         exclude_patterns: list[str] | None = None,
+        visited_digest_bytes: int = VisitedSet.DEFAULT_DIGEST_BYTES,
     ) -> "CrawlState":
         """Create a new crawl state for a source URL.
         
@@ -185,6 +677,8 @@ class CrawlState:
             max_pages: Maximum pages to crawl (safety limit)
             max_depth: Maximum link depth from source
             exclude_patterns: fnmatch patterns to exclude URLs
+            visited_digest_bytes: Bytes kept per visited URL hash; fewer
+                bytes save memory but raise the collision rate (see VisitedSet)
             
         Returns:
             A new CrawlState initialized with the source URL in the frontier
@@ -199,10 +693,11 @@ class CrawlState:
             source_hash=source_hash,
             scope=scope,
             status="pending",
-            frontier=[source_url],
+            frontier=CrawlFrontier([source_url]),
             max_pages=max_pages,
             max_depth=max_depth,
             exclude_patterns=exclude_patterns or [],
+            visited_hashes=VisitedSet(digest_bytes=visited_digest_bytes),
             content_root=f"crawls/{source_hash}/content",
             registry_path=f"crawls/{source_hash}/registry.json",
         )
@@ -239,21 +734,45 @@ class CrawlState:
         self.visited_count += 1
         self.last_activity = datetime.now(timezone.utc)
     
-    def add_to_frontier(self, url: str) -> bool:
+    def mark_url_unchanged(self, url: str) -> None:
+        """Mark a URL as known unchanged, so it is neither queued nor fetched."""
+        self.visited_hashes.add(_url_hash(url))
+        self.unchanged_count += 1
+    
+    def add_to_frontier(
+        self,
+        url: str,
+        depth: int = 0,
+        discovered_from: str | None = None,
+    ) -> bool:
         """Add a URL to the frontier if not already visited.
         
+        URLs deeper than ``max_depth`` are pruned here rather than popped
+        and dropped later.
+        
+        Args:
+            url: The URL to queue
+            depth: Link depth from the source URL
+            discovered_from: URL of the page that linked here
+        
         Returns:
-            True if the URL was added, False if already visited
+            True if the URL was added, False if visited, queued or too deep
         """
-        if self.is_url_visited(url):
+        if depth > self.max_depth or self.is_url_visited(url):
             return False
         
-        # Check if URL is already in frontier
-        if url in self.frontier:
-            return False
+        # Membership check is O(1) via the frontier's URL index
+        return self.frontier.append(url, depth=depth, discovered_from=discovered_from)
+    
+    def pop_frontier_entry(self) -> FrontierEntry | None:
+        """Pop the highest-priority frontier entry.
         
-        self.frontier.append(url)
-        return True
+        Returns:
+            The next entry to visit, or None if frontier is empty
+        """
+        if not self.frontier:
+            return None
+        return self.frontier.pop()
     
     def pop_frontier(self) -> str | None:
         """Pop the next URL from the frontier.
@@ -261,9 +780,8 @@ class CrawlState:
         Returns:
             The next URL to visit, or None if frontier is empty
         """
-        if not self.frontier:
-            return None
-        return self.frontier.pop(0)
+        entry = self.pop_frontier_entry()
+        return entry.url if entry is not None else None
     
     @property
     def frontier_size(self) -> int:
@@ -289,9 +807,12 @@ class CrawlStateStorage:
     writes via the GitHub API instead of the local filesystem.
     """
     
-    # Maximum URLs to keep in memory frontier (rest goes to overflow)
+    # Maximum URLs to keep in memory frontier (rest is spilled to disk)
     MAX_FRONTIER_IN_MEMORY = 1000
     
+    # Entries per frontier spill segment file
+    FRONTIER_SEGMENT_SIZE = DEFAULT_SEGMENT_SIZE
+    
     def __init__(
         self,
         root: Path | None = None,
@@ -324,11 +845,74 @@ class CrawlStateStorage:
         """Get the path for the frontier overflow file."""
         return self._get_state_dir(source_hash) / "frontier_overflow.jsonl"
     
+    def _get_frontier_spill_dir(self, source_hash: str) -> Path:
+        """Get the directory for the frontier spill segments."""
+        return self._get_state_dir(source_hash) / SPILL_DIRNAME
+    
+    def _attach_spill(
+        self,
+        state: CrawlState,
+        data: dict[str, Any] | None = None,
+        spilled: dict[str, Any] | None = None,
+    ) -> None:
+        """Back the state's frontier with its on-disk spill.
+        
+        Args:
+            state: The crawl state
+            data: Spill pointers from the state snapshot, if any
+            spilled: Spilled-URL digests from the state snapshot, if any
+        """
+        spill = FrontierSpill.restore(self._get_frontier_spill_dir(state.source_hash), data)
+        if data is None:
+            spill.segment_size = self.FRONTIER_SEGMENT_SIZE
+        digests = VisitedSet.from_dict(spilled) if spilled is not None else None
+        state.frontier.attach_spill(spill, self.MAX_FRONTIER_IN_MEMORY, digests)
+    
+    def get_robots_cache_dir(self) -> Path:
+        """Get the directory caching fetched robots.txt files."""
+        return self._crawls_dir / ROBOTS_CACHE_DIRNAME
+    
+    def get_journal_path(self, source_hash: str) -> Path:
+        """Get the path for the crawl event journal."""
+        return self._get_state_dir(source_hash) / JOURNAL_FILENAME
+    
+    def open_journal(
+        self,
+        source_hash: str,
+        *,
+        sync_every: int = DEFAULT_SYNC_EVERY,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+    ) -> CrawlJournal:
+        """Open the event journal for a crawl.
+        
+        The journal always lives on the local filesystem; in GitHub mode
+        only snapshots written by :meth:`compact` are committed.
+        
+        Args:
+            source_hash: The crawl's source hash
+            sync_every: fsync after this many records
+            compact_bytes: Journal size at which compaction is due
+        """
+        return CrawlJournal(
+            self.get_journal_path(source_hash),
+            sync_every=sync_every,
+            compact_bytes=compact_bytes,
+        )
+    
+    def compact(self, state: CrawlState, journal: CrawlJournal) -> None:
+        """Fold the journal into a fresh state snapshot and discard it."""
+        self.save_state(state)
+        journal.reset()
+    
     def save_state(self, state: CrawlState) -> None:
         """Save crawl state to storage.
         
-        If the frontier exceeds MAX_FRONTIER_IN_MEMORY, excess URLs are
-        written to a separate overflow file.
+        Only the in-memory frontier window goes into the state file; the
+        rest of the frontier lives in append-only spill segments, of which
+        only those appended to since the last save are written out, so the
+        cost of a save does not grow with the frontier. The digests of
+        spilled URLs are saved too (8 bytes each), so loading never has to
+        read the spill.
         """
         state_dir = self._get_state_dir(state.source_hash)
         utils.ensure_directory(state_dir)
@@ -336,27 +920,26 @@ class CrawlStateStorage:
         state_path = self._get_state_path(state.source_hash)
         overflow_path = self._get_frontier_overflow_path(state.source_hash)
         
-        # Handle frontier overflow
-        frontier_to_save = state.frontier
-        overflow_urls: List[str] = []
+        if state.frontier.spill is None:
+            self._attach_spill(state)
+        spill = state.frontier.spill
+        spill.sync()
         
-        if len(state.frontier) > self.MAX_FRONTIER_IN_MEMORY:
-            frontier_to_save = state.frontier[:self.MAX_FRONTIER_IN_MEMORY]
-            overflow_urls = state.frontier[self.MAX_FRONTIER_IN_MEMORY:]
-        
-        # Create a copy of state with truncated frontier for serialization
         state_data = state.to_dict()
-        state_data["frontier"] = frontier_to_save
-        state_data["frontier_overflow_count"] = len(overflow_urls)
+        state_data["frontier_overflow_count"] = len(spill)
+        state_data["frontier_spill"] = spill.to_dict()
+        state_data["frontier_spilled"] = state.frontier.spilled_digests.to_dict()
         
         state_content = json.dumps(state_data, indent=2)
         
         if self._github_client:
-            files_to_commit = [(self._get_relative_path(state_path), state_content)]
-            
-            if overflow_urls:
-                overflow_content = "\n".join(json.dumps({"url": url}) for url in overflow_urls)
-                files_to_commit.append((self._get_relative_path(overflow_path), overflow_content))
+            files_to_commit: List[tuple[str, str | bytes]] = [
+                (self._get_relative_path(state_path), state_content)
+            ]
+            files_to_commit.extend(
+                (self._get_relative_path(path), path.read_bytes())
+                for path in spill.dirty_segments()
+            )
             
             self._github_client.commit_files_batch(
                 files=files_to_commit,
@@ -368,15 +951,11 @@ class CrawlStateStorage:
             tmp_path.write_text(state_content, encoding="utf-8")
             tmp_path.replace(state_path)
             
-            # Write overflow if present
-            if overflow_urls:
-                overflow_content = "\n".join(json.dumps({"url": url}) for url in overflow_urls)
-                tmp_overflow = overflow_path.with_suffix(".jsonl.tmp")
-                tmp_overflow.write_text(overflow_content, encoding="utf-8")
-                tmp_overflow.replace(overflow_path)
-            elif overflow_path.exists():
-                # Remove overflow file if no longer needed
-                overflow_path.unlink()
+            # Overflow files from before spill segments are migrated on load
+            overflow_path.unlink(missing_ok=True)
+        
+        # Segments behind the saved head are no longer needed
+        spill.checkpoint()
     
     def load_state(self, source_url: str) -> CrawlState | None:
         """Load crawl state for a source URL.
@@ -407,16 +986,21 @@ class CrawlStateStorage:
         try:
             data = json.loads(state_path.read_text(encoding="utf-8"))
             state = CrawlState.from_dict(data)
+            self._attach_spill(state, data.get("frontier_spill"), data.get("frontier_spilled"))
             
-            # Load overflow URLs if present
+            # States saved before spill segments keep overflow in one file
             overflow_path = self._get_frontier_overflow_path(source_hash)
-            if overflow_path.exists() and state.frontier_overflow_count > 0:
-                overflow_lines = overflow_path.read_text(encoding="utf-8").strip().split("\n")
-                for line in overflow_lines:
-                    if line:
-                        url_data = json.loads(line)
-                        state.frontier.append(url_data["url"])
-                state.frontier_overflow_count = 0  # All URLs now in memory
+            if "frontier_spill" not in data and overflow_path.exists():
+                with overflow_path.open("r", encoding="utf-8") as handle:
+                    state.frontier.extend(
+                        FrontierEntry.from_dict(json.loads(line)) for line in handle if line.strip()
+                    )
+            state.frontier_overflow_count = 0  # Spilled URLs are counted by the frontier
+            
+            # Apply events recorded since the snapshot was written
+            replayed = CrawlJournal(self.get_journal_path(source_hash)).replay(state)
+            if replayed:
+                logger.info("Replayed %d journal records for crawl %s", replayed, source_hash)
             
             return state
         except (json.JSONDecodeError, KeyError):
@@ -1,11 +1,13 @@
 """Source change detection and monitoring utilities.
 
 This module provides the core functionality for detecting content changes
-in registered sources. It implements a tiered detection strategy:
+in registered sources. Each check is one conditional GET:
 
-1. ETag comparison (cheapest - HEAD request only)
-2. Last-Modified comparison (HEAD request)
-3. Content hash comparison (requires full GET)
+1. ETag / Last-Modified validators are sent as If-None-Match and
+   If-Modified-Since; a 304 response means unchanged without a body
+2. Otherwise the body is compared with what was last acquired: HTML by its
+   normalized content fingerprint, anything else by content hash (the only
+   signal for servers that support neither validator)
 
 The Monitor Agent uses these utilities to queue sources for acquisition
 when changes are detected.
@@ -13,14 +15,18 @@ when changes are detected.
 
 from __future__ import annotations
 
+import hashlib
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Iterator, Literal
 
 import requests
+import urllib3
 from requests.exceptions import SSLError
 
-from src.parsing import utils
+from src.parsing.content_fingerprint import html_fingerprint
+from src.parsing.http import DEFAULT_MAX_BYTES, decode_html, is_html_content_type
 
 if TYPE_CHECKING:
     from .storage import SourceEntry, SourceRegistry
@@ -45,6 +51,15 @@ MAX_BACKOFF_INTERVAL = timedelta(days=7)
 # Maximum consecutive failures before marking source degraded
 MAX_FAILURES_BEFORE_DEGRADED = 5
 
+# Response bytes hashed per check; longer bodies get a truncated hash
+DEFAULT_MAX_HASH_BYTES = 64 * 1024 * 1024
+
+# Wall-clock limit for reading one response body
+DEFAULT_HASH_DEADLINE_SECONDS = 60.0
+
+# Bytes read from the response per hash update
+HASH_CHUNK_BYTES = 64 * 1024
+
 
 # =============================================================================
 # Data Classes
@@ -76,9 +91,11 @@ class CheckResult:
     etag: str | None = None
     last_modified: str | None = None
     content_hash: str | None = None
+    content_hash_bytes: int | None = None  # Set when only this many leading bytes were hashed
+    content_fingerprint: str | None = None  # Normalized main-text fingerprint (HTML only)
 
     # Change details (if status == "changed" or "initial")
-    detection_method: str | None = None  # "initial" | "etag" | "last_modified" | "content_hash"
+    detection_method: str | None = None  # "initial" | "content_hash" | "content_fingerprint"
 
     # Error details (if status == "error")
     error_message: str | None = None
@@ -93,6 +110,8 @@ class CheckResult:
             "etag": self.etag,
             "last_modified": self.last_modified,
             "content_hash": self.content_hash,
+            "content_hash_bytes": self.content_hash_bytes,
+            "content_fingerprint": self.content_fingerprint,
             "detection_method": self.detection_method,
             "error_message": self.error_message,
         }
@@ -107,7 +126,7 @@ class ChangeDetection:
     detected_at: datetime  # When change/need was detected
 
     # Detection context
-    detection_method: str  # "initial" | "etag" | "last_modified" | "content_hash"
+    detection_method: str  # "initial" | "content_hash" | "content_fingerprint"
     change_type: str  # "initial" | "content" | "metadata"
 
     # Previous state (None for initial acquisition)
@@ -216,6 +235,104 @@ def calculate_urgency(source: "SourceEntry", is_initial: bool) -> str:
     return "low"
 
 
+def conditional_headers(source: "SourceEntry") -> dict[str, str]:
+    """Build conditional request headers from a source's stored validators.
+    
+    Args:
+        source: The source entry with last_etag and last_modified_header
+        
+    Returns:
+        dict[str, str]: If-None-Match / If-Modified-Since headers (may be empty)
+    """
+    headers: dict[str, str] = {}
+    if source.last_etag:
+        headers["If-None-Match"] = source.last_etag
+    if source.last_modified_header:
+        headers["If-Modified-Since"] = source.last_modified_header
+    return headers
+
+
+def _iter_body(response: requests.Response, deadline: float) -> Iterator[bytes]:
+    """Yield decoded body chunks as they arrive, stopping at ``deadline``.
+    
+    A plain streamed read blocks until a whole chunk has arrived, so a
+    server trickling bytes would never be cut off. Each read here returns
+    whatever one socket read delivers, and the socket timeout is lowered to
+    the time left, so no read outlasts the deadline.
+    
+    Raises:
+        TimeoutError: If the deadline passes before the body ends.
+    """
+    raw = response.raw
+    if not isinstance(raw, urllib3.HTTPResponse) or not hasattr(raw, "read1"):
+        # Without read1 (urllib3 1.x) reads are bounded by the read timeout only
+        yield from response.iter_content(chunk_size=HASH_CHUNK_BYTES)
+        return
+    
+    sock = getattr(raw.connection, "sock", None)
+    read_timeout = sock.gettimeout() if sock is not None else None
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            if sock is not None:
+                sock.settimeout(remaining if read_timeout is None else min(remaining, read_timeout))
+            try:
+                chunk = raw.read1(HASH_CHUNK_BYTES, decode_content=True)
+            except urllib3.exceptions.ReadTimeoutError as e:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError from e
+                raise requests.exceptions.ConnectionError(e) from e
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        if sock is not None and sock.fileno() != -1:
+            sock.settimeout(read_timeout)
+
+
+def _hash_body(
+    response: requests.Response,
+    limit: int,
+    deadline: float,
+    keep_bytes: int = 0,
+) -> tuple[str, int | None, bytes | None] | None:
+    """Hash a streamed response body, reading at most ``limit`` bytes.
+    
+    Args:
+        response: Response opened with ``stream=True``
+        limit: Most bytes to hash
+        deadline: ``time.monotonic()`` value by which reading must finish
+        keep_bytes: Also return the body if it is complete and no longer
+            than this
+        
+    Returns:
+        (sha256 hex digest, bytes hashed if the body was longer than
+        ``limit`` else None, the body if kept), or None if the deadline
+        passed first.
+    """
+    digest = hashlib.sha256()
+    hashed = 0
+    kept: bytearray | None = bytearray() if keep_bytes > 0 else None
+    try:
+        for chunk in _iter_body(response, deadline):
+            if time.monotonic() > deadline:
+                return None
+            if hashed + len(chunk) > limit:
+                digest.update(chunk[: limit - hashed])
+                return digest.hexdigest(), limit, None
+            digest.update(chunk)
+            hashed += len(chunk)
+            if kept is not None:
+                kept.extend(chunk)
+                if len(kept) > keep_bytes:
+                    kept = None
+    except TimeoutError:
+        return None
+    return digest.hexdigest(), None, bytes(kept) if kept is not None else None
+
+
 # =============================================================================
 # Source Monitor Class
 # =============================================================================
@@ -225,15 +342,24 @@ def calculate_urgency(source: "SourceEntry", is_initial: bool) -> str:
 class SourceMonitor:
     """Monitors sources for content changes.
     
-    Uses a tiered detection strategy:
-    1. ETag comparison (HEAD request)
-    2. Last-Modified comparison (HEAD request)
-    3. Content hash comparison (GET request, only if tiers 1-2 indicate change)
+    Each check is a single GET carrying the source's stored validators:
+    1. 304 Not Modified: unchanged, no body transferred
+    2. HTML body: its content fingerprint (normalized main text, see
+       ``src.parsing.content_fingerprint``) is compared with the one the
+       crawler stored, so markup-only churn is not a change
+    3. Otherwise: content hash comparison on the returned body
+    
+    Bodies are streamed into the hash, so memory stays flat however large
+    the response. At most ``max_hash_bytes`` are hashed; a longer body gets
+    a hash of its leading bytes only (see ``CheckResult.content_hash_bytes``).
+    Reading a body for longer than ``hash_deadline_seconds`` fails the check.
     """
 
     registry: "SourceRegistry"
     timeout: float = 10.0
     user_agent: str = "speculum-principum-monitor/1.0"
+    max_hash_bytes: int = DEFAULT_MAX_HASH_BYTES
+    hash_deadline_seconds: float = DEFAULT_HASH_DEADLINE_SECONDS
     _session: requests.Session = field(default_factory=requests.Session, repr=False)
 
     def __post_init__(self) -> None:
@@ -278,11 +404,11 @@ class SourceMonitor:
         source: "SourceEntry",
         force_full: bool = False,
     ) -> CheckResult:
-        """Check a source for changes using tiered detection.
+        """Check a source for changes with one conditional request.
         
         Args:
             source: The source to check
-            force_full: If True, skip tiered detection and do full hash comparison
+            force_full: If True, send no validators and always compare hashes
             
         Returns:
             CheckResult: Result of the check
@@ -298,25 +424,9 @@ class SourceMonitor:
                 detection_method="initial",
             )
 
-        # Mode 2: Update monitoring with tiered detection
+        # Mode 2: Update monitoring with one conditional GET
         try:
-            if not force_full:
-                # Tier 1: Check ETag
-                etag_result = self._check_etag(source)
-                if etag_result is not None:
-                    if etag_result.status == "unchanged":
-                        return etag_result
-                    # ETag changed, proceed to verify with content hash
-
-                # Tier 2: Check Last-Modified (if no ETag or ETag changed)
-                modified_result = self._check_last_modified(source)
-                if modified_result is not None:
-                    if modified_result.status == "unchanged":
-                        return modified_result
-                    # Last-Modified indicates change, verify with content hash
-
-            # Tier 3: Full content hash comparison
-            return self._check_content_hash(source)
+            return self._check_conditional(source, force_full)
 
         except requests.Timeout:
             return CheckResult(
@@ -340,113 +450,95 @@ class SourceMonitor:
                 error_message=str(e),
             )
 
-    def _check_etag(self, source: "SourceEntry") -> CheckResult | None:
-        """Check if ETag has changed (Tier 1).
+    def _check_conditional(self, source: "SourceEntry", force_full: bool) -> CheckResult:
+        """Check for changes with a single conditional GET.
         
-        Returns:
-            CheckResult if ETag comparison is conclusive, None otherwise
+        The stored ETag and Last-Modified values are sent as
+        ``If-None-Match`` and ``If-Modified-Since``. A 304 means unchanged
+        and carries no body. Any other success response has its body hashed
+        and compared with the stored hash, which also catches servers whose
+        validators change without the content changing.
         """
-        if source.last_etag is None:
-            # No previous ETag to compare
-            return None
-
         now = datetime.now(timezone.utc)
-        response = self._session.head(source.url, timeout=self.timeout, allow_redirects=True)
-        current_etag = response.headers.get("ETag")
-
-        if current_etag is None:
-            # Server doesn't provide ETag anymore
-            return None
-
-        if current_etag == source.last_etag:
-            return CheckResult(
-                source_url=source.url,
-                checked_at=now,
-                status="unchanged",
-                http_status=response.status_code,
-                etag=current_etag,
-            )
-
-        # ETag changed - need to verify with content hash
-        return CheckResult(
-            source_url=source.url,
-            checked_at=now,
-            status="changed",
-            http_status=response.status_code,
-            etag=current_etag,
-            detection_method="etag",
+        headers = {} if force_full else conditional_headers(source)
+        response = self._session.get(
+            source.url,
+            headers=headers,
+            timeout=self.timeout,
+            allow_redirects=True,
+            stream=True,
         )
+        try:
+            return self._evaluate_response(source, response, bool(headers), now)
+        finally:
+            response.close()
 
-    def _check_last_modified(self, source: "SourceEntry") -> CheckResult | None:
-        """Check if Last-Modified has changed (Tier 2).
-        
-        Returns:
-            CheckResult if Last-Modified comparison is conclusive, None otherwise
-        """
-        if source.last_modified_header is None:
-            # No previous Last-Modified to compare
-            return None
-
-        now = datetime.now(timezone.utc)
-        response = self._session.head(source.url, timeout=self.timeout, allow_redirects=True)
+    def _evaluate_response(
+        self,
+        source: "SourceEntry",
+        response: requests.Response,
+        conditional: bool,
+        now: datetime,
+    ) -> CheckResult:
+        """Classify a (streamed) check response."""
+        current_etag = response.headers.get("ETag")
         current_last_modified = response.headers.get("Last-Modified")
 
-        if current_last_modified is None:
-            # Server doesn't provide Last-Modified anymore
-            return None
-
-        if current_last_modified == source.last_modified_header:
+        if response.status_code == 304 and conditional:
             return CheckResult(
                 source_url=source.url,
                 checked_at=now,
                 status="unchanged",
                 http_status=response.status_code,
-                last_modified=current_last_modified,
+                etag=current_etag or source.last_etag,
+                last_modified=current_last_modified or source.last_modified_header,
             )
 
-        # Last-Modified changed - need to verify with content hash
-        return CheckResult(
-            source_url=source.url,
-            checked_at=now,
-            status="changed",
-            http_status=response.status_code,
-            last_modified=current_last_modified,
-            detection_method="last_modified",
-        )
-
-    def _check_content_hash(self, source: "SourceEntry") -> CheckResult:
-        """Check if content hash has changed (Tier 3).
-        
-        This performs a full GET request and computes the content hash.
-        """
-        now = datetime.now(timezone.utc)
-        response = self._session.get(source.url, timeout=self.timeout, allow_redirects=True)
         response.raise_for_status()
 
-        current_hash = utils.sha256_bytes(response.content)
-        current_etag = response.headers.get("ETag")
-        current_last_modified = response.headers.get("Last-Modified")
-
-        if current_hash == source.last_content_hash:
+        # A stored hash of a truncated body is compared over the same prefix
+        limit = self.max_hash_bytes
+        if source.last_content_hash_bytes is not None:
+            limit = min(limit, source.last_content_hash_bytes)
+        is_html = is_html_content_type(response.headers.get("Content-Type"))
+        hashed = _hash_body(
+            response,
+            limit,
+            time.monotonic() + self.hash_deadline_seconds,
+            keep_bytes=DEFAULT_MAX_BYTES if is_html else 0,
+        )
+        if hashed is None:
             return CheckResult(
                 source_url=source.url,
                 checked_at=now,
-                status="unchanged",
+                status="error",
                 http_status=response.status_code,
-                etag=current_etag,
-                last_modified=current_last_modified,
-                content_hash=current_hash,
+                error_message=f"Body not read within {self.hash_deadline_seconds:.0f}s",
             )
+        current_hash, hashed_bytes, body = hashed
+        fingerprint = None
+        if body is not None:
+            html, _encoding = decode_html(body, response)
+            fingerprint = html_fingerprint(html, source.url)
+
+        if fingerprint is not None and source.last_content_fingerprint is not None:
+            changed = fingerprint != source.last_content_fingerprint
+            method = "content_fingerprint"
+        else:
+            changed = current_hash != source.last_content_hash
+            method = "content_hash"
 
         return CheckResult(
             source_url=source.url,
             checked_at=now,
-            status="changed",
+            status="changed" if changed else "unchanged",
             http_status=response.status_code,
             etag=current_etag,
             last_modified=current_last_modified,
             content_hash=current_hash,
-            detection_method="content_hash",
+            content_hash_bytes=hashed_bytes,
+            content_fingerprint=fingerprint,
+            detection_method=method if changed else None,
         )
 
     def create_change_detection(
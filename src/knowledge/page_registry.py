@@ -18,7 +18,7 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterator, List
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List
 
 from src import paths
 from src.parsing import utils
@@ -54,6 +54,8 @@ class PageEntry:
         content_type: HTTP Content-Type header value
         error_message: Error message if fetch failed
         content_hash: SHA-256 hash of the fetched content
+        content_fingerprint: Normalized main-text fingerprint, used to spot
+            pages whose content did not change between fetches
         content_path: Relative path to stored content file
         content_size: Size of content in bytes
         extracted_chars: Number of characters extracted from content
@@ -82,6 +84,7 @@ class PageEntry:
     
     # Content (if fetched)
     content_hash: str | None = None
+    content_fingerprint: str | None = None
     content_path: str | None = None
     content_size: int | None = None
     extracted_chars: int | None = None
@@ -106,6 +109,7 @@ class PageEntry:
             "content_type": self.content_type,
             "error_message": self.error_message,
             "content_hash": self.content_hash,
+            "content_fingerprint": self.content_fingerprint,
             "content_path": self.content_path,
             "content_size": self.content_size,
             "extracted_chars": self.extracted_chars,
@@ -138,6 +142,7 @@ class PageEntry:
             content_type=data.get("content_type"),
             error_message=data.get("error_message"),
             content_hash=data.get("content_hash"),
+            content_fingerprint=data.get("content_fingerprint"),
             content_path=data.get("content_path"),
             content_size=data.get("content_size"),
             extracted_chars=data.get("extracted_chars"),
@@ -185,6 +190,7 @@ class PageEntry:
         title: str | None = None,
         outgoing_links_count: int | None = None,
         outgoing_links_in_scope: int | None = None,
+        content_fingerprint: str | None = None,
     ) -> None:
         """Mark the page as successfully fetched."""
         self.status = "fetched"
@@ -192,6 +198,7 @@ class PageEntry:
         self.http_status = http_status
         self.content_type = content_type
         self.content_hash = content_hash
+        self.content_fingerprint = content_fingerprint
         self.content_path = content_path
         self.content_size = content_size
         self.extracted_chars = extracted_chars
@@ -263,15 +270,106 @@ class PageBatch:
         return True
 
 
+@dataclass
+class PageIndex:
+    """In-memory form of a crawl's ``registry.json``.
+    
+    Version 2 of the file stores, next to ``url_to_batch``, each page's
+    position inside its batch and its status, plus per-status counts. Point
+    lookups are then one dict hit and one batch read, status queries read
+    only the batches holding matching pages, and stats need no batch files.
+    Version 1 files are upgraded by scanning the batches once.
+    """
+    
+    url_to_batch: dict[str, int] = field(default_factory=dict)
+    url_to_position: dict[str, int] = field(default_factory=dict)
+    url_status: dict[str, str] = field(default_factory=dict)
+    current_batch: int = 0
+    by_status: dict[str, set[str]] = field(default_factory=dict, repr=False)
+    
+    VERSION = 2
+    
+    def __post_init__(self) -> None:
+        if not self.by_status:
+            for url_hash, status in self.url_status.items():
+                self.by_status.setdefault(status, set()).add(url_hash)
+    
+    def __len__(self) -> int:
+        return len(self.url_to_batch)
+    
+    def __contains__(self, url_hash: object) -> bool:
+        return url_hash in self.url_to_batch
+    
+    @property
+    def status_counts(self) -> dict[str, int]:
+        """Number of pages per status."""
+        return {status: len(hashes) for status, hashes in self.by_status.items() if hashes}
+    
+    def locate(self, url_hash: str) -> tuple[int, int | None] | None:
+        """Return ``(batch_number, position)`` for a page, or None."""
+        batch_number = self.url_to_batch.get(url_hash)
+        if batch_number is None:
+            return None
+        return batch_number, self.url_to_position.get(url_hash)
+    
+    def record(self, page: PageEntry, batch_number: int, position: int) -> None:
+        """Record where ``page`` is stored and update the status counters."""
+        url_hash = page.url_hash
+        previous = self.url_status.get(url_hash)
+        if previous is not None:
+            self.by_status.get(previous, set()).discard(url_hash)
+        self.url_to_batch[url_hash] = batch_number
+        self.url_to_position[url_hash] = position
+        self.url_status[url_hash] = page.status
+        self.by_status.setdefault(page.status, set()).add(url_hash)
+    
+    def locations_with_status(self, status: str) -> dict[int, list[int]]:
+        """Map batch number to sorted positions of pages with ``status``."""
+        locations: dict[int, list[int]] = {}
+        for url_hash in self.by_status.get(status, ()):
+            position = self.url_to_position.get(url_hash)
+            if position is not None:
+                locations.setdefault(self.url_to_batch[url_hash], []).append(position)
+        for positions in locations.values():
+            positions.sort()
+        return locations
+    
+    def to_dict(self, source_hash: str) -> dict[str, Any]:
+        """Serialize to the ``registry.json`` layout."""
+        return {
+            "version": self.VERSION,
+            "source_hash": source_hash,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "total_pages": len(self),
+            "current_batch": self.current_batch,
+            "status_counts": self.status_counts,
+            "url_to_batch": self.url_to_batch,
+            "url_to_position": self.url_to_position,
+            "url_status": self.url_status,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PageIndex":
+        """Deserialize; version 1 data has no positions or statuses yet."""
+        return cls(
+            url_to_batch=data.get("url_to_batch", {}),
+            url_to_position=data.get("url_to_position", {}),
+            url_status=data.get("url_status", {}),
+            current_batch=data.get("current_batch", 0),
+        )
+
+
 class PageRegistry:
     """Manages storage of page entries for crawls.
     
     Pages are stored in batched files to handle large crawls. The registry
-    maintains an index mapping URL hashes to batch numbers for fast lookups.
+    maintains an index (see :class:`PageIndex`) locating every page by batch
+    and position, with its status, for fast lookups. Parsed indexes are
+    cached per crawl and reloaded when ``registry.json`` changes on disk.
     
     Storage layout:
         knowledge-graph/crawls/{source_hash}/
-            registry.json          # Index: url_hash -> batch_number
+            registry.json          # Index: url_hash -> batch, position, status
             pages_0000.json        # Batch 0: pages 0-499
             pages_0001.json        # Batch 1: pages 500-999
             ...
@@ -291,6 +389,7 @@ class PageRegistry:
         self._project_root = project_root or Path.cwd()
         self._crawls_dir = self.root / "crawls"
         utils.ensure_directory(self._crawls_dir)
+        self._index_cache: dict[str, tuple[tuple[int, int, int] | None, PageIndex]] = {}
     
     def _get_relative_path(self, path: Path) -> str:
         """Get path relative to project root for GitHub API."""
@@ -311,38 +410,57 @@ class PageRegistry:
         """Get the path for a page batch file."""
         return self._get_crawl_dir(source_hash) / f"pages_{batch_number:04d}.json"
     
-    def _load_registry_index(self, source_hash: str) -> dict[str, int]:
-        """Load the registry index mapping URL hashes to batch numbers."""
-        registry_path = self._get_registry_path(source_hash)
-        
-        if not registry_path.exists():
-            return {}
-        
+    def _index_state(self, source_hash: str) -> tuple[int, int, int] | None:
         try:
-            data = json.loads(registry_path.read_text(encoding="utf-8"))
-            return data.get("url_to_batch", {})
-        except (json.JSONDecodeError, KeyError):
-            return {}
+            stat = self._get_registry_path(source_hash).stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
     
-    def _save_registry_index(
-        self,
-        source_hash: str,
-        index: dict[str, int],
-        current_batch: int,
-    ) -> None:
+    def _load_index(self, source_hash: str, *, for_update: bool = False) -> PageIndex:
+        """Load the crawl's index, from cache when ``registry.json`` is unchanged.
+        
+        With ``for_update`` the cached copy is handed over to the caller,
+        which must write it back through :meth:`_write`.
+        """
+        state = self._index_state(source_hash)
+        cached = self._index_cache.get(source_hash)
+        if cached is not None and cached[0] == state:
+            if for_update:
+                del self._index_cache[source_hash]
+            return cached[1]
+        
+        index = PageIndex()
+        if state is not None:
+            try:
+                data = json.loads(self._get_registry_path(source_hash).read_text(encoding="utf-8"))
+                index = PageIndex.from_dict(data)
+                if data.get("version", 1) < PageIndex.VERSION:
+                    index = self._upgrade_index(source_hash, index)
+            except (json.JSONDecodeError, KeyError):
+                index = PageIndex()
+        if not for_update:
+            self._index_cache[source_hash] = (state, index)
+        return index
+    
+    def _upgrade_index(self, source_hash: str, legacy: PageIndex) -> PageIndex:
+        """Build a version 2 index from a version 1 index and its batches."""
+        index = PageIndex(current_batch=legacy.current_batch)
+        for batch_number in sorted(set(legacy.url_to_batch.values()) | {legacy.current_batch}):
+            batch = self._load_batch(source_hash, batch_number)
+            if batch is None:
+                continue
+            for position, page in enumerate(batch.pages):
+                if page.url_hash in legacy.url_to_batch:
+                    index.record(page, batch_number, position)
+        return index
+    
+    def _save_registry_index(self, source_hash: str, index: PageIndex) -> None:
         """Save the registry index."""
         registry_path = self._get_registry_path(source_hash)
         utils.ensure_directory(registry_path.parent)
         
-        data = {
-            "version": 1,
-            "source_hash": source_hash,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "total_pages": len(index),
-            "current_batch": current_batch,
-            "url_to_batch": index,
-        }
-        content = json.dumps(data, indent=2)
+        content = json.dumps(index.to_dict(source_hash), indent=2)
         
         if self._github_client:
             rel_path = self._get_relative_path(registry_path)
@@ -388,18 +506,58 @@ class PageRegistry:
             tmp_path.write_text(content, encoding="utf-8")
             tmp_path.replace(batch_path)
     
+    def _write(
+        self,
+        source_hash: str,
+        batches: List[PageBatch],
+        index: PageIndex,
+        message: str,
+    ) -> None:
+        """Persist batches, then the index (one commit in GitHub mode)."""
+        utils.ensure_directory(self._get_crawl_dir(source_hash))
+        
+        if self._github_client:
+            files = [
+                (
+                    self._get_relative_path(self._get_batch_path(source_hash, batch.batch_number)),
+                    json.dumps(batch.to_dict(), indent=2),
+                )
+                for batch in batches
+            ]
+            files.append(
+                (
+                    self._get_relative_path(self._get_registry_path(source_hash)),
+                    json.dumps(index.to_dict(source_hash), indent=2),
+                )
+            )
+            self._github_client.commit_files_batch(files=files, message=message)
+        else:
+            for batch in batches:
+                self._save_batch(source_hash, batch)
+            self._save_registry_index(source_hash, index)
+        
+        # Readers reload the index written above on their next lookup
+        self._index_cache.pop(source_hash, None)
+    
     def _get_current_batch_number(self, source_hash: str) -> int:
         """Get the current batch number from the registry."""
-        registry_path = self._get_registry_path(source_hash)
+        return self._load_index(source_hash).current_batch
+    
+    def session(
+        self,
+        source_hash: str,
+        *,
+        flush_every: int | None = None,
+    ) -> "PageRegistrySession":
+        """Open a write-back session for one crawl.
         
-        if not registry_path.exists():
-            return 0
+        Use as a context manager; see :class:`PageRegistrySession`.
         
-        try:
-            data = json.loads(registry_path.read_text(encoding="utf-8"))
-            return data.get("current_batch", 0)
-        except (json.JSONDecodeError, KeyError):
-            return 0
+        Args:
+            source_hash: The source hash whose pages will be saved
+            flush_every: Also flush after this many saved pages (optional)
+        """
+        return PageRegistrySession(self, source_hash, flush_every=flush_every)
     
     def save_page(self, page: PageEntry, source_hash: str) -> None:
         """Save a page entry to the registry.
@@ -411,73 +569,38 @@ class PageRegistry:
             page: The PageEntry to save
             source_hash: The source hash this page belongs to
         """
-        crawl_dir = self._get_crawl_dir(source_hash)
-        utils.ensure_directory(crawl_dir)
-        
-        # Load registry index
-        index = self._load_registry_index(source_hash)
-        current_batch_num = self._get_current_batch_number(source_hash)
+        index = self._load_index(source_hash, for_update=True)
+        location = index.locate(page.url_hash)
         
-        # Check if page already exists
-        if page.url_hash in index:
+        if location is not None:
             # Update existing page in its batch
-            batch_num = index[page.url_hash]
-            batch = self._load_batch(source_hash, batch_num)
-            if batch:
-                for i, p in enumerate(batch.pages):
-                    if p.url_hash == page.url_hash:
-                        batch.pages[i] = page
-                        break
-                self._save_batch(source_hash, batch)
+            batch = self._load_batch(source_hash, location[0])
+            if batch is None:
+                return
+            position = _store_page(batch, page, location[1])
+            index.record(page, batch.batch_number, position)
+            self._write(source_hash, [batch], index, f"Update page in registry for {source_hash[:8]}")
             return
         
         # Load or create current batch
-        batch = self._load_batch(source_hash, current_batch_num)
+        batch = self._load_batch(source_hash, index.current_batch)
         if batch is None:
             batch = PageBatch(
-                batch_number=current_batch_num,
+                batch_number=index.current_batch,
                 source_hash=source_hash,
             )
         
         # Check if batch is full
         if batch.is_full:
-            current_batch_num += 1
+            index.current_batch += 1
             batch = PageBatch(
-                batch_number=current_batch_num,
+                batch_number=index.current_batch,
                 source_hash=source_hash,
             )
         
-        # Add page to batch
+        index.record(page, batch.batch_number, len(batch.pages))
         batch.add_page(page)
-        index[page.url_hash] = current_batch_num
-        
-        # Save batch and index
-        if self._github_client:
-            # Batch commit for efficiency
-            batch_path = self._get_batch_path(source_hash, batch.batch_number)
-            registry_path = self._get_registry_path(source_hash)
-            
-            batch_content = json.dumps(batch.to_dict(), indent=2)
-            index_data = {
-                "version": 1,
-                "source_hash": source_hash,
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "total_pages": len(index),
-                "current_batch": current_batch_num,
-                "url_to_batch": index,
-            }
-            index_content = json.dumps(index_data, indent=2)
-            
-            self._github_client.commit_files_batch(
-                files=[
-                    (self._get_relative_path(batch_path), batch_content),
-                    (self._get_relative_path(registry_path), index_content),
-                ],
-                message=f"Add page to registry for {source_hash[:8]}",
-            )
-        else:
-            self._save_batch(source_hash, batch)
-            self._save_registry_index(source_hash, index, current_batch_num)
+        self._write(source_hash, [batch], index, f"Add page to registry for {source_hash[:8]}")
     
     def save_pages_batch(self, pages: List[PageEntry], source_hash: str) -> None:
         """Save multiple pages to the registry efficiently.
@@ -492,81 +615,55 @@ class PageRegistry:
         if not pages:
             return
         
-        crawl_dir = self._get_crawl_dir(source_hash)
-        utils.ensure_directory(crawl_dir)
-        
-        # Load registry index
-        index = self._load_registry_index(source_hash)
-        current_batch_num = self._get_current_batch_number(source_hash)
+        with self.session(source_hash) as session:
+            for page in pages:
+                session.save_page(page)
+    
+    def replace_pages(self, source_hash: str, pages: Iterable[PageEntry]) -> int:
+        """Rewrite a crawl's batches and index from ``pages``, in order.
         
-        # Load current batch
-        batch = self._load_batch(source_hash, current_batch_num)
-        if batch is None:
-            batch = PageBatch(
-                batch_number=current_batch_num,
-                source_hash=source_hash,
-            )
+        Existing pages of the crawl are discarded. Locally, full batches are
+        written as they fill and stale batch files are removed afterwards;
+        in GitHub mode everything goes into one commit. ``pages`` must not
+        repeat a URL.
         
-        # Track modified batches
-        modified_batches: dict[int, PageBatch] = {current_batch_num: batch}
+        Args:
+            source_hash: The source hash the pages belong to
+            pages: The pages to store
+            
+        Returns:
+            Number of pages written
+        """
+        self._index_cache.pop(source_hash, None)
+        index = PageIndex()
+        pending: List[PageBatch] = []
+        batch = PageBatch(batch_number=0, source_hash=source_hash)
         
         for page in pages:
-            # Check if page already exists (update case)
-            if page.url_hash in index:
-                existing_batch_num = index[page.url_hash]
-                if existing_batch_num not in modified_batches:
-                    existing_batch = self._load_batch(source_hash, existing_batch_num)
-                    if existing_batch:
-                        modified_batches[existing_batch_num] = existing_batch
-                
-                if existing_batch_num in modified_batches:
-                    for i, p in enumerate(modified_batches[existing_batch_num].pages):
-                        if p.url_hash == page.url_hash:
-                            modified_batches[existing_batch_num].pages[i] = page
-                            break
-                continue
-            
-            # Add to current batch or create new one
             if batch.is_full:
-                current_batch_num += 1
-                batch = PageBatch(
-                    batch_number=current_batch_num,
-                    source_hash=source_hash,
-                )
-                modified_batches[current_batch_num] = batch
-            
+                if self._github_client:
+                    pending.append(batch)
+                else:
+                    self._save_batch(source_hash, batch)
+                batch = PageBatch(batch_number=batch.batch_number + 1, source_hash=source_hash)
+            index.record(page, batch.batch_number, len(batch.pages))
             batch.add_page(page)
-            index[page.url_hash] = current_batch_num
         
-        # Save all modified batches
-        if self._github_client:
-            files_to_commit = []
-            
-            for batch_num, batch_obj in modified_batches.items():
-                batch_path = self._get_batch_path(source_hash, batch_num)
-                batch_content = json.dumps(batch_obj.to_dict(), indent=2)
-                files_to_commit.append((self._get_relative_path(batch_path), batch_content))
-            
-            # Add registry index
-            registry_path = self._get_registry_path(source_hash)
-            index_data = {
-                "version": 1,
-                "source_hash": source_hash,
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "total_pages": len(index),
-                "current_batch": current_batch_num,
-                "url_to_batch": index,
-            }
-            files_to_commit.append((self._get_relative_path(registry_path), json.dumps(index_data, indent=2)))
-            
-            self._github_client.commit_files_batch(
-                files=files_to_commit,
-                message=f"Batch update page registry for {source_hash[:8]}",
-            )
-        else:
-            for batch_obj in modified_batches.values():
-                self._save_batch(source_hash, batch_obj)
-            self._save_registry_index(source_hash, index, current_batch_num)
+        index.current_batch = batch.batch_number
+        pending.append(batch)
+        self._write(
+            source_hash,
+            pending,
+            index,
+            f"Rewrite page registry for {source_hash[:8]} ({len(index)} pages)",
+        )
+        
+        if not self._github_client:
+            stale = batch.batch_number + 1
+            while self._get_batch_path(source_hash, stale).exists():
+                self._get_batch_path(source_hash, stale).unlink()
+                stale += 1
+        return len(index)
     
     def get_page(self, url: str, source_hash: str) -> PageEntry | None:
         """Get a page entry by URL.
@@ -591,22 +688,15 @@ class PageRegistry:
         Returns:
             The PageEntry if found, None otherwise
         """
-        index = self._load_registry_index(source_hash)
-        
-        if url_hash not in index:
+        location = self._load_index(source_hash).locate(url_hash)
+        if location is None:
             return None
         
-        batch_num = index[url_hash]
-        batch = self._load_batch(source_hash, batch_num)
-        
+        batch = self._load_batch(source_hash, location[0])
         if batch is None:
             return None
         
-        for page in batch.pages:
-            if page.url_hash == url_hash:
-                return page
-        
-        return None
+        return _find_page(batch, url_hash, location[1])
     
     def iterate_pages(self, source_hash: str) -> Iterator[PageEntry]:
         """Iterate over all pages for a source.
@@ -631,6 +721,8 @@ class PageRegistry:
     ) -> List[PageEntry]:
         """Get all pages with a specific status.
         
+        Only batches holding at least one matching page are read.
+        
         Args:
             source_hash: The source hash to filter by
             status: The status to filter by ("pending", "fetched", "failed", "skipped")
@@ -638,34 +730,194 @@ class PageRegistry:
         Returns:
             List of PageEntry objects matching the status
         """
-        return [p for p in self.iterate_pages(source_hash) if p.status == status]
+        locations = self._load_index(source_hash).locations_with_status(status)
+        pages: List[PageEntry] = []
+        for batch_number in sorted(locations):
+            batch = self._load_batch(source_hash, batch_number)
+            if batch is None:
+                continue
+            for position in locations[batch_number]:
+                if position < len(batch.pages) and batch.pages[position].status == status:
+                    pages.append(batch.pages[position])
+        return pages
     
     def get_stats(self, source_hash: str) -> dict[str, int]:
         """Get statistics for a crawl.
         
+        Counts come from the index; no batch files are read.
+        
         Args:
             source_hash: The source hash to get stats for
             
         Returns:
             Dictionary with counts by status
         """
-        stats = {
-            "total": 0,
-            "pending": 0,
-            "fetched": 0,
-            "failed": 0,
-            "skipped": 0,
-        }
-        
-        for page in self.iterate_pages(source_hash):
-            stats["total"] += 1
-            if page.status in stats:
-                stats[page.status] += 1
-        
+        index = self._load_index(source_hash)
+        counts = index.status_counts
+        stats = {"total": len(index)}
+        for status in ("pending", "fetched", "failed", "skipped"):
+            stats[status] = counts.get(status, 0)
         return stats
     
     def page_exists(self, url: str, source_hash: str) -> bool:
         """Check if a page exists in the registry."""
-        url_hash = _url_hash(url)
-        index = self._load_registry_index(source_hash)
-        return url_hash in index
+        return _url_hash(url) in self._load_index(source_hash)
+
+
+class PageRegistrySession:
+    """Write-back cache over one crawl's page registry.
+    
+    The index is read once when the session opens. Saved pages go into
+    batches held in memory; :meth:`flush` writes every batch touched since
+    the last flush and then the index, exactly once each (a single commit
+    in GitHub mode). Flushing happens on exit, including when the block
+    raises, and every ``flush_every`` pages if set.
+    
+    In GitHub mode batches are committed through the API without being
+    written locally, so flushed batches stay in memory for the session.
+    
+    Crash recovery: batch files are always written before the index, so a
+    crash mid-flush can leave pages in a batch file that the index does not
+    list yet. Such pages can only sit in the index's current batch or later
+    ones, so opening a session re-reads those batches and adds any missing
+    pages back to the index. Pages saved after the last completed flush are
+    lost, as they would be with an interrupted ``save_pages_batch``.
+    """
+    
+    def __init__(
+        self,
+        registry: PageRegistry,
+        source_hash: str,
+        *,
+        flush_every: int | None = None,
+    ) -> None:
+        self._registry = registry
+        self.source_hash = source_hash
+        self.flush_every = flush_every
+        self.batch_writes = 0
+        self.index_writes = 0
+        self._batches: dict[int, PageBatch] = {}
+        self._dirty: set[int] = set()
+        self._index_dirty = False
+        self._unflushed_pages = 0
+        self._index = registry._load_index(source_hash, for_update=True)
+        self._recover_unindexed_pages()
+    
+    def __enter__(self) -> "PageRegistrySession":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+    
+    def save_page(self, page: PageEntry) -> None:
+        """Add or update a page in memory."""
+        location = self._index.locate(page.url_hash)
+        if location is not None:
+            batch = self._batch(location[0])
+            position = _store_page(batch, page, location[1])
+        else:
+            batch = self._batch(self._index.current_batch)
+            if batch.is_full:
+                self._index.current_batch += 1
+                batch = self._batch(self._index.current_batch)
+            position = len(batch.pages)
+            batch.add_page(page)
+        self._index.record(page, batch.batch_number, position)
+        
+        self._index_dirty = True
+        self._dirty.add(batch.batch_number)
+        self._unflushed_pages += 1
+        if self.flush_every and self._unflushed_pages >= self.flush_every:
+            self.flush()
+    
+    def get_page(self, url: str) -> PageEntry | None:
+        """Get a page by URL, including unflushed changes."""
+        return self.get_page_by_hash(_url_hash(url))
+    
+    def get_page_by_hash(self, url_hash: str) -> PageEntry | None:
+        """Get a page by URL hash, including unflushed changes."""
+        location = self._index.locate(url_hash)
+        if location is None:
+            return None
+        return _find_page(self._batch(location[0]), url_hash, location[1])
+    
+    def page_exists(self, url: str) -> bool:
+        """Check if a page is registered, including unflushed pages."""
+        return _url_hash(url) in self._index
+    
+    def flush(self) -> None:
+        """Write dirty batches, then the index."""
+        if not self._dirty and not self._index_dirty:
+            return
+        
+        dirty = [self._batches[number] for number in sorted(self._dirty)]
+        self._registry._write(
+            self.source_hash,
+            dirty,
+            self._index,
+            f"Update page registry for {self.source_hash[:8]} ({self._unflushed_pages} pages)",
+        )
+        
+        self.batch_writes += len(dirty)
+        self.index_writes += 1
+        self._dirty.clear()
+        self._index_dirty = False
+        self._unflushed_pages = 0
+        # Full batches will not change again unless a page in them is updated,
+        # and can then be reloaded from disk. GitHub mode only commits through
+        # the API, so there the session's copy is the only one it can read.
+        if self._registry._github_client:
+            return
+        for number in [n for n in self._batches if n != self._index.current_batch]:
+            del self._batches[number]
+    
+    def _batch(self, batch_number: int) -> PageBatch:
+        batch = self._batches.get(batch_number)
+        if batch is None:
+            batch = self._registry._load_batch(self.source_hash, batch_number)
+            if batch is None:
+                batch = PageBatch(batch_number=batch_number, source_hash=self.source_hash)
+            self._batches[batch_number] = batch
+        return batch
+    
+    def _recover_unindexed_pages(self) -> None:
+        batch_number = self._index.current_batch
+        while True:
+            batch = self._registry._load_batch(self.source_hash, batch_number)
+            if batch is None:
+                break
+            self._batches[batch_number] = batch
+            for position, page in enumerate(batch.pages):
+                if page.url_hash not in self._index:
+                    self._index.record(page, batch_number, position)
+                    self._index_dirty = True
+            if batch_number != self._index.current_batch:
+                self._index.current_batch = batch_number
+                self._index_dirty = True
+            batch_number += 1
+
+
+def _find_page(batch: PageBatch, url_hash: str, position: int | None) -> PageEntry | None:
+    """Return the page at ``position``, falling back to a scan if it moved."""
+    if position is not None and position < len(batch.pages):
+        page = batch.pages[position]
+        if page.url_hash == url_hash:
+            return page
+    for page in batch.pages:
+        if page.url_hash == url_hash:
+            return page
+    return None
+
+
+def _store_page(batch: PageBatch, page: PageEntry, position: int | None) -> int:
+    """Replace ``page`` in ``batch`` and return its position."""
+    if position is not None and position < len(batch.pages):
+        if batch.pages[position].url_hash == page.url_hash:
+            batch.pages[position] = page
+            return position
+    for i, existing in enumerate(batch.pages):
+        if existing.url_hash == page.url_hash:
+            batch.pages[i] = page
+            return i
+    batch.pages.append(page)
+    return len(batch.pages) - 1
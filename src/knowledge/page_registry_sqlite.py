@@ -0,0 +1,301 @@
+"""SQLite-backed page registry for large crawls.
+
+:class:`SqlitePageRegistry` offers the same interface as
+:class:`~src.knowledge.page_registry.PageRegistry`, but keeps each crawl's
+pages in a single SQLite database instead of hundreds of JSON batch files.
+Saving a page is one upsert rather than a batch and index rewrite, and
+status queries and stats are answered from indexes.
+
+The database is a local working store and is not meant to be committed.
+:meth:`SqlitePageRegistry.export_json` regenerates the JSON batch layout
+from it so a crawl can still be reviewed in a pull request, and
+:meth:`SqlitePageRegistry.import_json` loads an existing JSON registry.
+
+Storage layout:
+    knowledge-graph/crawls/{source_hash}/
+        pages.sqlite3          # One row per page, in discovery order
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+from src import paths
+from src.parsing import utils
+
+from .page_registry import PageEntry, PageRegistry, _url_hash
+
+DATABASE_FILENAME = "pages.sqlite3"
+
+# Rows fetched per round trip while streaming pages
+_FETCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    url_hash TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL,
+    content_hash TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_status ON pages(status);
+CREATE INDEX IF NOT EXISTS idx_pages_content_hash ON pages(content_hash);
+"""
+
+_UPSERT = """
+INSERT INTO pages (url_hash, status, content_hash, data) VALUES (?, ?, ?, ?)
+ON CONFLICT(url_hash) DO UPDATE SET
+    status = excluded.status,
+    content_hash = excluded.content_hash,
+    data = excluded.data
+"""
+
+
+def _row(page: PageEntry) -> tuple[str, str, str | None, str]:
+    return (
+        page.url_hash,
+        page.status,
+        page.content_hash,
+        json.dumps(page.to_dict(), separators=(",", ":")),
+    )
+
+
+def _page(data: str) -> PageEntry:
+    return PageEntry.from_dict(json.loads(data))
+
+
+class SqlitePageRegistry:
+    """Stores crawl pages in one SQLite database per source.
+
+    Databases run in WAL mode so readers do not block the crawler while it
+    writes. Updating a page keeps its original position, so iteration and
+    :meth:`export_json` follow discovery order like the JSON batches do.
+
+    Connections stay open until :meth:`close`; the registry can be used as
+    a context manager. Only writes create a database: reads on a crawl
+    without one return no pages.
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        self.root = root or paths.get_knowledge_graph_root()
+        self.root = self.root if self.root.is_absolute() else self.root.resolve()
+        self._crawls_dir = self.root / "crawls"
+        utils.ensure_directory(self._crawls_dir)
+        self._connections: dict[str, sqlite3.Connection] = {}
+
+    def __enter__(self) -> "SqlitePageRegistry":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all open databases."""
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+
+    def get_database_path(self, source_hash: str) -> Path:
+        """Get the path of a crawl's database."""
+        return self._crawls_dir / source_hash / DATABASE_FILENAME
+
+    def _connect(self, source_hash: str) -> sqlite3.Connection:
+        conn = self._connections.get(source_hash)
+        if conn is None:
+            db_path = self.get_database_path(source_hash)
+            utils.ensure_directory(db_path.parent)
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._connections[source_hash] = conn
+        return conn
+
+    def _reader(self, source_hash: str) -> sqlite3.Connection | None:
+        """Connection for a read, or None if the crawl has no database yet."""
+        if source_hash not in self._connections and not self.get_database_path(source_hash).exists():
+            return None
+        return self._connect(source_hash)
+
+    def session(
+        self,
+        source_hash: str,
+        *,
+        flush_every: int | None = None,
+    ) -> "SqlitePageRegistrySession":
+        """Open a write-back session, as :meth:`PageRegistry.session` does."""
+        return SqlitePageRegistrySession(self, source_hash, flush_every=flush_every)
+
+    def save_page(self, page: PageEntry, source_hash: str) -> None:
+        """Insert or update a page entry.
+
+        Args:
+            page: The PageEntry to save
+            source_hash: The source hash this page belongs to
+        """
+        conn = self._connect(source_hash)
+        with conn:
+            conn.execute(_UPSERT, _row(page))
+
+    def save_pages_batch(self, pages: Iterable[PageEntry], source_hash: str) -> int:
+        """Upsert many pages in a single transaction.
+
+        Args:
+            pages: PageEntry objects to save; any iterable is consumed lazily
+            source_hash: The source hash these pages belong to
+
+        Returns:
+            Number of pages saved
+        """
+        conn = self._connect(source_hash)
+        with conn:
+            cursor = conn.executemany(_UPSERT, (_row(page) for page in pages))
+        return max(cursor.rowcount, 0)
+
+    def get_page(self, url: str, source_hash: str) -> PageEntry | None:
+        """Get a page entry by URL."""
+        return self.get_page_by_hash(_url_hash(url), source_hash)
+
+    def get_page_by_hash(self, url_hash: str, source_hash: str) -> PageEntry | None:
+        """Get a page entry by URL hash."""
+        conn = self._reader(source_hash)
+        if conn is None:
+            return None
+        row = conn.execute("SELECT data FROM pages WHERE url_hash = ?", (url_hash,)).fetchone()
+        return _page(row[0]) if row else None
+
+    def page_exists(self, url: str, source_hash: str) -> bool:
+        """Check if a page exists in the registry."""
+        conn = self._reader(source_hash)
+        if conn is None:
+            return False
+        row = conn.execute("SELECT 1 FROM pages WHERE url_hash = ?", (_url_hash(url),)).fetchone()
+        return row is not None
+
+    def iterate_pages(self, source_hash: str) -> Iterator[PageEntry]:
+        """Stream all pages for a source in discovery order.
+
+        Rows are fetched in chunks, so memory use does not grow with the
+        size of the crawl.
+        """
+        conn = self._reader(source_hash)
+        if conn is None:
+            return
+        cursor = conn.execute("SELECT data FROM pages ORDER BY seq")
+        while True:
+            rows = cursor.fetchmany(_FETCH_SIZE)
+            if not rows:
+                return
+            for (data,) in rows:
+                yield _page(data)
+
+    def get_pages_by_status(self, source_hash: str, status: str) -> List[PageEntry]:
+        """Get all pages with a specific status, in discovery order."""
+        conn = self._reader(source_hash)
+        if conn is None:
+            return []
+        rows = conn.execute("SELECT data FROM pages WHERE status = ? ORDER BY seq", (status,))
+        return [_page(data) for (data,) in rows]
+
+    def get_pages_by_content_hash(self, source_hash: str, content_hash: str) -> List[PageEntry]:
+        """Get all pages whose fetched content has ``content_hash``."""
+        conn = self._reader(source_hash)
+        if conn is None:
+            return []
+        rows = conn.execute(
+            "SELECT data FROM pages WHERE content_hash = ? ORDER BY seq", (content_hash,)
+        )
+        return [_page(data) for (data,) in rows]
+
+    def get_stats(self, source_hash: str) -> dict[str, int]:
+        """Get statistics for a crawl.
+
+        Returns:
+            Dictionary with counts by status
+        """
+        conn = self._reader(source_hash)
+        counts = {}
+        if conn is not None:
+            counts = dict(conn.execute("SELECT status, COUNT(*) FROM pages GROUP BY status"))
+        stats = {"total": sum(counts.values())}
+        for status in ("pending", "fetched", "failed", "skipped"):
+            stats[status] = counts.get(status, 0)
+        return stats
+
+    def export_json(self, source_hash: str, registry: PageRegistry) -> int:
+        """Regenerate the JSON batch layout of a crawl from its database.
+
+        The crawl's existing JSON batches and index in ``registry`` are
+        replaced; in GitHub mode the result is a single commit.
+
+        Returns:
+            Number of pages exported
+        """
+        return registry.replace_pages(source_hash, self.iterate_pages(source_hash))
+
+    def import_json(self, source_hash: str, registry: PageRegistry) -> int:
+        """Load every page of a JSON registry crawl into the database.
+
+        Returns:
+            Number of pages imported
+        """
+        return self.save_pages_batch(registry.iterate_pages(source_hash), source_hash)
+
+
+class SqlitePageRegistrySession:
+    """Buffers page saves and writes them as one bulk upsert per flush.
+
+    Mirrors :class:`~src.knowledge.page_registry.PageRegistrySession`:
+    reads see unflushed pages, and the buffer is flushed on exit and every
+    ``flush_every`` pages if set.
+    """
+
+    def __init__(
+        self,
+        registry: SqlitePageRegistry,
+        source_hash: str,
+        *,
+        flush_every: int | None = None,
+    ) -> None:
+        self._registry = registry
+        self.source_hash = source_hash
+        self.flush_every = flush_every
+        self._pending: dict[str, PageEntry] = {}
+
+    def __enter__(self) -> "SqlitePageRegistrySession":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+    def save_page(self, page: PageEntry) -> None:
+        """Buffer a page until the next flush."""
+        self._pending[page.url_hash] = page
+        if self.flush_every and len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def get_page(self, url: str) -> PageEntry | None:
+        """Get a page by URL, including unflushed changes."""
+        return self.get_page_by_hash(_url_hash(url))
+
+    def get_page_by_hash(self, url_hash: str) -> PageEntry | None:
+        """Get a page by URL hash, including unflushed changes."""
+        page = self._pending.get(url_hash)
+        if page is not None:
+            return page
+        return self._registry.get_page_by_hash(url_hash, self.source_hash)
+
+    def page_exists(self, url: str) -> bool:
+        """Check if a page is registered, including unflushed pages."""
+        return self.get_page(url) is not None
+
+    def flush(self) -> None:
+        """Write buffered pages in one transaction."""
+        if not self._pending:
+            return
+        self._registry.save_pages_batch(self._pending.values(), self.source_hash)
+        self._pending.clear()
+
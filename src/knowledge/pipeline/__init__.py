@@ -17,7 +17,7 @@ Usage:
 
 from .config import PipelineConfig, PipelinePoliteness
 from .runner import run_pipeline, PipelineResult
-from .scheduler import DomainScheduler, ScheduledSource
+from .scheduler import DomainDispatcher, DomainScheduler, ScheduledSource
 
 __all__ = [
     # Config
@@ -27,6 +27,7 @@ __all__ = [
     "run_pipeline",
     "PipelineResult",
     # Scheduler
+    "DomainDispatcher",
     "DomainScheduler",
     "ScheduledSource",
 ]
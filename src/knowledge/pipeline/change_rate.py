@@ -0,0 +1,113 @@
+"""Change-rate estimation for adaptive check intervals.
+
+Each source keeps a short history of its update checks: how long since the
+previous check, and whether a change was detected. Changes are modelled as
+a Poisson process with rate ``λ``, so a check ``t`` seconds after the
+previous one sees a change with probability ``1 - exp(-λt)``. Several
+changes between two checks look like one, which is why the rate is not
+simply changes divided by elapsed time.
+
+The estimate is the maximum a posteriori rate under a Gamma(2, T) prior,
+where ``T`` is the static interval for the source's ``update_frequency``.
+The prior counts as one change seen over one such interval: a source
+without history is checked at its static interval, and the history pulls
+the interval towards its observed change rate as checks accumulate.
+The next check is then scheduled one expected change ahead (``1 / λ``),
+within configured bounds.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import timedelta
+from typing import Sequence
+
+# Checks kept per source; older observations are dropped
+CHANGE_HISTORY_LIMIT = 32
+
+# Bisection range for the rate, in changes per second (~30 ms to ~3000 years)
+_MIN_RATE = 1e-11
+_MAX_RATE = 30.0
+
+
+def record_observation(
+    history: Sequence[Sequence[int]],
+    elapsed: timedelta,
+    changed: bool,
+) -> list[list[int]]:
+    """Return ``history`` with one check appended, trimmed to the limit.
+
+    Args:
+        history: Previous observations as ``[seconds, changed]`` pairs,
+            oldest first.
+        elapsed: Time since the previous check.
+        changed: Whether this check detected a change.
+    """
+    observation = [max(0, int(elapsed.total_seconds())), int(changed)]
+    return [list(entry) for entry in history][-(CHANGE_HISTORY_LIMIT - 1):] + [observation]
+
+
+def estimate_change_rate(history: Sequence[Sequence[int]], prior_interval: timedelta) -> float:
+    """Estimate a source's change rate in changes per second.
+
+    Args:
+        history: Observations as ``[seconds, changed]`` pairs.
+        prior_interval: Expected time between changes before any history.
+
+    Returns:
+        The maximum a posteriori Poisson rate.
+    """
+    prior_seconds = prior_interval.total_seconds()
+    changed = [seconds for seconds, was_changed in history if was_changed and seconds > 0]
+    unchanged_seconds = sum(seconds for seconds, was_changed in history if not was_changed)
+
+    def score(rate: float) -> float:
+        # Derivative of the log posterior; strictly decreasing in rate
+        return (
+            sum(seconds / math.expm1(rate * seconds) for seconds in changed if rate * seconds < 700)
+            - unchanged_seconds
+            + 1 / rate
+            - prior_seconds
+        )
+
+    # Bisect in log space: rates span many orders of magnitude
+    low, high = math.log(_MIN_RATE), math.log(_MAX_RATE)
+    for _ in range(60):
+        middle = (low + high) / 2
+        if score(math.exp(middle)) > 0:
+            low = middle
+        else:
+            high = middle
+    return math.exp((low + high) / 2)
+
+
+def adaptive_check_interval(
+    history: Sequence[Sequence[int]],
+    prior_interval: timedelta,
+    min_interval: timedelta,
+    max_interval: timedelta,
+) -> timedelta:
+    """Return the time until a source's next check.
+
+    Args:
+        history: Observations as ``[seconds, changed]`` pairs.
+        prior_interval: Static interval for the source's update frequency.
+        min_interval: Shortest interval allowed.
+        max_interval: Longest interval allowed.
+
+    Returns:
+        The expected time between changes, clamped to the bounds.
+    """
+    if not history:
+        interval = prior_interval
+    else:
+        interval = timedelta(seconds=1 / estimate_change_rate(history, prior_interval))
+    return max(min_interval, min(interval, max_interval))
+
+
+__all__ = [
+    "CHANGE_HISTORY_LIMIT",
+    "adaptive_check_interval",
+    "estimate_change_rate",
+    "record_observation",
+]
@@ -10,6 +10,9 @@ from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from src.knowledge.crawl_journal import DEFAULT_COMPACT_BYTES, DEFAULT_SYNC_EVERY
+from src.knowledge.monitoring import DEFAULT_HASH_DEADLINE_SECONDS, DEFAULT_MAX_HASH_BYTES
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -32,10 +35,16 @@ class PipelinePoliteness:
             Prevents runaway execution.
         check_jitter_minutes: Random offset (0 to N minutes) added to 
             next_check_after timestamps. Prevents predictable access patterns.
+        adaptive_check_intervals: If True, space checks by each source's
+            estimated change rate instead of its static update frequency.
+        min_check_interval: Shortest adaptive interval between checks.
+        max_check_interval: Longest adaptive interval between checks.
         crawler_delay_seconds: Delay between page fetches during crawling.
             Applied between every page fetch within a crawl.
         respect_robots_crawl_delay: If True, use Crawl-delay from robots.txt
             when it exceeds our default delay.
+        robots_cache_ttl: How long a fetched robots.txt is reused before
+            it is downloaded again.
     """
     
     # Per-domain limits
@@ -48,10 +57,22 @@ class PipelinePoliteness:
     
     # Scheduling
     check_jitter_minutes: int = 60
+    adaptive_check_intervals: bool = True
+    min_check_interval: timedelta = field(default_factory=lambda: timedelta(hours=6))
+    max_check_interval: timedelta = field(default_factory=lambda: timedelta(days=30))
     
     # Crawler settings
     crawler_delay_seconds: float = 1.0
     respect_robots_crawl_delay: bool = True
+    robots_cache_ttl: timedelta = field(default_factory=lambda: timedelta(hours=24))
+    
+    def __post_init__(self) -> None:
+        """Validate scheduling bounds."""
+        if not timedelta(0) < self.min_check_interval <= self.max_check_interval:
+            raise ValueError(
+                "min_check_interval must be positive and no longer than max_check_interval, "
+                f"got {self.min_check_interval} and {self.max_check_interval}"
+            )
 
 
 @dataclass
@@ -75,6 +96,27 @@ class PipelineConfig:
         max_pages_per_crawl: Maximum pages to crawl per source in one run.
         rendering_timeout_ms: Timeout for browser rendering in milliseconds.
             Default is 60000ms (60 seconds) to handle slow JavaScript-heavy pages.
+        browser_recycle_after_pages: Pages rendered in one pooled browser
+            context before it is closed and replaced.
+        browser_max_memory_mb: JavaScript heap ceiling (MB) that triggers an
+            early context recycle.
+        static_fetch_first: If True, try a plain HTTP GET before rendering
+            and only launch the browser for JavaScript-dependent pages.
+        crawl_journal_sync_every: Crawl journal records between fsyncs.
+            A power loss can lose at most this many pages of progress.
+        crawl_journal_compact_bytes: Crawl journal size that triggers a
+            full state snapshot mid-crawl.
+        crawler_workers: Sources acquired in parallel by the crawler phase.
+            Each domain still has at most one source in flight. Each
+            worker launches its own browser pool, so this is opt-in.
+        monitor_workers: Update checks run in parallel by the monitor
+            phase. Each domain still has at most one request in flight.
+        monitor_max_hash_bytes: Most response bytes hashed per update
+            check. Longer bodies are compared by their leading bytes.
+        monitor_hash_deadline_seconds: Wall-clock limit for reading one
+            response body during an update check.
+        use_sitemaps: If True, seed new crawls from the site's sitemaps and
+            skip pages whose ``<lastmod>`` predates their last fetch.
         github_client: Optional GitHub storage client for Actions environment.
     """
     
@@ -88,6 +130,16 @@ class PipelineConfig:
     enable_crawling: bool = True
     max_pages_per_crawl: int = 100
     rendering_timeout_ms: int = 60000  # Timeout for browser rendering in milliseconds
+    browser_recycle_after_pages: int = 50
+    browser_max_memory_mb: int = 512
+    static_fetch_first: bool = True
+    crawl_journal_sync_every: int = DEFAULT_SYNC_EVERY
+    crawl_journal_compact_bytes: int = DEFAULT_COMPACT_BYTES
+    crawler_workers: int = 1
+    monitor_workers: int = 4
+    monitor_max_hash_bytes: int = DEFAULT_MAX_HASH_BYTES
+    monitor_hash_deadline_seconds: float = DEFAULT_HASH_DEADLINE_SECONDS
+    use_sitemaps: bool = True
     github_client: object = None  # GitHubStorageClient
     
     def __post_init__(self) -> None:
@@ -95,6 +147,16 @@ class PipelineConfig:
         valid_modes = ("full", "check", "acquire")
         if self.mode not in valid_modes:
             raise ValueError(f"Invalid mode: {self.mode}. Must be one of {valid_modes}")
+        if self.crawler_workers < 1:
+            raise ValueError(f"crawler_workers must be at least 1, got {self.crawler_workers}")
+        if self.monitor_workers < 1:
+            raise ValueError(f"monitor_workers must be at least 1, got {self.monitor_workers}")
+        if self.monitor_max_hash_bytes < 1:
+            raise ValueError(f"monitor_max_hash_bytes must be at least 1, got {self.monitor_max_hash_bytes}")
+        if self.monitor_hash_deadline_seconds <= 0:
+            raise ValueError(
+                f"monitor_hash_deadline_seconds must be positive, got {self.monitor_hash_deadline_seconds}"
+            )
 
 
 # Default check intervals by update frequency
@@ -13,30 +13,39 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import queue
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Callable, ContextManager, Sequence
 from urllib.parse import urlparse
 
 if TYPE_CHECKING:
     from src.knowledge.storage import SourceEntry, SourceRegistry
     from src.knowledge.monitoring import CheckResult
 
+from src.knowledge.crawl_journal import DEFAULT_COMPACT_BYTES, DEFAULT_SYNC_EVERY, make_record
 from src.knowledge.crawl_state import CrawlState, CrawlStateStorage
+from src.knowledge.page_registry import PageEntry, PageRegistry, PageRegistrySession
 from src.parsing.base import ParseTarget, ParserError
-from src.parsing.link_extractor import extract_links
-from src.parsing.robots import RobotsChecker
+from src.parsing.content_fingerprint import document_fingerprint
+from src.parsing.rendering import BrowserPool, shared_browser_pool
+from src.parsing.robots import DEFAULT_CACHE_TTL, RobotsChecker
+from src.parsing.sitemap import DEFAULT_MAX_SITEMAPS, default_sitemap_url, iter_sitemap_urls
 from src.parsing.storage import ParseStorage
-from src.parsing.url_scope import filter_urls_by_scope, normalize_url
+from src.parsing.url_scope import filter_urls_by_scope, is_url_in_scope, normalize_url
 from src.parsing.web import WebParser
 
 from .config import PipelineConfig
-from .scheduler import DomainScheduler
+from .scheduler import DomainDispatcher, DomainScheduler
 
 logger = logging.getLogger(__name__)
 
+# Product token matched against robots.txt groups and sent when fetching them
+CRAWLER_USER_AGENT = "speculum-principum-crawler/1.0"
+
 
 @dataclass
 class AcquisitionResult:
@@ -46,17 +55,25 @@ class AcquisitionResult:
         source_url: The source URL that was acquired.
         success: Whether acquisition succeeded.
         content_hash: SHA-256 hash of acquired content.
+        content_fingerprint: Normalized main-text fingerprint of the source
+            URL's page, comparable with the monitor's.
         content_path: Path where content was stored.
         pages_acquired: Number of pages acquired (1 for single-page).
         error: Error message if acquisition failed.
+        fetch_stats: Pages and seconds per fetch path (static vs rendered).
+        sitemaps_fetched: Sitemap files requested to seed the crawl. They
+            count against the same page budget as pages.
     """
     
     source_url: str
     success: bool
     content_hash: str | None = None
+    content_fingerprint: str | None = None
     content_path: str | None = None
     pages_acquired: int = 0
     error: str | None = None
+    fetch_stats: dict[str, int | float] | None = None
+    sitemaps_fetched: int = 0
 
 
 @dataclass
@@ -99,11 +116,102 @@ def _get_domain(url: str) -> str:
     return host
 
 
+def _make_parser(
+    config: PipelineConfig | None,
+    browser_pool: BrowserPool | None,
+    domain_strategies: dict[str, str] | None,
+) -> WebParser:
+    """Build a WebParser configured from the pipeline settings."""
+    parser = WebParser(
+        timeout=config.rendering_timeout_ms if config else 60000,
+        browser_pool=browser_pool,
+        static_first=config.static_fetch_first if config else True,
+    )
+    if domain_strategies is not None:
+        parser.domain_strategies = domain_strategies
+    return parser
+
+
+def _make_robots_checker(
+    config: PipelineConfig | None,
+    crawl_storage: CrawlStateStorage,
+) -> RobotsChecker:
+    """Build a checker that fetches robots.txt per host and caches it on disk."""
+    return RobotsChecker(
+        CRAWLER_USER_AGENT,
+        fetch=True,
+        cache_dir=crawl_storage.get_robots_cache_dir(),
+        ttl=config.politeness.robots_cache_ttl if config else DEFAULT_CACHE_TTL,
+    )
+
+
+def _seed_from_sitemaps(
+    state: CrawlState,
+    source: "SourceEntry",
+    robots: RobotsChecker,
+    pages: PageRegistrySession,
+    *,
+    max_sitemaps: int = DEFAULT_MAX_SITEMAPS,
+    before_fetch: Callable[[str], None] | None = None,
+) -> tuple[int, int]:
+    """Queue a new crawl's pages from the site's sitemaps.
+    
+    Sitemaps come from robots.txt, falling back to ``/sitemap.xml``, and
+    ``before_fetch`` is called before each one is requested. Pages
+    whose ``<lastmod>`` is no later than their last successful fetch are
+    marked unchanged instead of queued; the source URL itself is always
+    fetched so that newly linked pages are still found. Pages linked only
+    from unchanged pages are not revisited until they change.
+    
+    Returns:
+        (queued, unchanged) page counts.
+    """
+    sitemap_urls = robots.get_sitemaps(source.url) or [default_sitemap_url(source.url)]
+    source_url = normalize_url(source.url)
+    queued = unchanged = 0
+    for sitemap_entry in iter_sitemap_urls(
+        sitemap_urls,
+        user_agent=CRAWLER_USER_AGENT,
+        is_allowed=robots.is_allowed,
+        max_sitemaps=max_sitemaps,
+        before_fetch=before_fetch,
+    ):
+        if queued >= state.max_pages:
+            break
+        if not is_url_in_scope(sitemap_entry.loc, source.url, source.crawl_scope):
+            continue
+        url = normalize_url(sitemap_entry.loc)
+        if url == source_url or state.is_url_visited(url):
+            continue
+        page = pages.get_page(url)
+        if (
+            sitemap_entry.lastmod is not None
+            and page is not None
+            and page.status == "fetched"
+            and page.fetched_at is not None
+            and sitemap_entry.lastmod <= page.fetched_at
+        ):
+            state.mark_url_unchanged(url)
+            unchanged += 1
+        elif state.add_to_frontier(url, depth=1, discovered_from=source.url):
+            queued += 1
+    
+    logger.info(
+        "Seeded %s from sitemaps: %d pages queued, %d unchanged since last fetch",
+        source.url,
+        queued,
+        unchanged,
+    )
+    return queued, unchanged
+
+
 def acquire_single_page(
     source: "SourceEntry",
     storage: ParseStorage,
     delay_seconds: float = 1.0,
     config: PipelineConfig | None = None,
+    browser_pool: BrowserPool | None = None,
+    domain_strategies: dict[str, str] | None = None,
 ) -> AcquisitionResult:
     """Acquire content from a single-page source.
     
@@ -112,6 +220,8 @@ def acquire_single_page(
         storage: Storage for parsed content.
         delay_seconds: Delay before fetching (politeness).
         config: Pipeline configuration (optional, for timeout settings).
+        browser_pool: Shared browser to render with (optional).
+        domain_strategies: Shared per-domain fetch strategy memory (optional).
         
     Returns:
         AcquisitionResult with content hash and path.
@@ -127,8 +237,7 @@ def acquire_single_page(
         if config and config.github_client:
             storage.begin_batch()
         
-        timeout_ms = config.rendering_timeout_ms if config else 60000
-        parser = WebParser(timeout=timeout_ms)
+        parser = _make_parser(config, browser_pool, domain_strategies)
         target = ParseTarget(source=source.url, is_remote=True)
         
         document = parser.extract(target)
@@ -161,8 +270,10 @@ def acquire_single_page(
             source_url=source.url,
             success=True,
             content_hash=content_hash,
+            content_fingerprint=document_fingerprint(document),
             content_path=entry.artifact_path,
             pages_acquired=1,
+            fetch_stats=parser.fetch_stats.to_dict(),
         )
         
     except ParserError as e:
@@ -189,9 +300,20 @@ def acquire_crawl(
     delay_seconds: float = 1.0,
     force_restart: bool = False,
     config: PipelineConfig | None = None,
+    browser_pool: BrowserPool | None = None,
+    domain_strategies: dict[str, str] | None = None,
+    robots: RobotsChecker | None = None,
+    page_registry: PageRegistry | None = None,
 ) -> AcquisitionResult:
     """Acquire content from a multi-page source via crawling.
     
+    Every fetched or failed page is recorded in the page registry. A crawl
+    that already completed is started over, and with ``config.use_sitemaps``
+    a new crawl is seeded from the site's sitemaps: pages whose
+    ``<lastmod>`` is no later than their last fetch are marked visited
+    without being fetched. Sitemap requests are spaced like page fetches
+    and count against ``max_pages``.
+    
     Args:
         source: The source to crawl.
         storage: Storage for parsed content.
@@ -200,6 +322,12 @@ def acquire_crawl(
         delay_seconds: Delay between page fetches.
         force_restart: If True, restart crawl from scratch.
         config: Pipeline configuration (optional, for timeout settings).
+        browser_pool: Shared browser to render with (optional).
+        domain_strategies: Shared per-domain fetch strategy memory (optional).
+        robots: Shared robots.txt checker (optional). By default one is
+            created that fetches and caches robots.txt per host.
+        page_registry: Registry to record pages in (optional). Defaults to
+            one under ``crawl_storage.root``.
         
     Returns:
         AcquisitionResult with aggregate statistics.
@@ -211,8 +339,12 @@ def acquire_crawl(
         max_pages,
     )
     
-    # Load or create crawl state
+    # Load or create crawl state (loading replays the event journal)
     state = None if force_restart else crawl_storage.load_state(source.url)
+    if state is not None and state.status == "completed":
+        logger.info("Previous crawl of %s completed; starting a refresh", source.url)
+        state = None
+    created = state is None
     
     if state is None:
         state = CrawlState.create_new(
@@ -232,43 +364,91 @@ def acquire_crawl(
     
     state.mark_started()
     
-    # Load robots.txt
-    robots = RobotsChecker(source.url)
+    # robots.txt is fetched per host on first use
+    if robots is None:
+        robots = _make_robots_checker(config, crawl_storage)
+    respect_crawl_delay = config.politeness.respect_robots_crawl_delay if config else True
+    
+    def wait_politely(url: str) -> None:
+        # Politeness delay, stretched to the robots.txt Crawl-delay
+        delay = delay_seconds
+        if respect_crawl_delay:
+            delay = max(delay, robots.get_crawl_delay(url) or 0.0)
+        if delay > 0:
+            time.sleep(delay)
+    
+    if page_registry is None:
+        page_registry = PageRegistry(root=crawl_storage.root)
+    pages = page_registry.session(state.source_hash)
+    
+    # Sitemap requests share the page budget, leaving at least the source URL
+    sitemaps_fetched = 0
+    
+    def before_sitemap(url: str) -> None:
+        nonlocal sitemaps_fetched
+        sitemaps_fetched += 1
+        wait_politely(url)
+    
+    if created and config and config.use_sitemaps and max_pages > 1:
+        _seed_from_sitemaps(
+            state,
+            source,
+            robots,
+            pages,
+            max_sitemaps=min(DEFAULT_MAX_SITEMAPS, max_pages - 1),
+            before_fetch=before_sitemap,
+        )
+    page_budget = max_pages - sitemaps_fetched
+    
+    # Per-page progress is appended to the journal; the full state is only
+    # rewritten when the journal is compacted. Compacting up front also
+    # gives a new crawl the snapshot its journal records build on.
+    journal = crawl_storage.open_journal(
+        state.source_hash,
+        sync_every=config.crawl_journal_sync_every if config else DEFAULT_SYNC_EVERY,
+        compact_bytes=config.crawl_journal_compact_bytes if config else DEFAULT_COMPACT_BYTES,
+    )
+    crawl_storage.compact(state, journal)
     
-    # Initialize parser with configured timeout
-    timeout_ms = config.rendering_timeout_ms if config else 60000
-    parser = WebParser(timeout=timeout_ms)
+    # Initialize parser with configured timeout and fetch strategy
+    parser = _make_parser(config, browser_pool, domain_strategies)
     
     # Enable batch mode for manifest writes (GitHub API efficiency)
     if config and config.github_client:
         storage.begin_batch()
     
     pages_this_run = 0
+    pages_deduplicated = 0
     content_hashes: list[str] = []
     errors: list[str] = []
+    seed_url = normalize_url(source.url)
+    seed_fingerprint: str | None = None
     
-    while state.frontier and pages_this_run < max_pages:
-        url = state.pop_frontier()
-        if url is None:
+    # Content stored this run by fingerprint, so a page whose text is
+    # already stored under another URL is not stored again
+    stored_paths: dict[str, str] = {}
+    
+    while state.frontier and pages_this_run < page_budget:
+        entry = state.pop_frontier_entry()
+        if entry is None:
             break
+        queued_url = entry.url
         
         # Normalize URL first to ensure consistent deduplication
-        url = normalize_url(url)
+        url = normalize_url(queued_url)
         
         # Skip if already visited (check AFTER normalization)
         if state.is_url_visited(url):
+            journal.append(state, make_record("popped", url, popped=queued_url))
             continue
         
         # Check robots.txt
         if not robots.is_allowed(url):
-            state.skipped_count += 1
-            state.mark_url_visited(url)
+            journal.append(state, make_record("skipped", url, popped=queued_url))
             logger.debug("Skipped (robots.txt): %s", url)
             continue
         
-        # Apply politeness delay
-        if delay_seconds > 0:
-            time.sleep(delay_seconds)
+        wait_politely(url)
         
         # Fetch page
         try:
@@ -276,55 +456,96 @@ def acquire_crawl(
             document = parser.extract(target)
             markdown = parser.to_markdown(document)
             
-            # Store content
-            document.metadata.update({
-                "crawl_source": source.url,
-                "acquired_at": datetime.now(timezone.utc).isoformat(),
-            })
-            storage.persist_document(document)
+            fingerprint = document_fingerprint(document)
+            if url == seed_url:
+                seed_fingerprint = fingerprint
+            page = pages.get_page(url)
+            
+            # Store content, unless the same text is already stored: the
+            # page is unchanged since its last fetch, or duplicates a page
+            # stored earlier in this run
+            content_path = None
+            if fingerprint is not None:
+                if page is not None and page.content_fingerprint == fingerprint and page.content_path:
+                    content_path = page.content_path
+                else:
+                    content_path = stored_paths.get(fingerprint)
+            if content_path is None:
+                document.metadata.update({
+                    "crawl_source": source.url,
+                    "acquired_at": datetime.now(timezone.utc).isoformat(),
+                })
+                content_path = storage.persist_document(document).artifact_path
+                if fingerprint is not None:
+                    stored_paths[fingerprint] = content_path
+            else:
+                pages_deduplicated += 1
             
             page_hash = _content_hash(markdown)
             content_hashes.append(page_hash)
             
-            # Extract links from raw HTML
-            raw_html = document.metadata.get("raw_html")
-            if raw_html:
-                links = extract_links(raw_html, url)
-                in_scope = filter_urls_by_scope(
-                    [link.url for link in links],
-                    source.url,
-                    source.crawl_scope,
-                )
-                
-                # Normalize and add to frontier (deduplication happens in add_to_frontier)
-                for link_url in in_scope:
-                    normalized_link = normalize_url(link_url)
-                    if state.add_to_frontier(normalized_link):
-                        state.in_scope_count += 1
-                
-                state.discovered_count += len(links)
-                state.out_of_scope_count += len(links) - len(in_scope)
+            # Links were extracted from the same parse as the content;
+            # normalized in-scope links are enqueued when the record is applied
+            links = document.links or []
+            in_scope = filter_urls_by_scope(links, source.url, source.crawl_scope) if links else []
             
-            state.mark_url_visited(url)
+            journal.append(
+                state,
+                make_record(
+                    "visited",
+                    url,
+                    popped=queued_url,
+                    depth=entry.depth,
+                    enqueued=[normalize_url(link_url) for link_url in in_scope],
+                    discovered=len(links),
+                    out_of_scope=len(links) - len(in_scope),
+                ),
+            )
+            page = page or PageEntry.create_pending(
+                url,
+                source.url,
+                discovered_from=entry.discovered_from,
+                link_depth=entry.depth,
+            )
+            page.mark_fetched(
+                http_status=200,
+                content_type=document.metadata.get("content_type", "text/html"),
+                content_hash=page_hash,
+                content_fingerprint=fingerprint,
+                content_path=content_path,
+                content_size=len(markdown),
+                extracted_chars=len(markdown),
+                title=document.metadata.get("title"),
+                outgoing_links_count=len(links),
+                outgoing_links_in_scope=len(in_scope),
+            )
+            pages.save_page(page)
             pages_this_run += 1
             
             logger.debug(
                 "Crawled [%d/%d]: %s",
                 pages_this_run,
-                max_pages,
+                page_budget,
                 url[:80],
             )
             
         except Exception as e:
-            state.failed_count += 1
-            state.mark_url_visited(url)
+            journal.append(state, make_record("failed", url, popped=queued_url))
             error_msg = f"{type(e).__name__}: {e}"
             errors.append(error_msg)
+            page = pages.get_page(url) or PageEntry.create_pending(
+                url,
+                source.url,
+                discovered_from=entry.discovered_from,
+                link_depth=entry.depth,
+            )
+            page.mark_failed(error_msg)
+            pages.save_page(page)
             logger.error("Failed to crawl %s: %s", url, e, exc_info=True)
         
-        # Periodic state save
-        if pages_this_run % 10 == 0:
-            crawl_storage.save_state(state)
+        # Fold a large journal into a snapshot so replay stays short
+        if journal.needs_compaction():
+            crawl_storage.compact(state, journal)
     
     # Final state update
     if not state.frontier:
@@ -332,7 +553,9 @@ def acquire_crawl(
     else:
         state.mark_paused()
     
-    crawl_storage.save_state(state)
+    # Pages first: the registry must not lag behind the visited set
+    pages.flush()
+    crawl_storage.compact(state, journal)
     
     # Flush all pending writes (content files + manifest) in one batch
     if config and config.github_client:
@@ -345,11 +568,25 @@ def acquire_crawl(
         aggregate_hash = _content_hash(combined)
     
     logger.info(
-        "Crawl complete for %s: %d pages this run, %d total visited, %d failed",
+        "Crawl complete for %s: %d pages this run (%d with content already stored), "
+        "%d total visited, %d failed, %d unchanged",
         source.url,
         pages_this_run,
+        pages_deduplicated,
         state.visited_count,
         state.failed_count,
+        state.unchanged_count,
+    )
+    fetch_stats = parser.fetch_stats.to_dict()
+    logger.info(
+        "Fetch paths for %s: %d static (%.1fs), %d rendered (%.1fs, %d escalated after %.1fs probing)",
+        source.url,
+        fetch_stats["static_pages"],
+        fetch_stats["static_seconds"],
+        fetch_stats["rendered_pages"],
+        fetch_stats["rendered_seconds"],
+        fetch_stats["escalated_pages"],
+        fetch_stats["probe_seconds"],
     )
     
     # Consider crawl successful only if we got at least one page this run
@@ -363,25 +600,125 @@ def acquire_crawl(
         source_url=source.url,
         success=success,
         content_hash=aggregate_hash,
+        content_fingerprint=seed_fingerprint,
         pages_acquired=pages_this_run,
         error=error,
+        fetch_stats=fetch_stats,
+        sitemaps_fetched=sitemaps_fetched,
     )
 
 
+def _acquire_source(
+    source: "SourceEntry",
+    domain: str,
+    *,
+    config: PipelineConfig,
+    scheduler: DomainScheduler,
+    parse_storage: ParseStorage,
+    crawl_storage: CrawlStateStorage,
+    browser_pool: BrowserPool | None,
+    domain_strategies: dict[str, str],
+    robots: RobotsChecker,
+    page_registry: PageRegistry,
+) -> AcquisitionResult | None:
+    """Acquire one source within the scheduler's page budgets.
+    
+    Returns:
+        The acquisition result, or None if the run's page budget for the
+        domain is spent and the source was left for the next run.
+    """
+    crawl = config.enable_crawling and source.is_crawlable
+    granted = scheduler.reserve_pages(domain, config.max_pages_per_crawl if crawl else 1)
+    if granted == 0:
+        logger.info("Page budget spent for %s, leaving %s for the next run", domain, source.url)
+        return None
+    
+    delay = config.politeness.crawler_delay_seconds
+    try:
+        if crawl:
+            acq_result = acquire_crawl(
+                source=source,
+                storage=parse_storage,
+                crawl_storage=crawl_storage,
+                max_pages=granted,
+                delay_seconds=delay,
+                force_restart=config.force_fresh,
+                config=config,
+                browser_pool=browser_pool,
+                domain_strategies=domain_strategies,
+                robots=robots,
+                page_registry=page_registry,
+            )
+        else:
+            acq_result = acquire_single_page(
+                source=source,
+                storage=parse_storage,
+                delay_seconds=delay,
+                config=config,
+                browser_pool=browser_pool,
+                domain_strategies=domain_strategies,
+            )
+    except Exception as e:
+        logger.error("Acquisition failed for %s: %s", source.url, e, exc_info=True)
+        acq_result = AcquisitionResult(
+            source_url=source.url,
+            success=False,
+            error=f"{type(e).__name__}: {e}",
+        )
+    
+    if crawl:
+        # Give back the pages the crawl did not use
+        scheduler.return_pages(domain, granted - acq_result.pages_acquired - acq_result.sitemaps_fetched)
+        # Space later sources on this domain by its robots.txt Crawl-delay
+        scheduler.set_crawl_delay(domain, robots.get_crawl_delay(source.url))
+    return acq_result
+
+
+def _crawl_worker(
+    dispatcher: DomainDispatcher["SourceEntry"],
+    acquire: Callable[["SourceEntry", str], AcquisitionResult | None],
+    deliver: Callable[["SourceEntry", AcquisitionResult | None], None],
+) -> None:
+    """Acquire sources from the dispatcher until none remain."""
+    while (claimed := dispatcher.next_item()) is not None:
+        source, domain = claimed
+        acq_result = None
+        try:
+            acq_result = acquire(source, domain)
+        finally:
+            dispatcher.release(domain, requested=acq_result is not None)
+        deliver(source, acq_result)
+
+
 def run_crawler(
     sources: Sequence[tuple["SourceEntry", "CheckResult | None"]],
     config: PipelineConfig,
     registry: "SourceRegistry",
     scheduler: DomainScheduler,
+    browser_pool: BrowserPool | None = None,
 ) -> CrawlerResult:
     """Run the crawler phase to acquire content from sources.
     
+    Sources are acquired by up to ``config.crawler_workers`` threads. The
+    scheduler keeps at most one source per domain in flight, spaces
+    same-domain sources by ``min_domain_interval``, and shares the
+    per-domain and per-run page budgets between workers; sources left
+    without budget are picked up by the next run.
+    
+    Playwright's sync API is bound to the thread that started it, so each
+    worker thread launches its own browser (lazily, on the first page that
+    needs rendering). With a single worker, sources are acquired on the
+    calling thread and share ``browser_pool``; if none is given, one is
+    created here and closed on exit. Registry updates always happen on the
+    calling thread.
+    
     Args:
         sources: List of (source, check_result) tuples to acquire.
             check_result is None for initial acquisitions.
         config: Pipeline configuration.
         registry: Source registry for metadata updates.
         scheduler: Domain scheduler for politeness.
+        browser_pool: Browser pool to reuse across sources (optional).
         
     Returns:
         CrawlerResult with acquisition outcomes.
@@ -391,6 +728,17 @@ def run_crawler(
     
     result = CrawlerResult()
     
+    if config.dry_run:
+        for source, _check_result in sources:
+            result.sources_processed += 1
+            logger.info("[DRY RUN] Would acquire: %s", source.url)
+            result.successful.append(AcquisitionResult(
+                source_url=source.url,
+                success=True,
+                pages_acquired=0,
+            ))
+        return result
+    
     # Initialize storage
     evidence_root = config.evidence_root or paths.get_evidence_root()
     kb_root = config.kb_root or paths.get_knowledge_graph_root()
@@ -406,61 +754,28 @@ def run_crawler(
         root=kb_root,
         github_client=github_client,
     )
+    page_registry = PageRegistry(
+        root=kb_root,
+        github_client=github_client,
+    )
     
-    delay = config.politeness.crawler_delay_seconds
+    check_results = {
+        id(source): check_result
+        for source, check_result in sources
+        if check_result is not None
+    }
+    
+    # Which fetch strategy worked per domain, shared across sources
+    domain_strategies: dict[str, str] = {}
     
-    for source, check_result in sources:
+    # robots.txt rules and Crawl-delay per host, shared across sources
+    robots = _make_robots_checker(config, crawl_storage)
+    
+    def record(source: "SourceEntry", acq_result: AcquisitionResult | None) -> None:
+        if acq_result is None:
+            return
         result.sources_processed += 1
         
-        # Wait for domain cooldown
-        domain = _get_domain(source.url)
-        cooldown = scheduler.get_domain_cooldown(domain)
-        if cooldown > 0:
-            logger.debug("Waiting %.1fs for domain %s", cooldown, domain)
-            time.sleep(cooldown)
-        
-        if config.dry_run:
-            logger.info("[DRY RUN] Would acquire: %s", source.url)
-            result.successful.append(AcquisitionResult(
-                source_url=source.url,
-                success=True,
-                pages_acquired=0,
-            ))
-            continue
-        
-        # Decide: single page or crawl
-        try:
-            if config.enable_crawling and source.is_crawlable:
-                max_pages = min(
-                    config.max_pages_per_crawl,
-                    config.politeness.max_domain_requests_per_run,
-                )
-                acq_result = acquire_crawl(
-                    source=source,
-                    storage=parse_storage,
-                    crawl_storage=crawl_storage,
-                    max_pages=max_pages,
-                    delay_seconds=delay,
-                    force_restart=config.force_fresh,
-                    config=config,
-                )
-            else:
-                acq_result = acquire_single_page(
-                    source=source,
-                    storage=parse_storage,
-                    delay_seconds=delay,
-                    config=config,
-                )
-        except Exception as e:
-            logger.error("Acquisition failed for %s: %s", source.url, e, exc_info=True)
-            acq_result = AcquisitionResult(
-                source_url=source.url,
-                success=False,
-                error=f"{type(e).__name__}: {e}",
-            )
-        
-        scheduler.record_request(domain)
-        
         if acq_result.success:
             result.successful.append(acq_result)
             result.pages_total += acq_result.pages_acquired
@@ -468,6 +783,20 @@ def run_crawler(
             # Update source metadata
             if acq_result.content_hash:
                 source.last_content_hash = acq_result.content_hash
+                source.last_content_hash_bytes = None
+            if acq_result.content_fingerprint:
+                source.last_content_fingerprint = acq_result.content_fingerprint
+            check_result = check_results.get(id(source))
+            if check_result is not None and check_result.content_hash:
+                # Keep the monitor's hash of the raw body (or of its prefix)
+                # so the next check compares like for like, not against the
+                # hash of the converted markdown
+                source.last_content_hash = check_result.content_hash
+                source.last_content_hash_bytes = check_result.content_hash_bytes
+            if check_result is not None and check_result.content_fingerprint:
+                # Prefer what the monitor sees: a page the crawler had to
+                # render can extract differently from its static HTML
+                source.last_content_fingerprint = check_result.content_fingerprint
             source.last_checked = datetime.now(timezone.utc)
             source.check_failures = 0
             
@@ -486,6 +815,76 @@ def run_crawler(
             source.last_checked = datetime.now(timezone.utc)
             registry.save_source(source)
     
+    def acquire_with(pool: BrowserPool) -> Callable[["SourceEntry", str], AcquisitionResult | None]:
+        return lambda source, domain: _acquire_source(
+            source,
+            domain,
+            config=config,
+            scheduler=scheduler,
+            parse_storage=parse_storage,
+            crawl_storage=crawl_storage,
+            browser_pool=pool,
+            domain_strategies=domain_strategies,
+            robots=robots,
+            page_registry=page_registry,
+        )
+    
+    def browser_pool_for_worker() -> ContextManager[BrowserPool]:
+        return shared_browser_pool(
+            recycle_after_pages=config.browser_recycle_after_pages,
+            max_memory_mb=config.browser_max_memory_mb,
+        )
+    
+    dispatcher = DomainDispatcher(
+        [(source, _get_domain(source.url)) for source, _check_result in sources],
+        scheduler,
+    )
+    domains = {_get_domain(source.url) for source, _check_result in sources}
+    workers = max(1, min(config.crawler_workers, len(domains)))
+    
+    if workers == 1:
+        if browser_pool is not None:
+            _crawl_worker(dispatcher, acquire_with(browser_pool), record)
+        else:
+            with browser_pool_for_worker() as pool:
+                _crawl_worker(dispatcher, acquire_with(pool), record)
+    else:
+        logger.info("Acquiring %d sources with %d workers", len(sources), workers)
+        outcomes: queue.Queue = queue.Queue()
+        
+        def run_worker() -> None:
+            try:
+                with browser_pool_for_worker() as pool:
+                    _crawl_worker(
+                        dispatcher,
+                        acquire_with(pool),
+                        lambda source, acq_result: outcomes.put((source, acq_result)),
+                    )
+            except Exception:
+                logger.exception("Crawler worker stopped")
+            finally:
+                outcomes.put(None)
+        
+        threads = [
+            threading.Thread(target=run_worker, name=f"crawler-{number}", daemon=True)
+            for number in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            running = workers
+            while running:
+                outcome = outcomes.get()
+                if outcome is None:
+                    running -= 1
+                else:
+                    record(*outcome)
+        finally:
+            # On interruption, let in-flight sources finish and close browsers
+            dispatcher.cancel()
+            for thread in threads:
+                thread.join()
+    
     logger.info(
         "Crawler complete: %d processed, %d successful, %d failed, %d pages",
         result.sources_processed,
@@ -6,22 +6,36 @@ any LLM involvement - the logic is entirely programmatic.
 
 Two modes of operation:
 1. Initial acquisition: Sources with no previous content hash
-2. Update checking: Tiered detection (ETag → Last-Modified → Content Hash)
+2. Update checking: One conditional GET per source (304 → unchanged,
+   otherwise Content Hash)
+
+Update checks can run on a pool of worker threads; the scheduler still
+keeps one request per domain in flight and spaces same-domain requests.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Sequence
 
 if TYPE_CHECKING:
     from src.knowledge.storage import SourceEntry, SourceRegistry
 
-from src.knowledge.monitoring import ChangeDetection, CheckResult, SourceMonitor
+from src.knowledge.monitoring import (
+    DEFAULT_HASH_DEADLINE_SECONDS,
+    DEFAULT_MAX_HASH_BYTES,
+    ChangeDetection,
+    CheckResult,
+    SourceMonitor,
+)
 
+from .change_rate import record_observation
 from .scheduler import (
+    DomainDispatcher,
     DomainScheduler,
     ScheduledSource,
     calculate_backoff_interval,
@@ -104,9 +118,8 @@ def get_sources_due_for_check(registry: "SourceRegistry") -> list["SourceEntry"]
     now = datetime.now(timezone.utc)
     return [
         source
-        for source in registry.list_sources(status="active")
+        for source in registry.list_due_sources(now, status="active")
         if source.last_content_hash is not None
-        and (source.next_check_after is None or source.next_check_after <= now)
     ]
 
 
@@ -115,6 +128,9 @@ def run_monitor(
     scheduler: DomainScheduler,
     dry_run: bool = False,
     force_fresh: bool = False,
+    workers: int = 1,
+    max_hash_bytes: int = DEFAULT_MAX_HASH_BYTES,
+    hash_deadline_seconds: float = DEFAULT_HASH_DEADLINE_SECONDS,
 ) -> MonitorResult:
     """Run the monitor phase to detect sources needing acquisition.
     
@@ -124,17 +140,30 @@ def run_monitor(
     3. Updates source metadata (last_checked, next_check_after)
     4. Returns lists of sources needing acquisition
     
+    With more than one worker, update checks run on worker threads under
+    the scheduler's per-domain rules, and results are then recorded on the
+    calling thread in schedule order, exactly as a serial run records them.
+    
     Args:
         registry: The source registry.
         scheduler: Domain scheduler with politeness settings.
         dry_run: If True, don't update source metadata.
         force_fresh: If True, treat all active sources as needing acquisition.
+        workers: Update checks run in parallel (one per domain at most).
+        max_hash_bytes: Most response bytes hashed per check.
+        hash_deadline_seconds: Wall-clock limit for reading one response.
         
     Returns:
         MonitorResult with categorized sources.
     """
     result = MonitorResult()
-    monitor = SourceMonitor(registry=registry)
+    new_monitor = partial(
+        SourceMonitor,
+        registry=registry,
+        max_hash_bytes=max_hash_bytes,
+        hash_deadline_seconds=hash_deadline_seconds,
+    )
+    monitor = new_monitor()
     
     # Force fresh mode: treat all active sources as needing acquisition
     if force_fresh:
@@ -169,11 +198,14 @@ def run_monitor(
     logger.info("Found %d sources due for update check", len(check_sources))
     
     # Phase 3: Process scheduled sources
-    for scheduled in scheduler.get_schedule():
+    schedule = list(scheduler.get_schedule())
+    outcomes = _check_concurrently(new_monitor, scheduler, schedule, workers) if workers > 1 else None
+    
+    for index, scheduled in enumerate(schedule):
         source = scheduled.source
         
-        # Wait for domain cooldown
-        cooldown = scheduler.get_domain_cooldown(scheduled.domain)
+        # Wait for domain cooldown (concurrent checks have already waited)
+        cooldown = scheduler.get_domain_cooldown(scheduled.domain) if outcomes is None else 0.0
         if cooldown > 0:
             import time
             logger.debug("Waiting %.1fs for domain %s cooldown", cooldown, scheduled.domain)
@@ -192,10 +224,16 @@ def run_monitor(
                 registry.save_source(source)
             
         else:
-            # Update check - use tiered detection
+            # Update check - one conditional GET
             try:
-                check_result = monitor.check_source(source)
-                scheduler.record_request(scheduled.domain)
+                if outcomes is None:
+                    check_result = monitor.check_source(source)
+                    scheduler.record_request(scheduled.domain)
+                else:
+                    outcome = outcomes[index]
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    check_result = outcome
                 
                 if check_result.status == "changed":
                     result.updates_needed.append((source, check_result))
@@ -233,15 +271,15 @@ def run_monitor(
                     registry.save_source(source)
     
     # Track skipped sources (those not scheduled due to limits)
+    handled_urls = {s.url for s in result.initial_needed}
+    handled_urls.update(u[0].url for u in result.updates_needed)
+    handled_urls.update(s.url for s in result.unchanged)
+    handled_urls.update(e[0].url for e in result.errors)
     result.skipped = [
-        ScheduledSource.from_source(s, "check").source
+        s
         for domain in scheduler.domains_with_pending
-        for s in registry.list_sources(status="active")
-        if ScheduledSource.from_source(s, "check").domain == domain
-        and s not in result.initial_needed
-        and s not in [u[0] for u in result.updates_needed]
-        and s not in result.unchanged
-        and s not in [e[0] for e in result.errors]
+        for s in registry.list_sources_by_domain(domain, status="active")
+        if s.url not in handled_urls
     ][:50]  # Limit to first 50 for logging
     
     logger.info(
@@ -256,6 +294,62 @@ def run_monitor(
     return result
 
 
+def _check_concurrently(
+    new_monitor: Callable[[], SourceMonitor],
+    scheduler: DomainScheduler,
+    schedule: Sequence[ScheduledSource],
+    workers: int,
+) -> dict[int, CheckResult | Exception]:
+    """Run the schedule's update checks on a pool of worker threads.
+    
+    Each worker has its own ``new_monitor()``, and so its own HTTP
+    session. A domain gets at most one request in flight, and same-domain
+    requests are spaced by the scheduler's cooldown.
+    
+    Returns:
+        Check result, or the exception the check raised, by schedule index.
+    """
+    checks = [
+        (index, scheduled.domain)
+        for index, scheduled in enumerate(schedule)
+        if scheduled.action == "check"
+    ]
+    workers = min(workers, len({domain for _index, domain in checks}))
+    if workers == 0:
+        return {}
+    
+    logger.info("Checking %d sources with %d workers", len(checks), workers)
+    dispatcher: DomainDispatcher[int] = DomainDispatcher(checks, scheduler)
+    outcomes: dict[int, CheckResult | Exception] = {}
+    
+    def run_worker() -> None:
+        monitor = new_monitor()
+        while (claimed := dispatcher.next_item()) is not None:
+            index, domain = claimed
+            try:
+                outcomes[index] = monitor.check_source(schedule[index].source)
+            except Exception as e:
+                outcomes[index] = e
+            finally:
+                dispatcher.release(domain)
+    
+    threads = [
+        threading.Thread(target=run_worker, name=f"monitor-{number}", daemon=True)
+        for number in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    finally:
+        # On interruption, let in-flight checks finish
+        dispatcher.cancel()
+        for thread in threads:
+            thread.join()
+    return outcomes
+
+
 def _update_source_after_check(
     registry: "SourceRegistry",
     source: "SourceEntry",
@@ -264,12 +358,18 @@ def _update_source_after_check(
 ) -> None:
     """Update source metadata after a check.
     
+    A successful check is added to the source's change history, which sets
+    the next check time when adaptive intervals are enabled. Its window
+    starts at the previous successful check (``last_observed_at``), since
+    failed checks and acquisitions also move ``last_checked``.
+    
     Args:
         registry: The source registry.
         source: The source that was checked.
         check_result: Result of the check.
-        scheduler: Scheduler with jitter settings.
+        scheduler: Scheduler with jitter and interval settings.
     """
+    previous_check = source.last_checked
     source.last_checked = datetime.now(timezone.utc)
     
     if check_result.status == "error":
@@ -281,9 +381,26 @@ def _update_source_after_check(
     else:
         # Reset failures on success
         source.check_failures = 0
+        if check_result.status in ("changed", "unchanged"):
+            observed_since = source.last_observed_at
+            if observed_since is None and source.change_history:
+                # History recorded before last_observed_at was stored
+                observed_since = previous_check
+            if observed_since is not None:
+                source.change_history = record_observation(
+                    source.change_history,
+                    source.last_checked - observed_since,
+                    changed=check_result.status == "changed",
+                )
+            source.last_observed_at = source.last_checked
+        
+        politeness = scheduler.politeness
+        adaptive = politeness.adaptive_check_intervals
         source.next_check_after = calculate_next_check_with_jitter(
             source,
-            jitter_minutes=scheduler.politeness.check_jitter_minutes,
+            jitter_minutes=politeness.check_jitter_minutes,
+            min_interval=politeness.min_check_interval if adaptive else None,
+            max_interval=politeness.max_check_interval if adaptive else None,
         )
         
         # Update HTTP metadata if available
@@ -153,60 +153,66 @@ def run_pipeline(
     # Track sources needing acquisition
     sources_to_acquire: list[tuple] = []
     
-    # Phase 1: Monitor (if mode is "full" or "check")
-    if config.mode in ("full", "check"):
-        logger.info("Running monitor phase...")
-        result.monitor = run_monitor(
-            registry=registry,
-            scheduler=scheduler,
-            dry_run=config.dry_run,
-            force_fresh=config.force_fresh,
-        )
-        
-        # Collect sources needing acquisition
-        for source in result.monitor.initial_needed:
-            sources_to_acquire.append((source, None))
-        
-        for source, check_result in result.monitor.updates_needed:
-            sources_to_acquire.append((source, check_result))
-        
-        logger.info(
-            "Monitor phase complete: %d sources need acquisition",
-            len(sources_to_acquire),
-        )
-    
-    # Phase 2: Crawler (if mode is "full" or "acquire")
-    if config.mode in ("full", "acquire"):
-        # If acquire-only mode, find sources that need acquisition
-        if config.mode == "acquire" and not sources_to_acquire:
-            if config.force_fresh:
-                logger.info("Acquire mode with force fresh: acquiring all active sources...")
-                all_sources = list(registry.list_sources(status="active"))
-                for source in all_sources[:config.politeness.max_sources_per_run]:
-                    sources_to_acquire.append((source, None))
-            else:
-                logger.info("Acquire mode: looking for pending sources...")
-                from .monitor import get_sources_pending_initial
-                
-                pending = get_sources_pending_initial(registry)
-                for source in pending[:config.politeness.max_sources_per_run]:
-                    sources_to_acquire.append((source, None))
-        
-        if sources_to_acquire:
-            logger.info("Running crawler phase for %d sources...", len(sources_to_acquire))
+    # Buffer source updates: one registry index write (or one GitHub commit)
+    # for the whole run instead of one per saved source
+    with registry.batch():
+        # Phase 1: Monitor (if mode is "full" or "check")
+        if config.mode in ("full", "check"):
+            logger.info("Running monitor phase...")
+            result.monitor = run_monitor(
+                registry=registry,
+                scheduler=scheduler,
+                dry_run=config.dry_run,
+                force_fresh=config.force_fresh,
+                workers=config.monitor_workers,
+                max_hash_bytes=config.monitor_max_hash_bytes,
+                hash_deadline_seconds=config.monitor_hash_deadline_seconds,
+            )
             
-            # Re-initialize scheduler for crawler phase
-            crawler_scheduler = DomainScheduler(politeness=config.politeness)
+            # Collect sources needing acquisition
+            for source in result.monitor.initial_needed:
+                sources_to_acquire.append((source, None))
             
-            result.crawler = run_crawler(
-                sources=sources_to_acquire,
-                config=config,
-                registry=registry,
-                scheduler=crawler_scheduler,
+            for source, check_result in result.monitor.updates_needed:
+                sources_to_acquire.append((source, check_result))
+            
+            logger.info(
+                "Monitor phase complete: %d sources need acquisition",
+                len(sources_to_acquire),
             )
-        else:
-            logger.info("No sources need acquisition, skipping crawler phase")
-            result.crawler = CrawlerResult()
+        
+        # Phase 2: Crawler (if mode is "full" or "acquire")
+        if config.mode in ("full", "acquire"):
+            # If acquire-only mode, find sources that need acquisition
+            if config.mode == "acquire" and not sources_to_acquire:
+                if config.force_fresh:
+                    logger.info("Acquire mode with force fresh: acquiring all active sources...")
+                    all_sources = list(registry.list_sources(status="active"))
+                    for source in all_sources[:config.politeness.max_sources_per_run]:
+                        sources_to_acquire.append((source, None))
+                else:
+                    logger.info("Acquire mode: looking for pending sources...")
+                    from .monitor import get_sources_pending_initial
+                    
+                    pending = get_sources_pending_initial(registry)
+                    for source in pending[:config.politeness.max_sources_per_run]:
+                        sources_to_acquire.append((source, None))
+            
+            if sources_to_acquire:
+                logger.info("Running crawler phase for %d sources...", len(sources_to_acquire))
+                
+                # Re-initialize scheduler for crawler phase
+                crawler_scheduler = DomainScheduler(politeness=config.politeness)
+                
+                result.crawler = run_crawler(
+                    sources=sources_to_acquire,
+                    config=config,
+                    registry=registry,
+                    scheduler=crawler_scheduler,
+                )
+            else:
+                logger.info("No sources need acquisition, skipping crawler phase")
+                result.crawler = CrawlerResult()
     
     result.completed_at = datetime.now(timezone.utc)
     
@@ -5,24 +5,35 @@ any single server with too many requests. It implements:
 
 1. Domain fairness: Round-robin across domains
 2. Per-domain limits: Maximum requests per domain per run
-3. Jitter: Randomization of next check times
+3. Jitter: Randomization of next check times, spaced by each source's
+   estimated change rate when adaptive intervals are enabled
 4. Cooldown tracking: Enforce delays between same-domain requests
+5. Concurrency: One in-flight source per domain and shared request budgets,
+   with DomainDispatcher handing work to worker threads
+6. Crawl-delay: robots.txt delays can stretch a domain's cooldown
 """
 
 from __future__ import annotations
 
+import logging
 import random
+import threading
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Iterator, Sequence
+from typing import TYPE_CHECKING, Generic, Iterator, Sequence, TypeVar
 from urllib.parse import urlparse
 
 if TYPE_CHECKING:
     from src.knowledge.storage import SourceEntry
 
+from .change_rate import adaptive_check_interval
 from .config import PipelinePoliteness, get_check_interval
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 
 @dataclass
 class ScheduledSource:
@@ -111,6 +122,11 @@ class DomainScheduler:
     2. Round-robin ordering across domains
     3. Total sources limited to max_sources
     4. Cooldown enforcement between same-domain requests
+    5. At most one in-flight source per domain when workers run concurrently
+    6. Per-domain and per-run page budgets shared by concurrent workers
+    
+    Request tracking, claims and budgets are guarded by a lock, so one
+    scheduler can be shared by crawl worker threads.
     
     Usage:
         scheduler = DomainScheduler(politeness)
@@ -129,6 +145,11 @@ class DomainScheduler:
     _domain_request_counts: dict[str, int] = field(default_factory=lambda: defaultdict(int))
     _last_request_by_domain: dict[str, datetime] = field(default_factory=dict)
     _total_scheduled: int = 0
+    _in_flight: set[str] = field(default_factory=set)
+    _pages_by_domain: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    _pages_total: int = 0
+    _crawl_delay_by_domain: dict[str, float] = field(default_factory=dict)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
     
     def add_sources(
         self,
@@ -205,8 +226,9 @@ class DomainScheduler:
         Args:
             domain: The domain that was accessed.
         """
-        self._last_request_by_domain[domain] = datetime.now(timezone.utc)
-        self._domain_request_counts[domain] += 1
+        with self._lock:
+            self._last_request_by_domain[domain] = datetime.now(timezone.utc)
+            self._domain_request_counts[domain] += 1
     
     def get_domain_cooldown(self, domain: str) -> float:
         """Get seconds to wait before next request to domain.
@@ -217,18 +239,102 @@ class DomainScheduler:
         Returns:
             Seconds to wait (0 if no wait needed).
         """
-        last_request = self._last_request_by_domain.get(domain)
+        with self._lock:
+            last_request = self._last_request_by_domain.get(domain)
+            crawl_delay = self._crawl_delay_by_domain.get(domain)
         if last_request is None:
             return 0.0
         
         elapsed = datetime.now(timezone.utc) - last_request
         min_interval = self.politeness.min_domain_interval
+        if crawl_delay is not None and self.politeness.respect_robots_crawl_delay:
+            min_interval = max(min_interval, timedelta(seconds=crawl_delay))
         
         if elapsed >= min_interval:
             return 0.0
         
         return (min_interval - elapsed).total_seconds()
     
+    def set_crawl_delay(self, domain: str, seconds: float | None) -> None:
+        """Record the Crawl-delay a domain's robots.txt asks for.
+        
+        When respect_robots_crawl_delay is set, a delay longer than
+        min_domain_interval stretches the domain's cooldown.
+        
+        Args:
+            domain: The domain the robots.txt belongs to.
+            seconds: The Crawl-delay, or None if there is none.
+        """
+        with self._lock:
+            if seconds is None:
+                self._crawl_delay_by_domain.pop(domain, None)
+            else:
+                self._crawl_delay_by_domain[domain] = seconds
+    
+    def claim_domain(self, domain: str) -> bool:
+        """Mark a domain as having a source in flight.
+        
+        Args:
+            domain: The domain about to be accessed.
+            
+        Returns:
+            True if claimed, False if another worker already holds it.
+        """
+        with self._lock:
+            if domain in self._in_flight:
+                return False
+            self._in_flight.add(domain)
+            return True
+    
+    def release_domain(self, domain: str, *, requested: bool = True) -> None:
+        """Record the finished request and free the domain for other workers.
+        
+        Args:
+            domain: A domain previously claimed with claim_domain.
+            requested: False if the worker gave up without contacting the
+                domain, so no cooldown is started.
+        """
+        with self._lock:
+            if requested:
+                self.record_request(domain)
+            self._in_flight.discard(domain)
+    
+    def is_domain_in_flight(self, domain: str) -> bool:
+        """Check whether a worker currently holds the domain."""
+        with self._lock:
+            return domain in self._in_flight
+    
+    def reserve_pages(self, domain: str, wanted: int) -> int:
+        """Reserve page fetches against the per-domain and per-run budgets.
+        
+        Args:
+            domain: The domain the pages belong to.
+            wanted: Pages the caller would like to fetch.
+            
+        Returns:
+            Pages granted (0 once either budget is spent).
+        """
+        with self._lock:
+            domain_left = self.politeness.max_domain_requests_per_run - self._pages_by_domain[domain]
+            total_left = self.politeness.max_total_requests_per_run - self._pages_total
+            granted = max(0, min(wanted, domain_left, total_left))
+            self._pages_by_domain[domain] += granted
+            self._pages_total += granted
+            return granted
+    
+    def return_pages(self, domain: str, unused: int) -> None:
+        """Give back reserved pages that were not fetched.
+        
+        Args:
+            domain: The domain the pages were reserved for.
+            unused: Reserved pages left over.
+        """
+        if unused <= 0:
+            return
+        with self._lock:
+            self._pages_by_domain[domain] -= unused
+            self._pages_total -= unused
+    
     @property
     def total_scheduled(self) -> int:
         """Total sources scheduled in the current run."""
@@ -243,23 +349,97 @@ class DomainScheduler:
         ]
 
 
+class DomainDispatcher(Generic[T]):
+    """Hand pending work items to worker threads under a scheduler's rules.
+    
+    An item is handed out only when no other worker holds its domain and
+    the domain's cooldown has elapsed. Workers with nothing ready wait until
+    a domain is released or the nearest cooldown ends. Items are considered
+    in the order given.
+    """
+    
+    def __init__(self, items: Sequence[tuple[T, str]], scheduler: DomainScheduler) -> None:
+        """Initialize the dispatcher.
+        
+        Args:
+            items: (item, domain) pairs to hand out.
+            scheduler: Scheduler holding domain claims and cooldowns.
+        """
+        self._pending = list(items)
+        self._scheduler = scheduler
+        self._ready = threading.Condition()
+    
+    def next_item(self) -> tuple[T, str] | None:
+        """Claim the next ready item, blocking until one is ready.
+        
+        Returns:
+            (item, domain) tuple, or None once no items remain.
+        """
+        with self._ready:
+            while self._pending:
+                wait: float | None = None
+                for index, (item, domain) in enumerate(self._pending):
+                    if self._scheduler.is_domain_in_flight(domain):
+                        continue
+                    cooldown = self._scheduler.get_domain_cooldown(domain)
+                    if cooldown > 0:
+                        wait = cooldown if wait is None else min(wait, cooldown)
+                        continue
+                    if self._scheduler.claim_domain(domain):
+                        del self._pending[index]
+                        return item, domain
+                if wait is not None:
+                    logger.debug("No domain ready; waiting up to %.1fs", wait)
+                self._ready.wait(timeout=wait)
+            return None
+    
+    def release(self, domain: str, *, requested: bool = True) -> None:
+        """Free a domain and wake workers waiting for it."""
+        self._scheduler.release_domain(domain, requested=requested)
+        with self._ready:
+            self._ready.notify_all()
+    
+    def cancel(self) -> None:
+        """Drop items not yet handed out."""
+        with self._ready:
+            self._pending.clear()
+            self._ready.notify_all()
+
+
 def calculate_next_check_with_jitter(
     source: "SourceEntry",
     jitter_minutes: int = 60,
+    *,
+    min_interval: timedelta | None = None,
+    max_interval: timedelta | None = None,
 ) -> datetime:
     """Calculate when to next check a source, with jitter.
     
     Adds random jitter to prevent all sources with the same frequency
     from being checked at the exact same time.
     
+    When both bounds are given, the interval adapts to the source's
+    ``change_history`` (see ``change_rate``), starting from the static
+    interval for its update frequency. Otherwise the static interval is
+    used as is.
+    
     Args:
         source: The source to calculate next check for.
         jitter_minutes: Maximum random offset in minutes.
+        min_interval: Shortest adaptive interval (optional).
+        max_interval: Longest adaptive interval (optional).
         
     Returns:
         datetime: When the source should next be checked.
     """
     base_interval = get_check_interval(source.update_frequency)
+    if min_interval is not None and max_interval is not None:
+        base_interval = adaptive_check_interval(
+            source.change_history,
+            base_interval,
+            min_interval,
+            max_interval,
+        )
     jitter = timedelta(minutes=random.randint(0, jitter_minutes))
     
     return datetime.now(timezone.utc) + base_interval + jitter
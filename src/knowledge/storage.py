@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
-from dataclasses import dataclass, field
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List
+from urllib.parse import urlparse
 
 from src import paths
 from src.parsing import utils
@@ -487,11 +491,15 @@ class SourceEntry:
 
     # Monitoring metadata (for change detection)
     last_content_hash: str | None = None  # SHA-256 of last acquired content
+    last_content_hash_bytes: int | None = None  # Hash covers only this many leading bytes (None = whole body)
+    last_content_fingerprint: str | None = None  # Normalized main-text fingerprint of the source page
     last_etag: str | None = None  # HTTP ETag from last check
     last_modified_header: str | None = None  # Last-Modified header value
     last_checked: datetime | None = None  # When source was last probed
+    last_observed_at: datetime | None = None  # When a check last compared content successfully
     check_failures: int = 0  # Consecutive check failures
     next_check_after: datetime | None = None  # Backoff: don't check before this
+    change_history: List[List[int]] = field(default_factory=list)  # [seconds since previous check, changed] per check
 
     # Site-wide crawl configuration
     is_crawlable: bool = False  # Enable site-wide crawling
@@ -530,10 +538,14 @@ class SourceEntry:
             "notes": self.notes,
             # Monitoring metadata
             "last_content_hash": self.last_content_hash,
+            "last_content_hash_bytes": self.last_content_hash_bytes,
+            "last_content_fingerprint": self.last_content_fingerprint,
             "last_etag": self.last_etag,
             "last_modified_header": self.last_modified_header,
             "last_checked": self.last_checked.isoformat() if self.last_checked else None,
+            "last_observed_at": self.last_observed_at.isoformat() if self.last_observed_at else None,
             "check_failures": self.check_failures,
+            "change_history": self.change_history,
             "next_check_after": self.next_check_after.isoformat() if self.next_check_after else None,
             # Crawl configuration
             "is_crawlable": self.is_crawlable,
@@ -560,6 +572,10 @@ class SourceEntry:
         if payload.get("last_checked"):
             last_checked = datetime.fromisoformat(payload["last_checked"])
         
+        last_observed_at = None
+        if payload.get("last_observed_at"):
+            last_observed_at = datetime.fromisoformat(payload["last_observed_at"])
+        
         next_check_after = None
         if payload.get("next_check_after"):
             next_check_after = datetime.fromisoformat(payload["next_check_after"])
@@ -594,10 +610,14 @@ class SourceEntry:
             notes=payload.get("notes", ""),
             # Monitoring metadata (with defaults for backward compatibility)
             last_content_hash=payload.get("last_content_hash"),
+            last_content_hash_bytes=payload.get("last_content_hash_bytes"),
+            last_content_fingerprint=payload.get("last_content_fingerprint"),
             last_etag=payload.get("last_etag"),
             last_modified_header=payload.get("last_modified_header"),
             last_checked=last_checked,
+            last_observed_at=last_observed_at,
             check_failures=payload.get("check_failures", 0),
+            change_history=[list(entry) for entry in payload.get("change_history", [])],
             next_check_after=next_check_after,
             # Crawl configuration (with defaults for backward compatibility)
             is_crawlable=payload.get("is_crawlable", False),
@@ -618,11 +638,92 @@ class SourceEntry:
         return _url_hash(self.url)
 
 
+def _source_domain(url: str) -> str:
+    """Domain key used for grouping sources (matches ``scheduler.extract_domain``)."""
+    host = urlparse(url).netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host.split(":")[0]
+
+
+def _due_key(next_check_after: datetime | None) -> float:
+    return next_check_after.timestamp() if next_check_after is not None else float("-inf")
+
+
+def _render_registry_index(index: dict[str, str]) -> str:
+    data = {
+        "version": 1,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "sources": index,
+    }
+    return json.dumps(data, indent=2)
+
+
+def _clone_source(source: SourceEntry) -> SourceEntry:
+    """Copy a cached entry so callers can mutate it without touching the snapshot."""
+    return replace(source, topics=list(source.topics))
+
+
+class _SourceSnapshot:
+    """In-memory view of the registry with secondary indexes.
+
+    ``order`` preserves the position of each source in ``registry.json`` so
+    filtered listings come back in the same order as a full scan. ``due`` is
+    kept sorted by ``next_check_after`` (unscheduled sources first) so the
+    sources due at a given time are a prefix found by bisection.
+    """
+
+    def __init__(self, state: tuple[int, int, int] | None) -> None:
+        self.state = state
+        self.entries: dict[str, SourceEntry] = {}
+        self.order: dict[str, int] = {}
+        self.by_status: dict[str, set[str]] = defaultdict(set)
+        self.by_domain: dict[str, set[str]] = defaultdict(set)
+        self.due: list[tuple[float, str]] = []
+        self._next_position = 0
+
+    def upsert(self, url_hash: str, source: SourceEntry) -> None:
+        if url_hash in self.entries:
+            self._unindex(url_hash)
+        else:
+            self.order[url_hash] = self._next_position
+            self._next_position += 1
+        self.entries[url_hash] = source
+        self.by_status[source.status].add(url_hash)
+        self.by_domain[_source_domain(source.url)].add(url_hash)
+        bisect.insort(self.due, (_due_key(source.next_check_after), url_hash))
+
+    def remove(self, url_hash: str) -> None:
+        if url_hash in self.entries:
+            self._unindex(url_hash)
+            del self.entries[url_hash]
+            del self.order[url_hash]
+
+    def ordered(self, url_hashes: Iterable[str]) -> list[SourceEntry]:
+        return [self.entries[h] for h in sorted(url_hashes, key=self.order.__getitem__)]
+
+    def _unindex(self, url_hash: str) -> None:
+        previous = self.entries[url_hash]
+        self.by_status[previous.status].discard(url_hash)
+        self.by_domain[_source_domain(previous.url)].discard(url_hash)
+        key = (_due_key(previous.next_check_after), url_hash)
+        position = bisect.bisect_left(self.due, key)
+        if position < len(self.due) and self.due[position] == key:
+            del self.due[position]
+
+
 class SourceRegistry:
     """Manages storage of authoritative sources.
 
     When running in GitHub Actions, pass a GitHubStorageClient to persist
     writes via the GitHub API instead of the local filesystem.
+
+    Reads are served from an in-process snapshot of every source, indexed by
+    status, domain and ``next_check_after``. The snapshot is rebuilt when
+    ``registry.json`` changes on disk (another process saved a source) and
+    is updated in place by this instance's own writes, which also bump
+    :attr:`generation`. Returned entries are copies; mutate them freely and
+    call :meth:`save_source` to persist.
     """
 
     def __init__(
@@ -640,6 +741,21 @@ class SourceRegistry:
         self._sources_dir = self.root / "sources"
         utils.ensure_directory(self._sources_dir)
         self._registry_path = self._sources_dir / "registry.json"
+        self._snapshot: _SourceSnapshot | None = None
+        self._generation = 0
+        # Unit of work: buffered writes between begin_batch() and flush_all()
+        self._batching = False
+        self._pending_sources: dict[str, SourceEntry] = {}
+        self._pending_deletes: set[str] = set()
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every write or reload of the snapshot."""
+        return self._generation
+
+    def refresh(self) -> None:
+        """Drop the snapshot so the next read reloads from disk."""
+        self._snapshot = None
 
     def _get_relative_path(self, path: Path) -> str:
         """Get path relative to project root for GitHub API."""
@@ -653,6 +769,58 @@ class SourceRegistry:
         """Get the path for an individual source entry."""
         return self._sources_dir / f"{_url_hash(url)}.json"
 
+    def _index_state(self) -> tuple[int, int, int] | None:
+        """Stat signature of ``registry.json``; every local save rewrites it."""
+        try:
+            stat = self._registry_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _current_snapshot(self) -> _SourceSnapshot:
+        state = self._index_state()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.state != state:
+            snapshot = _SourceSnapshot(state)
+            for url_hash in self._load_registry_index():
+                source = self._read_source_file(self._sources_dir / f"{url_hash}.json")
+                if source is not None:
+                    snapshot.upsert(url_hash, source)
+            # Buffered batch writes are not on disk yet
+            for url_hash in self._pending_deletes:
+                snapshot.remove(url_hash)
+            for url_hash, source in self._pending_sources.items():
+                snapshot.upsert(url_hash, source)
+            self._snapshot = snapshot
+            self._generation += 1
+        return snapshot
+
+    def _apply_to_snapshot(
+        self,
+        previous_state: tuple[int, int, int] | None,
+        change: Callable[[_SourceSnapshot], None],
+    ) -> None:
+        """Apply a local write to the snapshot, or drop it if others wrote too."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+        if snapshot.state != previous_state:
+            self._snapshot = None
+        else:
+            change(snapshot)
+            snapshot.state = self._index_state()
+        self._generation += 1
+
+    @staticmethod
+    def _read_source_file(path: Path) -> SourceEntry | None:
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return SourceEntry.from_dict(data)
+        except (json.JSONDecodeError, KeyError):
+            return None
+
     def _load_registry_index(self) -> dict[str, str]:
         """Load the registry index mapping URL hashes to URLs."""
         if not self._registry_path.exists():
@@ -665,12 +833,7 @@ class SourceRegistry:
 
     def _save_registry_index(self, index: dict[str, str]) -> None:
         """Save the registry index."""
-        data = {
-            "version": 1,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "sources": index,
-        }
-        content = json.dumps(data, indent=2)
+        content = _render_registry_index(index)
 
         if self._github_client:
             rel_path = self._get_relative_path(self._registry_path)
@@ -684,20 +847,96 @@ class SourceRegistry:
             tmp_path.write_text(content, encoding="utf-8")
             tmp_path.replace(self._registry_path)
 
+    def begin_batch(self) -> None:
+        """Start buffering source writes until :meth:`flush_all`.
+
+        While batching, :meth:`save_source` and :meth:`delete_source` only
+        update memory; reads see the buffered changes. ``flush_all`` then
+        writes each touched source file once and ``registry.json`` once, or
+        makes a single commit when using a GitHub client.
+        """
+        self._current_snapshot()
+        self._batching = True
+
+    def flush_all(self) -> None:
+        """Write buffered source changes and end the batch."""
+        self._batching = False
+        if not self._pending_sources and not self._pending_deletes:
+            return
+
+        previous_state = self._index_state()
+        index = self._load_registry_index()
+        for url_hash in self._pending_deletes:
+            index.pop(url_hash, None)
+        source_files = []
+        for url_hash, source in self._pending_sources.items():
+            index[url_hash] = source.url
+            source_files.append(
+                (self._sources_dir / f"{url_hash}.json", json.dumps(source.to_dict(), indent=2))
+            )
+        index_content = _render_registry_index(index)
+
+        if self._github_client:
+            files = [(self._get_relative_path(path), content) for path, content in source_files]
+            files.append((self._get_relative_path(self._registry_path), index_content))
+            changed = len(self._pending_sources) + len(self._pending_deletes)
+            self._github_client.commit_files_batch(
+                files=files,
+                message=f"Update sources ({changed} changed)",
+            )
+            for url_hash in self._pending_deletes:
+                (self._sources_dir / f"{url_hash}.json").unlink(missing_ok=True)
+        else:
+            for url_hash in self._pending_deletes:
+                (self._sources_dir / f"{url_hash}.json").unlink(missing_ok=True)
+            for path, content in source_files:
+                tmp_path = path.with_suffix(path.suffix + ".tmp")
+                tmp_path.write_text(content, encoding="utf-8")
+                tmp_path.replace(path)
+            tmp_idx = self._registry_path.with_suffix(".json.tmp")
+            tmp_idx.write_text(index_content, encoding="utf-8")
+            tmp_idx.replace(self._registry_path)
+
+        self._pending_sources = {}
+        self._pending_deletes = set()
+        # The snapshot already holds the flushed changes
+        self._apply_to_snapshot(previous_state, lambda snapshot: None)
+
+    @contextmanager
+    def batch(self) -> Iterator["SourceRegistry"]:
+        """Context manager around :meth:`begin_batch` / :meth:`flush_all`.
+
+        Buffered changes are flushed even if the block raises, so progress
+        made before a failure is kept as it was with unbatched saves. Nested
+        ``batch()`` blocks join the outer one.
+        """
+        if self._batching:
+            yield self
+            return
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.flush_all()
+
     def save_source(self, source: SourceEntry) -> None:
         """Save a source entry to storage."""
+        if self._batching:
+            saved = _clone_source(source)
+            self._pending_deletes.discard(source.url_hash)
+            self._pending_sources[source.url_hash] = saved
+            self._current_snapshot().upsert(source.url_hash, saved)
+            self._generation += 1
+            return
+
+        previous_state = self._index_state()
         path = self._get_source_path(source.url)
         source_content = json.dumps(source.to_dict(), indent=2)
 
         # Update registry index
         index = self._load_registry_index()
         index[source.url_hash] = source.url
-        index_data = {
-            "version": 1,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "sources": index,
-        }
-        index_content = json.dumps(index_data, indent=2)
+        index_content = _render_registry_index(index)
 
         if self._github_client:
             # Batch commit both files together
@@ -720,29 +959,22 @@ class SourceRegistry:
             tmp_idx.write_text(index_content, encoding="utf-8")
             tmp_idx.replace(self._registry_path)
 
+        saved = _clone_source(source)
+        self._apply_to_snapshot(
+            previous_state, lambda snapshot: snapshot.upsert(source.url_hash, saved)
+        )
+
     def get_source(self, url: str) -> SourceEntry | None:
         """Retrieve a source entry by URL."""
-        path = self._get_source_path(url)
-        if not path.exists():
-            return None
-
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            return SourceEntry.from_dict(data)
-        except (json.JSONDecodeError, KeyError):
-            return None
+        return self.get_source_by_hash(_url_hash(url))
 
     def get_source_by_hash(self, url_hash: str) -> SourceEntry | None:
         """Retrieve a source entry by its URL hash."""
-        path = self._sources_dir / f"{url_hash}.json"
-        if not path.exists():
-            return None
-
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            return SourceEntry.from_dict(data)
-        except (json.JSONDecodeError, KeyError):
-            return None
+        source = self._current_snapshot().entries.get(url_hash)
+        if source is None:
+            # Files not listed in registry.json are still readable directly
+            return self._read_source_file(self._sources_dir / f"{url_hash}.json")
+        return _clone_source(source)
 
     def list_sources(
         self,
@@ -750,29 +982,64 @@ class SourceRegistry:
         source_type: str | None = None,
     ) -> List[SourceEntry]:
         """List all sources, optionally filtered by status or type."""
-        sources: List[SourceEntry] = []
-        index = self._load_registry_index()
+        snapshot = self._current_snapshot()
+        if status is not None:
+            candidates = snapshot.ordered(snapshot.by_status.get(status, ()))
+        else:
+            candidates = list(snapshot.entries.values())
 
-        for url_hash in index:
-            source = self.get_source_by_hash(url_hash)
-            if source is None:
-                continue
-            if status is not None and source.status != status:
-                continue
-            if source_type is not None and source.source_type != source_type:
-                continue
-            sources.append(source)
+        return [
+            _clone_source(source)
+            for source in candidates
+            if source_type is None or source.source_type == source_type
+        ]
 
-        return sources
+    def list_sources_by_domain(
+        self,
+        domain: str,
+        status: str | None = None,
+    ) -> List[SourceEntry]:
+        """List sources whose host (minus ``www.`` and port) equals ``domain``."""
+        snapshot = self._current_snapshot()
+        return [
+            _clone_source(source)
+            for source in snapshot.ordered(snapshot.by_domain.get(domain.lower(), ()))
+            if status is None or source.status == status
+        ]
+
+    def list_due_sources(
+        self,
+        now: datetime | None = None,
+        status: str | None = "active",
+    ) -> List[SourceEntry]:
+        """List sources whose ``next_check_after`` is unset or not after ``now``."""
+        now = now or datetime.now(timezone.utc)
+        snapshot = self._current_snapshot()
+        cutoff = bisect.bisect_right(snapshot.due, (now.timestamp(), "\uffff"))
+        return [
+            _clone_source(source)
+            for source in snapshot.ordered(url_hash for _key, url_hash in snapshot.due[:cutoff])
+            if status is None or source.status == status
+        ]
 
     def delete_source(self, url: str) -> bool:
         """Delete a source entry. Returns True if deleted, False if not found."""
         path = self._get_source_path(url)
         url_hash = _url_hash(url)
 
+        if self._batching:
+            if not self.source_exists(url):
+                return False
+            self._pending_sources.pop(url_hash, None)
+            self._pending_deletes.add(url_hash)
+            self._current_snapshot().remove(url_hash)
+            self._generation += 1
+            return True
+
         if not path.exists():
             return False
 
+        previous_state = self._index_state()
         path.unlink()
 
         # Update registry index
@@ -781,14 +1048,19 @@ class SourceRegistry:
             del index[url_hash]
             self._save_registry_index(index)
 
+        self._apply_to_snapshot(previous_state, lambda snapshot: snapshot.remove(url_hash))
         return True
 
     def source_exists(self, url: str) -> bool:
         """Check if a source is already registered."""
+        url_hash = _url_hash(url)
+        if url_hash in self._pending_sources:
+            return True
+        if url_hash in self._pending_deletes:
+            return False
         return self._get_source_path(url).exists()
 
     def get_all_urls(self) -> List[str]:
         """Get all registered source URLs."""
-        index = self._load_registry_index()
-        return list(index.values())
+        return [source.url for source in self._current_snapshot().entries.values()]
 
@@ -14,11 +14,16 @@ class ParserError(RuntimeError):
 
 @dataclass(frozen=True)
 class ParseTarget:
-    """Describes the origin that a parser should operate on."""
+    """Describes the origin that a parser should operate on.
+
+    ``checksum`` carries the SHA-256 of a local file when the caller already
+    knows it, so parsers do not hash the file a second time.
+    """
 
     source: str
     is_remote: bool = False
     media_type: str | None = None
+    checksum: str | None = None
 
     def to_path(self) -> Path:
         """Return the source as a ``Path`` when the target is local."""
@@ -29,7 +34,11 @@ class ParseTarget:
 
 @dataclass(slots=True)
 class ParsedDocument:
-    """Represents the structured output from a parser."""
+    """Represents the structured output from a parser.
+
+    ``links`` holds absolute outbound URLs for parsers that discover them
+    (currently only the web parser); it is not persisted.
+    """
 
     target: ParseTarget
     checksum: str
@@ -37,6 +46,7 @@ class ParsedDocument:
     segments: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
     warnings: list[str] = field(default_factory=list)
+    links: list[str] = field(default_factory=list)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def add_segment(self, segment: str) -> None:
@@ -14,6 +14,8 @@ from . import utils
 _DEFAULT_OUTPUT_ROOT = paths.get_evidence_root() / "parsed"
 _DEFAULT_SCAN_SUFFIXES = (".pdf", ".docx", ".html", ".htm", ".xhtml")
 _DEFAULT_CONFIG_PATH = Path("config/parsing.yaml")
+_DEFAULT_MANIFEST_BACKEND = "json"
+_MANIFEST_BACKENDS = ("json", "journal")
 
 
 @dataclass(slots=True)
@@ -28,6 +30,7 @@ class ScanConfig:
 class ParsingConfig:
     output_root: Path
     scan: ScanConfig
+    manifest_backend: str = _DEFAULT_MANIFEST_BACKEND
 
     @classmethod
     def default(cls) -> "ParsingConfig":
@@ -46,7 +49,12 @@ class ParsingConfig:
 
         scan_payload = payload.get("scan") or {}
         scan = _build_scan_config(scan_payload)
-        return cls(output_root=output_root, scan=scan)
+        manifest_backend = str(payload.get("manifest_backend") or _DEFAULT_MANIFEST_BACKEND)
+        if manifest_backend not in _MANIFEST_BACKENDS:
+            raise ValueError(
+                f"Invalid manifest_backend: {manifest_backend}. Must be one of {_MANIFEST_BACKENDS}"
+            )
+        return cls(output_root=output_root, scan=scan, manifest_backend=manifest_backend)
 
 
 def load_parsing_config(config_path: Path | None) -> ParsingConfig:
@@ -0,0 +1,81 @@
+"""Normalized content fingerprints for change detection.
+
+Hashing raw HTML flags a page as changed whenever a CSP nonce, CSRF token,
+ad slot or "generated at" footer changes, even though nothing a reader
+would notice is different. A fingerprint hashes only what the page says:
+the main text that trafilatura extracts (navigation, ads and other
+boilerplate stripped), with volatile tokens such as dates, clock times,
+relative ages and long opaque identifiers removed and whitespace
+collapsed.
+
+The monitor fingerprints the HTML it downloads and the crawler
+fingerprints the documents it parses, so the two compare like for like.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import TYPE_CHECKING
+
+from .web import analyze_html
+
+if TYPE_CHECKING:
+    from .base import ParsedDocument
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+
+# Tokens that change between fetches without the content changing
+_VOLATILE = re.compile(
+    rf"""
+    \b\d{{4}}-\d{{2}}-\d{{2}}(?:[T\s]\d{{1,2}}:\d{{2}}(?::\d{{2}}(?:\.\d+)?)?(?:Z|[+-]\d{{2}}:?\d{{2}})?)?\b
+    | \b\d{{1,2}}[/.]\d{{1,2}}[/.]\d{{2,4}}\b
+    | \b{_MONTH}\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}\b
+    | \b\d{{1,2}}(?:st|nd|rd|th)?\s+{_MONTH},?\s+\d{{4}}\b
+    | \b\d{{1,2}}:\d{{2}}(?::\d{{2}})?(?:\s*[ap]\.?m\b\.?)?
+    | \b\d+\s+(?:second|minute|hour|day|week|month|year)s?\s+ago\b
+    | \b1\d{{9}}(?:\d{{3}})?\b
+    | \b(?=[0-9a-f-]*\d)(?=[0-9a-f-]*[a-f])[0-9a-f-]{{16,}}\b
+    | (?<![\w+/=-])(?=[\w+/=-]*\d)(?=[\w+/=-]*[a-z])[\w+/=-]{{24,}}
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+def normalize_text(text: str) -> str:
+    """Drop volatile tokens from ``text`` and collapse its whitespace."""
+    return " ".join(_VOLATILE.sub(" ", text).split())
+
+
+def text_fingerprint(text: str | None) -> str | None:
+    """Return the SHA-256 fingerprint of normalized text.
+
+    Returns None when nothing is left after normalization.
+    """
+    normalized = normalize_text(text or "")
+    if not normalized:
+        return None
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def html_fingerprint(html: str, url: str | None = None) -> str | None:
+    """Return the fingerprint of an HTML page's main text.
+
+    Args:
+        html: The HTML document.
+        url: Page URL, passed through to extraction.
+    """
+    return text_fingerprint(analyze_html(html, url).text)
+
+
+def document_fingerprint(document: "ParsedDocument") -> str | None:
+    """Return the fingerprint of a parsed document's extracted text."""
+    return text_fingerprint("\n\n".join(document.segments))
+
+
+__all__ = [
+    "document_fingerprint",
+    "html_fingerprint",
+    "normalize_text",
+    "text_fingerprint",
+]
@@ -0,0 +1,125 @@
+"""Stat-based cache of file checksums.
+
+Rescanning an evidence folder used to hash every file just to learn that it
+was already parsed. The cache remembers the checksum of each file together
+with its size, ``mtime_ns`` and inode; while all three still match, the
+cached checksum is returned without reading the file.
+
+Files modified within :data:`RACY_WINDOW_NS` of being hashed are not cached,
+since a second write inside the filesystem's timestamp granularity could
+leave the stat unchanged (the same "racy clean" rule git applies to its
+index). The cache is a local, machine-specific file: it lives beside the
+parsed output rather than inside it (see :func:`default_cache_path`), so
+committing that output never picks it up.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+from . import utils
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_FILENAME = ".fingerprints.json"
+FINGERPRINT_DIRNAME = ".parse-cache"
+_CACHE_VERSION = 1
+
+# Files whose mtime is this close to "now" are hashed but not cached.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def default_cache_path(root: Path) -> Path:
+    """Return the cache file for documents parsed into ``root``.
+
+    The file sits in a ``.parse-cache`` directory next to ``root``, e.g.
+    ``evidence/.parse-cache/parsed.fingerprints.json`` for ``evidence/parsed``.
+    """
+    return root.parent / FINGERPRINT_DIRNAME / f"{root.name}{FINGERPRINT_FILENAME}"
+
+
+class FingerprintCache:
+    """Maps ``path -> (size, mtime_ns, inode, checksum)``, persisted as JSON.
+
+    Args:
+        path: Location of the cache file. ``None`` keeps the cache in memory.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, list] = {}
+        self._dirty = False
+        if path is not None:
+            self._entries = self._load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def checksum(self, path: Path) -> str:
+        """Return the SHA-256 of ``path``, hashing only if its stat changed."""
+        key = str(path)
+        stat = os.stat(path)
+        fingerprint = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+        cached = self._entries.get(key)
+        if cached is not None and cached[:3] == fingerprint:
+            self.hits += 1
+            return cached[3]
+
+        self.misses += 1
+        checksum = utils.sha256_path(path)
+        if time.time_ns() - stat.st_mtime_ns > RACY_WINDOW_NS:
+            self._entries[key] = [*fingerprint, checksum]
+            self._dirty = True
+        elif cached is not None:
+            del self._entries[key]
+            self._dirty = True
+        return checksum
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed since it was loaded.
+
+        Entries for files that no longer exist are dropped first, so the
+        cache does not grow with every file ever parsed.
+        """
+        if self.path is None:
+            return
+        missing = [key for key in self._entries if not os.path.exists(key)]
+        for key in missing:
+            del self._entries[key]
+        if not (self._dirty or missing):
+            return
+        payload = {"version": _CACHE_VERSION, "files": self._entries}
+        utils.ensure_directory(self.path.parent)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+    @staticmethod
+    def _load(path: Path) -> dict[str, list]:
+        if not path.exists():
+            return {}
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable fingerprint cache %s: %s", path, exc)
+            return {}
+        if payload.get("version") != _CACHE_VERSION:
+            return {}
+        return dict(payload.get("files", {}))
+
+
+__all__ = [
+    "FINGERPRINT_DIRNAME",
+    "FINGERPRINT_FILENAME",
+    "FingerprintCache",
+    "RACY_WINDOW_NS",
+    "default_cache_path",
+]
@@ -0,0 +1,204 @@
+"""Pooled static HTTP fetching for remote pages.
+
+Most pages are server-rendered and can be fetched with a plain GET, which is
+far cheaper than launching a browser. This module keeps one process-wide
+:class:`requests.Session` so connections to the same host are kept alive and
+reused across pages, sources, and pipeline phases.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing for the shared session
+DEFAULT_POOL_CONNECTIONS = 16
+DEFAULT_POOL_MAXSIZE = 16
+
+# Default request timeout in seconds
+DEFAULT_TIMEOUT = 30.0
+
+# Refuse to buffer bodies larger than this many bytes
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+class StaticFetchError(Exception):
+    """Raised when a static HTTP fetch cannot produce usable HTML."""
+
+
+@dataclass(slots=True, frozen=True)
+class FetchedPage:
+    """Result of fetching a page with a plain HTTP GET."""
+
+    url: str
+    final_url: str
+    html: str
+    status_code: int
+    content_type: str | None = None
+    encoding: str | None = None
+
+    @property
+    def content_length(self) -> int:
+        """Return the length of the decoded HTML."""
+        return len(self.html)
+
+
+def get_session() -> requests.Session:
+    """Return the shared, connection-pooled HTTP session.
+
+    The session is created lazily on first use and closed at interpreter
+    exit. Callers should pass per-request headers (such as ``User-Agent``)
+    rather than mutating the session's defaults.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=DEFAULT_POOL_CONNECTIONS,
+                    pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def close_session() -> None:
+    """Close the shared session and drop its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+atexit.register(close_session)
+
+
+def fetch_static(
+    url: str,
+    *,
+    user_agent: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    session: requests.Session | None = None,
+) -> FetchedPage:
+    """Fetch ``url`` with a plain GET and decode it as HTML.
+
+    Args:
+        url: The URL to fetch.
+        user_agent: User agent string sent with the request.
+        timeout: Connect/read timeout in seconds.
+        max_bytes: Maximum response body size to accept.
+        session: Session to use (defaults to the shared session).
+
+    Returns:
+        FetchedPage with the decoded HTML.
+
+    Raises:
+        StaticFetchError: If the request fails, returns an error status,
+            is not HTML, or exceeds ``max_bytes``.
+    """
+    session = session or get_session()
+    headers = {
+        "User-Agent": user_agent,
+        "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+
+    try:
+        response = session.get(url, headers=headers, timeout=timeout, stream=True)
+    except requests.RequestException as e:
+        raise StaticFetchError(f"Request failed for URL '{url}': {e}") from e
+
+    try:
+        if response.status_code >= 400:
+            raise StaticFetchError(f"HTTP {response.status_code} error for URL: {url}")
+
+        content_type = response.headers.get("Content-Type", "")
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        if media_type and media_type not in _HTML_CONTENT_TYPES:
+            raise StaticFetchError(f"Unexpected content type '{media_type}' for URL: {url}")
+
+        body = bytearray()
+        try:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body.extend(chunk)
+                if len(body) > max_bytes:
+                    raise StaticFetchError(
+                        f"Response for URL '{url}' exceeds {max_bytes} bytes"
+                    )
+        except requests.RequestException as e:
+            raise StaticFetchError(f"Failed reading response for URL '{url}': {e}") from e
+
+        html, encoding = decode_html(bytes(body), response)
+
+        return FetchedPage(
+            url=url,
+            final_url=response.url or url,
+            html=html,
+            status_code=response.status_code,
+            content_type=media_type or None,
+            encoding=encoding,
+        )
+    finally:
+        response.close()
+
+
+def is_html_content_type(content_type: str | None) -> bool:
+    """Return True if a Content-Type header value names an HTML media type."""
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    return media_type in _HTML_CONTENT_TYPES
+
+
+def decode_html(data: bytes, response: requests.Response) -> tuple[str, str]:
+    """Decode an HTML body read from ``response``.
+
+    Returns:
+        (html, encoding used).
+    """
+    # Only trust the declared charset; requests otherwise assumes
+    # ISO-8859-1 for text/* which garbles most modern pages.
+    content_type = response.headers.get("Content-Type", "")
+    declared = response.encoding if "charset=" in content_type.lower() else None
+    return _decode(data, declared)
+
+
+def _decode(data: bytes, declared: str | None) -> tuple[str, str]:
+    """Decode a response body, preferring the declared charset."""
+    if declared:
+        try:
+            return data.decode(declared), declared
+        except (LookupError, UnicodeDecodeError):
+            pass
+    for encoding in ("utf-8", "latin-1"):
+        try:
+            return data.decode(encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    return data.decode("utf-8", errors="replace"), "unknown"  # pragma: no cover
+
+
+__all__ = [
+    "FetchedPage",
+    "StaticFetchError",
+    "close_session",
+    "decode_html",
+    "fetch_static",
+    "get_session",
+    "is_html_content_type",
+]
@@ -16,7 +16,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from html.parser import HTMLParser
-from typing import List, Set
+from typing import TYPE_CHECKING, List, Set
 from urllib.parse import urljoin, urlparse
 
 from src.parsing.url_scope import (
@@ -25,6 +25,9 @@ from src.parsing.url_scope import (
     should_skip_url,
 )
 
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
 
 @dataclass
 class ExtractedLink:
@@ -212,6 +215,37 @@ def extract_links(html: str, base_url: str) -> List[ExtractedLink]:
     return extractor.get_links()
 
 
+def extract_links_from_tree(tree: "HtmlElement", base_url: str) -> List[ExtractedLink]:
+    """Extract links from an already-parsed lxml HTML tree.
+    
+    Applies the same filtering, resolution and deduplication as
+    :func:`extract_links`, without parsing the document again.
+    
+    Args:
+        tree: Root element of the parsed document
+        base_url: The URL of the page (for resolving relative URLs)
+        
+    Returns:
+        List of ExtractedLink objects
+    """
+    extractor = LinkExtractor(base_url)
+    for element in tree.iter("base", *LinkExtractor.LINK_ATTRS):
+        tag = element.tag
+        href = element.get("href") or ""
+        if not href:
+            continue
+        if tag == "base":
+            extractor.base_url = urljoin(extractor.base_url, href)
+        elif tag == "a":
+            anchor_text = " ".join(
+                text.strip() for text in element.itertext() if text.strip()
+            )
+            extractor._add_link(href, anchor_text=anchor_text, tag="a", rel=element.get("rel", ""))
+        else:
+            extractor._add_link(href, tag=tag, rel=element.get("rel", ""))
+    return extractor.get_links()
+
+
 def extract_urls(html: str, base_url: str) -> List[str]:
     """Extract just the URLs from HTML content.
     
@@ -272,6 +306,24 @@ def extract_title(html: str) -> str | None:
     return None
 
 
+def extract_title_from_tree(tree: "HtmlElement") -> str | None:
+    """Extract the page title from an already-parsed lxml HTML tree.
+    
+    Args:
+        tree: Root element of the parsed document
+        
+    Returns:
+        The page title, or None if not found
+    """
+    title = tree.find("head/title")
+    if title is None:
+        title = tree.find(".//title")
+    if title is None:
+        return None
+    text = title.text_content().strip()
+    return text or None
+
+
 def count_links(html: str, base_url: str, source_url: str, scope: str) -> tuple[int, int]:
     """Count total links and in-scope links in HTML content.
     
@@ -0,0 +1,124 @@
+"""Append-only journal backing the parse manifest.
+
+Rewriting the whole ``manifest.json`` for every recorded document makes a
+scan quadratic in the number of documents. The journal backend instead
+appends one JSON line per ``record_entry`` to ``<manifest>.journal`` and only
+rewrites the JSON snapshot during compaction. On load, the snapshot is read
+and the journal replayed on top of it; replaying is idempotent, so a crash
+between writing the snapshot and truncating the journal is harmless.
+
+A crash while appending can leave a torn final line. Replay ignores it and
+truncates the file back to the last complete record before appending again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import weakref
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .storage import Manifest, ManifestEntry
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal"
+
+# Compact once the journal holds this many records, or as many records as
+# the manifest has entries, whichever is larger (amortized O(1) per record).
+DEFAULT_COMPACT_MIN_RECORDS = 1000
+
+
+class ManifestJournal:
+    """Append-only record log for a manifest snapshot file.
+
+    Args:
+        snapshot_path: Path of the JSON manifest the journal belongs to.
+        compact_min_records: Minimum journal length before compaction.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        *,
+        compact_min_records: int = DEFAULT_COMPACT_MIN_RECORDS,
+    ) -> None:
+        self.path = snapshot_path.with_name(snapshot_path.name + JOURNAL_SUFFIX)
+        self.compact_min_records = max(compact_min_records, 1)
+        self.records = 0
+        self._handle: IO[bytes] | None = None
+        self._finalizer: weakref.finalize | None = None
+
+    def replay(self, manifest: "Manifest", entry_factory: Callable[[dict], "ManifestEntry"]) -> int:
+        """Apply journal records to ``manifest`` and return how many were applied."""
+        if not self.path.exists():
+            self.records = 0
+            return 0
+
+        applied = 0
+        good_offset = 0
+        with self.path.open("rb") as handle:
+            for raw_line in handle:
+                if not raw_line.endswith(b"\n"):
+                    logger.warning("Ignoring torn record at end of %s", self.path)
+                    break
+                try:
+                    record = json.loads(raw_line)
+                    entry = entry_factory(record["entry"])
+                except (ValueError, KeyError, TypeError) as exc:
+                    logger.warning("Skipping unreadable record in %s: %s", self.path, exc)
+                    good_offset += len(raw_line)
+                    continue
+                manifest.upsert(entry)
+                applied += 1
+                good_offset += len(raw_line)
+
+        if good_offset < self.path.stat().st_size:
+            with self.path.open("r+b") as handle:
+                handle.truncate(good_offset)
+
+        self.records = applied
+        return applied
+
+    def append(self, entry: "ManifestEntry") -> None:
+        """Append one upsert record for ``entry``."""
+        line = json.dumps({"op": "upsert", "entry": entry.to_dict()}, sort_keys=True)
+        handle = self._open()
+        handle.write(line.encode("utf-8") + b"\n")
+        handle.flush()
+        self.records += 1
+
+    def needs_compaction(self, entry_count: int) -> bool:
+        """Return True once the journal outweighs the snapshot."""
+        return self.records >= max(self.compact_min_records, entry_count)
+
+    def sync(self) -> None:
+        """Force appended records to stable storage."""
+        if self._handle is not None:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+
+    def reset(self) -> None:
+        """Discard the journal after its records were folded into the snapshot."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self.records = 0
+
+    def close(self) -> None:
+        """Close the append handle, if open."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._handle = None
+
+    def _open(self) -> IO[bytes]:
+        if self._handle is None:
+            self._handle = self.path.open("ab")
+            self._finalizer = weakref.finalize(self, self._handle.close)
+        return self._handle
+
+
+__all__ = ["DEFAULT_COMPACT_MIN_RECORDS", "JOURNAL_SUFFIX", "ManifestJournal"]
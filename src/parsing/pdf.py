@@ -39,7 +39,7 @@ class PdfParser:
     def extract(self, target: ParseTarget) -> ParsedDocument:
         path = self._require_local_file(target)
 
-        checksum = utils.sha256_path(path)
+        checksum = target.checksum or utils.sha256_path(path)
         document = ParsedDocument(target=target, checksum=checksum, parser_name=self.name)
 
         try:
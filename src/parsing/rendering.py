@@ -7,9 +7,14 @@ static HTML extraction via trafilatura yields insufficient content.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import signal
+import threading
+import weakref
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Iterator, Literal
 
 if TYPE_CHECKING:
     from playwright.sync_api import Page
@@ -25,6 +30,28 @@ MIN_CONTENT_LENGTH = 100
 DEFAULT_NAVIGATION_TIMEOUT = 30000
 DEFAULT_WAIT_TIMEOUT = 5000
 
+# Browser pool defaults
+DEFAULT_RECYCLE_AFTER_PAGES = 50
+DEFAULT_MAX_MEMORY_MB = 512
+
+# needs_rendering() heuristics
+_NOSCRIPT_NOTICES = (
+    "enable javascript",
+    "javascript is disabled",
+    "javascript is required",
+    "requires javascript",
+    "turn on javascript",
+)
+_SCRIPT_HEAVY_THRESHOLD = 15
+
+_BROWSER_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-web-security",
+)
+
 
 class RenderingError(Exception):
     """Raised when browser rendering fails."""
@@ -65,12 +92,14 @@ def render_page(
     wait_until: WaitUntilEvent = "load",
     wait_after_load: int = 0,
     block_media: bool = True,
+    pool: "BrowserPool | None" = None,
 ) -> RenderedPage:
     """Render a page using Playwright and return the HTML content.
     
     This function launches a headless browser, navigates to the URL,
     waits for the page to fully load (including JavaScript execution),
-    and returns the rendered HTML.
+    and returns the rendered HTML. When a :class:`BrowserPool` is given,
+    the pooled browser is reused instead of launching a new one.
     
     Args:
         url: The URL to render.
@@ -83,6 +112,8 @@ def render_page(
         wait_after_load: Additional milliseconds to wait after page load.
         block_media: If True, block video/audio downloads to prevent timeouts on
             media-heavy pages. Only affects media files, not page structure.
+        pool: Optional browser pool to render with. ``headless`` is ignored
+            in that case; the pool's own setting applies.
         
     Returns:
         RenderedPage with the rendered HTML content.
@@ -90,8 +121,18 @@ def render_page(
     Raises:
         RenderingError: If rendering fails.
     """
+    if pool is not None:
+        return pool.render(
+            url,
+            user_agent=user_agent,
+            timeout=timeout,
+            wait_until=wait_until,
+            wait_after_load=wait_after_load,
+            block_media=block_media,
+        )
+    
     try:
-        from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+        from playwright.sync_api import sync_playwright
     except ImportError as e:
         raise RenderingError(
             "Playwright is not installed. Install with: pip install playwright && playwright install chromium"
@@ -99,95 +140,26 @@ def render_page(
     
     try:
         with sync_playwright() as p:
-            browser_args = []
-            browser_args.extend([
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-web-security",
-            ])
-            
             # Launch browser
             browser = p.chromium.launch(
                 headless=headless,
-                args=browser_args if browser_args else None,
+                args=list(_BROWSER_ARGS),
             )
             
             # Create context with user agent and stealth options
-            context_options = {
-                "user_agent": user_agent,
-                "viewport": {"width": 1920, "height": 1080},
-                "java_script_enabled": True,
-                "bypass_csp": False,
-                "ignore_https_errors": True,
-                "extra_http_headers": {
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br, zstd",
-                    "Cache-Control": "max-age=0",
-                    "Sec-Ch-Ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-                    "Sec-Ch-Ua-Mobile": "?0",
-                    "Sec-Ch-Ua-Platform": '"Windows"',
-                    "Sec-Fetch-Dest": "document",
-                    "Sec-Fetch-Mode": "navigate",
-                    "Sec-Fetch-Site": "none",
-                    "Sec-Fetch-User": "?1",
-                    "Upgrade-Insecure-Requests": "1",
-                }
-            }
-            
-            context = browser.new_context(**context_options)
+            context = browser.new_context(**_context_options(user_agent))
             page = context.new_page()
             
-            # Block media files to prevent timeouts on video-heavy pages
-            if block_media:
-                def block_media_route(route):
-                    """Block video, audio, and other large media files."""
-                    request = route.request
-                    resource_type = request.resource_type
-                    if resource_type in ("media", "video", "audio"):
-                        route.abort()
-                    else:
-                        route.continue_()
-                
-                # Apply route handler for media blocking
-                page.route("**/*", block_media_route)
-            
-            # Set timeout
-            page.set_default_timeout(timeout)
-            
             try:
-                # Navigate to URL
-                response = page.goto(url, wait_until=wait_until)
-                
-                if response is None:
-                    raise RenderingError(f"No response received for URL: {url}")
-                
-                if response.status >= 400:
-                    raise RenderingError(
-                        f"HTTP {response.status} error for URL: {url}"
-                    )
-                
-                # Optional additional wait for dynamic content
-                if wait_after_load > 0:
-                    page.wait_for_timeout(wait_after_load)
-                
-                # Get rendered content
-                html = page.content()
-                title = page.title()
-                final_url = page.url
-                
-                return RenderedPage(
-                    url=url,
-                    final_url=final_url,
-                    html=html,
-                    title=title,
+                return _navigate(
+                    page,
+                    url,
                     user_agent=user_agent,
+                    timeout=timeout,
+                    wait_until=wait_until,
+                    wait_after_load=wait_after_load,
+                    block_media=block_media,
                 )
-                
-            except PlaywrightTimeout as e:
-                raise RenderingError(f"Timeout rendering URL: {url}") from e
             finally:
                 context.close()
                 browser.close()
@@ -198,6 +170,336 @@ def render_page(
         raise RenderingError(f"Failed to render URL '{url}': {e}") from e
 
 
+def _context_options(user_agent: str) -> dict[str, Any]:
+    """Build browser context options with user agent and stealth headers."""
+    return {
+        "user_agent": user_agent,
+        "viewport": {"width": 1920, "height": 1080},
+        "java_script_enabled": True,
+        "bypass_csp": False,
+        "ignore_https_errors": True,
+        "extra_http_headers": {
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate, br, zstd",
+            "Cache-Control": "max-age=0",
+            "Sec-Ch-Ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+            "Sec-Ch-Ua-Mobile": "?0",
+            "Sec-Ch-Ua-Platform": '"Windows"',
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "none",
+            "Sec-Fetch-User": "?1",
+            "Upgrade-Insecure-Requests": "1",
+        }
+    }
+
+
+def _navigate(
+    page: "Page",
+    url: str,
+    *,
+    user_agent: str,
+    timeout: int,
+    wait_until: WaitUntilEvent,
+    wait_after_load: int,
+    block_media: bool,
+) -> RenderedPage:
+    """Load ``url`` in an open page and capture the rendered HTML."""
+    from playwright.sync_api import TimeoutError as PlaywrightTimeout
+    
+    # Block media files to prevent timeouts on video-heavy pages
+    if block_media:
+        def block_media_route(route):
+            """Block video, audio, and other large media files."""
+            request = route.request
+            resource_type = request.resource_type
+            if resource_type in ("media", "video", "audio"):
+                route.abort()
+            else:
+                route.continue_()
+        
+        # Apply route handler for media blocking
+        page.route("**/*", block_media_route)
+    
+    # Set timeout
+    page.set_default_timeout(timeout)
+    
+    try:
+        # Navigate to URL
+        response = page.goto(url, wait_until=wait_until)
+        
+        if response is None:
+            raise RenderingError(f"No response received for URL: {url}")
+        
+        if response.status >= 400:
+            raise RenderingError(
+                f"HTTP {response.status} error for URL: {url}"
+            )
+        
+        # Optional additional wait for dynamic content
+        if wait_after_load > 0:
+            page.wait_for_timeout(wait_after_load)
+        
+        # Get rendered content
+        html = page.content()
+        title = page.title()
+        final_url = page.url
+        
+        return RenderedPage(
+            url=url,
+            final_url=final_url,
+            html=html,
+            title=title,
+            user_agent=user_agent,
+        )
+        
+    except PlaywrightTimeout as e:
+        raise RenderingError(f"Timeout rendering URL: {url}") from e
+
+
+class BrowserPool:
+    """Long-lived headless browser shared across many page renders.
+    
+    Starting Playwright and Chromium costs far more than rendering a typical
+    page, so the pool launches one browser lazily and keeps a browser context
+    per user agent alive between renders. Each render gets a fresh page that
+    is closed afterwards. Contexts are recycled after ``recycle_after_pages``
+    renders, or sooner when the page's JavaScript heap exceeds
+    ``max_memory_mb``, to bound the memory growth of long crawls.
+    
+    Playwright's sync API is bound to the thread that started it, so a pool
+    must only be used from the thread that created it.
+    
+    Usage:
+        with BrowserPool() as pool:
+            page = render_page(url, user_agent=ua, pool=pool)
+    """
+    
+    def __init__(
+        self,
+        *,
+        headless: bool = True,
+        recycle_after_pages: int = DEFAULT_RECYCLE_AFTER_PAGES,
+        max_memory_mb: int = DEFAULT_MAX_MEMORY_MB,
+    ) -> None:
+        self.headless = headless
+        self.recycle_after_pages = max(recycle_after_pages, 1)
+        self.max_memory_mb = max_memory_mb
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._contexts: dict[str, Any] = {}
+        self._context_pages: dict[str, int] = {}
+        self._owner_thread: int | None = None
+        self._closed = False
+        self.pages_rendered = 0
+        self.browser_launches = 0
+        self.contexts_recycled = 0
+    
+    def __enter__(self) -> "BrowserPool":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+    
+    @property
+    def is_running(self) -> bool:
+        """True when a browser has been launched and not yet closed."""
+        return self._browser is not None
+    
+    def render(
+        self,
+        url: str,
+        *,
+        user_agent: str,
+        timeout: int = DEFAULT_NAVIGATION_TIMEOUT,
+        wait_until: WaitUntilEvent = "load",
+        wait_after_load: int = 0,
+        block_media: bool = True,
+    ) -> RenderedPage:
+        """Render ``url`` using a pooled browser context.
+        
+        Raises:
+            RenderingError: If the pool is closed, used from another thread,
+                or rendering fails.
+        """
+        if self._closed:
+            raise RenderingError("Browser pool has been closed")
+        self._check_thread()
+        
+        try:
+            context = self._get_context(user_agent)
+            page = context.new_page()
+            try:
+                rendered = _navigate(
+                    page,
+                    url,
+                    user_agent=user_agent,
+                    timeout=timeout,
+                    wait_until=wait_until,
+                    wait_after_load=wait_after_load,
+                    block_media=block_media,
+                )
+                heap_mb = _js_heap_mb(page)
+            finally:
+                page.close()
+        except RenderingError:
+            self._after_render(user_agent, heap_mb=None)
+            raise
+        except Exception as e:
+            # The browser may have crashed; drop it so the next render relaunches
+            self._discard_browser()
+            raise RenderingError(f"Failed to render URL '{url}': {e}") from e
+        
+        self._after_render(user_agent, heap_mb=heap_mb)
+        return rendered
+    
+    def close(self) -> None:
+        """Close all contexts, the browser, and Playwright. Safe to call twice."""
+        self._closed = True
+        self._discard_browser()
+    
+    def _check_thread(self) -> None:
+        current = threading.get_ident()
+        if self._owner_thread is None:
+            self._owner_thread = current
+        elif self._owner_thread != current:
+            raise RenderingError("BrowserPool used from a thread other than its owner")
+    
+    def _ensure_browser(self) -> Any:
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+        if self._browser is not None:
+            # Browser died underneath us; start over with a clean slate
+            self._discard_browser()
+        
+        try:
+            from playwright.sync_api import sync_playwright
+        except ImportError as e:
+            raise RenderingError(
+                "Playwright is not installed. Install with: pip install playwright && playwright install chromium"
+            ) from e
+        
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(
+            headless=self.headless,
+            args=list(_BROWSER_ARGS),
+        )
+        self.browser_launches += 1
+        _register_for_shutdown(self)
+        logger.debug("Launched pooled browser (launch #%d)", self.browser_launches)
+        return self._browser
+    
+    def _get_context(self, user_agent: str) -> Any:
+        browser = self._ensure_browser()
+        context = self._contexts.get(user_agent)
+        if context is None:
+            context = browser.new_context(**_context_options(user_agent))
+            self._contexts[user_agent] = context
+            self._context_pages[user_agent] = 0
+        return context
+    
+    def _after_render(self, user_agent: str, *, heap_mb: float | None) -> None:
+        self.pages_rendered += 1
+        count = self._context_pages.get(user_agent, 0) + 1
+        self._context_pages[user_agent] = count
+        
+        over_memory = heap_mb is not None and heap_mb > self.max_memory_mb
+        if count >= self.recycle_after_pages or over_memory:
+            logger.debug(
+                "Recycling browser context after %d pages (heap=%.1fMB)",
+                count,
+                heap_mb or 0.0,
+            )
+            self._close_context(user_agent)
+            self.contexts_recycled += 1
+    
+    def _close_context(self, user_agent: str) -> None:
+        context = self._contexts.pop(user_agent, None)
+        self._context_pages.pop(user_agent, None)
+        if context is not None:
+            try:
+                context.close()
+            except Exception:  # pragma: no cover - best effort cleanup
+                pass
+    
+    def _discard_browser(self) -> None:
+        for user_agent in list(self._contexts):
+            self._close_context(user_agent)
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:  # pragma: no cover - best effort cleanup
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:  # pragma: no cover - best effort cleanup
+                pass
+            self._playwright = None
+
+
+def _js_heap_mb(page: "Page") -> float | None:
+    """Return the page's used JS heap in MB (Chromium only), or None."""
+    try:
+        used = page.evaluate(
+            "() => (performance.memory ? performance.memory.usedJSHeapSize : 0)"
+        )
+    except Exception:
+        return None
+    if not used:
+        return None
+    return float(used) / (1024 * 1024)
+
+
+_live_pools: "weakref.WeakSet[BrowserPool]" = weakref.WeakSet()
+
+
+def _register_for_shutdown(pool: BrowserPool) -> None:
+    """Make sure pooled browsers are closed when the interpreter exits."""
+    _live_pools.add(pool)
+
+
+@atexit.register
+def _close_live_pools() -> None:  # pragma: no cover - exercised at interpreter exit
+    for pool in list(_live_pools):
+        try:
+            pool.close()
+        except Exception:
+            pass
+
+
+@contextmanager
+def shared_browser_pool(**kwargs: Any) -> Iterator[BrowserPool]:
+    """Provide a BrowserPool for the duration of a block.
+    
+    The pool is closed when the block exits, including on exceptions. When
+    called from the main thread, SIGTERM is translated into ``SystemExit``
+    for the duration of the block so that a terminated pipeline run still
+    unwinds through ``finally`` and shuts Chromium down cleanly.
+    
+    Args:
+        **kwargs: Forwarded to :class:`BrowserPool`.
+    """
+    pool = BrowserPool(**kwargs)
+    previous_handler = None
+    install_handler = threading.current_thread() is threading.main_thread()
+    
+    if install_handler:
+        def _terminate(signum: int, _frame: object) -> None:
+            raise SystemExit(128 + signum)
+        
+        previous_handler = signal.signal(signal.SIGTERM, _terminate)
+    
+    try:
+        yield pool
+    finally:
+        pool.close()
+        if install_handler:
+            signal.signal(signal.SIGTERM, previous_handler)
+
+
 def render_and_extract_text(
     url: str,
     *,
@@ -240,6 +542,7 @@ def needs_rendering(html: str, extracted_text: str | None) -> bool:
     Heuristics used:
     - Extraction returned None or very little text
     - HTML contains common SPA framework indicators
+    - A ``<noscript>`` notice asks the reader to enable JavaScript
     - HTML has minimal visible text but lots of script tags
     
     Args:
@@ -271,10 +574,22 @@ def needs_rendering(html: str, extracted_text: str | None) -> bool:
     ]
     
     html_lower = html.lower()
+    text_length = len(extracted_text.strip())
     for indicator in spa_indicators:
         if indicator.lower() in html_lower:
             # SPA detected, but check if we got meaningful content anyway
-            if len(extracted_text.strip()) < 500:
+            if text_length < 500:
                 return True
     
+    # Pages that tell non-JS clients to turn JavaScript on
+    if "<noscript" in html_lower and any(
+        notice in html_lower for notice in _NOSCRIPT_NOTICES
+    ):
+        if text_length < 1000:
+            return True
+    
+    # Script-heavy shells: many script tags, little extracted text
+    if text_length < 500 and html_lower.count("<script") >= _SCRIPT_HEAVY_THRESHOLD:
+        return True
+    
     return False
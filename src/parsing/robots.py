@@ -8,18 +8,90 @@ Features:
 - Check if a URL is allowed for a given user agent
 - Handle wildcards and pattern matching
 - Respect Crawl-delay directives
-- Cache parsed robots.txt files
+- Fetch robots.txt per host and cache it in memory and on disk
+
+Rules are compiled once per group: plain path prefixes go into a hash map
+probed from the longest prefix length down, and only rules with wildcards
+or an end anchor are matched as regular expressions.
+
+Fetch results are interpreted as in RFC 9309: a 4xx response (other than
+429) means there are no rules, while a 5xx, a 429, or a network error
+means the host is unreachable and everything is disallowed until a retry
+succeeds. A previously cached copy, even an expired one, is preferred over
+disallowing everything.
 
 Reference: https://www.robotstxt.org/robotstxt.html
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import re
+import threading
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List
 from urllib.parse import urlparse
 
+import requests
+
+from src.parsing.http import DEFAULT_TIMEOUT, get_session
+
+logger = logging.getLogger(__name__)
+
+# Bytes of a robots.txt body that are parsed (RFC 9309 section 2.5)
+MAX_ROBOTS_BYTES = 500 * 1024
+
+# How long a fetched robots.txt is trusted before it is fetched again
+DEFAULT_CACHE_TTL = timedelta(hours=24)
+
+# How long an unreachable host stays fully disallowed before a retry
+UNREACHABLE_RETRY = timedelta(minutes=10)
+
+
+@lru_cache(maxsize=4096)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Translate a robots.txt path pattern into an anchored regex.
+    
+    ``*`` matches any sequence of characters and a trailing ``$`` anchors
+    the match at the end of the path; everything else is literal.
+    """
+    anchored = pattern.endswith("$")
+    body = pattern[:-1] if anchored else pattern
+    regex = ".*".join(re.escape(part) for part in body.split("*"))
+    return re.compile(regex + ("$" if anchored else ""))
+
+
+def _is_plain_prefix(pattern: str) -> bool:
+    return "*" not in pattern and not pattern.endswith("$")
+
+
+# scheme://authority, then path and query up to any fragment
+_URL_PARTS = re.compile(r"([A-Za-z][A-Za-z0-9+.-]*://[^/?#]*)([^#]*)")
+
+
+def _split_url(url: str) -> tuple[str, str]:
+    """Split a URL into its robots.txt cache key and the path to check.
+    
+    A single regex match is several times cheaper than urlparse, which
+    matters when every queued URL is checked.
+    """
+    match = _URL_PARTS.match(url)
+    if match is None:
+        parsed = urlparse(url)
+        key, path = f"{parsed.scheme}://{parsed.netloc}", parsed.path
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+    else:
+        key, path = match.groups()
+    if not path.startswith("/"):
+        path = f"/{path}"
+    return key.lower(), path
+
 
 @dataclass
 class RobotRule:
@@ -47,32 +119,57 @@ class RobotRule:
         if not pattern:
             return self.allowed
         
-        # Convert robots.txt pattern to regex
-        # * matches any sequence of characters
-        # $ at end means end of path
-        regex_pattern = ""
-        i = 0
-        while i < len(pattern):
-            char = pattern[i]
-            if char == "*":
-                regex_pattern += ".*"
-            elif char == "$" and i == len(pattern) - 1:
-                regex_pattern += "$"
+        if _is_plain_prefix(pattern):
+            return url_path.startswith(pattern)
+        return _compile_pattern(pattern).match(url_path) is not None
+
+
+class _CompiledRules:
+    """Rules of one group, indexed for longest-match lookup.
+    
+    Plain prefixes live in a dict keyed by the prefix, probed with slices
+    of the path from the longest prefix length down, so the first hit is
+    the longest matching prefix. Pattern rules are kept in priority order
+    and only tried while they could still outrank that hit.
+    """
+    
+    __slots__ = ("size", "prefixes", "lengths", "patterns")
+    
+    def __init__(self, rules: List[RobotRule]) -> None:
+        self.size = len(rules)
+        self.prefixes: Dict[str, bool] = {}
+        patterns: List[tuple[int, bool, re.Pattern[str]]] = []
+        for rule in rules:
+            path = rule.path
+            if not path:
+                if rule.allowed:
+                    self.prefixes[""] = True
+            elif _is_plain_prefix(path):
+                # Allow wins over Disallow for the same path
+                self.prefixes[path] = self.prefixes.get(path, False) or rule.allowed
             else:
-                regex_pattern += re.escape(char)
-            i += 1
-        
-        # If pattern doesn't end with $, allow prefix matching
-        if not pattern.endswith("$"):
-            regex_pattern = f"^{regex_pattern}"
-        else:
-            regex_pattern = f"^{regex_pattern}"
-        
-        try:
-            return bool(re.match(regex_pattern, url_path))
-        except re.error:
-            # If regex is invalid, fall back to prefix matching
-            return url_path.startswith(pattern.rstrip("$").replace("*", ""))
+                patterns.append((len(path), rule.allowed, _compile_pattern(path)))
+        self.lengths = sorted({len(prefix) for prefix in self.prefixes}, reverse=True)
+        patterns.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        self.patterns = patterns
+    
+    def is_allowed(self, url_path: str) -> bool:
+        best_length = -1
+        best_allowed = True
+        path_length = len(url_path)
+        for length in self.lengths:
+            if length <= path_length:
+                allowed = self.prefixes.get(url_path[:length])
+                if allowed is not None:
+                    best_length, best_allowed = length, allowed
+                    break
+        
+        for length, allowed, regex in self.patterns:
+            if length < best_length or (length == best_length and (best_allowed or not allowed)):
+                break
+            if regex.match(url_path):
+                return allowed
+        return best_allowed
 
 
 @dataclass
@@ -87,6 +184,7 @@ class RobotRuleset:
     user_agent: str
     rules: List[RobotRule] = field(default_factory=list)
     crawl_delay: float | None = None
+    _compiled: _CompiledRules | None = field(default=None, init=False, repr=False, compare=False)
     
     def is_allowed(self, url_path: str) -> bool:
         """Check if a URL path is allowed by this ruleset.
@@ -103,22 +201,11 @@ class RobotRuleset:
         if not self.rules:
             return True
         
-        # Find all matching rules
-        matching_rules: List[tuple[int, RobotRule]] = []
-        for rule in self.rules:
-            if rule.matches(url_path):
-                # Use pattern length as priority (longer = more specific)
-                matching_rules.append((len(rule.path), rule))
-        
-        if not matching_rules:
-            # No matching rules means allowed
-            return True
-        
-        # Sort by length (descending), then by allowed (Allow > Disallow)
-        matching_rules.sort(key=lambda x: (x[0], x[1].allowed), reverse=True)
-        
-        # Return the result of the highest priority rule
-        return matching_rules[0][1].allowed
+        compiled = self._compiled
+        if compiled is None or compiled.size != len(self.rules):
+            # Compiled on first use and again if rules were appended
+            compiled = self._compiled = _CompiledRules(self.rules)
+        return compiled.is_allowed(url_path)
 
 
 @dataclass
@@ -132,6 +219,11 @@ class RobotsTxt:
     rulesets: Dict[str, RobotRuleset] = field(default_factory=dict)
     sitemaps: List[str] = field(default_factory=list)
     
+    @classmethod
+    def disallow_all(cls) -> "RobotsTxt":
+        """Rules that block every path for every user agent."""
+        return cls(rulesets={"*": RobotRuleset(user_agent="*", rules=[RobotRule(path="/", allowed=False)])})
+    
     def get_ruleset(self, user_agent: str) -> RobotRuleset | None:
         """Get the ruleset for a specific user agent.
         
@@ -284,12 +376,93 @@ def parse_robots_txt(content: str) -> RobotsTxt:
     return robots
 
 
+def fetch_robots_txt(
+    url: str,
+    *,
+    user_agent: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    session: requests.Session | None = None,
+) -> tuple[int | None, str]:
+    """Download the robots.txt for a URL's host.
+    
+    Args:
+        url: Any URL on the site
+        user_agent: User agent string sent with the request
+        timeout: Connect/read timeout in seconds
+        session: Session to use (defaults to the shared pooled session)
+        
+    Returns:
+        (status, content) tuple. status is None if no response arrived;
+        content is empty unless the response was successful, and is cut
+        at MAX_ROBOTS_BYTES.
+    """
+    parsed = urlparse(url)
+    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+    session = session or get_session()
+    
+    try:
+        response = session.get(
+            robots_url,
+            headers={"User-Agent": user_agent},
+            timeout=timeout,
+            stream=True,
+        )
+    except requests.RequestException as e:
+        logger.info("Could not fetch %s: %s", robots_url, e)
+        return None, ""
+    
+    try:
+        if not 200 <= response.status_code < 300:
+            return response.status_code, ""
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            body.extend(chunk)
+            if len(body) >= MAX_ROBOTS_BYTES:
+                break
+        content = bytes(body[:MAX_ROBOTS_BYTES]).decode("utf-8", errors="replace")
+        return response.status_code, content
+    except requests.RequestException as e:
+        logger.info("Failed reading %s: %s", robots_url, e)
+        return None, ""
+    finally:
+        response.close()
+
+
+def robots_from_response(status: int | None, content: str) -> RobotsTxt:
+    """Interpret a robots.txt fetch result.
+    
+    Args:
+        status: HTTP status, or None if the host could not be reached
+        content: Response body
+        
+    Returns:
+        Parsed rules for a success, no rules for a 4xx (the file is
+        unavailable), and rules disallowing everything otherwise.
+    """
+    if status is None or status == 429 or status >= 500:
+        return RobotsTxt.disallow_all()
+    if 200 <= status < 300:
+        return parse_robots_txt(content)
+    return RobotsTxt()
+
+
+def _is_unreachable(status: int | None) -> bool:
+    return status is None or status == 429 or status >= 500
+
+
 class RobotsChecker:
     """Caching robots.txt checker for crawling.
     
     This class caches parsed robots.txt files and provides a simple
     interface for checking if URLs are allowed.
     
+    By default rules are only known once set with set_robots_txt(). With
+    ``fetch=True`` the robots.txt of each new host is downloaded on first
+    use through the shared HTTP session and kept for ``ttl``; with a
+    ``cache_dir`` the fetch results also survive across runs. A checker may
+    be shared between threads: concurrent first hits on a host wait for a
+    single robots.txt fetch.
+    
     Usage:
         checker = RobotsChecker()
         checker.set_robots_txt("https://example.com/", robots_txt_content)
@@ -297,19 +470,49 @@ class RobotsChecker:
             # crawl the page
     """
     
-    def __init__(self, user_agent: str = "*"):
+    def __init__(
+        self,
+        user_agent: str = "*",
+        *,
+        fetch: bool = False,
+        cache_dir: Path | None = None,
+        ttl: timedelta = DEFAULT_CACHE_TTL,
+        timeout: float = DEFAULT_TIMEOUT,
+        session: requests.Session | None = None,
+    ):
         """Initialize the robots checker.
         
         Args:
             user_agent: The user agent to use for checking (default: *)
+            fetch: If True, download robots.txt for hosts not yet cached
+            cache_dir: Directory for fetched robots.txt files (optional)
+            ttl: How long a fetched robots.txt stays fresh
+            timeout: Fetch timeout in seconds
+            session: HTTP session for fetches (defaults to the shared one)
         """
         self.user_agent = user_agent
+        self.fetch = fetch
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.timeout = timeout
+        self._session = session
         self._cache: Dict[str, RobotsTxt] = {}
+        self._expires: Dict[str, datetime] = {}
+        self._rulesets: Dict[str, RobotRuleset | None] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
     
     def _get_robots_key(self, url: str) -> str:
         """Get the cache key for a URL (scheme + host)."""
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}"
+        return _split_url(url)[0]
+    
+    def _store(self, key: str, robots: RobotsTxt, expires: datetime | None = None) -> None:
+        self._cache[key] = robots
+        self._rulesets.pop(key, None)
+        if expires is None:
+            self._expires.pop(key, None)
+        else:
+            self._expires[key] = expires
     
     def set_robots_txt(self, base_url: str, content: str) -> RobotsTxt:
         """Set the robots.txt content for a site.
@@ -323,7 +526,7 @@ class RobotsChecker:
         """
         key = self._get_robots_key(base_url)
         robots = parse_robots_txt(content)
-        self._cache[key] = robots
+        self._store(key, robots)
         return robots
     
     def get_robots_txt(self, url: str) -> RobotsTxt | None:
@@ -338,6 +541,129 @@ class RobotsChecker:
         key = self._get_robots_key(url)
         return self._cache.get(key)
     
+    def load(self, url: str) -> RobotsTxt:
+        """Return the robots.txt for a URL's host, fetching it if stale.
+        
+        Uses the in-memory copy, then the on-disk cache, then the network.
+        
+        Args:
+            url: Any URL on the site
+            
+        Returns:
+            The rules in effect for the host
+        """
+        key = self._get_robots_key(url)
+        cached = self._fresh(key)
+        if cached is not None:
+            return cached
+        with self._host_lock(key):
+            # Another thread may have fetched it while this one waited
+            cached = self._fresh(key)
+            if cached is not None:
+                return cached
+            return self._refresh(key)
+    
+    def _fresh(self, key: str) -> RobotsTxt | None:
+        cached = self._cache.get(key)
+        expires = self._expires.get(key)
+        if cached is not None and (expires is None or expires > datetime.now(timezone.utc)):
+            return cached
+        return None
+    
+    def _host_lock(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+    
+    def _refresh(self, key: str) -> RobotsTxt:
+        now = datetime.now(timezone.utc)
+        stored = self._read_cache_file(key)
+        if stored is not None and stored[2] > now:
+            robots = robots_from_response(stored[0], stored[1])
+            self._store(key, robots, stored[2])
+            return robots
+        
+        status, content = fetch_robots_txt(
+            key,
+            user_agent=self.user_agent,
+            timeout=self.timeout,
+            session=self._session,
+        )
+        if _is_unreachable(status):
+            expires = now + min(UNREACHABLE_RETRY, self.ttl)
+            if stored is not None and not _is_unreachable(stored[0]):
+                logger.info("robots.txt for %s unreachable; using the cached copy", key)
+                status, content = stored[0], stored[1]
+            else:
+                logger.warning("robots.txt for %s unreachable (status %s); disallowing all", key, status)
+        else:
+            expires = now + self.ttl
+        
+        robots = robots_from_response(status, content)
+        self._store(key, robots, expires)
+        self._write_cache_file(key, status, content, now, expires)
+        return robots
+    
+    def _cache_path(self, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{digest}.json"
+    
+    def _read_cache_file(self, key: str) -> tuple[int | None, str, datetime] | None:
+        path = self._cache_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("key") != key:
+                return None
+            return data["status"], data["content"], datetime.fromisoformat(data["expires_at"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable robots.txt cache %s: %s", path, e)
+            return None
+    
+    def _write_cache_file(
+        self,
+        key: str,
+        status: int | None,
+        content: str,
+        fetched_at: datetime,
+        expires_at: datetime,
+    ) -> None:
+        path = self._cache_path(key)
+        if path is None:
+            return
+        data = {
+            "key": key,
+            "status": status,
+            "fetched_at": fetched_at.isoformat(),
+            "expires_at": expires_at.isoformat(),
+            "content": content,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning("Could not cache robots.txt for %s: %s", key, e)
+    
+    def _ruleset_for(self, key: str, url: str) -> RobotRuleset | None:
+        if self.fetch:
+            expires = self._expires.get(key)
+            if key not in self._cache or (
+                expires is not None and expires <= datetime.now(timezone.utc)
+            ):
+                self.load(url)
+        try:
+            return self._rulesets[key]
+        except KeyError:
+            robots = self._cache.get(key)
+            ruleset = robots.get_ruleset(self.user_agent) if robots is not None else None
+            if robots is not None:
+                self._rulesets[key] = ruleset
+            return ruleset
+    
     def is_allowed(self, url: str) -> bool:
         """Check if a URL is allowed by robots.txt.
         
@@ -345,14 +671,14 @@ class RobotsChecker:
             url: The URL to check
             
         Returns:
-            True if allowed (or no robots.txt cached), False if disallowed
+            True if allowed (or no robots.txt known), False if disallowed
         """
-        robots = self.get_robots_txt(url)
-        if robots is None:
-            # No robots.txt cached, assume allowed
+        key, path = _split_url(url)
+        ruleset = self._ruleset_for(key, url)
+        if ruleset is None:
+            # No rules for this host or user agent, assume allowed
             return True
-        
-        return robots.is_allowed(url, self.user_agent)
+        return ruleset.is_allowed(path)
     
     def get_crawl_delay(self, url: str) -> float | None:
         """Get the crawl delay for a URL's site.
@@ -363,12 +689,41 @@ class RobotsChecker:
         Returns:
             Crawl delay in seconds, or None if not specified
         """
-        robots = self.get_robots_txt(url)
-        if robots is None:
+        ruleset = self._ruleset_for(self._get_robots_key(url), url)
+        if ruleset is None:
             return None
         
-        return robots.get_crawl_delay(self.user_agent)
+        return ruleset.crawl_delay
+    
+    def get_sitemaps(self, url: str) -> List[str]:
+        """Get the sitemap URLs a site's robots.txt lists.
+        
+        Args:
+            url: Any URL on the site
+            
+        Returns:
+            Sitemap URLs in file order (empty if none are known)
+        """
+        key = self._get_robots_key(url)
+        self._ruleset_for(key, url)
+        robots = self._cache.get(key)
+        return list(robots.sitemaps) if robots is not None else []
     
     def clear_cache(self) -> None:
-        """Clear the robots.txt cache."""
+        """Clear the in-memory robots.txt cache."""
         self._cache.clear()
+        self._expires.clear()
+        self._rulesets.clear()
+
+
+__all__ = [
+    "DEFAULT_CACHE_TTL",
+    "MAX_ROBOTS_BYTES",
+    "RobotRule",
+    "RobotRuleset",
+    "RobotsChecker",
+    "RobotsTxt",
+    "fetch_robots_txt",
+    "parse_robots_txt",
+    "robots_from_response",
+]
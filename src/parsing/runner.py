@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Iterable, Sequence
 
 from . import utils
-from .base import ParseTarget, ParserError
+from .base import DocumentParser, ParsedDocument, ParseTarget, ParserError
 from .registry import ParserRegistry, registry
 from .storage import ManifestEntry, ParseStorage
+from .workers import WorkerJob, run_extractions
 
 _DEFAULT_SCAN_SUFFIXES = (".pdf", ".docx", ".html", ".htm", ".xhtml")
 
+# Per-document wall-clock limit applied when parsing in worker processes.
+DEFAULT_DOCUMENT_TIMEOUT = 300.0
+
 
 @dataclass(slots=True)
 class ParseOutcome:
@@ -41,6 +45,165 @@ def parse_single_target(
     media_type: str | None = None,
     is_remote: bool | None = None,
 ) -> ParseOutcome:
+    try:
+        return _parse_target(
+            source,
+            storage=storage,
+            registry_override=registry_override,
+            expected_parser=expected_parser,
+            force=force,
+            media_type=media_type,
+            is_remote=is_remote,
+        )
+    finally:
+        storage.fingerprints.save()
+
+
+def scan_and_parse(
+    root: str | Path,
+    *,
+    storage: ParseStorage,
+    registry_override: ParserRegistry | None = None,
+    suffixes: Sequence[str] | None = None,
+    recursive: bool = True,
+    force: bool = False,
+    limit: int | None = None,
+    include_patterns: Sequence[str] | None = None,
+    exclude_patterns: Sequence[str] | None = None,
+    workers: int = 1,
+    document_timeout: float | None = DEFAULT_DOCUMENT_TIMEOUT,
+    memory_limit_mb: int | None = None,
+) -> list[ParseOutcome]:
+    """Parse every candidate under ``root`` and return outcomes in path order.
+
+    With ``workers`` greater than one, extraction runs in separate processes
+    (see :mod:`src.parsing.workers`); ``document_timeout`` and
+    ``memory_limit_mb`` then bound each document. Checksums, manifest updates
+    and artifact writes always happen in this process, one document at a time,
+    so the outcomes match a sequential run.
+
+    Checksums come from the storage's fingerprint cache, so files whose size,
+    mtime and inode are unchanged since the last scan are not read at all.
+    """
+    candidates = collect_parse_candidates(
+        root,
+        suffixes=suffixes,
+        recursive=recursive,
+        storage_root=storage.root,
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+    )
+    if limit is not None and limit >= 0:
+        candidates = candidates[:limit]
+
+    try:
+        if workers > 1:
+            return _parse_in_workers(
+                candidates,
+                storage=storage,
+                registry_override=registry_override,
+                force=force,
+                workers=workers,
+                document_timeout=document_timeout,
+                memory_limit_mb=memory_limit_mb,
+            )
+
+        results: list[ParseOutcome] = []
+        for candidate in candidates:
+            outcome = _parse_target(
+                candidate,
+                storage=storage,
+                registry_override=registry_override,
+                expected_parser=None,
+                force=force,
+                media_type=None,
+                is_remote=None,
+            )
+            results.append(outcome)
+        return results
+    finally:
+        storage.fingerprints.save()
+
+
+def collect_parse_candidates(
+    root: str | Path,
+    *,
+    suffixes: Sequence[str] | None = None,
+    recursive: bool = True,
+    storage_root: Path | None = None,
+    include_patterns: Sequence[str] | None = None,
+    exclude_patterns: Sequence[str] | None = None,
+) -> list[Path]:
+    """Return candidate paths that match the parsing filters without executing parsers."""
+
+    root_path = Path(root).expanduser().resolve()
+    if not root_path.exists():
+        raise FileNotFoundError(f"Scan root '{root_path}' does not exist")
+
+    normalized_suffixes = utils.normalize_suffixes(
+        suffixes,
+        default=_DEFAULT_SCAN_SUFFIXES,
+        sort=True,
+        preserve_order=False,
+    )
+
+    return _collect_candidates(
+        root_path,
+        normalized_suffixes,
+        recursive,
+        storage_root,
+        include_patterns,
+        exclude_patterns,
+    )
+
+
+def _parse_target(
+    source: str | Path,
+    *,
+    storage: ParseStorage,
+    registry_override: ParserRegistry | None,
+    expected_parser: str | None,
+    force: bool,
+    media_type: str | None,
+    is_remote: bool | None,
+) -> ParseOutcome:
+    prepared = _prepare_target(
+        source,
+        storage=storage,
+        registry_override=registry_override,
+        expected_parser=expected_parser,
+        force=force,
+        media_type=media_type,
+        is_remote=is_remote,
+    )
+    if isinstance(prepared, ParseOutcome):
+        return prepared
+
+    try:
+        document = prepared.parser.extract(prepared.target)
+    except ParserError as exc:
+        return _extraction_error(prepared, str(exc))
+
+    return _finish_target(prepared, document, storage=storage, force=force)
+
+
+@dataclass(slots=True)
+class _PreparedTarget:
+    target: ParseTarget
+    parser: DocumentParser
+    precomputed_checksum: str | None
+
+
+def _prepare_target(
+    source: str | Path,
+    *,
+    storage: ParseStorage,
+    registry_override: ParserRegistry | None,
+    expected_parser: str | None,
+    force: bool,
+    media_type: str | None,
+    is_remote: bool | None,
+) -> _PreparedTarget | ParseOutcome:
     active_registry = registry_override or registry
     target = _build_target(source, is_remote=is_remote, media_type=media_type)
 
@@ -64,12 +227,16 @@ def parse_single_target(
 
     precomputed_checksum = None
 
-    if not force and not target.is_remote:
+    if not target.is_remote:
         try:
-            path = target.to_path()
-        except ValueError:
-            path = Path(target.source)
-        precomputed_checksum = utils.sha256_path(path)
+            precomputed_checksum = storage.fingerprints.checksum(target.to_path())
+        except OSError:
+            # Let the parser report the unreadable file
+            precomputed_checksum = None
+        else:
+            target = replace(target, checksum=precomputed_checksum)
+
+    if not force and precomputed_checksum is not None:
         if not storage.should_process(precomputed_checksum):
             return _outcome_from_manifest(
                 target.source,
@@ -79,23 +246,33 @@ def parse_single_target(
                 message="Already processed",
             )
 
-    try:
-        document = parser.extract(target)
-    except ParserError as exc:
-        return ParseOutcome(
-            source=target.source,
-            parser=parser.name,
-            status="error",
-            checksum=precomputed_checksum,
-            error=str(exc),
-        )
+    return _PreparedTarget(target=target, parser=parser, precomputed_checksum=precomputed_checksum)
+
+
+def _extraction_error(prepared: _PreparedTarget, error: str) -> ParseOutcome:
+    return ParseOutcome(
+        source=prepared.target.source,
+        parser=prepared.parser.name,
+        status="error",
+        checksum=prepared.precomputed_checksum,
+        error=error,
+    )
+
 
+def _finish_target(
+    prepared: _PreparedTarget,
+    document: ParsedDocument,
+    *,
+    storage: ParseStorage,
+    force: bool,
+) -> ParseOutcome:
+    parser_name = prepared.parser.name
     checksum = document.checksum
 
     if not force and not storage.should_process(checksum):
         return _outcome_from_manifest(
             document.target.source,
-            parser.name,
+            parser_name,
             storage.manifest().get(checksum),
             checksum=checksum,
             message="Already processed",
@@ -105,7 +282,7 @@ def parse_single_target(
 
     return ParseOutcome(
         source=document.target.source,
-        parser=parser.name,
+        parser=parser_name,
         status=entry.status,
         artifact_path=entry.artifact_path,
         warnings=document.warnings,
@@ -113,71 +290,44 @@ def parse_single_target(
     )
 
 
-def scan_and_parse(
-    root: str | Path,
+def _parse_in_workers(
+    candidates: Sequence[Path],
     *,
     storage: ParseStorage,
-    registry_override: ParserRegistry | None = None,
-    suffixes: Sequence[str] | None = None,
-    recursive: bool = True,
-    force: bool = False,
-    limit: int | None = None,
-    include_patterns: Sequence[str] | None = None,
-    exclude_patterns: Sequence[str] | None = None,
+    registry_override: ParserRegistry | None,
+    force: bool,
+    workers: int,
+    document_timeout: float | None,
+    memory_limit_mb: int | None,
 ) -> list[ParseOutcome]:
-    candidates = collect_parse_candidates(
-        root,
-        suffixes=suffixes,
-        recursive=recursive,
-        storage_root=storage.root,
-        include_patterns=include_patterns,
-        exclude_patterns=exclude_patterns,
-    )
-    if limit is not None and limit >= 0:
-        candidates = candidates[:limit]
-
-    results: list[ParseOutcome] = []
+    slots: list[ParseOutcome | _PreparedTarget] = []
     for candidate in candidates:
-        outcome = parse_single_target(
-            candidate,
-            storage=storage,
-            registry_override=registry_override,
-            force=force,
+        slots.append(
+            _prepare_target(
+                candidate,
+                storage=storage,
+                registry_override=registry_override,
+                expected_parser=None,
+                force=force,
+                media_type=None,
+                is_remote=None,
+            )
         )
-        results.append(outcome)
-    return results
 
-
-def collect_parse_candidates(
-    root: str | Path,
-    *,
-    suffixes: Sequence[str] | None = None,
-    recursive: bool = True,
-    storage_root: Path | None = None,
-    include_patterns: Sequence[str] | None = None,
-    exclude_patterns: Sequence[str] | None = None,
-) -> list[Path]:
-    """Return candidate paths that match the parsing filters without executing parsers."""
-
-    root_path = Path(root).expanduser().resolve()
-    if not root_path.exists():
-        raise FileNotFoundError(f"Scan root '{root_path}' does not exist")
-
-    normalized_suffixes = utils.normalize_suffixes(
-        suffixes,
-        default=_DEFAULT_SCAN_SUFFIXES,
-        sort=True,
-        preserve_order=False,
+    pending = [(index, slot) for index, slot in enumerate(slots) if isinstance(slot, _PreparedTarget)]
+    extracted = run_extractions(
+        [WorkerJob(parser=item.parser, target=item.target) for _index, item in pending],
+        workers=workers,
+        timeout=document_timeout,
+        memory_limit_mb=memory_limit_mb,
     )
 
-    return _collect_candidates(
-        root_path,
-        normalized_suffixes,
-        recursive,
-        storage_root,
-        include_patterns,
-        exclude_patterns,
-    )
+    for (index, item), result in zip(pending, extracted):
+        if result.document is None:
+            slots[index] = _extraction_error(item, result.error or "Unknown worker error")
+        else:
+            slots[index] = _finish_target(item, result.document, storage=storage, force=force)
+    return [slot for slot in slots if isinstance(slot, ParseOutcome)]
 
 
 def _outcome_from_manifest(
@@ -269,6 +419,7 @@ def _is_within(path: Path, ancestor: Path) -> bool:
 
 
 __all__ = [
+    "DEFAULT_DOCUMENT_TIMEOUT",
     "ParseOutcome",
     "parse_single_target",
     "scan_and_parse",
@@ -0,0 +1,261 @@
+"""Sitemap discovery and streaming parsing.
+
+Sites list their pages in sitemap.xml files (https://www.sitemaps.org/):
+either a ``<urlset>`` of page ``<url>`` entries, each with an optional
+``<lastmod>``, or a ``<sitemapindex>`` pointing at further sitemaps. Their
+locations are announced by ``Sitemap:`` lines in robots.txt, with
+``/sitemap.xml`` as the conventional fallback.
+
+Sitemaps can hold 50,000 URLs and a site can have hundreds of them, so
+parsing is incremental: each entry is yielded as soon as its closing tag is
+read and then dropped from the tree, and responses are read from the
+network as the parser consumes them. Gzipped sitemaps are decompressed on
+the fly.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import re
+import xml.etree.ElementTree as ET
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Callable, Iterable, Iterator
+from urllib.parse import urlparse
+
+import requests
+
+from src.parsing.http import DEFAULT_TIMEOUT, get_session
+
+logger = logging.getLogger(__name__)
+
+# Most sitemap files fetched for one crawl, counting indexes
+DEFAULT_MAX_SITEMAPS = 100
+
+# Largest uncompressed sitemap accepted (the protocol limit)
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# W3C datetime: YYYY, YYYY-MM, YYYY-MM-DD, or a full timestamp
+_LASTMOD = re.compile(r"^\d{4}(-\d{2}(-\d{2})?)?$")
+
+
+@dataclass(frozen=True, slots=True)
+class SitemapEntry:
+    """One ``<url>`` or ``<sitemap>`` entry.
+
+    Attributes:
+        loc: The page URL, or the child sitemap URL for index entries.
+        lastmod: When the page last changed, if the sitemap says.
+        is_sitemap: True for entries of a sitemap index.
+    """
+
+    loc: str
+    lastmod: datetime | None = None
+    is_sitemap: bool = False
+
+
+def parse_lastmod(value: str | None) -> datetime | None:
+    """Parse a W3C datetime, as used by ``<lastmod>``, into UTC.
+
+    A year, month or date without a time is taken as the last moment of
+    that period in UTC: the page may have changed at any point in it, so a
+    fetch earlier in the period must not count as up to date. Timestamps
+    without an offset are taken as UTC. Returns None for missing or
+    malformed values.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        if _LASTMOD.match(value):
+            return _end_of_period([int(part) for part in value.split("-")])
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, OverflowError):
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _end_of_period(parts: list[int]) -> datetime:
+    """Return the last microsecond of a year, month or day."""
+    start = datetime(*(parts + [1, 1])[:3], tzinfo=timezone.utc)
+    if len(parts) == 3:
+        end = start + timedelta(days=1)
+    elif len(parts) == 2:
+        end = start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    else:
+        end = start.replace(year=start.year + 1)
+    return end - timedelta(microseconds=1)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def parse_sitemap(stream: BinaryIO) -> Iterator[SitemapEntry]:
+    """Yield the entries of a sitemap or sitemap index as they are parsed.
+
+    Memory stays flat however large the file is: each entry is removed
+    from the tree once yielded.
+
+    Args:
+        stream: Binary file-like object with the (uncompressed) XML.
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the XML is malformed. Entries
+            before the error have already been yielded.
+    """
+    root: ET.Element | None = None
+    loc: str | None = None
+    lastmod: str | None = None
+    for event, element in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+        name = _local_name(element.tag)
+        if name == "loc":
+            loc = (element.text or "").strip()
+        elif name == "lastmod":
+            lastmod = element.text
+        elif name in ("url", "sitemap"):
+            if loc:
+                yield SitemapEntry(loc, parse_lastmod(lastmod), is_sitemap=name == "sitemap")
+            loc = lastmod = None
+            if root is not None:
+                root.clear()
+
+
+class _CappedReader:
+    """File-like wrapper that refuses to read past a byte limit."""
+
+    def __init__(self, raw: BinaryIO, limit: int) -> None:
+        self._raw = raw
+        self._remaining = limit
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size if size >= 0 else self._remaining + 1)
+        self._remaining -= len(data)
+        if self._remaining < 0:
+            raise ValueError("sitemap exceeds the size limit")
+        return data
+
+
+class _Prefixed:
+    """Put already-read bytes back in front of a stream."""
+
+    def __init__(self, head: bytes, raw: BinaryIO) -> None:
+        self._head = head
+        self._raw = raw
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._head:
+            return self._raw.read(size)
+        if size < 0:
+            data, self._head = self._head + self._raw.read(), b""
+            return data
+        data, self._head = self._head[:size], self._head[size:]
+        if len(data) < size:
+            data += self._raw.read(size - len(data))
+        return data
+
+
+def _open_body(response: requests.Response, url: str) -> BinaryIO:
+    """Return a stream of the uncompressed XML body."""
+    response.raw.decode_content = True
+    raw = response.raw
+    if url.endswith(".gz") or "gzip" in response.headers.get("Content-Type", ""):
+        head = raw.read(2)
+        if head == _GZIP_MAGIC:
+            raw = gzip.GzipFile(fileobj=_Prefixed(head, raw))
+        else:
+            raw = _Prefixed(head, raw)
+    return _CappedReader(raw, MAX_SITEMAP_BYTES)
+
+
+def default_sitemap_url(url: str) -> str:
+    """Return the well-known sitemap location for a URL's site."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}/sitemap.xml"
+
+
+def iter_sitemap_urls(
+    sitemap_urls: Iterable[str],
+    *,
+    user_agent: str,
+    is_allowed: Callable[[str], bool] | None = None,
+    max_sitemaps: int = DEFAULT_MAX_SITEMAPS,
+    timeout: float = DEFAULT_TIMEOUT,
+    session: requests.Session | None = None,
+    before_fetch: Callable[[str], None] | None = None,
+) -> Iterator[SitemapEntry]:
+    """Fetch sitemaps and yield their page entries, following indexes.
+
+    Sitemaps that cannot be fetched or parsed are logged and skipped; pages
+    read before a parse error are still yielded.
+
+    Args:
+        sitemap_urls: Sitemaps to start from.
+        user_agent: User agent string sent with each request.
+        is_allowed: robots.txt check applied to sitemap URLs (optional).
+        max_sitemaps: Most sitemap files to fetch, counting indexes.
+        timeout: Connect/read timeout in seconds.
+        session: Session to use (defaults to the shared pooled session).
+        before_fetch: Called with each sitemap URL just before it is
+            requested, for example to wait out the host's crawl delay.
+    """
+    session = session or get_session()
+    pending = deque(sitemap_urls)
+    seen: set[str] = set()
+    fetched = 0
+    while pending and fetched < max_sitemaps:
+        url = pending.popleft()
+        if url in seen or (is_allowed is not None and not is_allowed(url)):
+            continue
+        seen.add(url)
+        fetched += 1
+        if before_fetch is not None:
+            before_fetch(url)
+
+        try:
+            response = session.get(
+                url,
+                headers={"User-Agent": user_agent},
+                timeout=timeout,
+                stream=True,
+            )
+        except requests.RequestException as e:
+            logger.info("Could not fetch sitemap %s: %s", url, e)
+            continue
+
+        try:
+            if response.status_code >= 400:
+                logger.info("Sitemap %s returned HTTP %d", url, response.status_code)
+                continue
+            for entry in parse_sitemap(_open_body(response, url)):
+                if entry.is_sitemap:
+                    pending.append(entry.loc)
+                else:
+                    yield entry
+        except (ET.ParseError, OSError, ValueError, requests.RequestException) as e:
+            logger.warning("Stopped reading sitemap %s: %s", url, e)
+        finally:
+            response.close()
+
+    if pending:
+        logger.info("Sitemap limit of %d reached; %d sitemaps not read", max_sitemaps, len(pending))
+
+
+__all__ = [
+    "DEFAULT_MAX_SITEMAPS",
+    "SitemapEntry",
+    "default_sitemap_url",
+    "iter_sitemap_urls",
+    "parse_lastmod",
+    "parse_sitemap",
+]
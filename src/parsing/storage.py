@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
+import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -10,6 +14,8 @@ from typing import TYPE_CHECKING, Any
 
 from . import utils
 from .base import ParsedDocument
+from .fingerprints import FingerprintCache, default_cache_path
+from .manifest_journal import DEFAULT_COMPACT_MIN_RECORDS, ManifestJournal
 from .markdown import document_to_markdown
 
 if TYPE_CHECKING:
@@ -18,6 +24,14 @@ if TYPE_CHECKING:
 _MANIFEST_VERSION = 1
 _DEFAULT_MANIFEST = "manifest.json"
 
+# "json" rewrites manifest.json on every write; "journal" appends to a log
+MANIFEST_BACKENDS = ("json", "journal")
+
+# Raw HTML is kept out of the manifest in gzip sidecars named by content hash
+RAW_HTML_KEY = "raw_html"
+_RAW_HTML_PREFIX = "raw-"
+_RAW_HTML_SUFFIX = ".html.gz"
+
 
 @dataclass(slots=True)
 class ManifestEntry:
@@ -90,6 +104,17 @@ class ParseStorage:
 
     When running in GitHub Actions, pass a GitHubStorageClient to persist
     writes via the GitHub API instead of the local filesystem.
+
+    With ``manifest_backend="journal"`` each recorded entry is appended to
+    an append-only journal next to ``manifest.json``. The JSON file is only
+    rewritten when the journal is compacted, so recording stays O(1) however
+    large the manifest grows. Any storage instance replays a journal it finds
+    when it loads, so readers need no configuration. The journal backend is
+    local-only.
+
+    Writes are serialized by a lock, so concurrent crawl workers can share
+    one storage. Batches nest: each worker may begin and flush its own, and
+    only the outermost flush writes.
     """
 
     def __init__(
@@ -99,7 +124,15 @@ class ParseStorage:
         manifest_filename: str = _DEFAULT_MANIFEST,
         github_client: "GitHubStorageClient | None" = None,
         project_root: Path | None = None,
+        manifest_backend: str = "json",
+        journal_compact_min_records: int = DEFAULT_COMPACT_MIN_RECORDS,
     ) -> None:
+        if manifest_backend not in MANIFEST_BACKENDS:
+            raise ValueError(
+                f"Invalid manifest backend: {manifest_backend}. Must be one of {MANIFEST_BACKENDS}"
+            )
+        if manifest_backend == "journal" and github_client is not None:
+            raise ValueError("The journal manifest backend cannot be used with a GitHub client")
         self.root = Path(root)
         self.root = self.root if self.root.is_absolute() else self.root.resolve()
         self._manifest_filename = manifest_filename
@@ -111,9 +144,19 @@ class ParseStorage:
         self._manifest_dirty = False
         # Defer content file writes for batching (GitHub API efficiency)
         self._defer_content_writes = False
-        self._pending_content_files: list[tuple[Path, str]] = []
+        self._pending_content_files: list[tuple[Path, str | bytes]] = []
+        self._batch_depth = 0
+        self._batch_wants_content = False
+        self._lock = threading.RLock()
+        self._manifest_backend = manifest_backend
         utils.ensure_directory(self.root)
+        self._journal = ManifestJournal(
+            self.manifest_path,
+            compact_min_records=journal_compact_min_records,
+        )
         self._manifest = self._load_manifest()
+        # Local stat -> checksum cache used to skip rehashing unchanged files
+        self.fingerprints = FingerprintCache(default_cache_path(self.root))
 
     def _get_relative_path(self, path: Path) -> str:
         """Get path relative to project root for GitHub API."""
@@ -140,12 +183,26 @@ class ParseStorage:
         """Start batching manifest and content writes to reduce GitHub API commits.
         
         Call this before processing multiple documents, then call flush_all()
-        when done to write all changes in a single commit.
+        when done to write all changes in a single commit. A batch begun
+        while another is open joins it.
         """
-        self._defer_manifest_writes = True
-        self._defer_content_writes = True
-        self._manifest_dirty = False
-        self._pending_content_files = []
+        with self._lock:
+            self._batch_depth += 1
+            if self._batch_depth > 1:
+                return
+            self._defer_manifest_writes = True
+            self._defer_content_writes = True
+            self._manifest_dirty = False
+            self._pending_content_files = []
+            self._batch_wants_content = False
+    
+    def _leave_nested_batch(self) -> bool:
+        """Close an inner batch; return True if an outer one is still open."""
+        if self._batch_depth > 1:
+            self._batch_depth -= 1
+            return True
+        self._batch_depth = 0
+        return False
     
     def flush_manifest(self) -> None:
         """Write pending manifest changes if any exist.
@@ -155,7 +212,21 @@ class ParseStorage:
         
         Note: This only flushes the manifest file. For content files, use flush_all().
         """
-        if self._manifest_dirty:
+        with self._lock:
+            if self._leave_nested_batch():
+                return
+            if self._batch_wants_content:
+                # A joined batch asked for its content files to be written
+                self._flush_all()
+            else:
+                self._flush_manifest()
+    
+    def _flush_manifest(self) -> None:
+        if self._manifest_backend == "journal":
+            # Entries were appended as they were recorded; make them durable
+            self._journal.sync()
+            self._manifest_dirty = False
+        elif self._manifest_dirty:
             self._write_manifest()
             self._manifest_dirty = False
         self._defer_manifest_writes = False
@@ -166,6 +237,13 @@ class ParseStorage:
         This commits all accumulated content files and the manifest in a single
         batch commit when using GitHub client. Uses PR branch if available.
         """
+        with self._lock:
+            if self._leave_nested_batch():
+                self._batch_wants_content = True
+                return
+            self._flush_all()
+    
+    def _flush_all(self) -> None:
         # Flush content files first
         if self._pending_content_files:
             if self._github_client:
@@ -182,24 +260,56 @@ class ParseStorage:
             else:
                 # Write to local filesystem
                 for path, content in self._pending_content_files:
-                    _write_atomic_text(path, content)
+                    _write_atomic(path, content)
             
             self._pending_content_files = []
         
         self._defer_content_writes = False
+        self._batch_wants_content = False
         
         # Then flush manifest
-        self.flush_manifest()
+        self._flush_manifest()
 
     def record_entry(self, entry: ManifestEntry) -> None:
-        self._manifest.upsert(entry)
-        self._manifest_dirty = True
-        if not self._defer_manifest_writes:
-            self._write_manifest()
+        with self._lock:
+            self._manifest.upsert(entry)
+            if self._manifest_backend == "journal":
+                self._journal.append(entry)
+                if self._journal.needs_compaction(len(self._manifest.entries)):
+                    self.compact_manifest()
+                return
+            self._manifest_dirty = True
+            if not self._defer_manifest_writes:
+                self._write_manifest()
+
+    def compact_manifest(self) -> None:
+        """Fold journaled entries into ``manifest.json`` and drop the journal."""
+        self._write_manifest()
+        self._manifest_dirty = False
+
+    def export_manifest(self, path: Path) -> Path:
+        """Write the manifest in the ``manifest.json`` layout to ``path``.
+        
+        Useful for handing a journal-backed manifest to tools that only
+        read the JSON file, without compacting the live journal.
+        """
+        path = Path(path)
+        utils.ensure_directory(path.parent)
+        _write_atomic_text(path, _serialize_manifest(self._manifest))
+        return path
+
+    def close(self) -> None:
+        """Flush and release the manifest journal and save fingerprints."""
+        self._journal.sync()
+        self._journal.close()
+        self.fingerprints.save()
 
     def persist_document(self, document: ParsedDocument) -> ManifestEntry:
         """Write the document to disk and record a manifest entry."""
+        with self._lock:
+            return self._persist_document(document)
 
+    def _persist_document(self, document: ParsedDocument) -> ManifestEntry:
         checksum = document.checksum
         processed_at = document.created_at
         artifact_dir, _ = self._prepare_artifact_directory(
@@ -221,7 +331,7 @@ class ParseStorage:
         page_files: list[str] = []
 
         # Collect all files to write (for batching with GitHub API)
-        files_to_write: list[tuple[Path, str]] = []
+        files_to_write: list[tuple[Path, str | bytes]] = []
 
         for index, segment in enumerate(document.segments, start=1):
             normalized = segment.strip("\n")
@@ -276,6 +386,16 @@ class ParseStorage:
         index_content = document_to_markdown(index_doc)
         files_to_write.append((index_path, index_content))
 
+        metadata = dict(document.metadata)
+        raw_html = metadata.pop(RAW_HTML_KEY, None)
+        if isinstance(raw_html, str):
+            sidecar_path, sidecar_content, raw_metadata = self._prepare_raw_html_sidecar(
+                artifact_dir, raw_html
+            )
+            metadata.update(raw_metadata)
+            if sidecar_content is not None:
+                files_to_write.append((sidecar_path, sidecar_content))
+
         # Write all files (local or GitHub)
         if self._defer_content_writes:
             # Accumulate files for batch commit
@@ -295,9 +415,8 @@ class ParseStorage:
         else:
             # Write to local filesystem
             for path, content in files_to_write:
-                _write_atomic_text(path, content)
+                _write_atomic(path, content)
 
-        metadata = dict(document.metadata)
         metadata.update(
             {
                 "artifact_type": "page-directory",
@@ -318,6 +437,107 @@ class ParseStorage:
         self.record_entry(entry)
         return entry
 
+    def load_raw_html(self, entry: ManifestEntry) -> str | None:
+        """Return the raw HTML recorded for ``entry``, if any.
+        
+        Reads the compressed sidecar, falling back to HTML stored inline by
+        manifests that have not been migrated yet.
+        """
+        reference = entry.metadata.get("raw_html_path")
+        if reference:
+            path = self.root / reference
+            if path.exists():
+                return gzip.decompress(path.read_bytes()).decode("utf-8")
+            return None
+        inline = entry.metadata.get(RAW_HTML_KEY)
+        return inline if isinstance(inline, str) else None
+
+    def migrate_raw_html(self, *, dry_run: bool = False) -> "RawHtmlMigration":
+        """Move raw HTML stored inline in the manifest into sidecar files.
+        
+        Each affected entry gets the same sidecar and metadata reference that
+        :meth:`persist_document` now writes, and the manifest is rewritten
+        once at the end. Entries without inline HTML are left untouched, so
+        running the migration again is a no-op.
+        
+        Args:
+            dry_run: Report what would change without writing anything.
+            
+        Returns:
+            RawHtmlMigration summarizing the entries and bytes moved.
+        """
+        result = RawHtmlMigration(
+            manifest_bytes_before=(
+                self.manifest_path.stat().st_size if self.manifest_path.exists() else 0
+            ),
+        )
+        files_to_write: list[tuple[Path, str | bytes]] = []
+
+        for entry in self._manifest.entries.values():
+            raw_html = entry.metadata.get(RAW_HTML_KEY)
+            if not isinstance(raw_html, str):
+                continue
+            result.entries_migrated += 1
+            result.html_bytes_moved += len(raw_html.encode("utf-8"))
+            if dry_run:
+                continue
+
+            artifact_dir = (self.root / entry.artifact_path).parent
+            sidecar_path, sidecar_content, raw_metadata = self._prepare_raw_html_sidecar(
+                artifact_dir, raw_html
+            )
+            if sidecar_content is not None:
+                files_to_write.append((sidecar_path, sidecar_content))
+            metadata = dict(entry.metadata)
+            del metadata[RAW_HTML_KEY]
+            metadata.update(raw_metadata)
+            entry.metadata = metadata
+
+        if dry_run or not result.entries_migrated:
+            result.manifest_bytes_after = result.manifest_bytes_before
+            return result
+
+        if self._github_client:
+            files_to_write.append(
+                (self.manifest_path, json.dumps(self._manifest.to_dict(), indent=2, sort_keys=True))
+            )
+            self._github_client.commit_files_batch(
+                files=[(self._get_relative_path(path), content) for path, content in files_to_write],
+                message=f"Move raw HTML out of parse manifest ({result.entries_migrated} entries)",
+                use_pr_branch=True,
+            )
+        else:
+            for path, content in files_to_write:
+                _write_atomic(path, content)
+            self._write_manifest()
+        self._manifest_dirty = False
+
+        if self.manifest_path.exists():
+            result.manifest_bytes_after = self.manifest_path.stat().st_size
+        return result
+
+    def _prepare_raw_html_sidecar(
+        self,
+        artifact_dir: Path,
+        raw_html: str,
+    ) -> tuple[Path, bytes | None, dict[str, Any]]:
+        """Build the sidecar for ``raw_html`` and the manifest reference to it.
+        
+        Returns the sidecar path, its gzip content (None when an identical
+        sidecar already exists locally), and the metadata to record.
+        """
+        data = raw_html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = artifact_dir / f"{_RAW_HTML_PREFIX}{digest}{_RAW_HTML_SUFFIX}"
+        metadata = {
+            "raw_html_path": self.relative_artifact_path(path),
+            "raw_html_bytes": len(data),
+        }
+        if not self._github_client and path.exists():
+            return path, None, metadata
+        # mtime=0 keeps the compressed bytes stable for identical HTML
+        return path, gzip.compress(data, mtime=0), metadata
+
     def make_artifact_path(
         self,
         source: str,
@@ -355,14 +575,15 @@ class ParseStorage:
 
     def _load_manifest(self) -> Manifest:
         path = self.manifest_path
-        if not path.exists():
-            return Manifest()
-        raw = json.loads(path.read_text(encoding="utf-8"))
-        return Manifest.from_dict(raw)
+        manifest = Manifest()
+        if path.exists():
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            manifest = Manifest.from_dict(raw)
+        self._journal.replay(manifest, ManifestEntry.from_dict)
+        return manifest
 
     def _write_manifest(self) -> None:
-        payload = self._manifest.to_dict()
-        content = json.dumps(payload, indent=2, sort_keys=True)
+        content = _serialize_manifest(self._manifest)
 
         if self._github_client:
             rel_path = self._get_relative_path(self.manifest_path)
@@ -374,8 +595,15 @@ class ParseStorage:
             )
         else:
             tmp_path = self.manifest_path.with_suffix(".tmp")
-            tmp_path.write_text(content, encoding="utf-8")
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                handle.write(content)
+                if self._journal.records:
+                    # The snapshot must be durable before the journal goes away
+                    handle.flush()
+                    os.fsync(handle.fileno())
             tmp_path.replace(self.manifest_path)
+            # Journal records are now part of the snapshot
+            self._journal.reset()
 
     def _prepare_artifact_directory(
         self,
@@ -394,12 +622,39 @@ class ParseStorage:
         return directory, base_name
 
 
+def _serialize_manifest(manifest: Manifest) -> str:
+    return json.dumps(manifest.to_dict(), indent=2, sort_keys=True)
+
+
+@dataclass(slots=True)
+class RawHtmlMigration:
+    """Outcome of :meth:`ParseStorage.migrate_raw_html`."""
+
+    entries_migrated: int = 0
+    html_bytes_moved: int = 0
+    manifest_bytes_before: int = 0
+    manifest_bytes_after: int = 0
+
+
+def _write_atomic(path: Path, content: str | bytes) -> None:
+    if isinstance(content, bytes):
+        _write_atomic_bytes(path, content)
+    else:
+        _write_atomic_text(path, content)
+
+
 def _write_atomic_text(path: Path, content: str) -> None:
     tmp_path = path.with_suffix(path.suffix + ".tmp")
     tmp_path.write_text(content, encoding="utf-8")
     tmp_path.replace(path)
 
 
+def _write_atomic_bytes(path: Path, content: bytes) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(content)
+    tmp_path.replace(path)
+
+
 def _determine_segment_unit(document: ParsedDocument) -> str:
     if document.parser_name == "pdf":
         return "page"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import mimetypes
+import mmap
 import os
 import re
 from collections.abc import Sequence
@@ -11,6 +12,7 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 _DEFAULT_CHUNK_SIZE = 1024 * 1024
+_MMAP_THRESHOLD = 16 * 1024 * 1024
 _SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
 
 
@@ -32,6 +34,15 @@ def sha256_bytes(data: bytes) -> str:
 def sha256_path(path: Path, *, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> str:
     digest = hashlib.sha256()
     with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size >= _MMAP_THRESHOLD:
+            # One update over a read-only mapping avoids a copy per chunk
+            try:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
+                return digest.hexdigest()
+            except (OSError, ValueError):
+                handle.seek(0)
         while True:
             chunk = handle.read(chunk_size)
             if not chunk:
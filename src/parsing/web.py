@@ -3,35 +3,101 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import re
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
+from urllib.parse import urlparse
 
 import trafilatura
-try:  # pragma: no cover - optional dependency fallback
-    from bs4 import BeautifulSoup
-except ImportError:  # pragma: no cover - executed only if dependency missing
-    BeautifulSoup = None
+from lxml import etree
+from trafilatura.utils import load_html
 
 from . import utils
 from .base import ParsedDocument, ParseTarget, ParserError
+from .link_extractor import ExtractedLink, extract_links_from_tree, extract_title_from_tree
 from .markdown import document_to_markdown
 from .registry import registry
 
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
+    from .rendering import BrowserPool, RenderedPage
+
 logger = logging.getLogger(__name__)
 
 _HTML_SUFFIXES = (".html", ".htm", ".xhtml")
 _HTML_MEDIA_TYPES = ("text/html", "application/xhtml+xml")
 
+# Fetch strategies for remote pages
+FETCH_STATIC = "static"
+FETCH_RENDERED = "rendered"
+
+
+@dataclass(slots=True)
+class FetchStats:
+    """Counts and wall time for each remote fetch path.
+    
+    Attributes:
+        static_pages: Pages served from a plain HTTP GET.
+        rendered_pages: Pages rendered with Playwright.
+        static_seconds: Time spent on pages served statically.
+        rendered_seconds: Time spent rendering pages.
+        escalated_pages: Rendered pages that were probed statically first.
+        probe_seconds: Time spent on static probes that ended in a render.
+    """
+
+    static_pages: int = 0
+    rendered_pages: int = 0
+    static_seconds: float = 0.0
+    rendered_seconds: float = 0.0
+    escalated_pages: int = 0
+    probe_seconds: float = 0.0
+
+    def record(
+        self,
+        strategy: str,
+        seconds: float,
+        *,
+        probe_seconds: float = 0.0,
+        escalated: bool = False,
+    ) -> None:
+        """Record one fetched page under ``strategy``."""
+        if strategy == FETCH_STATIC:
+            self.static_pages += 1
+            self.static_seconds += seconds
+        else:
+            self.rendered_pages += 1
+            self.rendered_seconds += seconds
+            if escalated:
+                self.escalated_pages += 1
+                self.probe_seconds += probe_seconds
+
+    def to_dict(self) -> dict[str, int | float]:
+        """Serialize to dictionary for logging/reporting."""
+        return {
+            "static_pages": self.static_pages,
+            "rendered_pages": self.rendered_pages,
+            "static_seconds": round(self.static_seconds, 3),
+            "rendered_seconds": round(self.rendered_seconds, 3),
+            "escalated_pages": self.escalated_pages,
+            "probe_seconds": round(self.probe_seconds, 3),
+        }
+
 
 @dataclass(slots=True)
 class WebParser:
     """Concrete :class:`DocumentParser` for HTML sources and URLs.
     
-    Uses Playwright browser rendering for all remote URL fetching to ensure
-    accurate extraction from JavaScript-rendered pages. Local HTML files are
-    parsed directly without browser rendering.
+    Remote URLs are fetched with a pooled static GET first and rendered with
+    Playwright only when the static HTML looks JavaScript-dependent. The
+    strategy that worked is remembered per domain in ``domain_strategies``
+    and per-path counts and timings accumulate in ``fetch_stats``. Set
+    ``static_first=False`` to always render. Local HTML files are parsed
+    directly without browser rendering. Pass a ``browser_pool`` to reuse one
+    browser across many URLs instead of launching one per page.
     """
 
     name: str = "web"
@@ -43,6 +109,10 @@ class WebParser:
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/131.0.0.0 Safari/537.36"
     )
+    browser_pool: "BrowserPool | None" = None
+    static_first: bool = True
+    domain_strategies: dict[str, str] = field(default_factory=dict)
+    fetch_stats: FetchStats = field(default_factory=FetchStats)
 
     def detect(self, target: ParseTarget) -> bool:
         is_url = utils.is_http_url(target.source)
@@ -69,11 +139,96 @@ class WebParser:
         return document_to_markdown(document)
 
     def _extract_remote(self, target: ParseTarget) -> ParsedDocument:
-        """Extract content from a remote URL using Playwright browser rendering."""
-        from .rendering import render_page, RenderingError, is_playwright_available
+        """Extract content from a remote URL.
+        
+        Tries a static GET first and only renders with Playwright when the
+        static HTML looks incomplete (see :func:`needs_rendering`). Domains
+        that needed rendering are remembered so later pages skip the probe.
+        """
+        from .http import StaticFetchError, fetch_static
+        from .rendering import needs_rendering
         
         self._apply_rate_limit(target)
         fetched_at = datetime.now(timezone.utc)
+        domain = _domain_of(target.source)
+        
+        fetched = None
+        extracted: str | None = None
+        probe_seconds = 0.0
+        if self.static_first and self.domain_strategies.get(domain) != FETCH_RENDERED:
+            started = time.perf_counter()
+            try:
+                fetched = fetch_static(
+                    target.source,
+                    user_agent=self.user_agent,
+                    timeout=self.timeout / 1000,
+                )
+            except StaticFetchError as e:
+                logger.debug("Static fetch failed for %s: %s", target.source, e)
+            else:
+                analysis = analyze_html(fetched.html, target.source)
+                if not needs_rendering(fetched.html, analysis.text):
+                    self.fetch_stats.record(FETCH_STATIC, time.perf_counter() - started)
+                    self.domain_strategies[domain] = FETCH_STATIC
+                    logger.info("Fetched %s without rendering", target.source)
+                    return self._build_remote_document(
+                        target,
+                        fetched.html,
+                        analysis,
+                        fetched_at=fetched_at,
+                        final_url=fetched.final_url,
+                        rendered=False,
+                        title=analysis.title,
+                        user_agent=self.user_agent,
+                    )
+            probe_seconds = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        try:
+            rendered = self._render(target)
+        except ParserError as e:
+            if fetched is None:
+                raise
+            # Rendering is unavailable; the static HTML is the best we have
+            logger.warning("Rendering failed for %s, using static HTML: %s", target.source, e)
+            self.fetch_stats.record(FETCH_STATIC, probe_seconds)
+            document = self._build_remote_document(
+                target,
+                fetched.html,
+                analysis,
+                fetched_at=fetched_at,
+                final_url=fetched.final_url,
+                rendered=False,
+                title=analysis.title,
+                user_agent=self.user_agent,
+            )
+            document.warnings.append(f"Page may need JavaScript rendering: {e}")
+            return document
+        
+        self.fetch_stats.record(
+            FETCH_RENDERED,
+            time.perf_counter() - started,
+            probe_seconds=probe_seconds,
+            escalated=probe_seconds > 0,
+        )
+        if self.static_first:
+            self.domain_strategies[domain] = FETCH_RENDERED
+        
+        analysis = analyze_html(rendered.html, target.source)
+        return self._build_remote_document(
+            target,
+            rendered.html,
+            analysis,
+            fetched_at=fetched_at,
+            final_url=rendered.final_url,
+            rendered=True,
+            title=rendered.title or analysis.title,
+            user_agent=rendered.user_agent,
+        )
+
+    def _render(self, target: ParseTarget) -> "RenderedPage":
+        """Render a remote URL with Playwright."""
+        from .rendering import render_page, RenderingError, is_playwright_available
         
         if not is_playwright_available():
             raise ParserError(
@@ -84,42 +239,54 @@ class WebParser:
         logger.info("Fetching %s with browser rendering", target.source)
         
         try:
-            rendered = render_page(
+            return render_page(
                 target.source,
                 user_agent=self.user_agent,
                 headless=True,
                 timeout=self.timeout,
+                pool=self.browser_pool,
             )
         except RenderingError as e:
             raise ParserError(f"Failed to fetch URL '{target.source}': {e}") from e
-        
+
+    def _build_remote_document(
+        self,
+        target: ParseTarget,
+        html: str,
+        analysis: HtmlAnalysis,
+        *,
+        fetched_at: datetime,
+        final_url: str,
+        rendered: bool,
+        title: str | None,
+        user_agent: str | None,
+    ) -> ParsedDocument:
         document_target = ParseTarget(
             source=target.source,
             is_remote=True,
             media_type="text/html",
         )
-        checksum = utils.sha256_bytes(rendered.html.encode("utf-8"))
+        checksum = utils.sha256_bytes(html.encode("utf-8"))
         document = ParsedDocument(target=document_target, checksum=checksum, parser_name=self.name)
         
         document.metadata.update(
             {
                 "fetched_at": fetched_at.isoformat(),
                 "url": target.source,
-                "final_url": rendered.final_url,
+                "final_url": final_url,
                 "content_type": "text/html",
-                "content_length": rendered.content_length,
-                "rendered": True,
-                "user_agent": rendered.user_agent,
+                "content_length": len(html),
+                "rendered": rendered,
+                "user_agent": user_agent,
             }
         )
-        if rendered.title:
-            document.metadata["title"] = rendered.title
+        if title:
+            document.metadata["title"] = title
         
         # Store raw HTML for link extraction (used by crawler)
-        document.metadata["raw_html"] = rendered.html
+        document.metadata["raw_html"] = html
         
-        # Extract text content from rendered HTML
-        self._populate_segments(document, rendered.html, document_target)
+        self._apply_analysis(document, analysis)
         
         if document.segments:
             logger.info(
@@ -132,8 +299,8 @@ class WebParser:
 
     def _extract_local(self, target: ParseTarget) -> ParsedDocument:
         path = self._require_local_file(target)
-        checksum = utils.sha256_path(path)
         raw = path.read_bytes()
+        checksum = target.checksum or utils.sha256_bytes(raw)
         html, encoding = _decode_html(raw)
 
         document = ParsedDocument(target=target, checksum=checksum, parser_name=self.name)
@@ -151,11 +318,13 @@ class WebParser:
         return document
 
     def _populate_segments(self, document: ParsedDocument, html: str, target: ParseTarget) -> None:
-        normalized_html = _rewrite_key_value_tables(html)
-        extracted = trafilatura.extract(
-            normalized_html,
-            url=target.source if target.is_remote else None,
-        )
+        url = target.source if target.is_remote else None
+        self._apply_analysis(document, analyze_html(html, url))
+
+    @staticmethod
+    def _apply_analysis(document: ParsedDocument, analysis: HtmlAnalysis) -> None:
+        document.links = [link.url for link in analysis.links]
+        extracted = analysis.text
         if not extracted:
             document.warnings.append("No extractable text found in HTML content")
             return
@@ -198,47 +367,135 @@ def _decode_html(data: bytes) -> tuple[str, str]:
     return data.decode("utf-8", errors="ignore"), "unknown"
 
 
+def _domain_of(url: str) -> str:
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
 def _sleep(seconds: float) -> None:
     from time import sleep
 
     sleep(max(seconds, 0.0))
 
 
-def _rewrite_key_value_tables(html: str) -> str:
-    if BeautifulSoup is None:
-        return html
+@dataclass(slots=True)
+class HtmlAnalysis:
+    """Everything derived from one parse of an HTML document.
+    
+    Attributes:
+        text: Main text extracted by trafilatura (None if nothing usable).
+        title: Document title, if present.
+        links: Outbound links (empty unless a base URL was supplied).
+    """
+
+    text: str | None
+    title: str | None = None
+    links: list[ExtractedLink] = field(default_factory=list)
 
-    soup = BeautifulSoup(html, "html.parser")
+
+def analyze_html(
+    html: str,
+    url: str | None = None,
+    *,
+    timings: dict[str, float] | None = None,
+) -> HtmlAnalysis:
+    """Parse ``html`` once and derive title, links, and main text from the tree.
+    
+    The title and links are read before the tree is cleaned, so they match
+    the original markup. Hidden elements are then dropped and key/value
+    tables rewritten in place, but only when a quick scan of the raw markup
+    shows there is something to rewrite. The cleaned tree goes straight to
+    trafilatura without being serialized and parsed again.
     
+    Args:
+        html: The HTML document.
+        url: Page URL; enables link extraction and is passed to trafilatura.
+        timings: Optional dict that receives per-stage durations in seconds.
+        
+    Returns:
+        HtmlAnalysis for the document.
+    """
+    clock = _StageClock(timings)
+
+    tree = load_html(html)
+    clock.lap("parse")
+    if tree is None:
+        return HtmlAnalysis(text=None)
+
+    title = extract_title_from_tree(tree)
+    links = extract_links_from_tree(tree, url) if url else []
+    clock.lap("links")
+
+    if _REWRITE_HINTS.search(html):
+        _drop_hidden_elements(tree)
+        _rewrite_key_value_tables(tree)
+    clock.lap("rewrite")
+
+    text = trafilatura.extract(tree, url=url)
+    clock.lap("extract")
+
+    return HtmlAnalysis(text=text, title=title, links=links)
+
+
+class _StageClock:
+    """Accumulate per-stage durations into an optional dict."""
+
+    __slots__ = ("_timings", "_last")
+
+    def __init__(self, timings: dict[str, float] | None) -> None:
+        self._timings = timings
+        self._last = time.perf_counter() if timings is not None else 0.0
+
+    def lap(self, stage: str) -> None:
+        if self._timings is None:
+            return
+        now = time.perf_counter()
+        self._timings[stage] = self._timings.get(stage, 0.0) + now - self._last
+        self._last = now
+
+
+# Cheap pre-scan: only tables and hidden elements need tree rewriting
+_REWRITE_HINTS = re.compile(
+    r"<table\b|aria-hidden|class\s*=\s*[\"'][^\"']*(?:--hide|hidden|sr-only)",
+    re.IGNORECASE,
+)
+_HIDE_CLASS_PATTERNS = ("--hide", "hidden", "visually-hidden", "sr-only")
+
+
+def _drop_hidden_elements(tree: "HtmlElement") -> None:
     # Remove aria-hidden elements before extraction (these are hidden from screen readers
     # and should not be included in text extraction)
-    for hidden in soup.find_all(attrs={"aria-hidden": "true"}):
-        hidden.decompose()
-    
+    for hidden in tree.xpath('//*[@aria-hidden="true"]'):
+        if hidden.getparent() is not None:
+            hidden.drop_tree()
+
     # Remove elements with common "hide" CSS classes
-    for hidden in soup.find_all(class_=lambda c: c and any(
-        hide_pattern in c for hide_pattern in ["--hide", "hidden", "visually-hidden", "sr-only"]
-    )):
-        # Only remove if it looks like a visibility utility class
-        hidden.decompose()
-    
-    tables = soup.find_all("table")
-    for table in tables:
-        rows = table.find_all("tr")
+    for element in tree.xpath("//*[@class]"):
+        classes = element.get("class", "").split()
+        if element.getparent() is not None and any(
+            pattern in name for name in classes for pattern in _HIDE_CLASS_PATTERNS
+        ):
+            # Only remove if it looks like a visibility utility class
+            element.drop_tree()
+
+
+def _rewrite_key_value_tables(tree: "HtmlElement") -> None:
+    for table in list(tree.iter("table")):
+        rows = table.xpath(".//tr")
         if not rows or len(rows) > 20:
             continue
 
         key_value_pairs: list[tuple[str, list[str]]] = []
         for row in rows:
-            cells = [cell for cell in row.find_all(["th", "td"], recursive=False)]
-            if len(cells) != 2 or cells[0].name != "th" or cells[1].name != "td":
+            cells = [cell for cell in row if cell.tag in ("th", "td")]
+            if len(cells) != 2 or cells[0].tag != "th" or cells[1].tag != "td":
                 key_value_pairs = []
                 break
 
-            label = _normalize_whitespace(cells[0].get_text(" ", strip=True))
+            label = _normalize_whitespace(" ".join(cells[0].itertext()))
             values = [
                 _normalize_whitespace(token)
-                for token in cells[1].stripped_strings
+                for token in cells[1].itertext()
                 if _normalize_whitespace(token)
             ]
             if not label or not values:
@@ -249,31 +506,25 @@ def _rewrite_key_value_tables(html: str) -> str:
         if not key_value_pairs:
             continue
 
-        wrapper = soup.new_tag("div", attrs={"class": "normalized-key-value"})
+        wrapper = table.makeelement("div", {"class": "normalized-key-value"})
         for label, values in key_value_pairs:
-            section = soup.new_tag("div", attrs={"class": "normalized-key-value__item"})
-            label_tag = soup.new_tag("p")
-            strong = soup.new_tag("strong")
-            strong.string = f"{label}:"
-            label_tag.append(strong)
+            section = etree.SubElement(wrapper, "div", {"class": "normalized-key-value__item"})
+            label_tag = etree.SubElement(section, "p")
+            strong = etree.SubElement(label_tag, "strong")
+            strong.text = f"{label}:"
 
             if len(values) == 1:
-                label_tag.append(f" {values[0]}")
-                section.append(label_tag)
+                strong.tail = f" {values[0]}"
             else:
-                section.append(label_tag)
-                list_tag = soup.new_tag("ul")
+                list_tag = etree.SubElement(section, "ul")
                 for value in values:
-                    item_tag = soup.new_tag("li")
-                    item_tag.string = value
-                    list_tag.append(item_tag)
-                section.append(list_tag)
+                    etree.SubElement(list_tag, "li").text = value
 
-            wrapper.append(section)
-
-        table.replace_with(wrapper)
-
-    return str(soup)
+        parent = table.getparent()
+        if parent is None:
+            continue
+        wrapper.tail = table.tail
+        parent.replace(table, wrapper)
 
 
 def _normalize_whitespace(value: str) -> str:
@@ -289,4 +540,4 @@ registry.register_parser(
     replace=True,
 )
 
-__all__ = ["WebParser", "web_parser"]
+__all__ = ["FetchStats", "HtmlAnalysis", "WebParser", "analyze_html", "web_parser"]
@@ -0,0 +1,216 @@
+"""Run parser extraction in isolated worker processes.
+
+Each document is parsed in its own short-lived child process so that a
+parser which hangs, leaks, or crashes inside a C extension only costs that
+document. The parent keeps at most ``workers`` children in flight, kills any
+child that outlives ``timeout`` seconds, and hands results back in job order
+so callers can persist them serially and deterministically. Results that
+finish ahead of a slow document are held until it is done; at most
+``BUFFERED_RESULTS_PER_WORKER * workers`` are held, after which no new
+children start, so parent memory stays proportional to ``workers``.
+
+On platforms with ``fork`` the children inherit the parent's registry and
+parsers; elsewhere the parser and target are pickled into the child.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import Iterable, Iterator, Sequence
+
+from .base import DocumentParser, ParsedDocument, ParserError, ParseTarget
+
+logger = logging.getLogger(__name__)
+
+# Finished results held per worker while waiting for an earlier document
+BUFFERED_RESULTS_PER_WORKER = 2
+
+
+@dataclass(slots=True)
+class WorkerJob:
+    """One extraction request dispatched to a worker process."""
+
+    parser: DocumentParser
+    target: ParseTarget
+
+
+@dataclass(slots=True)
+class WorkerResult:
+    """Outcome of a :class:`WorkerJob`; exactly one of the fields is set."""
+
+    document: ParsedDocument | None = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class _Running:
+    index: int
+    process: multiprocessing.process.BaseProcess
+    connection: Connection
+    deadline: float | None
+
+
+def run_extractions(
+    jobs: Sequence[WorkerJob],
+    *,
+    workers: int,
+    timeout: float | None = None,
+    memory_limit_mb: int | None = None,
+) -> Iterator[WorkerResult]:
+    """Extract ``jobs`` in up to ``workers`` processes, yielding results in job order.
+
+    Args:
+        jobs: Parser/target pairs to extract.
+        workers: Maximum number of concurrent worker processes.
+        timeout: Seconds a single document may take before its worker is killed.
+        memory_limit_mb: Address-space headroom granted to each worker on top of
+            what it inherits from the parent. Exceeding it surfaces as an error.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    context = _mp_context()
+    pending = iter(enumerate(jobs))
+    running: dict[Connection, _Running] = {}
+    finished: dict[int, WorkerResult] = {}
+    max_buffered = BUFFERED_RESULTS_PER_WORKER * workers
+    next_to_yield = 0
+
+    try:
+        while True:
+            while next_to_yield in finished:
+                yield finished.pop(next_to_yield)
+                next_to_yield += 1
+
+            # The head of line is always started or finished, so waiting
+            # for it below cannot stall when the buffer is full
+            while len(running) < workers and len(finished) < max_buffered:
+                item = next(pending, None)
+                if item is None:
+                    break
+                index, job = item
+                slot = _start(context, index, job, timeout, memory_limit_mb)
+                running[slot.connection] = slot
+
+            if not running:
+                break
+
+            ready = wait(list(running), timeout=_wait_budget(running.values()))
+            for connection in ready:
+                slot = running.pop(connection)
+                finished[slot.index] = _collect(slot)
+
+            now = time.monotonic()
+            for connection, slot in list(running.items()):
+                if slot.deadline is not None and now >= slot.deadline:
+                    running.pop(connection)
+                    _terminate(slot)
+                    finished[slot.index] = WorkerResult(
+                        error=f"Parsing timed out after {timeout:g}s"
+                    )
+    finally:
+        for slot in running.values():
+            _terminate(slot)
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _start(
+    context: multiprocessing.context.BaseContext,
+    index: int,
+    job: WorkerJob,
+    timeout: float | None,
+    memory_limit_mb: int | None,
+) -> _Running:
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_worker_main,
+        args=(sender, job.parser, job.target, memory_limit_mb),
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+    deadline = time.monotonic() + timeout if timeout else None
+    return _Running(index=index, process=process, connection=receiver, deadline=deadline)
+
+
+def _wait_budget(slots: Iterable[_Running]) -> float | None:
+    deadlines = [slot.deadline for slot in slots if slot.deadline is not None]
+    if not deadlines:
+        return None
+    return max(min(deadlines) - time.monotonic(), 0.0)
+
+
+def _collect(slot: _Running) -> WorkerResult:
+    try:
+        status, payload = slot.connection.recv()
+    except (EOFError, OSError):
+        status, payload = None, None
+    finally:
+        slot.connection.close()
+    slot.process.join()
+
+    if status == "ok":
+        return WorkerResult(document=payload)
+    if status == "error":
+        return WorkerResult(error=payload)
+    return WorkerResult(error=f"Worker exited with code {slot.process.exitcode}")
+
+
+def _terminate(slot: _Running) -> None:
+    slot.process.kill()
+    slot.process.join()
+    slot.connection.close()
+
+
+def _worker_main(
+    connection: Connection,
+    parser: DocumentParser,
+    target: ParseTarget,
+    memory_limit_mb: int | None,
+) -> None:
+    if memory_limit_mb:
+        _limit_address_space(memory_limit_mb)
+    try:
+        document = parser.extract(target)
+    except ParserError as exc:
+        message: tuple[str, object] = ("error", str(exc))
+    except MemoryError:
+        message = ("error", f"Parsing exceeded the {memory_limit_mb} MB memory limit")
+    except Exception as exc:  # noqa: BLE001 - report instead of dying silently
+        message = ("error", f"{type(exc).__name__}: {exc}")
+    else:
+        message = ("ok", document)
+    try:
+        connection.send(message)
+    except Exception as exc:  # noqa: BLE001 - e.g. unpicklable document
+        connection.send(("error", f"Could not return parsed document: {exc}"))
+    connection.close()
+
+
+def _limit_address_space(memory_limit_mb: int) -> None:
+    """Cap the child's address space at its inherited size plus ``memory_limit_mb``."""
+    try:
+        import resource
+
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            baseline = int(handle.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+        limit = baseline + memory_limit_mb * 1024 * 1024
+        _soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ImportError, OSError, ValueError) as exc:
+        logger.debug("Worker memory limit unavailable: %s", exc)
+
+
+__all__ = ["BUFFERED_RESULTS_PER_WORKER", "WorkerJob", "WorkerResult", "run_extractions"]
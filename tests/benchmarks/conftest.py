@@ -0,0 +1,26 @@
+"""Shared configuration for performance benchmarks.
+
+Benchmarks are slow and timing-sensitive, so they are skipped unless the
+``RUN_BENCHMARKS`` environment variable is set:
+
+    RUN_BENCHMARKS=1 python -m pytest tests/benchmarks -s
+
+Each benchmark prints its measurements; assertions only guard against
+order-of-magnitude regressions so results stay stable on shared runners.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip benchmark modules unless RUN_BENCHMARKS is set."""
+    if os.getenv("RUN_BENCHMARKS"):
+        return
+    skip = pytest.mark.skip(reason="Set RUN_BENCHMARKS=1 to run benchmarks")
+    for item in items:
+        if "benchmarks" in item.path.parts:
+            item.add_marker(skip)
@@ -0,0 +1,141 @@
+"""Benchmark: detection latency against requests for adaptive check intervals.
+
+Synthetic change timelines are replayed for sources that are all labelled
+``daily`` but really change at very different rates, from every few hours
+to about once a year. Changes arrive as a Poisson process at each source's
+true rate. Every source is checked from day zero under two policies: the
+static interval for its label, and the adaptive interval computed from its
+change history. A check sees a change when at least one happened since
+the previous check.
+
+For each policy the harness counts the requests spent within the horizon
+and the detection latency of every change: the time from the change until
+the first check after it.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+from statistics import mean
+
+from tests.benchmarks.utils import report
+
+HORIZON_DAYS = 180
+SOURCES_PER_CLASS = 40
+JITTER_MINUTES = 60
+MIN_INTERVAL = timedelta(hours=6)
+MAX_INTERVAL = timedelta(days=30)
+
+# True mean time between changes, by class
+RATE_CLASSES = {
+    "every 4 hours": timedelta(hours=4),
+    "daily": timedelta(days=1),
+    "weekly": timedelta(days=7),
+    "monthly": timedelta(days=30),
+    "yearly": timedelta(days=365),
+}
+
+DAY = 86400.0
+
+
+def _timeline(rng: random.Random, mean_gap: timedelta, horizon: float) -> list[float]:
+    """Change times in seconds, as a Poisson process up to ``horizon``."""
+    changes, now = [], 0.0
+    while True:
+        now += rng.expovariate(1 / mean_gap.total_seconds())
+        if now >= horizon:
+            return changes
+        changes.append(now)
+
+
+def _replay(
+    changes: list[float],
+    horizon: float,
+    adaptive: bool,
+    rng: random.Random,
+) -> tuple[int, list[float]]:
+    """Check one source until every change is seen.
+
+    Returns:
+        Requests spent before ``horizon`` and the latency of each change.
+    """
+    from src.knowledge.pipeline.change_rate import adaptive_check_interval, record_observation
+    from src.knowledge.pipeline.config import get_check_interval
+
+    prior = get_check_interval("daily")
+    history: list[list[int]] = []
+    latencies: list[float] = []
+    requests = 0
+    now, pending = 0.0, 0
+
+    while pending < len(changes) or now < horizon:
+        if adaptive:
+            interval = adaptive_check_interval(history, prior, MIN_INTERVAL, MAX_INTERVAL)
+        else:
+            interval = prior
+        elapsed = interval.total_seconds() + rng.uniform(0, JITTER_MINUTES * 60)
+        now += elapsed
+        requests += now < horizon
+
+        seen = pending
+        while seen < len(changes) and changes[seen] <= now:
+            latencies.append(now - changes[seen])
+            seen += 1
+        history = record_observation(history, timedelta(seconds=elapsed), seen > pending)
+        pending = seen
+
+    return requests, latencies
+
+
+def _simulate(adaptive: bool) -> dict[str, tuple[int, list[float]]]:
+    timelines, jitter = random.Random(20240601), random.Random(7)
+    horizon = HORIZON_DAYS * DAY
+    outcomes = {}
+    for name, mean_gap in RATE_CLASSES.items():
+        requests, latencies = 0, []
+        for _ in range(SOURCES_PER_CLASS):
+            changes = _timeline(timelines, mean_gap, horizon)
+            spent, seen = _replay(changes, horizon, adaptive, jitter)
+            requests += spent
+            latencies += seen
+        outcomes[name] = (requests, latencies)
+    return outcomes
+
+
+def _summary(requests: int, latencies: list[float]) -> str:
+    latency = f"{mean(latencies) / 3600:.1f}h" if latencies else "n/a"
+    return f"{requests:>6} requests, {len(latencies):>5} changes, mean latency {latency}"
+
+
+def test_adaptive_intervals_spend_fewer_requests() -> None:
+    """Adaptive intervals cost fewer requests without slower detection overall."""
+    static = _simulate(adaptive=False)
+    adaptive = _simulate(adaptive=True)
+
+    rows = []
+    for name in RATE_CLASSES:
+        rows.append((f"static   {name}", _summary(*static[name])))
+        rows.append((f"adaptive {name}", _summary(*adaptive[name])))
+
+    totals = {}
+    for policy, outcomes in (("static", static), ("adaptive", adaptive)):
+        requests = sum(spent for spent, _ in outcomes.values())
+        latencies = [latency for _, seen in outcomes.values() for latency in seen]
+        totals[policy] = (requests, mean(latencies))
+        rows.append((f"{policy} total", _summary(requests, latencies)))
+
+    report(
+        f"{len(RATE_CLASSES) * SOURCES_PER_CLASS} 'daily' sources over {HORIZON_DAYS} days "
+        f"(adaptive bounds {MIN_INTERVAL} to {MAX_INTERVAL.days} days)",
+        rows,
+    )
+
+    # Same timelines for both policies
+    for name in RATE_CLASSES:
+        assert len(static[name][1]) == len(adaptive[name][1])
+    assert totals["adaptive"][0] < totals["static"][0]
+    assert totals["adaptive"][1] <= totals["static"][1]
+    # Fast sources are caught sooner, slow ones cost fewer requests
+    assert mean(adaptive["every 4 hours"][1]) < mean(static["every 4 hours"][1])
+    assert adaptive["yearly"][0] < static["yearly"][0] / 4
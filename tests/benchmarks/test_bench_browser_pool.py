@@ -0,0 +1,71 @@
+"""Benchmark: pages per minute for one-shot rendering vs. a shared browser pool."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from src.parsing.rendering import (
+    BrowserPool,
+    RenderingError,
+    is_playwright_available,
+    render_page,
+)
+
+from tests.benchmarks.utils import local_http_server, report
+
+PAGE_COUNT = 20
+USER_AGENT = "SpeculumBench/1.0"
+
+
+def _write_site(root: Path, count: int) -> None:
+    for i in range(count):
+        body = "".join(f"<p>Paragraph {j} of page {i}.</p>" for j in range(40))
+        (root / f"page{i}.html").write_text(
+            f"<html><head><title>Page {i}</title></head><body>{body}</body></html>",
+            encoding="utf-8",
+        )
+
+
+def _pages_per_minute(elapsed: float, pages: int) -> float:
+    return pages / elapsed * 60 if elapsed else float("inf")
+
+
+def test_pool_outpaces_one_shot_rendering(tmp_path: Path) -> None:
+    """Reusing one browser should render pages substantially faster."""
+    if not is_playwright_available():
+        pytest.skip("Playwright is not installed")
+
+    _write_site(tmp_path, PAGE_COUNT)
+
+    with local_http_server(tmp_path) as base_url:
+        urls = [f"{base_url}/page{i}.html" for i in range(PAGE_COUNT)]
+        render_kwargs = {"user_agent": USER_AGENT}
+
+        try:
+            render_page(urls[0], **render_kwargs)
+        except RenderingError as exc:
+            pytest.skip(f"Chromium is not available: {exc}")
+
+        began = time.perf_counter()
+        for url in urls:
+            render_page(url, **render_kwargs)
+        one_shot = time.perf_counter() - began
+
+        with BrowserPool() as pool:
+            began = time.perf_counter()
+            for url in urls:
+                pool.render(url, **render_kwargs)
+            pooled = time.perf_counter() - began
+
+    report(
+        f"Rendering {PAGE_COUNT} local pages",
+        [
+            ("one-shot pages/min", f"{_pages_per_minute(one_shot, PAGE_COUNT):.0f}"),
+            ("pooled pages/min", f"{_pages_per_minute(pooled, PAGE_COUNT):.0f}"),
+            ("speedup", f"{one_shot / pooled:.1f}x"),
+        ],
+    )
+    assert pooled < one_shot
@@ -0,0 +1,102 @@
+"""Benchmark: sequential vs concurrent crawler phase across several domains.
+
+Each "domain" is a local HTTP server on its own port (``_get_domain`` keeps
+the port, so the scheduler treats them as separate hosts) that sleeps
+before every response to stand in for network latency. Every server hosts
+two small crawlable sites, so each domain has two sources queued.
+``run_crawler`` acquires all of them with the real ``WebParser`` (static
+fetch only), first with one worker and then with one per domain. The
+servers also record how many requests they were serving at once, to check
+that concurrency never puts two requests in flight against one domain.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import ExitStack
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from tests.benchmarks.utils import ServerLoad, local_http_server, make_source, report
+
+DOMAINS = 4
+SECTIONS = ("guides", "reference")
+PAGES_PER_SECTION = 4
+LATENCY_SECONDS = 0.15
+
+
+def _page(title: str, body: str) -> str:
+    text = " ".join(f"{title} explains one more detail of the topic at hand." for _ in range(20))
+    return (
+        f"<html><head><title>{title}</title></head><body><main><h1>{title}</h1>"
+        f"<p>{text}</p>{body}</main></body></html>"
+    )
+
+
+def _build_site(root: Path) -> None:
+    for section in SECTIONS:
+        folder = root / section
+        folder.mkdir(parents=True, exist_ok=True)
+        links = "".join(
+            f'<li><a href="/{section}/{n}.html">Page {n}</a></li>' for n in range(1, PAGES_PER_SECTION)
+        )
+        (folder / "index.html").write_text(_page(f"{section} home", f"<ul>{links}</ul>"), encoding="utf-8")
+        for n in range(1, PAGES_PER_SECTION):
+            (folder / f"{n}.html").write_text(_page(f"{section} page {n}", ""), encoding="utf-8")
+
+
+def _run(base_urls: list[str], root: Path, workers: int) -> tuple[float, int]:
+    from src.knowledge.pipeline.config import PipelineConfig, PipelinePoliteness
+    from src.knowledge.pipeline.crawler import run_crawler
+    from src.knowledge.pipeline.scheduler import DomainScheduler
+
+    politeness = PipelinePoliteness(
+        min_domain_interval=timedelta(seconds=0.5),
+        crawler_delay_seconds=0.1,
+    )
+    config = PipelineConfig(
+        politeness=politeness,
+        kb_root=root / "kb",
+        evidence_root=root / "evidence",
+        crawler_workers=workers,
+        github_client=None,
+    )
+    sources = [
+        (make_source(f"{base_url}/{section}/", is_crawlable=True, crawl_max_pages=100, crawl_max_depth=5), None)
+        for section in SECTIONS
+        for base_url in base_urls
+    ]
+    started = time.perf_counter()
+    result = run_crawler(sources, config, MagicMock(), DomainScheduler(politeness=politeness))
+    return time.perf_counter() - started, result.pages_total
+
+
+def test_concurrent_crawler_overlaps_domains(tmp_path: Path) -> None:
+    """One worker per domain cuts the phase time without doubling up on a domain."""
+    site = tmp_path / "site"
+    _build_site(site)
+    loads = [ServerLoad() for _ in range(DOMAINS)]
+
+    with ExitStack() as stack:
+        base_urls = [
+            stack.enter_context(local_http_server(site, latency=LATENCY_SECONDS, load=load))
+            for load in loads
+        ]
+        sequential, sequential_pages = _run(base_urls, tmp_path / "sequential", workers=1)
+        concurrent, concurrent_pages = _run(base_urls, tmp_path / "concurrent", workers=DOMAINS)
+
+    expected_pages = DOMAINS * len(SECTIONS) * PAGES_PER_SECTION
+    report(
+        f"Crawler phase: {DOMAINS} domains x {len(SECTIONS)} sources, {LATENCY_SECONDS * 1e3:.0f} ms latency",
+        [
+            ("1 worker", f"{sequential:.2f}s, {sequential_pages} pages"),
+            (f"{DOMAINS} workers", f"{concurrent:.2f}s, {concurrent_pages} pages"),
+            ("speedup", f"{sequential / concurrent:.1f}x"),
+            ("peak requests per domain", str(max(load.peak for load in loads))),
+        ],
+    )
+
+    assert sequential_pages == concurrent_pages == expected_pages
+    assert all(load.peak == 1 for load in loads)
+    assert concurrent * 2 < sequential
@@ -0,0 +1,104 @@
+"""Benchmark: serial vs concurrent monitor phase across many hosts.
+
+Each "host" is a local HTTP server bound to its own loopback address
+(127.0.0.2, 127.0.0.3, ...), so ``extract_domain`` treats them as separate
+domains. Every server sleeps before responding to stand in for network
+latency, and hosts one page per monitored source. ``run_monitor`` checks
+the same due sources with the real ``SourceMonitor``, first serially and
+then with a pool of workers. The servers record how many requests they
+were serving at once.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tests.benchmarks.utils import ServerLoad, local_http_server, make_source, report
+
+if TYPE_CHECKING:
+    from src.knowledge.storage import SourceEntry
+
+HOSTS = 20
+SOURCES_PER_HOST = 2
+LATENCY_SECONDS = 0.15
+MIN_DOMAIN_INTERVAL = timedelta(seconds=0.3)
+WORKERS = (1, 4, HOSTS)
+
+
+@dataclass
+class _Registry:
+    sources: list["SourceEntry"] = field(default_factory=list)
+
+    def list_sources(self, status: str | None = None) -> list["SourceEntry"]:
+        return [s for s in self.sources if status is None or s.status == status]
+
+    def list_due_sources(self, now: datetime, status: str | None = "active") -> list["SourceEntry"]:
+        return [s for s in self.list_sources(status) if s.next_check_after is None or s.next_check_after <= now]
+
+    def list_sources_by_domain(self, domain: str, status: str | None = None) -> list["SourceEntry"]:
+        return []
+
+    def save_source(self, source: "SourceEntry") -> None:
+        return
+
+
+def _sources(base_urls: list[str]) -> list["SourceEntry"]:
+    return [
+        make_source(f"{base_url}/page-{n}.html", last_content_hash="stale")
+        for base_url in base_urls
+        for n in range(SOURCES_PER_HOST)
+    ]
+
+
+def _run(base_urls: list[str], workers: int) -> tuple[float, dict[str, int]]:
+    from src.knowledge.pipeline.config import PipelinePoliteness
+    from src.knowledge.pipeline.monitor import run_monitor
+    from src.knowledge.pipeline.scheduler import DomainScheduler
+
+    politeness = PipelinePoliteness(
+        min_domain_interval=MIN_DOMAIN_INTERVAL,
+        max_sources_per_run=HOSTS * SOURCES_PER_HOST,
+        max_domain_requests_per_run=SOURCES_PER_HOST,
+    )
+    started = time.perf_counter()
+    result = run_monitor(_Registry(_sources(base_urls)), DomainScheduler(politeness), workers=workers)
+    return time.perf_counter() - started, result.to_dict()
+
+
+def test_concurrent_monitor_overlaps_hosts(tmp_path: Path) -> None:
+    """A worker pool cuts the phase time without doubling up on a host."""
+    site = tmp_path / "site"
+    site.mkdir()
+    for n in range(SOURCES_PER_HOST):
+        (site / f"page-{n}.html").write_text(f"<html><body>Page {n}</body></html>", encoding="utf-8")
+    loads = [ServerLoad() for _ in range(HOSTS)]
+
+    with ExitStack() as stack:
+        base_urls = [
+            stack.enter_context(
+                local_http_server(site, address=f"127.0.0.{2 + n}", latency=LATENCY_SECONDS, load=load)
+            )
+            for n, load in enumerate(loads)
+        ]
+        runs = {workers: _run(base_urls, workers) for workers in WORKERS}
+
+    serial, serial_counts = runs[1]
+    report(
+        f"Monitor phase: {HOSTS} hosts x {SOURCES_PER_HOST} sources, "
+        f"{LATENCY_SECONDS * 1e3:.0f} ms latency, {MIN_DOMAIN_INTERVAL.total_seconds():.1f}s domain interval",
+        [
+            (f"{workers} worker{'s' if workers > 1 else ''}", f"{elapsed:.2f}s ({serial / elapsed:.1f}x)")
+            for workers, (elapsed, _counts) in runs.items()
+        ]
+        + [("peak requests per host", str(max(load.peak for load in loads)))],
+    )
+
+    assert serial_counts["updates_needed"] == HOSTS * SOURCES_PER_HOST
+    assert all(counts == serial_counts for _elapsed, counts in runs.values())
+    assert all(load.peak == 1 for load in loads)
+    assert runs[4][0] * 2 < serial
@@ -0,0 +1,177 @@
+"""Benchmark: monitor requests and bytes with conditional GET vs HEAD tiers.
+
+A local server hosts sources that support validators selectively: some
+send an ETag, some Last-Modified, some both and some neither, and only
+honour the matching conditional header. Every source is acquired once so
+its validators and content hash are stored, then a tenth of the pages
+change. One monitor pass is then run twice over the same stored state.
+The first replays the previous detection (HEAD for the ETag, HEAD for
+Last-Modified, then a GET to hash), and the second uses
+``SourceMonitor.check_source``. The server counts requests and body bytes.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Iterator
+from unittest.mock import MagicMock
+
+import requests
+
+from src.knowledge.monitoring import SourceMonitor
+from src.parsing import utils
+
+from tests.benchmarks.utils import make_source, report
+
+if TYPE_CHECKING:
+    from src.knowledge.storage import SourceEntry
+
+KINDS = ("both", "etag", "last-modified", "none")
+SOURCES_PER_KIND = 25
+CHANGED_EVERY = 10
+BODY_BYTES = 32 * 1024
+
+
+class _Site:
+    """Page versions plus request and byte counters."""
+
+    def __init__(self) -> None:
+        self.versions: dict[str, int] = {
+            f"/{kind}/{n}": 1 for kind in KINDS for n in range(SOURCES_PER_KIND)
+        }
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.body_bytes = 0
+
+    def body(self, path: str) -> bytes:
+        line = f"{path} version {self.versions[path]}\n".encode()
+        return (line * (BODY_BYTES // len(line) + 1))[:BODY_BYTES]
+
+    def count(self, body_bytes: int) -> None:
+        with self.lock:
+            self.requests += 1
+            self.body_bytes += body_bytes
+
+
+class _Handler(BaseHTTPRequestHandler):
+    site: _Site
+
+    def _respond(self, send_body: bool) -> None:
+        path = self.path
+        if path not in self.site.versions:
+            self.send_error(404)
+            self.site.count(0)
+            return
+        kind = path.split("/")[1]
+        version = self.site.versions[path]
+        etag = f'"{path}-v{version}"' if kind in ("both", "etag") else None
+        last_modified = formatdate(1_700_000_000 + version * 3600, usegmt=True) if kind in ("both", "last-modified") else None
+
+        not_modified = (etag is not None and self.headers.get("If-None-Match") == etag) or (
+            etag is None
+            and last_modified is not None
+            and self.headers.get("If-Modified-Since") == last_modified
+        )
+        body = b"" if not_modified else self.site.body(path)
+        self.send_response(304 if not_modified else 200)
+        if etag:
+            self.send_header("ETag", etag)
+        if last_modified:
+            self.send_header("Last-Modified", last_modified)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        sent = len(body) if send_body else 0
+        if sent:
+            self.wfile.write(body)
+        self.site.count(sent)
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+
+@contextmanager
+def _server(site: _Site) -> Iterator[str]:
+    handler = type("_SiteHandler", (_Handler,), {"site": site})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+def _previous_check(session: requests.Session, source: "SourceEntry") -> str:
+    """The HEAD/HEAD/GET tiers that check_source used before."""
+    if source.last_etag is not None:
+        etag = session.head(source.url, timeout=10).headers.get("ETag")
+        if etag is not None and etag == source.last_etag:
+            return "unchanged"
+    if source.last_modified_header is not None:
+        modified = session.head(source.url, timeout=10).headers.get("Last-Modified")
+        if modified is not None and modified == source.last_modified_header:
+            return "unchanged"
+    response = session.get(source.url, timeout=10)
+    changed = utils.sha256_bytes(response.content) != source.last_content_hash
+    return "changed" if changed else "unchanged"
+
+
+def _acquire(base_url: str, site: _Site) -> list["SourceEntry"]:
+    sources = []
+    with requests.Session() as session:
+        for path in site.versions:
+            response = session.get(base_url + path, timeout=10)
+            sources.append(
+                make_source(
+                    base_url + path,
+                    last_content_hash=utils.sha256_bytes(response.content),
+                    last_etag=response.headers.get("ETag"),
+                    last_modified_header=response.headers.get("Last-Modified"),
+                )
+            )
+    return sources
+
+
+def test_conditional_get_saves_requests() -> None:
+    """One conditional GET per source, and no bodies for unchanged pages."""
+    site = _Site()
+    with _server(site) as base_url:
+        sources = _acquire(base_url, site)
+        changed = set(list(site.versions)[::CHANGED_EVERY])
+        for path in changed:
+            site.versions[path] += 1
+
+        site.requests = site.body_bytes = 0
+        with requests.Session() as session:
+            previous = [_previous_check(session, source) for source in sources]
+        previous_counts = (site.requests, site.body_bytes)
+
+        site.requests = site.body_bytes = 0
+        monitor = SourceMonitor(registry=MagicMock())
+        current = [monitor.check_source(source).status for source in sources]
+        current_counts = (site.requests, site.body_bytes)
+
+    report(
+        f"Monitor pass over {len(sources)} sources, {len(changed)} changed",
+        [
+            ("HEAD tiers + GET", f"{previous_counts[0]} requests, {previous_counts[1] / 1024:.0f} KiB of bodies"),
+            ("conditional GET", f"{current_counts[0]} requests, {current_counts[1] / 1024:.0f} KiB of bodies"),
+        ],
+    )
+
+    assert previous == current
+    assert current.count("changed") == len(changed)
+    assert current_counts[0] == len(sources)
+    assert current_counts[0] < previous_counts[0]
+    assert current_counts[1] <= previous_counts[1]
@@ -0,0 +1,143 @@
+"""Benchmark: false-change rate of raw, extracted-text and fingerprint hashes.
+
+A fixture set of article pages is generated, each fetched several times.
+Between fetches the volatile parts of the markup change: CSP nonces and
+CSRF tokens, cache-busting asset URLs, rotating ad slots and related
+links, session ids in links, "updated at" and "N minutes ago" stamps in
+the article, and a generated-at footer. One fetch in ten also carries a
+real edit to the article text. Each consecutive pair of fetches is
+compared three ways: the raw body hash (what the monitor compared), the
+hash of the extracted text (what the crawler stored) and the normalized
+content fingerprint. A pair counts as a false change when the hash
+differs but the article was not edited.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import time
+
+from tests.benchmarks.utils import report
+
+PAGES = 60
+FETCHES = 8
+EDIT_EVERY = 10
+
+_WORDS = (
+    "council budget transit library residents funding northern line route "
+    "service schedule station report committee review proposal housing "
+    "planning district survey results project contract public hearing "
+    "community program grant water energy network upgrade safety policy"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.sample(_WORDS, rng.randint(8, 14))
+    return " ".join(words).capitalize() + "."
+
+
+def _article(rng: random.Random) -> list[str]:
+    return [" ".join(_sentence(rng) for _ in range(rng.randint(3, 5))) for _ in range(4)]
+
+
+def _token(rng: random.Random, length: int = 24) -> str:
+    return "".join(rng.choice("abcdef0123456789") for _ in range(length))
+
+
+def _render(page: int, paragraphs: list[str], rng: random.Random) -> str:
+    """One fetch of a page: same article, fresh volatile markup."""
+    nonce, session = _token(rng), _token(rng, 32)
+    hour, minute = rng.randint(0, 23), rng.randint(0, 59)
+    day = rng.randint(1, 28)
+    ads = "".join(
+        f'<li><a href="https://ads.example/c?id={_token(rng, 12)}">Offer {rng.randint(1, 999)}</a></li>'
+        for _ in range(3)
+    )
+    related = "".join(
+        f'<li><a href="/news/{n}?sid={session}">Story {n}</a></li>'
+        for n in rng.sample(range(PAGES), 4)
+    )
+    body = "".join(f"<p>{text}</p>" for text in paragraphs)
+    return f"""<!doctype html><html><head><title>Article {page}</title>
+<meta name="csrf-token" content="{_token(rng, 40)}">
+<link rel="stylesheet" href="/static/site.css?v={_token(rng, 8)}">
+<script nonce="{nonce}">window.__session = "{session}";</script></head>
+<body><header><nav><a href="/?sid={session}">Home</a> <a href="/news?sid={session}">News</a></nav></header>
+<aside class="ads"><ul>{ads}</ul></aside>
+<main><article><h1>Article {page}</h1>
+{body}
+<p>Last updated March {day}, 2024 at {hour:02d}:{minute:02d} ({rng.randint(2, 59)} minutes ago). Reference {_token(rng, 20)}.</p>
+<img src="/media/{page}.jpg?cb={int(time.time() * 1000) + rng.randint(0, 10**6)}" alt="">
+</article></main>
+<aside class="related"><ul>{related}</ul></aside>
+<form><input type="hidden" name="csrf" value="{_token(rng, 40)}"></form>
+<footer>Generated at {hour:02d}:{minute:02d}:{rng.randint(0, 59):02d} by node {_token(rng, 16)}</footer>
+<script nonce="{nonce}">track("{_token(rng)}");</script>
+</body></html>"""
+
+
+def _fixtures() -> list[list[tuple[str, bool]]]:
+    """Fetches per page, each flagged if the article was edited since the last."""
+    rng = random.Random(20240305)
+    pages = []
+    for page in range(PAGES):
+        paragraphs = _article(rng)
+        fetches = []
+        for fetch in range(FETCHES):
+            edited = fetch > 0 and rng.randrange(EDIT_EVERY) == 0
+            if edited:
+                paragraphs[rng.randrange(len(paragraphs))] = " ".join(_sentence(rng) for _ in range(3))
+            fetches.append((_render(page, paragraphs, rng), edited))
+        pages.append(fetches)
+    return pages
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def test_fingerprint_ignores_volatile_markup() -> None:
+    """The fingerprint flags real edits only; raw and text hashes flag churn."""
+    from src.parsing.content_fingerprint import html_fingerprint
+    from src.parsing.web import analyze_html
+
+    methods = {
+        "raw body hash": lambda html: _sha256(html),
+        "extracted text hash": lambda html: _sha256(analyze_html(html).text or ""),
+        "content fingerprint": lambda html: html_fingerprint(html),
+    }
+    fixtures = _fixtures()
+    pairs = sum(len(fetches) - 1 for fetches in fixtures)
+    edits = sum(edited for fetches in fixtures for _html, edited in fetches)
+
+    outcomes: dict[str, tuple[int, int, float]] = {}
+    for name, digest in methods.items():
+        false_changes = missed = 0
+        started = time.perf_counter()
+        for fetches in fixtures:
+            previous = digest(fetches[0][0])
+            for html, edited in fetches[1:]:
+                current = digest(html)
+                changed = current != previous
+                false_changes += changed and not edited
+                missed += edited and not changed
+                previous = current
+        outcomes[name] = (false_changes, missed, time.perf_counter() - started)
+
+    unedited = pairs - edits
+    report(
+        f"{PAGES} pages x {FETCHES} fetches: {pairs} comparisons, {edits} real edits",
+        [
+            (
+                name,
+                f"false changes {false_changes}/{unedited} ({false_changes / unedited:.0%}), "
+                f"missed edits {missed}/{edits}, {elapsed * 1e3 / (pairs + PAGES):.2f} ms/page",
+            )
+            for name, (false_changes, missed, elapsed) in outcomes.items()
+        ],
+    )
+
+    assert edits > 0
+    assert outcomes["raw body hash"][0] == unedited
+    assert outcomes["content fingerprint"][:2] == (0, 0)
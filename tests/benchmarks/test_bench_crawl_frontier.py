@@ -0,0 +1,53 @@
+"""Benchmark: crawl frontier enqueue/drain cost at scale."""
+
+from __future__ import annotations
+
+import time
+
+from src.knowledge.crawl_state import CrawlState
+
+from tests.benchmarks.utils import report
+
+TOTAL_URLS = 200_000
+CHUNK = 20_000
+
+
+def test_frontier_operations_stay_flat() -> None:
+    """Per-operation cost should not grow with frontier size."""
+    state = CrawlState.create_new("https://bench.example.com/", scope="host")
+    state.pop_frontier()
+
+    enqueue_chunks: list[float] = []
+    for start in range(0, TOTAL_URLS, CHUNK):
+        began = time.perf_counter()
+        for i in range(start, start + CHUNK):
+            state.add_to_frontier(f"https://bench.example.com/page/{i}")
+        enqueue_chunks.append((time.perf_counter() - began) / CHUNK)
+
+    # Re-adding queued URLs exercises the duplicate check at full size
+    began = time.perf_counter()
+    for i in range(CHUNK):
+        assert not state.add_to_frontier(f"https://bench.example.com/page/{i}")
+    duplicate_cost = (time.perf_counter() - began) / CHUNK
+
+    drain_chunks: list[float] = []
+    while state.frontier:
+        began = time.perf_counter()
+        for _ in range(min(CHUNK, len(state.frontier))):
+            state.pop_frontier()
+        drain_chunks.append((time.perf_counter() - began) / CHUNK)
+
+    rows = [
+        (f"enqueue chunk {n}", f"{cost * 1e9:8.0f} ns/op")
+        for n, cost in enumerate(enqueue_chunks)
+    ]
+    rows.append(("duplicate check @200k", f"{duplicate_cost * 1e9:8.0f} ns/op"))
+    rows.extend(
+        (f"drain chunk {n}", f"{cost * 1e9:8.0f} ns/op")
+        for n, cost in enumerate(drain_chunks)
+    )
+    report(f"CrawlState frontier, {TOTAL_URLS} URLs", rows)
+
+    # Linear structures would make the last chunk ~10x the first
+    assert enqueue_chunks[-1] < enqueue_chunks[0] * 4 + 1e-6
+    assert drain_chunks[0] < drain_chunks[-1] * 4 + 1e-6
@@ -0,0 +1,69 @@
+"""Benchmark: per-page persistence cost, full state saves vs the crawl journal."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from src.knowledge.crawl_journal import make_record
+from src.knowledge.crawl_state import CrawlState, CrawlStateStorage
+
+from tests.benchmarks.utils import report
+
+CRAWL_SIZES = [int(n) for n in os.environ.get("BENCH_CRAWL_SIZES", "1000,10000,100000").split(",")]
+SAMPLES = 50
+
+
+def _state(pages: int) -> CrawlState:
+    """A crawl with ``pages`` visited URLs and as many still queued."""
+    state = CrawlState.create_new(source_url="https://example.com/docs/", max_pages=10 * pages)
+    state.frontier.clear()
+    for i in range(pages):
+        state.mark_url_visited(f"https://example.com/docs/visited-{i}")
+        state.frontier.append(f"https://example.com/docs/queued-{i}")
+    return state
+
+
+def _page_record(i: int) -> dict:
+    links = [f"https://example.com/docs/new-{i}-{n}" for n in range(10)]
+    return make_record(
+        "visited", f"https://example.com/docs/queued-{i}", enqueued=links, discovered=len(links)
+    )
+
+
+def test_per_page_cost_by_crawl_size(tmp_path: Path) -> None:
+    """Journal appends cost the same at any crawl size; snapshots do not."""
+    rows: list[tuple[str, str]] = []
+    appends: list[float] = []
+    saves: list[float] = []
+    for pages in CRAWL_SIZES:
+        storage = CrawlStateStorage(root=tmp_path / str(pages))
+        state = _state(pages)
+        storage.save_state(state)
+
+        started = time.perf_counter()
+        storage.save_state(state)
+        save = time.perf_counter() - started
+
+        journal = storage.open_journal(state.source_hash)
+        started = time.perf_counter()
+        for i in range(SAMPLES):
+            state.pop_frontier()
+            journal.append(state, _page_record(i))
+        append = (time.perf_counter() - started) / SAMPLES
+        journal.close()
+
+        saves.append(save)
+        appends.append(append)
+        rows.append(
+            (
+                f"{pages} pages",
+                f"save_state {save * 1e3:.1f} ms (every 10 pages: {save * 100:.2f} ms/page), "
+                f"journal {append * 1e3:.3f} ms/page",
+            )
+        )
+    report("Crawl state persistence", rows)
+
+    assert appends[-1] < appends[0] * 5
+    assert appends[-1] * 10 < saves[-1]
@@ -0,0 +1,133 @@
+"""Benchmark: unique articles crawled within a page budget, FIFO vs priority frontier.
+
+A synthetic blog is written to disk and served over local HTTP. Its home
+page links to many tag pages and a paginated archive, which in turn link to
+the articles; articles link to each other, to their tags and to ``?share``
+variants of themselves. The crawl runs through ``acquire_crawl`` with the
+real ``WebParser`` (static fetch only) and a fixed page budget.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+from src.knowledge.crawl_state import CrawlStateStorage
+from src.knowledge.pipeline.config import PipelineConfig
+from src.knowledge.pipeline.crawler import acquire_crawl
+from src.parsing.storage import ParseStorage
+
+from tests.benchmarks.utils import local_http_server, make_source, report
+
+ARTICLES = 400
+TAGS = 40
+TAG_PAGES = 4
+PER_LISTING = 8
+BUDGET = 150
+
+_PARAGRAPH = (
+    "This article covers a topic in enough depth to count as real content. "
+    "It explains the background, walks through an example and closes with "
+    "practical advice for readers who want to apply the idea themselves. "
+)
+
+
+def _page(title: str, links: list[str], body: str = "") -> str:
+    items = "".join(f'<li><a href="{href}">{href}</a></li>' for href in links)
+    return (
+        f"<html><head><title>{title}</title></head><body><main><h1>{title}</h1>"
+        f"{body}<ul>{items}</ul></main></body></html>"
+    )
+
+
+def _write(root: Path, path: str, html: str) -> None:
+    target = root / path.strip("/") / "index.html" if path.endswith("/") else root / path.strip("/")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(html, encoding="utf-8")
+
+
+def _build_site(root: Path) -> None:
+    def article(n: int) -> str:
+        return f"/articles/a{n % ARTICLES}.html"
+
+    def tag(n: int) -> str:
+        return f"/tag/t{n % TAGS}/"
+
+    home = [tag(t) for t in range(TAGS)] + ["/blog/page/1/"] + [article(n) for n in range(3)]
+    _write(root, "/", _page("Home", home))
+
+    for t in range(TAGS):
+        for page in range(1, TAG_PAGES + 1):
+            first = (t * 37 + page * PER_LISTING) % ARTICLES
+            links = [article(first + i) for i in range(PER_LISTING)]
+            if page < TAG_PAGES:
+                links.append(f"/tag/t{t}/page/{page + 1}/")
+            path = f"/tag/t{t}/" if page == 1 else f"/tag/t{t}/page/{page}/"
+            _write(root, path, _page(f"Tag {t} page {page}", links))
+
+    archive_pages = ARTICLES // PER_LISTING
+    for page in range(1, archive_pages + 1):
+        links = [article((page - 1) * PER_LISTING + i) for i in range(PER_LISTING)]
+        if page < archive_pages:
+            links.append(f"/blog/page/{page + 1}/")
+        _write(root, f"/blog/page/{page}/", _page(f"Archive page {page}", links))
+
+    for n in range(ARTICLES):
+        links = [
+            article(n + 1),
+            article(n * 7 + 3),
+            tag(n),
+            tag(n + 11),
+            f"/articles/a{n}.html?share=twitter",
+            f"/articles/a{n}.html?share=email",
+        ]
+        _write(root, article(n), _page(f"Article {n}", links, f"<p>{_PARAGRAPH * 6}</p>"))
+
+
+def _crawl(base_url: str, tmp_path: Path, name: str) -> list[str]:
+    fetched: list[str] = []
+    storage = ParseStorage(tmp_path / f"evidence-{name}")
+    original = storage.persist_document
+
+    def record(document, *args, **kwargs):
+        fetched.append(document.target.source)
+        return original(document, *args, **kwargs)
+
+    storage.persist_document = record
+    acquire_crawl(
+        make_source(f"{base_url}/", name, crawl_scope="host"),
+        storage,
+        CrawlStateStorage(root=tmp_path / f"kb-{name}"),
+        max_pages=BUDGET,
+        delay_seconds=0,
+        config=PipelineConfig(static_fetch_first=True),
+    )
+    return fetched
+
+
+def _unique_articles(urls: list[str]) -> int:
+    return len({match.group(1) for url in urls if (match := re.search(r"/articles/a(\d+)\.html", url))})
+
+
+def test_priority_frontier_finds_more_articles(tmp_path: Path) -> None:
+    """Within the same budget the priority frontier fetches more distinct articles."""
+    site = tmp_path / "site"
+    _build_site(site)
+
+    with local_http_server(site) as base_url:
+        with patch("src.knowledge.crawl_state.score_url", lambda url, depth: 0.0):
+            fifo = _crawl(base_url, tmp_path, "fifo")
+        priority = _crawl(base_url, tmp_path, "priority")
+
+    fifo_articles = _unique_articles(fifo)
+    priority_articles = _unique_articles(priority)
+    report(
+        f"Crawl budget of {BUDGET} pages on a {ARTICLES}-article synthetic blog",
+        [
+            ("FIFO frontier", f"{fifo_articles} unique articles / {len(fifo)} pages"),
+            ("priority frontier", f"{priority_articles} unique articles / {len(priority)} pages"),
+        ],
+    )
+
+    assert priority_articles > fifo_articles * 1.25
@@ -0,0 +1,119 @@
+"""Benchmark: crawl memory with an in-memory vs disk-spilled frontier.
+
+A synthetic site is written to disk and served over local HTTP. Its home
+page links to hub pages, each listing a thousand article links, for
+500k queued links in total. ``acquire_crawl`` fetches the home page and
+every hub with the real ``WebParser`` (static fetch only), so the whole
+link set ends up in the frontier. Each crawl runs in its own process and
+reports how far its peak RSS grew over the crawl, along with the cost of
+a final ``save_state``. This takes a few minutes; set
+``BENCH_SPILL_LINKS_PER_HUB`` to queue fewer links.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import resource
+import time
+from pathlib import Path
+
+from tests.benchmarks.utils import local_http_server, make_source, report
+
+HUBS = 500
+LINKS_PER_HUB = int(os.environ.get("BENCH_SPILL_LINKS_PER_HUB", "1000"))
+RSS_BUDGET_MIB = 96
+
+
+def _build_site(root: Path) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    hubs = "".join(f'<li><a href="/hub/{h}.html">Hub {h}</a></li>' for h in range(HUBS))
+    (root / "index.html").write_text(
+        f"<html><head><title>Home</title></head><body><main><h1>Home</h1><ul>{hubs}</ul></main></body></html>",
+        encoding="utf-8",
+    )
+    (root / "hub").mkdir(exist_ok=True)
+    for h in range(HUBS):
+        links = "".join(
+            f'<a href="/articles/{h}/{n}.html">{n}</a> ' for n in range(LINKS_PER_HUB)
+        )
+        (root / "hub" / f"{h}.html").write_text(
+            f"<html><head><title>Hub {h}</title></head><body><main><h1>Hub {h}</h1>"
+            f"<p>Articles filed under hub {h}.</p><p>{links}</p></main></body></html>",
+            encoding="utf-8",
+        )
+
+
+def _max_rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _crawl(base_url: str, root: str, capacity: int, results: multiprocessing.Queue) -> None:
+    from src.knowledge.crawl_state import CrawlStateStorage
+    from src.knowledge.pipeline.config import PipelineConfig
+    from src.knowledge.pipeline.crawler import acquire_crawl
+    from src.parsing.storage import ParseStorage
+
+    crawl_storage = CrawlStateStorage(root=Path(root) / "kb")
+    crawl_storage.MAX_FRONTIER_IN_MEMORY = capacity
+    source = make_source(f"{base_url}/", "spill", crawl_scope="host", crawl_max_pages=1_000_000)
+    baseline = _max_rss_mib()
+    acquire_crawl(
+        source,
+        ParseStorage(Path(root) / "evidence"),
+        crawl_storage,
+        max_pages=HUBS + 1,
+        delay_seconds=0,
+        config=PipelineConfig(static_fetch_first=True),
+    )
+    growth = _max_rss_mib() - baseline
+
+    state = crawl_storage.load_state(source.url)
+    started = time.perf_counter()
+    crawl_storage.save_state(state)
+    save = time.perf_counter() - started
+    results.put((growth, save, len(state.frontier)))
+
+
+def _run_all(base_url: str, root: Path, capacities: dict[str, int]) -> dict[str, tuple[float, float, int]]:
+    """Crawl once per capacity, each in its own process, side by side."""
+    context = multiprocessing.get_context("spawn")
+    queues = {name: context.Queue() for name in capacities}
+    processes = [
+        context.Process(target=_crawl, args=(base_url, str(root / name), capacity, queues[name]))
+        for name, capacity in capacities.items()
+    ]
+    for process in processes:
+        process.start()
+    outcomes = {name: queue.get(timeout=900) for name, queue in queues.items()}
+    for process in processes:
+        process.join()
+    return outcomes
+
+
+def test_spilled_frontier_stays_within_rss_budget(tmp_path: Path) -> None:
+    """Frontier memory and save cost stay flat however many links are queued."""
+    site = tmp_path / "site"
+    _build_site(site)
+
+    with local_http_server(site) as base_url:
+        outcomes = _run_all(base_url, tmp_path, {"unbounded": 10**9, "spilled": 1000})
+    unbounded, spilled = outcomes["unbounded"], outcomes["spilled"]
+
+    report(
+        f"Crawl of {HUBS + 1} pages queuing {HUBS * LINKS_PER_HUB} links",
+        [
+            (
+                "in-memory frontier",
+                f"peak RSS +{unbounded[0]:.0f} MiB, save {unbounded[1] * 1e3:.0f} ms, {unbounded[2]} queued",
+            ),
+            (
+                "spilled frontier",
+                f"peak RSS +{spilled[0]:.0f} MiB, save {spilled[1] * 1e3:.0f} ms, {spilled[2]} queued",
+            ),
+        ],
+    )
+
+    assert spilled[2] == unbounded[2] == HUBS * LINKS_PER_HUB
+    assert spilled[0] < RSS_BUDGET_MIB
+    assert spilled[1] < unbounded[1]
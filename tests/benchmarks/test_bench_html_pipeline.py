@@ -0,0 +1,62 @@
+"""Benchmark: per-stage cost of the single-parse HTML pipeline.
+
+Runs every saved fixture under ``fixtures/html`` through :func:`analyze_html`
+and through the previous three-parse approach (BeautifulSoup rewrite and
+reserialization, trafilatura on the string, HTMLParser link extraction).
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import trafilatura
+from bs4 import BeautifulSoup
+
+from src.parsing.link_extractor import extract_links
+from src.parsing.web import analyze_html
+
+from tests.benchmarks.utils import report
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+ROUNDS = 5
+BASE_URL = "https://bench.example.com/page"
+
+
+def _legacy(html: str) -> None:
+    soup = BeautifulSoup(html, "html.parser")
+    trafilatura.extract(str(soup), url=BASE_URL)
+    extract_links(html, BASE_URL)
+
+
+def test_single_parse_pipeline_stages() -> None:
+    """Per-stage timings, and the shared parse should beat three parses."""
+    corpus = {path.name: path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("*.html"))}
+    assert corpus, "no HTML fixtures found"
+
+    timings: dict[str, float] = {}
+    began = time.perf_counter()
+    for _ in range(ROUNDS):
+        for html in corpus.values():
+            analyze_html(html, BASE_URL, timings=timings)
+    pipeline = time.perf_counter() - began
+
+    began = time.perf_counter()
+    for _ in range(ROUNDS):
+        for html in corpus.values():
+            _legacy(html)
+    legacy = time.perf_counter() - began
+
+    documents = ROUNDS * len(corpus)
+    rows = [
+        (f"stage {stage}", f"{seconds / documents * 1000:.2f} ms/doc")
+        for stage, seconds in timings.items()
+    ]
+    rows += [
+        ("single-parse total", f"{pipeline / documents * 1000:.2f} ms/doc"),
+        ("three-parse total", f"{legacy / documents * 1000:.2f} ms/doc"),
+        ("speedup", f"{legacy / pipeline:.2f}x"),
+    ]
+    report(f"HTML pipeline over {len(corpus)} fixtures x {ROUNDS}", rows)
+
+    assert pipeline < legacy
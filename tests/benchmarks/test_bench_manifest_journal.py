@@ -0,0 +1,75 @@
+"""Benchmark: recording 50k manifest entries with the journal backend."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.parsing.storage import ManifestEntry, ParseStorage
+
+from tests.benchmarks.utils import report
+
+JOURNAL_ENTRIES = 50_000
+# The JSON backend rewrites the whole file per entry, so sample it smaller
+JSON_ENTRIES = 1_000
+PROCESSED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _entry(index: int) -> ManifestEntry:
+    return ManifestEntry(
+        source=f"evidence/bench/doc-{index}.pdf",
+        checksum=f"{index:064x}",
+        parser="pdf",
+        artifact_path=f"2025/doc-{index}/index.md",
+        processed_at=PROCESSED_AT,
+        metadata={"page_unit": "page", "segments_total": 12, "artifact_type": "page-directory"},
+    )
+
+
+def _record(storage: ParseStorage, count: int) -> list[float]:
+    """Record ``count`` entries, returning per-entry cost for each tenth."""
+    chunk = count // 10
+    costs: list[float] = []
+    for start in range(0, count, chunk):
+        began = time.perf_counter()
+        for index in range(start, start + chunk):
+            storage.record_entry(_entry(index))
+        costs.append((time.perf_counter() - began) / chunk)
+    return costs
+
+
+def test_journal_records_50k_entries(tmp_path: Path) -> None:
+    """Journal appends stay flat while JSON rewrites grow with manifest size."""
+    journal = ParseStorage(tmp_path / "journal", manifest_backend="journal")
+    journal_costs = _record(journal, JOURNAL_ENTRIES)
+    journal.close()
+
+    began = time.perf_counter()
+    reloaded = ParseStorage(tmp_path / "journal")
+    load_seconds = time.perf_counter() - began
+    assert len(reloaded.manifest().entries) == JOURNAL_ENTRIES
+
+    began = time.perf_counter()
+    for index in range(0, JOURNAL_ENTRIES, 7):
+        assert reloaded.manifest().get(f"{index:064x}") is not None
+    get_cost = (time.perf_counter() - began) / len(range(0, JOURNAL_ENTRIES, 7))
+
+    json_costs = _record(ParseStorage(tmp_path / "json"), JSON_ENTRIES)
+
+    report(
+        "Parse manifest recording",
+        [
+            ("journal first 10%", f"{journal_costs[0] * 1e6:.1f} µs/entry"),
+            ("journal last 10%", f"{journal_costs[-1] * 1e6:.1f} µs/entry"),
+            ("journal total", f"{sum(journal_costs) * JOURNAL_ENTRIES / 10:.2f} s"),
+            ("load 50k (snapshot+replay)", f"{load_seconds:.2f} s"),
+            ("get", f"{get_cost * 1e6:.2f} µs"),
+            (f"json first 10% of {JSON_ENTRIES}", f"{json_costs[0] * 1e6:.1f} µs/entry"),
+            (f"json last 10% of {JSON_ENTRIES}", f"{json_costs[-1] * 1e6:.1f} µs/entry"),
+        ],
+    )
+
+    # Compactions are amortized: the tail should not be far above the head
+    assert journal_costs[-1] < journal_costs[0] * 5
+    assert json_costs[-1] > json_costs[0] * 3
@@ -0,0 +1,127 @@
+"""Benchmark: saving and querying 10k pages in a PageRegistry."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from src.knowledge.page_registry import PageEntry, PageRegistry
+
+from tests.benchmarks.utils import report
+
+SESSION_PAGES = 10_000
+# Per-page saves rewrite a growing index each time, so sample them smaller
+DIRECT_PAGES = 1_000
+SOURCE_HASH = "b" * 64
+
+
+def _page(index: int) -> PageEntry:
+    return PageEntry.create_pending(
+        url=f"https://example.com/docs/page-{index}",
+        source_url="https://example.com/docs/",
+    )
+
+
+class _WriteCounter:
+    def __init__(self, registry: PageRegistry) -> None:
+        self.batches = 0
+        self.indexes = 0
+        save_batch = registry._save_batch
+        save_index = registry._save_registry_index
+
+        def counting_batch(*args, **kwargs):
+            self.batches += 1
+            return save_batch(*args, **kwargs)
+
+        def counting_index(*args, **kwargs):
+            self.indexes += 1
+            return save_index(*args, **kwargs)
+
+        registry._save_batch = counting_batch
+        registry._save_registry_index = counting_index
+
+
+def test_session_saves_10k_pages(tmp_path: Path) -> None:
+    """A session writes each 500-page batch once instead of once per page."""
+    direct = PageRegistry(root=tmp_path / "direct")
+    direct_writes = _WriteCounter(direct)
+    started = time.perf_counter()
+    for i in range(DIRECT_PAGES):
+        direct.save_page(_page(i), SOURCE_HASH)
+    direct_seconds = time.perf_counter() - started
+
+    pooled = PageRegistry(root=tmp_path / "session")
+    session_writes = _WriteCounter(pooled)
+    started = time.perf_counter()
+    with pooled.session(SOURCE_HASH) as session:
+        for i in range(SESSION_PAGES):
+            session.save_page(_page(i))
+    session_seconds = time.perf_counter() - started
+
+    report(
+        "PageRegistry saves",
+        [
+            (f"save_page x{DIRECT_PAGES}", f"{direct_seconds:.2f} s"),
+            ("  per page", f"{direct_seconds / DIRECT_PAGES * 1e3:.2f} ms"),
+            ("  batch / index writes", f"{direct_writes.batches} / {direct_writes.indexes}"),
+            (f"session x{SESSION_PAGES}", f"{session_seconds:.2f} s"),
+            ("  per page", f"{session_seconds / SESSION_PAGES * 1e3:.3f} ms"),
+            ("  batch / index writes", f"{session_writes.batches} / {session_writes.indexes}"),
+        ],
+    )
+
+    assert session_writes.batches == SESSION_PAGES // PageRegistry.BATCH_SIZE
+    assert session_writes.indexes == 1
+    assert direct_writes.batches == DIRECT_PAGES
+    assert pooled.get_stats(SOURCE_HASH)["total"] == SESSION_PAGES
+    assert session_seconds / SESSION_PAGES * 20 < direct_seconds / DIRECT_PAGES
+
+
+def test_queries_10k_pages(tmp_path: Path) -> None:
+    """Stats and lookups come from the index instead of scanning batches."""
+    registry = PageRegistry(root=tmp_path)
+    with registry.session(SOURCE_HASH) as session:
+        for i in range(SESSION_PAGES):
+            page = _page(i)
+            if i % 1000 == 7:
+                page.mark_failed("timeout")
+            session.save_page(page)
+
+    reads: list[int] = []
+    load_batch = registry._load_batch
+
+    def counting(source_hash: str, batch_number: int):
+        reads.append(batch_number)
+        return load_batch(source_hash, batch_number)
+
+    registry._load_batch = counting
+
+    started = time.perf_counter()
+    stats = registry.get_stats(SOURCE_HASH)
+    stats_seconds = time.perf_counter() - started
+    stats_reads = len(reads)
+
+    started = time.perf_counter()
+    for i in range(0, SESSION_PAGES, 100):
+        registry.get_page(_page(i).url, SOURCE_HASH)
+    lookup_seconds = (time.perf_counter() - started) / (SESSION_PAGES // 100)
+    lookup_reads = (len(reads) - stats_reads) / (SESSION_PAGES // 100)
+
+    reads.clear()
+    started = time.perf_counter()
+    failed = registry.get_pages_by_status(SOURCE_HASH, "failed")
+    status_seconds = time.perf_counter() - started
+
+    report(
+        f"PageRegistry queries over {SESSION_PAGES} pages",
+        [
+            ("get_stats", f"{stats_seconds * 1e3:.2f} ms, {stats_reads} batch reads"),
+            ("get_page", f"{lookup_seconds * 1e3:.2f} ms, {lookup_reads:.0f} batch reads"),
+            (f"get_pages_by_status ({len(failed)})", f"{status_seconds * 1e3:.1f} ms, {len(reads)} batch reads"),
+        ],
+    )
+
+    assert stats["failed"] == SESSION_PAGES // 1000
+    assert stats_reads == 0
+    assert lookup_reads == 1
+    assert len(reads) == len(failed)
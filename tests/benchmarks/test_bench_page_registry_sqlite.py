@@ -0,0 +1,80 @@
+"""Benchmark: JSON batch files vs SQLite for crawl page registries."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from src.knowledge.page_registry import PageEntry, PageRegistry
+from src.knowledge.page_registry_sqlite import SqlitePageRegistry
+
+from tests.benchmarks.utils import report
+
+PAGE_COUNTS = [int(n) for n in os.environ.get("BENCH_PAGE_COUNTS", "1000,10000,100000").split(",")]
+LOOKUPS = 200
+SOURCE_HASH = "d" * 64
+
+
+def _page(index: int) -> PageEntry:
+    page = PageEntry.create_pending(
+        url=f"https://example.com/docs/page-{index}",
+        source_url="https://example.com/docs/",
+    )
+    if index % 100 == 3:
+        page.mark_failed("timeout")
+    return page
+
+
+def _measure(registry, pages: int) -> tuple[float, float, float, float]:
+    """Return (insert, single update, lookup, stats) seconds."""
+    started = time.perf_counter()
+    with registry.session(SOURCE_HASH) as session:
+        for i in range(pages):
+            session.save_page(_page(i))
+    insert = time.perf_counter() - started
+
+    page = _page(pages // 2)
+    page.mark_skipped("robots.txt")
+    started = time.perf_counter()
+    registry.save_page(page, SOURCE_HASH)
+    update = time.perf_counter() - started
+
+    step = max(pages // LOOKUPS, 1)
+    started = time.perf_counter()
+    for i in range(0, pages, step):
+        assert registry.get_page(_page(i).url, SOURCE_HASH) is not None
+    lookup = (time.perf_counter() - started) / len(range(0, pages, step))
+
+    started = time.perf_counter()
+    stats = registry.get_stats(SOURCE_HASH)
+    stats_seconds = time.perf_counter() - started
+    assert stats["total"] == pages
+    assert stats["skipped"] == 1
+    return insert, update, lookup, stats_seconds
+
+
+def test_backends_by_crawl_size(tmp_path: Path) -> None:
+    """SQLite keeps single-page updates cheap as the crawl grows."""
+    rows: list[tuple[str, str]] = []
+    last: dict[str, tuple[float, float, float, float]] = {}
+    for pages in PAGE_COUNTS:
+        json_registry = PageRegistry(root=tmp_path / f"json-{pages}")
+        with SqlitePageRegistry(root=tmp_path / f"sqlite-{pages}") as sqlite_registry:
+            last = {
+                "json": _measure(json_registry, pages),
+                "sqlite": _measure(sqlite_registry, pages),
+            }
+        for backend, (insert, update, lookup, stats) in last.items():
+            rows.append(
+                (
+                    f"{backend} x{pages}",
+                    f"insert {insert:.2f} s, update {update * 1e3:.1f} ms, "
+                    f"lookup {lookup * 1e3:.2f} ms, stats {stats * 1e3:.1f} ms",
+                )
+            )
+    report("Page registry backends", rows)
+
+    # At the largest size one update rewrites a batch and the whole index
+    # in JSON, but is a single-row upsert in SQLite
+    assert last["sqlite"][1] * 5 < last["json"][1]
@@ -0,0 +1,70 @@
+"""Benchmark: scan_and_parse throughput with worker processes.
+
+The ``dev_data/evidence`` PDFs are replicated into a larger corpus; each copy
+gets a unique trailing PDF comment so its checksum differs and it is parsed
+rather than skipped. Set ``BENCH_PARSE_COPIES`` to grow the corpus.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.parsing.runner import scan_and_parse
+from src.parsing.storage import ParseStorage
+
+from tests.benchmarks.utils import report
+
+EVIDENCE = Path(__file__).resolve().parents[2] / "dev_data" / "evidence"
+COPIES = int(os.environ.get("BENCH_PARSE_COPIES", "2"))
+
+
+def _build_corpus(target: Path) -> int:
+    sources = sorted(EVIDENCE.glob("*.pdf"))
+    if not sources:
+        pytest.skip("dev_data/evidence has no PDFs")
+    target.mkdir()
+    total_bytes = 0
+    for source in sources:
+        payload = source.read_bytes()
+        for copy in range(COPIES):
+            data = payload + f"\n%bench-copy-{copy}\n".encode("ascii")
+            (target / f"{source.stem}-{copy}.pdf").write_bytes(data)
+            total_bytes += len(data)
+    return total_bytes
+
+
+def test_parallel_scan_throughput(tmp_path: Path) -> None:
+    """Worker processes parse the replicated corpus with identical outcomes."""
+    corpus = tmp_path / "corpus"
+    total_bytes = _build_corpus(corpus)
+    workers = max(os.cpu_count() or 1, 2)
+
+    timings: dict[int, float] = {}
+    outcomes = {}
+    for count in (1, workers):
+        storage = ParseStorage(tmp_path / f"out-{count}")
+        started = time.perf_counter()
+        outcomes[count] = scan_and_parse(corpus, storage=storage, suffixes=(".pdf",), workers=count)
+        timings[count] = time.perf_counter() - started
+
+    documents = len(outcomes[1])
+    rows = [
+        ("corpus", f"{documents} PDFs, {total_bytes / 1e6:.1f} MB"),
+        ("cpu cores", str(os.cpu_count())),
+    ]
+    for count, seconds in timings.items():
+        rows.append(
+            (f"workers={count}", f"{seconds:.1f} s ({documents / seconds:.2f} docs/s)")
+        )
+    rows.append(("speedup", f"{timings[1] / timings[workers]:.2f}x"))
+    report("Parallel scan_and_parse", rows)
+
+    def summary(items):
+        return [(Path(o.source).name, o.status, o.checksum) for o in items]
+
+    assert summary(outcomes[workers]) == summary(outcomes[1])
+    assert all(outcome.status == "completed" for outcome in outcomes[1])
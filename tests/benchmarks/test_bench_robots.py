@@ -0,0 +1,106 @@
+"""Benchmark: robots.txt checks per URL with compiled rules.
+
+A robots.txt with a few hundred rules (mostly path prefixes, plus some
+wildcard and end-anchored patterns) is checked against 1M URLs through
+``RobotsChecker.is_allowed``. The baseline replays the previous
+evaluation, which built a regex for every rule on every check and sorted
+all the matches, on a slice of the same URLs.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import re
+import time
+
+from src.parsing.robots import RobotRule, RobotsChecker, parse_robots_txt
+
+from tests.benchmarks.utils import report
+
+CHECKS = int(os.environ.get("BENCH_ROBOTS_CHECKS", "1000000"))
+BASELINE_CHECKS = CHECKS // 200
+SECTIONS = 150
+
+
+def _robots_txt() -> str:
+    lines = ["User-agent: *"]
+    for n in range(SECTIONS):
+        lines.append(f"Disallow: /section-{n}/private/")
+        lines.append(f"Allow: /section-{n}/private/press/")
+    lines += [
+        "Disallow: /*.json$",
+        "Disallow: /*?sessionid=",
+        "Allow: /section-*/private/*.pdf$",
+        "Disallow: /search",
+        "Disallow: /tmp/",
+        "Crawl-delay: 2",
+    ]
+    return "\n".join(lines)
+
+
+def _urls(count: int) -> list[str]:
+    rng = random.Random(7)
+    tails = ["index.html", "private/report", "private/press/note", "private/a.pdf", "data.json", "page?sessionid=1"]
+    return [
+        f"https://example.com/section-{rng.randrange(SECTIONS * 2)}/{rng.choice(tails)}"
+        for _ in range(count)
+    ]
+
+
+def _previous_matches(rule: RobotRule, url_path: str) -> bool:
+    pattern = rule.path
+    if not pattern:
+        return rule.allowed
+    regex_pattern = ""
+    for i, char in enumerate(pattern):
+        if char == "*":
+            regex_pattern += ".*"
+        elif char == "$" and i == len(pattern) - 1:
+            regex_pattern += "$"
+        else:
+            regex_pattern += re.escape(char)
+    return bool(re.match(f"^{regex_pattern}", url_path))
+
+
+def _previous_is_allowed(rules: list[RobotRule], url_path: str) -> bool:
+    matching = [(len(rule.path), rule) for rule in rules if _previous_matches(rule, url_path)]
+    if not matching:
+        return True
+    matching.sort(key=lambda item: (item[0], item[1].allowed), reverse=True)
+    return matching[0][1].allowed
+
+
+def test_compiled_robots_checks() -> None:
+    """Compiled longest-match lookup handles 1M checks in seconds."""
+    content = _robots_txt()
+    rules = parse_robots_txt(content).rulesets["*"].rules
+    urls = _urls(CHECKS)
+
+    checker = RobotsChecker("bench-bot")
+    checker.set_robots_txt("https://example.com/", content)
+    started = time.perf_counter()
+    allowed = sum(checker.is_allowed(url) for url in urls)
+    compiled = time.perf_counter() - started
+
+    paths = ["/" + url.split("/", 3)[3] for url in urls[:BASELINE_CHECKS]]
+    started = time.perf_counter()
+    previous = [_previous_is_allowed(rules, path) for path in paths]
+    baseline = time.perf_counter() - started
+
+    report(
+        f"robots.txt checks ({len(rules)} rules)",
+        [
+            (
+                f"per-check regexes x{BASELINE_CHECKS}",
+                f"{baseline:.2f} s ({baseline / BASELINE_CHECKS * 1e6:.1f} us/check)",
+            ),
+            (
+                f"compiled rules x{CHECKS}",
+                f"{compiled:.2f} s ({compiled / CHECKS * 1e6:.2f} us/check), {allowed} allowed",
+            ),
+        ],
+    )
+
+    assert previous == [checker.is_allowed(url) for url in urls[:BASELINE_CHECKS]]
+    assert compiled / CHECKS * 50 < baseline / BASELINE_CHECKS
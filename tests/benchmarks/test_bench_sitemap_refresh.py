@@ -0,0 +1,153 @@
+"""Benchmark: refresh crawl with and without sitemap lastmod checks.
+
+A local site of a few hundred pages, all linked from its home page, lists
+every page in a sitemap.xml announced by robots.txt. Each run first crawls
+the whole site with ``acquire_crawl`` and the real ``WebParser`` (static
+fetch only). Then 5% of the pages are rewritten and given a fresh
+``<lastmod>``, and the completed crawl is refreshed: once following links
+only, once seeded from the sitemap. The server counts the page requests
+each refresh makes.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+from tests.benchmarks.utils import make_source, report
+
+PAGES = 400
+CHANGED_EVERY = 20  # 5% of pages change between crawls
+PUBLISHED = "2020-01-01"
+
+
+class _CountingHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args: object, requests: list[str], **kwargs: object) -> None:
+        self.requests = requests
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self) -> None:
+        self.requests.append(self.path)
+        super().do_GET()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+
+@contextmanager
+def _counting_server(root: Path, requests: list[str]) -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_CountingHandler, directory=str(root), requests=requests))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+def _page(title: str, body: str) -> str:
+    text = " ".join(f"{title} covers one more aspect of the subject." for _ in range(20))
+    return (
+        f"<html><head><title>{title}</title></head><body><main><h1>{title}</h1>"
+        f"<p>{text}</p>{body}</main></body></html>"
+    )
+
+
+def _write_page(root: Path, n: int, revision: int) -> None:
+    (root / "pages" / f"{n}.html").write_text(_page(f"Page {n} rev {revision}", ""), encoding="utf-8")
+
+
+def _write_sitemap(root: Path, base_url: str, lastmods: dict[int, str]) -> None:
+    urls = [f"<url><loc>{base_url}/</loc><lastmod>{PUBLISHED}</lastmod></url>"]
+    urls += [
+        f"<url><loc>{base_url}/pages/{n}.html</loc><lastmod>{lastmod}</lastmod></url>"
+        for n, lastmod in lastmods.items()
+    ]
+    (root / "sitemap.xml").write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        + "".join(urls)
+        + "</urlset>",
+        encoding="utf-8",
+    )
+
+
+def _build_site(root: Path, base_url: str) -> None:
+    (root / "pages").mkdir(parents=True, exist_ok=True)
+    links = "".join(f'<li><a href="/pages/{n}.html">Page {n}</a></li>' for n in range(PAGES))
+    (root / "index.html").write_text(_page("Home", f"<ul>{links}</ul>"), encoding="utf-8")
+    for n in range(PAGES):
+        _write_page(root, n, 0)
+    (root / "robots.txt").write_text(f"User-agent: *\nDisallow:\nSitemap: {base_url}/sitemap.xml\n", encoding="utf-8")
+    _write_sitemap(root, base_url, {n: PUBLISHED for n in range(PAGES)})
+
+
+def _crawl(base_url: str, root: Path, use_sitemaps: bool) -> int:
+    from src.knowledge.crawl_state import CrawlStateStorage
+    from src.knowledge.pipeline.config import PipelineConfig
+    from src.knowledge.pipeline.crawler import acquire_crawl
+    from src.parsing.storage import ParseStorage
+
+    result = acquire_crawl(
+        make_source(f"{base_url}/", "site", crawl_scope="host", crawl_max_depth=5),
+        ParseStorage(root / "evidence"),
+        CrawlStateStorage(root=root / "kb"),
+        max_pages=10_000,
+        delay_seconds=0,
+        config=PipelineConfig(kb_root=root / "kb", use_sitemaps=use_sitemaps),
+    )
+    return result.pages_acquired
+
+
+def _page_requests(requests: list[str]) -> list[str]:
+    return [path for path in requests if path == "/" or path.endswith(".html")]
+
+
+def test_sitemap_lastmod_skips_unchanged_pages(tmp_path: Path) -> None:
+    """Refreshing from the sitemap fetches only the changed pages and the home page."""
+    site = tmp_path / "site"
+    site.mkdir()
+    requests: list[str] = []
+    changed = list(range(0, PAGES, CHANGED_EVERY))
+
+    with _counting_server(site, requests) as base_url:
+        _build_site(site, base_url)
+        for name in ("links", "sitemap"):
+            assert _crawl(base_url, tmp_path / name, use_sitemaps=True) == PAGES + 1
+
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        for n in changed:
+            _write_page(site, n, 1)
+        _write_sitemap(site, base_url, {n: now if n in changed else PUBLISHED for n in range(PAGES)})
+
+        requests.clear()
+        links_pages = _crawl(base_url, tmp_path / "links", use_sitemaps=False)
+        links_requests = _page_requests(requests)
+
+        requests.clear()
+        sitemap_pages = _crawl(base_url, tmp_path / "sitemap", use_sitemaps=True)
+        sitemap_requests = _page_requests(requests)
+        sitemap_fetches = [path for path in requests if path.endswith(".xml")]
+
+    report(
+        f"Refresh of {PAGES + 1} pages with {len(changed)} changed",
+        [
+            ("links only", f"{len(links_requests)} page requests, {links_pages} pages acquired"),
+            (
+                "sitemap lastmod",
+                f"{len(sitemap_requests)} page requests, {sitemap_pages} pages acquired, "
+                f"{len(sitemap_fetches)} sitemap requests",
+            ),
+            ("requests saved", f"{1 - len(sitemap_requests) / len(links_requests):.0%}"),
+        ],
+    )
+
+    assert len(links_requests) == PAGES + 1
+    assert sorted(sitemap_requests) == sorted(["/"] + [f"/pages/{n}.html" for n in changed])
@@ -0,0 +1,98 @@
+"""Benchmark: SourceRegistry queries over 10k synthetic sources."""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from src.knowledge.storage import SourceEntry, SourceRegistry
+
+from tests.benchmarks.utils import report
+
+SOURCES = 10_000
+DOMAINS = 500
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _source(index: int) -> SourceEntry:
+    return SourceEntry(
+        url=f"https://www.site{index % DOMAINS}.example/page/{index}",
+        name=f"Source {index}",
+        source_type="primary",
+        status="deprecated" if index % 10 == 5 else "active",
+        last_verified=NOW,
+        added_at=NOW,
+        added_by="system",
+        proposal_discussion=None,
+        implementation_issue=None,
+        credibility_score=0.5,
+        is_official=False,
+        requires_auth=False,
+        discovered_from=None,
+        parent_source_url=None,
+        content_type="webpage",
+        update_frequency="daily",
+        last_content_hash=f"{index:064x}",
+        # One in twenty sources is due; the rest are spread over the next month
+        next_check_after=NOW + timedelta(minutes=(index % 20) * 2160) - timedelta(minutes=1),
+    )
+
+
+def _populate(root: Path) -> None:
+    """Write the on-disk layout directly; 10k save_source calls would dominate."""
+    sources_dir = root / "sources"
+    sources_dir.mkdir(parents=True)
+    index = {}
+    for i in range(SOURCES):
+        source = _source(i)
+        (sources_dir / f"{source.url_hash}.json").write_text(
+            json.dumps(source.to_dict()), encoding="utf-8"
+        )
+        index[source.url_hash] = source.url
+    (sources_dir / "registry.json").write_text(
+        json.dumps({"version": 1, "sources": index}), encoding="utf-8"
+    )
+
+
+def _time(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def test_registry_queries_10k(tmp_path: Path) -> None:
+    """Warm snapshot queries are far cheaper than rereading every source file."""
+    _populate(tmp_path)
+    registry = SourceRegistry(root=tmp_path)
+
+    def cold_list() -> None:
+        registry.refresh()
+        registry.list_sources(status="active")
+
+    cold = _time(cold_list, repeat=2)
+    warm_all = _time(lambda: registry.list_sources(status="active"))
+    due = _time(lambda: registry.list_due_sources(NOW))
+    by_domain = _time(lambda: registry.list_sources_by_domain("site7.example", status="active"))
+    get_one = _time(lambda: registry.get_source(_source(1234).url))
+
+    due_count = len(registry.list_due_sources(NOW))
+    report(
+        f"SourceRegistry with {SOURCES} sources",
+        [
+            ("cold list_sources (full reload)", f"{cold * 1e3:.1f} ms"),
+            ("warm list_sources(active)", f"{warm_all * 1e3:.1f} ms"),
+            (f"list_due_sources ({due_count} due)", f"{due * 1e3:.2f} ms"),
+            ("list_sources_by_domain", f"{by_domain * 1e6:.1f} µs"),
+            ("get_source", f"{get_one * 1e6:.1f} µs"),
+        ],
+    )
+
+    assert due_count == SOURCES // 20
+    assert due * 5 < warm_all
+    assert by_domain * 100 < cold
+    assert warm_all * 3 < cold
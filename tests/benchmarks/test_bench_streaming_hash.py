@@ -0,0 +1,94 @@
+"""Benchmark: monitor memory when checking a very large source.
+
+A 1 GiB sparse file is served over local HTTP and checked with
+``SourceMonitor.check_source``, once hashing the whole body and once with
+the default hash budget. For reference, it is also hashed the way checks
+used to, from ``response.content``. Each check runs in its own process
+and reports how far its peak RSS grew over the check.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import resource
+import time
+from pathlib import Path
+
+from tests.benchmarks.utils import local_http_server, make_source, report
+
+FILE_BYTES = 1024 * 1024 * 1024
+RSS_BUDGET_MIB = 32
+
+
+def _max_rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _check(url: str, max_hash_bytes: int, results: multiprocessing.Queue) -> None:
+    from unittest.mock import MagicMock
+
+    from src.knowledge.monitoring import SourceMonitor
+
+    monitor = SourceMonitor(registry=MagicMock(), timeout=60, max_hash_bytes=max_hash_bytes)
+    baseline = _max_rss_mib()
+    started = time.perf_counter()
+    result = monitor.check_source(make_source(url, last_content_hash="stale"))
+    elapsed = time.perf_counter() - started
+    results.put((_max_rss_mib() - baseline, elapsed, result.status, result.content_hash_bytes))
+
+
+def _check_buffered(url: str, _max_hash_bytes: int, results: multiprocessing.Queue) -> None:
+    import hashlib
+
+    import requests
+
+    baseline = _max_rss_mib()
+    started = time.perf_counter()
+    digest = hashlib.sha256(requests.get(url, timeout=60).content).hexdigest()
+    elapsed = time.perf_counter() - started
+    status = "changed" if digest != "stale" else "unchanged"
+    results.put((_max_rss_mib() - baseline, elapsed, status, None))
+
+
+def _run(target, url: str, max_hash_bytes: int) -> tuple[float, float, str, int | None]:
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=target, args=(url, max_hash_bytes, results))
+    process.start()
+    outcome = results.get(timeout=600)
+    process.join()
+    return outcome
+
+
+def test_large_body_hash_keeps_rss_flat(tmp_path: Path) -> None:
+    """Hashing a 1 GiB body, whole or capped, leaves peak RSS nearly unchanged."""
+    from src.knowledge.monitoring import DEFAULT_MAX_HASH_BYTES
+
+    site = tmp_path / "site"
+    site.mkdir()
+    with open(site / "large.bin", "wb") as handle:
+        handle.truncate(FILE_BYTES)
+
+    with local_http_server(site) as base_url:
+        url = f"{base_url}/large.bin"
+        buffered = _run(_check_buffered, url, 0)
+        whole = _run(_check, url, 2 * FILE_BYTES)
+        capped = _run(_check, url, DEFAULT_MAX_HASH_BYTES)
+
+    report(
+        f"Update check of a {FILE_BYTES // 1024**3} GiB body",
+        [
+            ("response.content", f"peak RSS +{buffered[0]:.1f} MiB, {buffered[1]:.1f}s"),
+            ("whole body hashed", f"peak RSS +{whole[0]:.1f} MiB, {whole[1]:.1f}s"),
+            (
+                f"first {DEFAULT_MAX_HASH_BYTES // 1024**2} MiB hashed",
+                f"peak RSS +{capped[0]:.1f} MiB, {capped[1]:.1f}s",
+            ),
+        ],
+    )
+
+    assert buffered[0] > FILE_BYTES / 1024**2 / 2
+    assert whole[2:] == ("changed", None)
+    assert capped[2:] == ("changed", DEFAULT_MAX_HASH_BYTES)
+    assert whole[0] < RSS_BUDGET_MIB
+    assert capped[0] < RSS_BUDGET_MIB
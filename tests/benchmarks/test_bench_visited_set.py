@@ -0,0 +1,66 @@
+"""Benchmark: memory and save cost of the crawl visited set."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+from src.knowledge.crawl_state import VisitedSet
+
+from tests.benchmarks.utils import report
+
+URL_COUNTS = [int(n) for n in os.environ.get("BENCH_VISITED_COUNTS", "10000,100000,1000000").split(",")]
+
+
+def _hashes(count: int) -> list[str]:
+    return [
+        hashlib.sha256(f"https://example.com/docs/page-{i}".encode()).hexdigest()
+        for i in range(count)
+    ]
+
+
+def _set_size(hashes: set[str]) -> int:
+    return sys.getsizeof(hashes) + sum(sys.getsizeof(h) for h in hashes)
+
+
+def _save_seconds(payload: object) -> tuple[float, int]:
+    started = time.perf_counter()
+    text = json.dumps({"visited": payload}, indent=2)
+    return time.perf_counter() - started, len(text)
+
+
+def test_visited_set_sizes() -> None:
+    """Truncated digests use a fraction of the memory and JSON of hex strings."""
+    rows: list[tuple[str, str]] = []
+    for count in URL_COUNTS:
+        hashes = _hashes(count)
+        hex_set = set(hashes)
+        started = time.perf_counter()
+        visited = VisitedSet(hashes)
+        build = time.perf_counter() - started
+
+        hex_save, hex_bytes = _save_seconds(list(hex_set))
+        compact_save, compact_bytes = _save_seconds(visited.to_dict())
+
+        rows.append(
+            (
+                f"set[str] x{count}",
+                f"{_set_size(hex_set) / 2**20:.1f} MiB, save {hex_save * 1e3:.0f} ms, "
+                f"{hex_bytes / 2**20:.1f} MiB JSON",
+            )
+        )
+        rows.append(
+            (
+                f"VisitedSet x{count}",
+                f"{sys.getsizeof(visited) / 2**20:.1f} MiB, save {compact_save * 1e3:.0f} ms, "
+                f"{compact_bytes / 2**20:.1f} MiB JSON, build {build:.2f} s",
+            )
+        )
+
+        assert len(visited) == count
+        assert sys.getsizeof(visited) * 8 < _set_size(hex_set)
+        assert compact_bytes * 5 < hex_bytes
+    report("Visited set", rows)
@@ -0,0 +1,137 @@
+"""Helpers shared by the benchmark modules."""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from src.knowledge.storage import SourceEntry
+
+
+@contextmanager
+def timed(label: str, results: dict[str, float]) -> Iterator[None]:
+    """Record the wall-clock duration of a block under ``label``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        results[label] = time.perf_counter() - started
+
+
+def report(title: str, rows: list[tuple[str, str]]) -> None:
+    """Print a small aligned table of benchmark results."""
+    width = max(len(name) for name, _ in rows) if rows else 0
+    print(f"\n== {title} ==")
+    for name, value in rows:
+        print(f"  {name.ljust(width)}  {value}")
+
+
+def make_source(url: str, name: str | None = None, **fields: Any) -> "SourceEntry":
+    """Build a real ``SourceEntry`` for ``url``; ``fields`` override the defaults."""
+    from datetime import datetime, timezone
+
+    from src.knowledge.storage import SourceEntry
+
+    now = datetime.now(timezone.utc)
+    defaults: dict[str, Any] = {
+        "source_type": "primary",
+        "status": "active",
+        "last_verified": now,
+        "added_at": now,
+        "added_by": "system",
+        "proposal_discussion": None,
+        "implementation_issue": None,
+        "credibility_score": 0.5,
+        "is_official": False,
+        "requires_auth": False,
+        "discovered_from": None,
+        "parent_source_url": None,
+        "content_type": "webpage",
+        "update_frequency": "daily",
+    }
+    return SourceEntry(url=url, name=name or url, **{**defaults, **fields})
+
+
+class ServerLoad:
+    """Requests in flight on one server, now and at peak.
+
+    A request is in flight while the server's simulated latency elapses.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc: object) -> None:
+        with self._lock:
+            self.current -= 1
+
+
+@contextmanager
+def local_http_server(
+    root: Path,
+    *,
+    address: str = "127.0.0.1",
+    latency: float = 0.0,
+    load: ServerLoad | None = None,
+) -> Iterator[str]:
+    """Serve ``root`` over HTTP on an ephemeral port.
+
+    Args:
+        root: Directory to serve.
+        address: Loopback address to bind; distinct addresses count as
+            distinct domains.
+        latency: Seconds to sleep before each response.
+        load: Records how many requests the server is delaying at once.
+
+    Yields:
+        Base URL of the server, without a trailing slash.
+    """
+    handler = partial(_QuietHandler, directory=str(root), latency=latency, load=load)
+    server = ThreadingHTTPServer((address, 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://{address}:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that does not log every request to stderr."""
+
+    def __init__(
+        self,
+        *args: Any,
+        latency: float = 0.0,
+        load: ServerLoad | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.latency = latency
+        self.load = load
+        super().__init__(*args, **kwargs)
+
+    def handle_one_request(self) -> None:
+        # Only the simulated latency counts as in flight: the response is
+        # sent before this method returns, so a client's next request could
+        # otherwise overlap the end of the previous one
+        with self.load or nullcontext():
+            time.sleep(self.latency)
+        super().handle_one_request()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
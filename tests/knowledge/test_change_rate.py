@@ -0,0 +1,87 @@
+"""Tests for src/knowledge/pipeline/change_rate.py."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from src.knowledge.pipeline.change_rate import (
+    CHANGE_HISTORY_LIMIT,
+    adaptive_check_interval,
+    estimate_change_rate,
+    record_observation,
+)
+
+DAY = timedelta(days=1)
+MIN = timedelta(hours=1)
+MAX = timedelta(days=30)
+
+
+def _history(changes: list[bool], every: timedelta = DAY) -> list[list[int]]:
+    history: list[list[int]] = []
+    for changed in changes:
+        history = record_observation(history, every, changed)
+    return history
+
+
+class TestRecordObservation:
+    """Tests for the per-source check history."""
+
+    def test_appends_seconds_and_flag(self) -> None:
+        """A check is stored as whole seconds and a 0/1 flag."""
+        history = record_observation([[60, 0]], timedelta(hours=2, microseconds=5), True)
+
+        assert history == [[60, 0], [7200, 1]]
+
+    def test_trims_to_limit(self) -> None:
+        """Only the most recent checks are kept."""
+        history = _history([True] + [False] * CHANGE_HISTORY_LIMIT)
+
+        assert len(history) == CHANGE_HISTORY_LIMIT
+        assert all(changed == 0 for _, changed in history)
+
+    def test_does_not_mutate_input(self) -> None:
+        """The stored history is replaced, not edited in place."""
+        history = [[60, 0]]
+        record_observation(history, DAY, True)
+
+        assert history == [[60, 0]]
+
+
+class TestAdaptiveInterval:
+    """Tests for change-rate based check intervals."""
+
+    def test_no_history_uses_prior(self) -> None:
+        """Without history the static interval is used."""
+        assert adaptive_check_interval([], DAY, MIN, MAX) == DAY
+
+    def test_prior_alone_matches_interval(self) -> None:
+        """The prior on its own expects one change per static interval."""
+        rate = estimate_change_rate([], DAY)
+
+        assert abs(1 / rate - DAY.total_seconds()) < 1
+
+    def test_unchanged_checks_lengthen_interval(self) -> None:
+        """A source that never changes is checked less often."""
+        interval = adaptive_check_interval(_history([False] * 10), DAY, MIN, MAX)
+
+        assert interval > timedelta(days=7)
+
+    def test_changed_checks_shorten_interval(self) -> None:
+        """A source that changes on every check is checked more often."""
+        interval = adaptive_check_interval(_history([True] * 10), DAY, MIN, MAX)
+
+        assert interval < timedelta(hours=12)
+
+    def test_occasional_changes_stay_near_prior(self) -> None:
+        """Changing on about half the checks keeps roughly the static interval."""
+        interval = adaptive_check_interval(_history([True, False] * 5), DAY, MIN, MAX)
+
+        assert timedelta(hours=18) < interval < timedelta(days=2)
+
+    def test_interval_clamped_to_bounds(self) -> None:
+        """The interval never leaves the configured bounds."""
+        fast = _history([True] * CHANGE_HISTORY_LIMIT, every=timedelta(minutes=5))
+        slow = _history([False] * CHANGE_HISTORY_LIMIT, every=timedelta(days=30))
+
+        assert adaptive_check_interval(fast, DAY, MIN, MAX) == MIN
+        assert adaptive_check_interval(slow, DAY, MIN, MAX) == MAX
@@ -5,14 +5,21 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.knowledge.crawl_journal import CrawlJournal, make_record
+from src.knowledge.crawl_spill import FrontierSpill
 from src.knowledge.crawl_state import (
+    CrawlFrontier,
     CrawlState,
     CrawlStateStorage,
+    FrontierEntry,
+    VisitedSet,
     _source_hash,
     _url_hash,
+    score_url,
 )
 
 
@@ -74,6 +81,160 @@ class TestHashFunctions:
         assert len(_url_hash(url)) == 64
 
 
+# =============================================================================
+# CrawlFrontier Tests
+# =============================================================================
+
+
+class TestCrawlFrontier:
+    """Tests for the priority frontier."""
+
+    def test_preserves_fifo_order(self) -> None:
+        """URLs with equal priority should pop in insertion order."""
+        frontier = CrawlFrontier(["a", "b", "c"])
+        
+        assert [frontier.pop().url for _ in range(3)] == ["a", "b", "c"]
+
+    def test_rejects_duplicates(self) -> None:
+        """Appending a queued URL should be a no-op."""
+        frontier = CrawlFrontier(["a"])
+        
+        assert frontier.append("a") is False
+        assert len(frontier) == 1
+
+    def test_membership_tracks_pops(self) -> None:
+        """Popped URLs should no longer be reported as members."""
+        frontier = CrawlFrontier(["a", "b"])
+        frontier.pop()
+        
+        assert "a" not in frontier
+        assert "b" in frontier
+        assert frontier.append("a") is True
+
+    def test_clear_resets_membership(self) -> None:
+        """clear should empty both the queue and the membership set."""
+        frontier = CrawlFrontier(["a", "b"])
+        frontier.clear()
+        
+        assert not frontier
+        assert "a" not in frontier
+
+    def test_head_and_tail_split(self) -> None:
+        """head and tail should partition the queue without consuming it."""
+        frontier = CrawlFrontier(["a", "b", "c", "d"])
+        
+        assert frontier.head(3) == ["a", "b", "c"]
+        assert frontier.tail(3) == ["d"]
+        assert len(frontier) == 4
+
+    def test_equals_list(self) -> None:
+        """Frontiers compare equal to lists with the same order."""
+        assert CrawlFrontier(["a", "b"]) == ["a", "b"]
+        assert CrawlFrontier(["a", "b"]) != ["b", "a"]
+
+    def test_pops_highest_score_first(self) -> None:
+        """Shallow content pages pop before deeper ones and listings."""
+        frontier = CrawlFrontier()
+        frontier.append("https://example.com/blog/page/2", depth=1)
+        frontier.append("https://example.com/tag/python", depth=1)
+        frontier.append("https://example.com/guide/deep", depth=3)
+        frontier.append("https://example.com/guide/intro", depth=1)
+        
+        assert frontier.to_list() == [
+            "https://example.com/guide/intro",
+            "https://example.com/guide/deep",
+            "https://example.com/blog/page/2",
+            "https://example.com/tag/python",
+        ]
+        assert frontier.pop().url == "https://example.com/guide/intro"
+
+    def test_custom_scorer(self) -> None:
+        """A constant scorer turns the frontier into a FIFO."""
+        frontier = CrawlFrontier(scorer=lambda url, depth: 0.0)
+        frontier.append("https://example.com/tag/a", depth=0)
+        frontier.append("https://example.com/guide", depth=5)
+        
+        assert frontier.head(2) == ["https://example.com/tag/a", "https://example.com/guide"]
+
+    def test_discard_skips_stale_heap_items(self) -> None:
+        """Discarded and re-added URLs pop once, at their new position."""
+        frontier = CrawlFrontier(["a", "b", "c"])
+        frontier.discard("a")
+        frontier.append("a")
+        
+        assert [frontier.pop().url for _ in range(3)] == ["b", "c", "a"]
+        assert not frontier
+
+
+class TestScoreUrl:
+    """Tests for frontier URL scoring."""
+
+    def test_depth_lowers_score(self) -> None:
+        """Each level of depth costs priority."""
+        assert score_url("https://example.com/a", 1) > score_url("https://example.com/a", 2)
+
+    def test_listing_pages_penalized(self) -> None:
+        """Pagination and tag pages rank below content pages."""
+        content = score_url("https://example.com/posts/hello", 1)
+        
+        assert score_url("https://example.com/posts?page=3", 1) < content
+        assert score_url("https://example.com/posts/page/3", 1) < content
+        assert score_url("https://example.com/tags/python", 1) < content
+        assert score_url("https://example.com/category/news", 1) < content
+        assert score_url("https://example.com/page1", 1) == content
+
+    def test_query_variants_penalized(self) -> None:
+        """Share and tracking variants rank below other query URLs."""
+        plain_query = score_url("https://example.com/posts/hello?id=3", 1)
+        
+        assert plain_query < score_url("https://example.com/posts/hello", 1)
+        assert score_url("https://example.com/posts/hello?share=email", 1) < plain_query
+
+    def test_documents_favoured(self) -> None:
+        """URLs naming document files get a bonus."""
+        assert score_url("https://example.com/report.pdf", 1) > score_url("https://example.com/report", 1)
+
+
+
+class TestVisitedSet:
+    """Tests for the compact visited-hash set."""
+
+    def test_membership_across_merges(self) -> None:
+        """Hashes stay members after recent additions are merged."""
+        hashes = [_url_hash(f"https://example.com/{i}") for i in range(5000)]
+        visited = VisitedSet(hashes)
+        
+        assert len(visited) == 5000
+        assert all(h in visited for h in hashes)
+        assert _url_hash("https://example.com/missing") not in visited
+        assert visited.add(hashes[0]) is False
+
+    def test_round_trip(self) -> None:
+        """Serialized digests load back with the same members."""
+        hashes = [_url_hash(f"https://example.com/{i}") for i in range(100)]
+        data = json.loads(json.dumps(VisitedSet(hashes, digest_bytes=6).to_dict()))
+        loaded = VisitedSet.from_dict(data)
+        
+        assert loaded.digest_bytes == 6
+        assert len(loaded) == 100
+        assert all(h in loaded for h in hashes)
+
+    def test_truncated_digest_collides(self) -> None:
+        """Hashes sharing the kept prefix are treated as the same URL."""
+        visited = VisitedSet(["ab" * 4 + "0" * 56], digest_bytes=4)
+        
+        assert ("ab" * 4 + "f" * 56) in visited
+
+    def test_collision_probability(self) -> None:
+        """Fewer digest bytes raise the documented collision rate."""
+        assert VisitedSet.collision_probability(1_000_000) < 1e-7
+        assert VisitedSet.collision_probability(100_000, digest_bytes=4) == 1.0
+
+    def test_rejects_invalid_digest_size(self) -> None:
+        """Digests must fit in an unsigned 64-bit integer."""
+        with pytest.raises(ValueError, match="digest_bytes"):
+            VisitedSet(digest_bytes=9)
+
 # =============================================================================
 # CrawlState Tests
 # =============================================================================
@@ -140,6 +301,15 @@ class TestCrawlState:
         assert restored.in_scope_count == 8
         assert restored.out_of_scope_count == 2
 
+    def test_mark_url_unchanged(self, sample_crawl_state: CrawlState) -> None:
+        """Unchanged URLs count as visited and are never queued."""
+        sample_crawl_state.mark_url_unchanged("https://example.com/old")
+        
+        assert sample_crawl_state.add_to_frontier("https://example.com/old") is False
+        restored = CrawlState.from_dict(sample_crawl_state.to_dict())
+        assert restored.unchanged_count == 1
+        assert restored.is_url_visited("https://example.com/old")
+
     def test_mark_started(self, sample_crawl_state: CrawlState) -> None:
         """mark_started should set status and timestamps."""
         assert sample_crawl_state.started_at is None
@@ -235,6 +405,52 @@ class TestCrawlState:
         assert sample_crawl_state.pop_frontier() == "https://example.com/page1"
         assert sample_crawl_state.pop_frontier() == "https://example.com/page2"
 
+    def test_pop_frontier_allows_requeue(self, sample_crawl_state: CrawlState) -> None:
+        """A popped URL can be queued again if it was never visited."""
+        url = sample_crawl_state.pop_frontier()
+        
+        assert url is not None
+        assert sample_crawl_state.add_to_frontier(url) is True
+
+    def test_from_dict_coerces_frontier(self, sample_crawl_state: CrawlState) -> None:
+        """Loaded states should use the set-backed frontier."""
+        restored = CrawlState.from_dict(sample_crawl_state.to_dict())
+        
+        assert isinstance(restored.frontier, CrawlFrontier)
+        assert restored.add_to_frontier("https://www.example.com/docs/") is False
+
+    def test_add_to_frontier_prunes_deep_urls(self, sample_crawl_state: CrawlState) -> None:
+        """URLs beyond max_depth are never queued."""
+        assert sample_crawl_state.add_to_frontier("https://example.com/deep", depth=6) is False
+        assert sample_crawl_state.add_to_frontier("https://example.com/ok", depth=5) is True
+        assert "https://example.com/deep" not in sample_crawl_state.frontier
+
+    def test_pop_frontier_entry_keeps_context(self, sample_crawl_state: CrawlState) -> None:
+        """Popped entries carry depth and the referring page."""
+        sample_crawl_state.frontier.clear()
+        sample_crawl_state.add_to_frontier(
+            "https://example.com/a", depth=2, discovered_from="https://example.com/"
+        )
+        
+        entry = sample_crawl_state.pop_frontier_entry()
+        
+        assert entry == FrontierEntry(
+            url="https://example.com/a",
+            depth=2,
+            score=score_url("https://example.com/a", 2),
+            discovered_from="https://example.com/",
+        )
+
+    def test_legacy_frontier_strings_load(self, sample_crawl_state: CrawlState) -> None:
+        """States saved with bare URL strings load at depth 0."""
+        data = sample_crawl_state.to_dict()
+        data["frontier"] = ["https://example.com/a", "https://example.com/b"]
+        
+        restored = CrawlState.from_dict(data)
+        
+        assert restored.frontier == ["https://example.com/a", "https://example.com/b"]
+        assert restored.pop_frontier_entry().depth == 0
+
     def test_pop_frontier_empty(self, sample_crawl_state: CrawlState) -> None:
         """pop_frontier should return None when empty."""
         sample_crawl_state.frontier.clear()
@@ -329,15 +545,61 @@ class TestCrawlStateStorage:
         
         temp_storage.save_state(state)
         
-        # Check overflow file exists
-        overflow_path = temp_storage._get_frontier_overflow_path(state.source_hash)
-        assert overflow_path.exists()
+        # Only the in-memory window is written to the state file
+        data = json.loads(temp_storage._get_state_path(state.source_hash).read_text())
+        assert len(data["frontier"]) == temp_storage.MAX_FRONTIER_IN_MEMORY
+        assert data["frontier_overflow_count"] == 501
+        assert list(temp_storage._get_frontier_spill_dir(state.source_hash).glob("*.jsonl"))
         
         # Load and verify all URLs are restored
         loaded = temp_storage.load_state(state.source_url)
         assert loaded is not None
         # Original 1 URL + 1500 added = 1501 total
         assert len(loaded.frontier) == 1501
+        assert loaded.frontier == state.frontier
+        # Overflow URLs should be tracked for duplicate detection too
+        assert loaded.add_to_frontier("https://example.com/page1499") is False
+        popped = {loaded.pop_frontier() for _ in range(1501)}
+        assert len(popped) == 1501
+        assert not loaded.frontier
+
+    def test_legacy_overflow_file_is_migrated(self, temp_storage: CrawlStateStorage) -> None:
+        """Overflow files from older saves load into the spill and are removed."""
+        state = CrawlState.create_new(source_url="https://example.com/", scope="host")
+        state_dir = temp_storage._get_state_dir(state.source_hash)
+        state_dir.mkdir(parents=True)
+        data = state.to_dict()
+        data["frontier_overflow_count"] = 2
+        temp_storage._get_state_path(state.source_hash).write_text(json.dumps(data))
+        overflow_path = temp_storage._get_frontier_overflow_path(state.source_hash)
+        overflow_path.write_text('{"url": "https://example.com/a"}\n{"url": "https://example.com/b"}')
+        
+        loaded = temp_storage.load_state(state.source_url)
+        assert loaded is not None
+        assert len(loaded.frontier) == 3
+        
+        temp_storage.save_state(loaded)
+        assert not overflow_path.exists()
+        assert len(temp_storage.load_state(state.source_url).frontier) == 3
+
+    def test_save_commits_only_new_segments(self, tmp_path: Path) -> None:
+        """In GitHub mode a save commits the state and segments appended since the last save."""
+        client = MagicMock()
+        storage = CrawlStateStorage(root=tmp_path, github_client=client, project_root=tmp_path)
+        storage.MAX_FRONTIER_IN_MEMORY = 2
+        storage.FRONTIER_SEGMENT_SIZE = 3
+        state = CrawlState.create_new(source_url="https://example.com/", scope="host")
+        for i in range(9):
+            state.add_to_frontier(f"https://example.com/{i}")
+        storage.save_state(state)
+        first = [path for path, _ in client.commit_files_batch.call_args.kwargs["files"]]
+        
+        state.add_to_frontier("https://example.com/new")
+        storage.save_state(state)
+        second = [path for path, _ in client.commit_files_batch.call_args.kwargs["files"]]
+        
+        assert len(first) == 4
+        assert second == [first[0], first[-1]]
 
     def test_delete_state(
         self,
@@ -421,3 +683,270 @@ class TestCrawlStateStorage:
         assert loaded.is_url_visited("https://example.com/page2")
         assert loaded.is_url_visited("https://example.com/page3")
         assert not loaded.is_url_visited("https://example.com/page4")
+
+    def test_loads_legacy_visited_hashes(
+        self,
+        temp_storage: CrawlStateStorage,
+        sample_crawl_state: CrawlState,
+    ) -> None:
+        """States saved with a list of hex hashes are still understood."""
+        temp_storage.save_state(sample_crawl_state)
+        state_path = temp_storage._get_state_path(sample_crawl_state.source_hash)
+        data = json.loads(state_path.read_text(encoding="utf-8"))
+        del data["visited"]
+        data["visited_hashes"] = [_url_hash("https://example.com/old")]
+        state_path.write_text(json.dumps(data), encoding="utf-8")
+        
+        loaded = temp_storage.load_state(sample_crawl_state.source_url)
+        
+        assert loaded is not None
+        assert loaded.is_url_visited("https://example.com/old")
+        assert "visited_hashes" not in loaded.to_dict()
+
+
+# =============================================================================
+# CrawlJournal Tests
+# =============================================================================
+
+
+class TestCrawlJournal:
+    """Tests for the append-only crawl event journal."""
+
+    def _visit(self, journal: CrawlJournal, state: CrawlState, url: str, links: list[str]) -> None:
+        state.pop_frontier()
+        journal.append(state, make_record("visited", url, enqueued=links, discovered=len(links)))
+
+    def test_replay_restores_state(
+        self,
+        temp_storage: CrawlStateStorage,
+        sample_crawl_state: CrawlState,
+    ) -> None:
+        """Loading a snapshot replays the journal written after it."""
+        temp_storage.save_state(sample_crawl_state)
+        journal = temp_storage.open_journal(sample_crawl_state.source_hash)
+        seed = sample_crawl_state.frontier.to_list()[0]
+        self._visit(journal, sample_crawl_state, seed, ["https://example.com/docs/a"])
+        journal.append(sample_crawl_state, make_record("failed", "https://example.com/docs/a"))
+        journal.close()
+        
+        loaded = temp_storage.load_state(sample_crawl_state.source_url)
+        
+        assert loaded is not None
+        assert loaded.journal_seq == 2
+        assert loaded.visited_count == sample_crawl_state.visited_count
+        assert loaded.failed_count == 1
+        assert loaded.in_scope_count == sample_crawl_state.in_scope_count
+        assert loaded.frontier == sample_crawl_state.frontier
+        assert loaded.is_url_visited("https://example.com/docs/a")
+
+    def test_torn_tail_is_dropped(
+        self,
+        temp_storage: CrawlStateStorage,
+        sample_crawl_state: CrawlState,
+    ) -> None:
+        """A partially written last record is ignored and truncated."""
+        temp_storage.save_state(sample_crawl_state)
+        journal = temp_storage.open_journal(sample_crawl_state.source_hash)
+        journal.append(sample_crawl_state, make_record("skipped", "https://example.com/docs/x"))
+        journal.close()
+        path = temp_storage.get_journal_path(sample_crawl_state.source_hash)
+        intact = path.stat().st_size
+        with path.open("ab") as handle:
+            handle.write(b'{"seq":2,"op":"visi')
+        
+        loaded = temp_storage.load_state(sample_crawl_state.source_url)
+        
+        assert loaded is not None
+        assert loaded.journal_seq == 1
+        assert loaded.skipped_count == 1
+        assert path.stat().st_size == intact
+
+    def test_records_in_snapshot_are_not_reapplied(
+        self,
+        temp_storage: CrawlStateStorage,
+        sample_crawl_state: CrawlState,
+    ) -> None:
+        """A crash between snapshot and journal removal does not double count."""
+        journal = temp_storage.open_journal(sample_crawl_state.source_hash)
+        journal.append(sample_crawl_state, make_record("failed", "https://example.com/docs/x"))
+        temp_storage.save_state(sample_crawl_state)
+        journal.close()
+        
+        loaded = temp_storage.load_state(sample_crawl_state.source_url)
+        
+        assert loaded is not None
+        assert loaded.failed_count == 1
+
+    def test_journal_with_gap_is_discarded(
+        self,
+        temp_storage: CrawlStateStorage,
+        sample_crawl_state: CrawlState,
+    ) -> None:
+        """Records that do not follow the snapshot cannot be applied."""
+        temp_storage.save_state(sample_crawl_state)
+        path = temp_storage.get_journal_path(sample_crawl_state.source_hash)
+        path.write_text('{"seq":5,"op":"failed","url":"https://example.com/x"}\n', encoding="utf-8")
+        
+        loaded = temp_storage.load_state(sample_crawl_state.source_url)
+        
+        assert loaded is not None
+        assert loaded.failed_count == 0
+        assert path.stat().st_size == 0
+
+    def test_sync_cadence(self, tmp_path: Path, sample_crawl_state: CrawlState) -> None:
+        """Records are fsynced every sync_every appends."""
+        journal = CrawlJournal(tmp_path / "journal.jsonl", sync_every=3)
+        with patch("src.knowledge.crawl_journal.os.fsync") as fsync:
+            for i in range(7):
+                journal.append(sample_crawl_state, make_record("skipped", f"https://example.com/{i}"))
+        journal.close()
+        
+        assert fsync.call_count == 2
+
+    def test_compaction_threshold(self, tmp_path: Path, sample_crawl_state: CrawlState) -> None:
+        """Compaction becomes due once the journal reaches compact_bytes."""
+        journal = CrawlJournal(tmp_path / "journal.jsonl", compact_bytes=200)
+        while not journal.needs_compaction():
+            journal.append(sample_crawl_state, make_record("skipped", "https://example.com/x"))
+        journal.reset()
+        
+        assert not journal.needs_compaction()
+        assert not journal.path.exists()
+
+    def test_rejects_unknown_op(self) -> None:
+        """Only the documented record types can be built."""
+        with pytest.raises(ValueError, match="Invalid journal op"):
+            make_record("enqueued", "https://example.com/")
+
+
+# =============================================================================
+# FrontierSpill Tests
+# =============================================================================
+
+
+class TestFrontierSpill:
+    """Tests for the segmented on-disk frontier queue."""
+
+    def test_fifo_across_segments(self, tmp_path: Path) -> None:
+        """Entries come back in order across segment boundaries."""
+        spill = FrontierSpill(tmp_path, segment_size=3)
+        spill.extend({"url": f"u{i}"} for i in range(8))
+        
+        assert len(list(tmp_path.glob("*.jsonl"))) == 3
+        assert [record["url"] for record in spill.take(5)] == ["u0", "u1", "u2", "u3", "u4"]
+        assert [record["url"] for record in spill.scan()] == ["u5", "u6", "u7"]
+        assert len(spill) == 3
+
+    def test_checkpoint_deletes_consumed_segments(self, tmp_path: Path) -> None:
+        """Segments behind the head are removed only at a checkpoint."""
+        spill = FrontierSpill(tmp_path, segment_size=2)
+        spill.extend({"url": f"u{i}"} for i in range(6))
+        spill.take(5)
+        
+        assert len(list(tmp_path.glob("*.jsonl"))) == 3
+        spill.checkpoint()
+        assert [path.name for path in tmp_path.glob("*.jsonl")] == ["000002.jsonl"]
+
+    def test_restore_discards_unsaved_appends(self, tmp_path: Path) -> None:
+        """Restoring rewinds to the saved pointers."""
+        spill = FrontierSpill(tmp_path, segment_size=2)
+        spill.extend({"url": f"u{i}"} for i in range(3))
+        saved = spill.to_dict()
+        spill.take(2)
+        spill.extend({"url": f"late{i}"} for i in range(3))
+        spill.close()
+        
+        restored = FrontierSpill.restore(tmp_path, saved)
+        
+        assert [record["url"] for record in restored.scan()] == ["u0", "u1", "u2"]
+        restored.append({"url": "u3"})
+        assert [record["url"] for record in restored.take(10)] == ["u0", "u1", "u2", "u3"]
+
+    def test_window_stays_bounded(self, tmp_path: Path) -> None:
+        """The frontier keeps at most ``capacity`` entries in memory."""
+        frontier = CrawlFrontier()
+        frontier.attach_spill(FrontierSpill(tmp_path, segment_size=10), capacity=8)
+        for i in range(100):
+            frontier.append(f"https://example.com/{i}")
+        
+        assert len(frontier) == 100
+        assert len(frontier.entries()) == 8
+        assert "https://example.com/99" in frontier
+        assert frontier.append("https://example.com/99") is False
+        
+        popped = []
+        while frontier:
+            popped.append(frontier.pop().url)
+            assert len(frontier.entries()) <= 8
+        assert sorted(popped) == sorted(f"https://example.com/{i}" for i in range(100))
+
+    def test_load_does_not_scan_spill(self, temp_storage: CrawlStateStorage) -> None:
+        """Spilled-URL digests come from the snapshot, not from reading segments."""
+        temp_storage.MAX_FRONTIER_IN_MEMORY = 4
+        state = CrawlState.create_new(source_url="https://example.com/", scope="host")
+        for i in range(50):
+            state.add_to_frontier(f"https://example.com/{i}")
+        temp_storage.save_state(state)
+        
+        with patch.object(FrontierSpill, "scan", side_effect=AssertionError("spill scanned")):
+            loaded = temp_storage.load_state(state.source_url)
+        
+        assert loaded is not None
+        assert len(loaded.frontier) == 51
+        assert loaded.add_to_frontier("https://example.com/49") is False
+    
+    def test_spilled_digests_released(self, tmp_path: Path) -> None:
+        """Digests are dropped once the spill drains, and capped meanwhile."""
+        frontier = CrawlFrontier()
+        frontier.attach_spill(FrontierSpill(tmp_path, segment_size=10), capacity=4)
+        for i in range(20):
+            frontier.append(f"https://example.com/{i}")
+        assert len(frontier.spilled_digests) == 16
+        
+        while frontier.spill:
+            frontier.pop()
+        assert len(frontier.spilled_digests) == 0
+        
+        with patch.object(CrawlFrontier, "MAX_SPILLED_DIGESTS", 5):
+            for i in range(20, 40):
+                frontier.append(f"https://example.com/{i}")
+        assert len(frontier.spilled_digests) <= 5
+    
+    def test_duplicate_spill_record_dropped_at_top_up(self, tmp_path: Path) -> None:
+        """A URL spilled twice is queued in the window only once."""
+        frontier = CrawlFrontier()
+        frontier.attach_spill(FrontierSpill(tmp_path, segment_size=10), capacity=4)
+        for i in range(4):
+            frontier.append(f"https://example.com/{i}")
+        frontier.spill.extend([{"url": "https://example.com/x", "score": 0.0}] * 2)
+        
+        popped = [frontier.pop().url for _ in range(len(frontier) - 1)]
+        
+        assert popped.count("https://example.com/x") == 1
+        assert not frontier
+    
+    def test_journal_replay_respills(self, temp_storage: CrawlStateStorage) -> None:
+        """Entries spilled after the last snapshot are rebuilt from the journal."""
+        temp_storage.MAX_FRONTIER_IN_MEMORY = 4
+        temp_storage.FRONTIER_SEGMENT_SIZE = 3
+        state = CrawlState.create_new(source_url="https://example.com/", scope="host")
+        temp_storage.save_state(state)
+        journal = temp_storage.open_journal(state.source_hash)
+        links = [f"https://example.com/{i}" for i in range(20)]
+        state.pop_frontier()
+        journal.append(state, make_record("visited", "https://example.com/", enqueued=links))
+        for _ in range(6):
+            url = state.pop_frontier()
+            journal.append(state, make_record("visited", url))
+        journal.close()
+        
+        loaded = temp_storage.load_state(state.source_url)
+        
+        assert loaded is not None
+        assert len(loaded.frontier) == len(state.frontier) == 14
+        remaining = set()
+        while loaded.frontier:
+            remaining.add(loaded.pop_frontier())
+        assert remaining == set(state.frontier.to_list()) | set(
+            record["url"] for record in state.frontier.spill.scan()
+        )
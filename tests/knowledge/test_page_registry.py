@@ -130,6 +130,7 @@ class TestPageEntry:
             title="Example Page",
             outgoing_links_count=10,
             outgoing_links_in_scope=8,
+            content_fingerprint="f1e2d3",
         )
         
         assert sample_page_entry.status == "fetched"
@@ -142,6 +143,7 @@ class TestPageEntry:
         assert sample_page_entry.title == "Example Page"
         assert sample_page_entry.outgoing_links_count == 10
         assert sample_page_entry.outgoing_links_in_scope == 8
+        assert PageEntry.from_dict(sample_page_entry.to_dict()).content_fingerprint == "f1e2d3"
 
     def test_mark_failed(self, sample_page_entry: PageEntry) -> None:
         """mark_failed should update error fields."""
@@ -490,3 +492,291 @@ class TestPageRegistry:
         data = json.loads(registry_path.read_text())
         assert "url_to_batch" in data
         assert sample_page_entry.url_hash in data["url_to_batch"]
+
+
+# =============================================================================
+# Write-back Session Tests
+# =============================================================================
+
+
+def _pending(index: int) -> PageEntry:
+    return PageEntry.create_pending(
+        url=f"https://example.com/docs/page-{index}",
+        source_url="https://example.com/docs/",
+    )
+
+
+class TestPageRegistrySession:
+    """Tests for PageRegistrySession write-back caching."""
+
+    def test_flushes_each_batch_once(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """1200 pages cost three batch writes and one index write."""
+        with temp_registry.session(source_hash) as session:
+            for i in range(1200):
+                session.save_page(_pending(i))
+            assert not temp_registry._get_registry_path(source_hash).exists()
+
+        assert session.batch_writes == 3
+        assert session.index_writes == 1
+        assert temp_registry.get_stats(source_hash)["total"] == 1200
+        assert temp_registry.get_page(_pending(1199).url, source_hash) is not None
+
+    def test_reads_see_unflushed_pages(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """Pages saved in the session are visible before flushing."""
+        with temp_registry.session(source_hash) as session:
+            page = _pending(1)
+            session.save_page(page)
+            page.mark_failed("timeout")
+            session.save_page(page)
+
+            assert session.page_exists(page.url)
+            assert session.get_page(page.url).status == "failed"
+
+        assert temp_registry.get_page(page.url, source_hash).status == "failed"
+        assert temp_registry.get_stats(source_hash)["total"] == 1
+
+    def test_flush_every(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """flush_every bounds how many pages can be lost to a crash."""
+        session = temp_registry.session(source_hash, flush_every=100)
+        for i in range(250):
+            session.save_page(_pending(i))
+
+        assert session.index_writes == 2
+        assert temp_registry.get_stats(source_hash)["total"] == 200
+
+        session.flush()
+        assert temp_registry.get_stats(source_hash)["total"] == 250
+
+    def test_continues_existing_registry(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """A session appends after pages saved by earlier writers."""
+        temp_registry.save_pages_batch([_pending(i) for i in range(499)], source_hash)
+
+        with temp_registry.session(source_hash) as session:
+            session.save_page(_pending(499))
+            session.save_page(_pending(500))
+            session.save_page(_pending(3))
+
+        index = temp_registry._load_index(source_hash)
+        assert index.current_batch == 1
+        assert len(index) == 501
+        assert temp_registry.get_stats(source_hash)["total"] == 501
+
+    def test_recovers_pages_missing_from_index(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """Batch files written before a crash are re-indexed on open."""
+        with temp_registry.session(source_hash) as session:
+            for i in range(10):
+                session.save_page(_pending(i))
+
+        # Simulate a crash after writing batches but before the index
+        orphans = PageBatch(batch_number=1, source_hash=source_hash)
+        orphans.add_page(_pending(900))
+        temp_registry._save_batch(source_hash, orphans)
+
+        with temp_registry.session(source_hash) as session:
+            assert session.page_exists(_pending(900).url)
+            session.save_page(_pending(901))
+
+        index = temp_registry._load_index(source_hash)
+        assert index.current_batch == 1
+        assert index.locate(_pending(900).url_hash) == (1, 0)
+        assert index.locate(_pending(901).url_hash) == (1, 1)
+
+    def test_github_mode_single_commit(self, tmp_path: Path, source_hash: str) -> None:
+        """Each flush is one commit containing dirty batches and the index."""
+        from unittest.mock import MagicMock
+
+        client = MagicMock()
+        registry = PageRegistry(root=tmp_path, github_client=client, project_root=tmp_path)
+
+        with registry.session(source_hash) as session:
+            for i in range(600):
+                session.save_page(_pending(i))
+
+        client.commit_files_batch.assert_called_once()
+        files = client.commit_files_batch.call_args.kwargs["files"]
+        assert [Path(path).name for path, _content in files] == [
+            "pages_0000.json",
+            "pages_0001.json",
+            "registry.json",
+        ]
+        client.commit_file.assert_not_called()
+
+    def test_github_mode_update_after_flush(self, tmp_path: Path, source_hash: str) -> None:
+        """Updating a page in a flushed batch commits the whole batch."""
+        from unittest.mock import MagicMock
+
+        client = MagicMock()
+        registry = PageRegistry(root=tmp_path, github_client=client, project_root=tmp_path)
+
+        with registry.session(source_hash, flush_every=600) as session:
+            for i in range(600):
+                session.save_page(_pending(i))
+            page = _pending(0)
+            page.mark_failed("timeout")
+            session.save_page(page)
+
+        assert client.commit_files_batch.call_count == 2
+        files = dict(client.commit_files_batch.call_args.kwargs["files"])
+        batch = json.loads(next(content for path, content in files.items() if path.endswith("pages_0000.json")))
+        assert len(batch["pages"]) == 500
+        assert batch["pages"][0]["status"] == "failed"
+
+
+class TestPageIndex:
+    """Tests for positions and status counters in the registry index."""
+
+    @staticmethod
+    def _count_batch_reads(registry: PageRegistry) -> list[int]:
+        reads: list[int] = []
+        load_batch = registry._load_batch
+
+        def counting(source_hash: str, batch_number: int):
+            reads.append(batch_number)
+            return load_batch(source_hash, batch_number)
+
+        registry._load_batch = counting
+        return reads
+
+    def _populate(self, registry: PageRegistry, source_hash: str) -> None:
+        pages = [_pending(i) for i in range(1200)]
+        for i in (3, 7, 1100):
+            pages[i].mark_failed("timeout")
+        registry.save_pages_batch(pages, source_hash)
+
+    def test_stats_read_no_batches(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """get_stats is answered from the index counters."""
+        self._populate(temp_registry, source_hash)
+        reads = self._count_batch_reads(temp_registry)
+
+        stats = temp_registry.get_stats(source_hash)
+
+        assert stats == {"total": 1200, "pending": 1197, "fetched": 0, "failed": 3, "skipped": 0}
+        assert reads == []
+
+    def test_counters_follow_status_changes(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """Re-saving a page moves it between status counters."""
+        page = _pending(1)
+        temp_registry.save_page(page, source_hash)
+        temp_registry.save_page(_pending(2), source_hash)
+        page.mark_fetched(200, "text/html", "abc", "p.md", 3)
+        temp_registry.save_page(page, source_hash)
+
+        stats = temp_registry.get_stats(source_hash)
+        assert stats["total"] == 2
+        assert stats["pending"] == 1
+        assert stats["fetched"] == 1
+
+    def test_status_query_reads_only_matching_batches(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """Batches without a page in the requested status are not opened."""
+        self._populate(temp_registry, source_hash)
+        reads = self._count_batch_reads(temp_registry)
+
+        failed = temp_registry.get_pages_by_status(source_hash, "failed")
+
+        assert [page.url for page in failed] == [_pending(i).url for i in (3, 7, 1100)]
+        assert sorted(reads) == [0, 2]
+
+    def test_point_lookup_reads_one_batch(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """A lookup opens only the batch named by the index."""
+        self._populate(temp_registry, source_hash)
+        reads = self._count_batch_reads(temp_registry)
+
+        page = temp_registry.get_page(_pending(777).url, source_hash)
+
+        assert page is not None and page.url == _pending(777).url
+        assert reads == [1]
+
+    def test_upgrades_version_1_index(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """Indexes without positions are rebuilt from the batch files."""
+        self._populate(temp_registry, source_hash)
+        registry_path = temp_registry._get_registry_path(source_hash)
+        data = json.loads(registry_path.read_text(encoding="utf-8"))
+        legacy = {
+            "version": 1,
+            "source_hash": source_hash,
+            "current_batch": data["current_batch"],
+            "url_to_batch": data["url_to_batch"],
+        }
+        registry_path.write_text(json.dumps(legacy), encoding="utf-8")
+
+        reopened = PageRegistry(root=temp_registry.root)
+        assert reopened.get_stats(source_hash)["failed"] == 3
+        assert reopened.get_page(_pending(1100).url, source_hash).status == "failed"
+
+        reopened.save_page(_pending(1200), source_hash)
+        upgraded = json.loads(registry_path.read_text(encoding="utf-8"))
+        assert upgraded["version"] == 2
+        assert upgraded["status_counts"] == {"pending": 1198, "failed": 3}
+        assert upgraded["url_to_position"][_pending(1100).url_hash] == 100
+
+    def test_index_reloads_after_external_write(
+        self,
+        temp_registry: PageRegistry,
+        source_hash: str,
+    ) -> None:
+        """A cached index is dropped when registry.json changes on disk."""
+        temp_registry.save_page(_pending(1), source_hash)
+        assert temp_registry.get_stats(source_hash)["total"] == 1
+
+        other = PageRegistry(root=temp_registry.root)
+        other.save_page(_pending(2), source_hash)
+
+        assert temp_registry.get_stats(source_hash)["total"] == 2
+
+    def test_replace_pages_github_single_commit(self, tmp_path: Path, source_hash: str) -> None:
+        """Rewriting a crawl in GitHub mode commits all batches and the index once."""
+        from unittest.mock import MagicMock
+
+        client = MagicMock()
+        registry = PageRegistry(root=tmp_path, github_client=client, project_root=tmp_path)
+
+        assert registry.replace_pages(source_hash, (_pending(i) for i in range(1001))) == 1001
+
+        client.commit_files_batch.assert_called_once()
+        files = client.commit_files_batch.call_args.kwargs["files"]
+        assert [Path(path).name for path, _content in files] == [
+            "pages_0000.json",
+            "pages_0001.json",
+            "pages_0002.json",
+            "registry.json",
+        ]
@@ -0,0 +1,133 @@
+"""Tests for the SQLite page registry backend."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.knowledge.page_registry import PageEntry, PageRegistry
+from src.knowledge.page_registry_sqlite import SqlitePageRegistry
+
+
+SOURCE_HASH = "c" * 64
+
+
+@pytest.fixture
+def registry(tmp_path: Path):
+    """Create a temporary SQLite page registry."""
+    with SqlitePageRegistry(root=tmp_path) as registry:
+        yield registry
+
+
+def _pending(index: int) -> PageEntry:
+    return PageEntry.create_pending(
+        url=f"https://example.com/docs/page-{index}",
+        source_url="https://example.com/docs/",
+    )
+
+
+class TestSqlitePageRegistry:
+    """Tests for SqlitePageRegistry."""
+
+    def test_save_and_get_page(self, registry: SqlitePageRegistry) -> None:
+        """A saved page round-trips through the database."""
+        page = _pending(1)
+        registry.save_page(page, SOURCE_HASH)
+
+        loaded = registry.get_page(page.url, SOURCE_HASH)
+        assert loaded is not None
+        assert loaded.to_dict() == page.to_dict()
+        assert registry.page_exists(page.url, SOURCE_HASH)
+        assert not registry.page_exists("https://example.com/other", SOURCE_HASH)
+
+    def test_reads_do_not_create_database(self, registry: SqlitePageRegistry) -> None:
+        """Reading a crawl with no database answers empty and writes nothing."""
+        page = _pending(1)
+
+        assert registry.get_page(page.url, SOURCE_HASH) is None
+        assert not registry.page_exists(page.url, SOURCE_HASH)
+        assert list(registry.iterate_pages(SOURCE_HASH)) == []
+        assert registry.get_pages_by_status(SOURCE_HASH, "pending") == []
+        assert registry.get_pages_by_content_hash(SOURCE_HASH, "abc") == []
+        assert registry.get_stats(SOURCE_HASH)["total"] == 0
+        assert not registry.get_database_path(SOURCE_HASH).parent.exists()
+
+    def test_uses_wal_and_indexes(self, registry: SqlitePageRegistry) -> None:
+        """Each crawl gets its own WAL-mode database with lookup indexes."""
+        registry.save_page(_pending(1), SOURCE_HASH)
+        conn = sqlite3.connect(registry.get_database_path(SOURCE_HASH))
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(pages)")}
+        finally:
+            conn.close()
+        assert {"idx_pages_status", "idx_pages_content_hash"} <= indexes
+
+    def test_update_keeps_discovery_order(self, registry: SqlitePageRegistry) -> None:
+        """Upserting an existing page changes it in place."""
+        pages = [_pending(i) for i in range(3)]
+        registry.save_pages_batch(pages, SOURCE_HASH)
+        pages[0].mark_fetched(200, "text/html", "abc", "content/a/abc.md", 10)
+        registry.save_pages_batch([pages[0]], SOURCE_HASH)
+
+        assert [p.url for p in registry.iterate_pages(SOURCE_HASH)] == [p.url for p in pages]
+        assert registry.get_stats(SOURCE_HASH) == {
+            "total": 3,
+            "pending": 2,
+            "fetched": 1,
+            "failed": 0,
+            "skipped": 0,
+        }
+        assert [p.url for p in registry.get_pages_by_content_hash(SOURCE_HASH, "abc")] == [
+            pages[0].url
+        ]
+
+    def test_status_queries(self, registry: SqlitePageRegistry) -> None:
+        """Pages are filtered by status in discovery order."""
+        pages = [_pending(i) for i in range(10)]
+        for i in (2, 5):
+            pages[i].mark_failed("timeout")
+        registry.save_pages_batch(iter(pages), SOURCE_HASH)
+
+        failed = registry.get_pages_by_status(SOURCE_HASH, "failed")
+        assert [p.url for p in failed] == [pages[2].url, pages[5].url]
+
+    def test_session_buffers_until_flush(self, registry: SqlitePageRegistry) -> None:
+        """Session saves are visible in the session and written on exit."""
+        with registry.session(SOURCE_HASH) as session:
+            session.save_page(_pending(1))
+            assert session.page_exists(_pending(1).url)
+            assert registry.get_stats(SOURCE_HASH)["total"] == 0
+
+        assert registry.get_stats(SOURCE_HASH)["total"] == 1
+
+    def test_export_regenerates_json_batches(
+        self,
+        registry: SqlitePageRegistry,
+        tmp_path: Path,
+    ) -> None:
+        """Export writes the JSON batch layout and drops stale batches."""
+        json_registry = PageRegistry(root=tmp_path / "json")
+        json_registry.save_pages_batch([_pending(i) for i in range(1200)], SOURCE_HASH)
+
+        pages = [_pending(i) for i in range(600)]
+        pages[550].mark_skipped("robots.txt")
+        registry.save_pages_batch(pages, SOURCE_HASH)
+
+        assert registry.export_json(SOURCE_HASH, json_registry) == 600
+
+        assert json_registry.get_stats(SOURCE_HASH) == registry.get_stats(SOURCE_HASH)
+        assert [p.url for p in json_registry.iterate_pages(SOURCE_HASH)] == [p.url for p in pages]
+        assert json_registry.get_page(pages[550].url, SOURCE_HASH).status == "skipped"
+        assert not json_registry._get_batch_path(SOURCE_HASH, 2).exists()
+
+    def test_import_json(self, registry: SqlitePageRegistry, tmp_path: Path) -> None:
+        """An existing JSON registry can be loaded into the database."""
+        json_registry = PageRegistry(root=tmp_path / "json")
+        json_registry.save_pages_batch([_pending(i) for i in range(700)], SOURCE_HASH)
+
+        assert registry.import_json(SOURCE_HASH, json_registry) == 700
+        assert registry.get_stats(SOURCE_HASH)["total"] == 700
+        assert registry.get_page(_pending(699).url, SOURCE_HASH) is not None
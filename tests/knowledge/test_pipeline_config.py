@@ -41,6 +41,16 @@ class TestPipelinePoliteness:
         assert politeness.max_sources_per_run == 10
         assert politeness.crawler_delay_seconds == 2.0
     
+    def test_check_interval_bounds_validated(self) -> None:
+        """Adaptive interval bounds must be positive and ordered."""
+        with pytest.raises(ValueError, match="min_check_interval"):
+            PipelinePoliteness(min_check_interval=timedelta(0))
+        with pytest.raises(ValueError, match="min_check_interval"):
+            PipelinePoliteness(
+                min_check_interval=timedelta(days=2),
+                max_check_interval=timedelta(days=1),
+            )
+    
     def test_frozen_default_interval(self) -> None:
         """Test that default factory creates independent timedelta."""
         p1 = PipelinePoliteness()
@@ -75,6 +85,23 @@ class TestPipelineConfig:
         with pytest.raises(ValueError, match="Invalid mode"):
             PipelineConfig(mode="invalid")
     
+    def test_crawler_workers_must_be_positive(self) -> None:
+        """Test that a crawler without workers is rejected."""
+        with pytest.raises(ValueError, match="crawler_workers"):
+            PipelineConfig(crawler_workers=0)
+    
+    def test_monitor_workers_must_be_positive(self) -> None:
+        """Test that a monitor without workers is rejected."""
+        with pytest.raises(ValueError, match="monitor_workers"):
+            PipelineConfig(monitor_workers=0)
+    
+    def test_monitor_hash_limits_must_be_positive(self) -> None:
+        """Test that an empty hash budget or deadline is rejected."""
+        with pytest.raises(ValueError, match="monitor_max_hash_bytes"):
+            PipelineConfig(monitor_max_hash_bytes=0)
+        with pytest.raises(ValueError, match="monitor_hash_deadline_seconds"):
+            PipelineConfig(monitor_hash_deadline_seconds=0)
+    
     def test_dry_run_mode(self) -> None:
         """Test dry run configuration."""
         config = PipelineConfig(dry_run=True, mode="check")
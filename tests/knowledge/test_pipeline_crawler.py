@@ -16,6 +16,7 @@ from src.knowledge.pipeline.crawler import (
     CrawlerResult,
     _content_hash,
     _get_domain,
+    acquire_crawl,
     acquire_single_page,
 )
 
@@ -36,6 +37,17 @@ class MockSourceEntry:
     scope_boundary: str = "page"
 
 
+@dataclass
+class MockCrawlSource:
+    """Minimal mock of a crawlable SourceEntry."""
+    
+    name: str = "docs"
+    url: str = "https://example.com/docs/"
+    crawl_scope: str = "path"
+    crawl_max_pages: int = 1000
+    crawl_max_depth: int = 100
+
+
 class TestAcquisitionResult:
     """Tests for AcquisitionResult dataclass."""
     
@@ -253,6 +265,30 @@ class TestAcquireSinglePage:
         assert document.metadata["source_type"] == source.source_type
         assert "acquired_at" in document.metadata
 
+    def test_shares_domain_strategies_and_reports_fetch_stats(self):
+        """Parser uses the shared strategy memory and its stats are returned."""
+        from src.parsing.web import FetchStats
+
+        source = MockSourceEntry(name="test", url="https://example.com")
+        mock_storage = MagicMock()
+        strategies = {"example.com": "rendered"}
+
+        with patch("src.knowledge.pipeline.crawler.WebParser") as mock_parser_cls:
+            mock_parser = MagicMock()
+            mock_parser.extract.return_value = MagicMock(metadata={})
+            mock_parser.to_markdown.return_value = "# Content"
+            mock_parser.fetch_stats = FetchStats(static_pages=1, static_seconds=0.25)
+            mock_parser_cls.return_value = mock_parser
+
+            result = acquire_single_page(
+                source, mock_storage, delay_seconds=0, domain_strategies=strategies
+            )
+
+        assert mock_parser.domain_strategies is strategies
+        assert mock_parser_cls.call_args.kwargs["static_first"] is True
+        assert result.fetch_stats["static_pages"] == 1
+        assert result.fetch_stats["static_seconds"] == 0.25
+
 
 class TestCrawlerIntegration:
     """Integration-style tests verifying crawler behavior."""
@@ -274,3 +310,540 @@ class TestCrawlerIntegration:
         assert d["successful"] == 2
         assert d["failed"] == 1
         assert d["pages_total"] == 8
+
+
+class TestAcquireCrawlJournal:
+    """acquire_crawl persists per-page progress through the crawl journal."""
+    
+    @staticmethod
+    def _parser(kill_after: int | None = None) -> MagicMock:
+        """Parser whose page N links to pages N+1 and N+2."""
+        from src.parsing.web import FetchStats
+        
+        fetched: list[str] = []
+        
+        def extract(target):
+            if kill_after is not None and len(fetched) == kill_after:
+                raise KeyboardInterrupt
+            fetched.append(target.source)
+            number = 0 if target.source.endswith("/docs/") else int(target.source.rsplit("-", 1)[1])
+            return MagicMock(
+                metadata={},
+                links=[f"https://example.com/docs/page-{number + step}" for step in (1, 2)],
+            )
+        
+        parser = MagicMock()
+        parser.extract.side_effect = extract
+        parser.to_markdown.side_effect = lambda document: f"# {id(document)}"
+        parser.fetch_stats = FetchStats()
+        parser.fetched = fetched
+        return parser
+    
+    def _crawl(self, crawl_storage, parser, max_pages: int):
+        with patch("src.knowledge.pipeline.crawler.WebParser", return_value=parser), \
+                patch("src.knowledge.pipeline.crawler.RobotsChecker") as robots_cls:
+            robots_cls.return_value.is_allowed.return_value = True
+            robots_cls.return_value.get_crawl_delay.return_value = None
+            storage = MagicMock()
+            storage.persist_document.return_value.artifact_path = "parsed/page/index.md"
+            return acquire_crawl(
+                MockCrawlSource(),
+                storage,
+                crawl_storage,
+                max_pages=max_pages,
+                delay_seconds=0,
+            )
+    
+    def test_state_snapshots_only_at_run_edges(self, tmp_path: Path) -> None:
+        """Pages are journaled; the full state is written at start and end."""
+        from src.knowledge.crawl_state import CrawlStateStorage
+        
+        crawl_storage = CrawlStateStorage(root=tmp_path)
+        with patch.object(crawl_storage, "save_state", wraps=crawl_storage.save_state) as save_state:
+            result = self._crawl(crawl_storage, self._parser(), max_pages=25)
+        
+        assert result.pages_acquired == 25
+        assert save_state.call_count == 2
+        state = crawl_storage.load_state(MockCrawlSource().url)
+        assert state.visited_count == 25
+        assert state.journal_seq == 25
+        assert not crawl_storage.get_journal_path(state.source_hash).exists()
+    
+    def test_resume_after_kill_keeps_journaled_pages(self, tmp_path: Path) -> None:
+        """A crawl killed mid-run resumes after the last journaled page."""
+        from src.knowledge.crawl_state import CrawlStateStorage
+        
+        crawl_storage = CrawlStateStorage(root=tmp_path)
+        with pytest.raises(KeyboardInterrupt):
+            self._crawl(crawl_storage, self._parser(kill_after=7), max_pages=50)
+        
+        state = crawl_storage.load_state(MockCrawlSource().url)
+        assert state.visited_count == 7
+        assert state.frontier.head(1) == ["https://example.com/docs/page-7"]
+        
+        parser = self._parser()
+        self._crawl(crawl_storage, parser, max_pages=3)
+        
+        assert parser.fetched == [f"https://example.com/docs/page-{n}" for n in (7, 8, 9)]
+        assert crawl_storage.load_state(MockCrawlSource().url).visited_count == 10
+
+
+class TestAcquireCrawlSitemaps:
+    """acquire_crawl records pages and refreshes from sitemap lastmods."""
+    
+    PAGES = [f"https://example.com/docs/page-{n}" for n in range(1, 6)]
+    
+    def _crawl(
+        self,
+        tmp_path: Path,
+        sitemap: list,
+        fetched: list[str],
+        *,
+        sitemap_files: tuple[str, ...] = (),
+        crawl_delay: float | None = None,
+        max_pages: int = 100,
+    ):
+        from src.knowledge.crawl_state import CrawlStateStorage
+        from src.knowledge.page_registry import PageRegistry
+        from src.knowledge.pipeline.config import PipelineConfig
+        from src.parsing.web import FetchStats
+        
+        def iter_sitemap_urls(sitemap_urls, *, before_fetch=None, **kwargs):
+            for url in sitemap_files:
+                before_fetch(url)
+            yield from sitemap
+        
+        def extract(target):
+            fetched.append(target.source)
+            links = self.PAGES if target.source.endswith("/docs/") else []
+            return MagicMock(metadata={"title": target.source}, links=links)
+        
+        parser = MagicMock()
+        parser.extract.side_effect = extract
+        parser.to_markdown.side_effect = lambda document: f"# {document.metadata['title']}"
+        parser.fetch_stats = FetchStats()
+        robots = MagicMock()
+        robots.is_allowed.return_value = True
+        robots.get_crawl_delay.return_value = crawl_delay
+        robots.get_sitemaps.return_value = []
+        storage = MagicMock()
+        storage.persist_document.return_value.artifact_path = "parsed/page/index.md"
+        registry = PageRegistry(root=tmp_path)
+        
+        with patch("src.knowledge.pipeline.crawler.WebParser", return_value=parser), \
+                patch("src.knowledge.pipeline.crawler.iter_sitemap_urls", side_effect=iter_sitemap_urls):
+            result = acquire_crawl(
+                MockCrawlSource(),
+                storage,
+                CrawlStateStorage(root=tmp_path),
+                max_pages=max_pages,
+                delay_seconds=0,
+                config=PipelineConfig(),
+                robots=robots,
+                page_registry=registry,
+            )
+        return result, registry
+    
+    def test_refresh_skips_pages_unchanged_since_fetch(self, tmp_path: Path) -> None:
+        """Only the source URL and pages with a newer lastmod are refetched."""
+        from datetime import timedelta
+        
+        from src.knowledge.crawl_state import CrawlStateStorage
+        from src.parsing.sitemap import SitemapEntry
+        
+        old = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        first: list[str] = []
+        result, registry = self._crawl(tmp_path, [SitemapEntry(url, old) for url in self.PAGES], first)
+        
+        assert result.pages_acquired == 6
+        source_hash = CrawlStateStorage(root=tmp_path).load_state(MockCrawlSource().url).source_hash
+        page = registry.get_page(self.PAGES[0], source_hash)
+        assert page.status == "fetched"
+        assert page.title == self.PAGES[0]
+        
+        new = datetime.now(timezone.utc) + timedelta(days=1)
+        sitemap = [SitemapEntry(url, old) for url in self.PAGES[:4]] + [SitemapEntry(self.PAGES[4], new)]
+        second: list[str] = []
+        result, _ = self._crawl(tmp_path, sitemap, second)
+        
+        assert sorted(second) == ["https://example.com/docs/", self.PAGES[4]]
+        assert result.pages_acquired == 2
+        state = CrawlStateStorage(root=tmp_path).load_state(MockCrawlSource().url)
+        assert state.status == "completed"
+        assert state.unchanged_count == 4
+    
+    def test_sitemap_fetches_are_spaced_and_budgeted(self, tmp_path: Path) -> None:
+        """Sitemap requests wait out the crawl delay and use up the page budget."""
+        fetched: list[str] = []
+        with patch("time.sleep") as mock_sleep:
+            result, _ = self._crawl(
+                tmp_path,
+                [],
+                fetched,
+                sitemap_files=("https://example.com/sitemap.xml", "https://example.com/sitemap-2.xml"),
+                crawl_delay=2.0,
+                max_pages=3,
+            )
+        
+        assert result.sitemaps_fetched == 2
+        assert fetched == ["https://example.com/docs/"]
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [2.0, 2.0, 2.0]
+    
+    def test_same_day_lastmod_is_refetched(self, tmp_path: Path) -> None:
+        """A date-only lastmod of the fetch day may postdate the fetch."""
+        from src.parsing.sitemap import SitemapEntry, parse_lastmod
+        
+        old = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        self._crawl(tmp_path, [SitemapEntry(url, old) for url in self.PAGES], [])
+        
+        today = parse_lastmod(datetime.now(timezone.utc).date().isoformat())
+        sitemap = [SitemapEntry(url, old) for url in self.PAGES[:4]] + [SitemapEntry(self.PAGES[4], today)]
+        fetched: list[str] = []
+        self._crawl(tmp_path, sitemap, fetched)
+        
+        assert sorted(fetched) == ["https://example.com/docs/", self.PAGES[4]]
+    
+    def test_pages_without_lastmod_are_refetched(self, tmp_path: Path) -> None:
+        """A sitemap without lastmods cannot rule any page out."""
+        from src.parsing.sitemap import SitemapEntry
+        
+        self._crawl(tmp_path, [], [])
+        fetched: list[str] = []
+        self._crawl(tmp_path, [SitemapEntry(url) for url in self.PAGES], fetched)
+        
+        assert len(fetched) == 6
+
+
+class TestAcquireCrawlFingerprints:
+    """acquire_crawl skips storing pages whose text is already stored."""
+    
+    def _crawl(self, tmp_path: Path, texts: dict[str, str]):
+        from src.knowledge.crawl_state import CrawlStateStorage
+        from src.knowledge.page_registry import PageRegistry
+        from src.parsing.base import ParsedDocument, ParseTarget
+        from src.parsing.web import FetchStats
+        
+        def extract(target):
+            document = ParsedDocument(target=target, checksum="x", parser_name="web")
+            document.extend_segments([texts[target.source]])
+            if target.source.endswith("/docs/"):
+                document.links = [url for url in texts if not url.endswith("/docs/")]
+            return document
+        
+        parser = MagicMock()
+        parser.extract.side_effect = extract
+        parser.to_markdown.side_effect = lambda document: "\n\n".join(document.segments)
+        parser.fetch_stats = FetchStats()
+        robots = MagicMock()
+        robots.is_allowed.return_value = True
+        robots.get_crawl_delay.return_value = None
+        storage = MagicMock()
+        storage.persist_document.side_effect = lambda document: MagicMock(
+            artifact_path=f"parsed/{document.target.source.rsplit('/', 1)[-1] or 'index'}.md"
+        )
+        registry = PageRegistry(root=tmp_path)
+        
+        with patch("src.knowledge.pipeline.crawler.WebParser", return_value=parser):
+            result = acquire_crawl(
+                MockCrawlSource(),
+                storage,
+                CrawlStateStorage(root=tmp_path),
+                delay_seconds=0,
+                robots=robots,
+                page_registry=registry,
+            )
+        return result, storage, registry
+    
+    def test_duplicates_and_unchanged_pages_are_not_stored_again(self, tmp_path: Path) -> None:
+        """Same text under two URLs is stored once; a refresh stores only edits."""
+        from src.knowledge.crawl_state import CrawlStateStorage
+        from src.parsing.content_fingerprint import text_fingerprint
+        
+        texts = {
+            "https://example.com/docs/": "Documentation home, updated 10:30 am.",
+            "https://example.com/docs/a": "Installing the command line tool.",
+            "https://example.com/docs/a-print": "Installing the command line tool.",
+            "https://example.com/docs/b": "Configuring sources and schedules.",
+        }
+        result, storage, registry = self._crawl(tmp_path, texts)
+        
+        assert result.pages_acquired == 4
+        assert storage.persist_document.call_count == 3
+        assert result.content_fingerprint == text_fingerprint(texts["https://example.com/docs/"])
+        source_hash = CrawlStateStorage(root=tmp_path).load_state(MockCrawlSource().url).source_hash
+        assert registry.get_page("https://example.com/docs/a-print", source_hash).content_path == "parsed/a.md"
+        
+        texts["https://example.com/docs/"] = "Documentation home, updated 11:45 am."
+        texts["https://example.com/docs/b"] = "Configuring sources, schedules and limits."
+        result, storage, _registry = self._crawl(tmp_path, texts)
+        
+        assert result.pages_acquired == 4
+        assert [call.args[0].target.source for call in storage.persist_document.call_args_list] == [
+            "https://example.com/docs/b",
+        ]
+
+
+@dataclass
+class MockRunSource:
+    """Minimal mock of a SourceEntry as handled by run_crawler."""
+    
+    name: str
+    url: str
+    is_crawlable: bool = False
+    last_content_hash: str | None = None
+    last_content_hash_bytes: int | None = None
+    last_content_fingerprint: str | None = None
+    last_checked: datetime | None = None
+    check_failures: int = 0
+    total_pages_acquired: int = 0
+    last_crawl_completed: datetime | None = None
+
+
+class TestRunCrawlerConcurrency:
+    """run_crawler acquires sources in parallel within politeness limits."""
+    
+    @staticmethod
+    def _run(tmp_path: Path, sources, config, scheduler, check_result=None, **patches):
+        from src.knowledge.pipeline.crawler import run_crawler
+        
+        registry = MagicMock()
+        from src.parsing.robots import RobotsChecker
+        
+        with patch("src.knowledge.pipeline.crawler.shared_browser_pool") as pool_cm, \
+                patch("src.knowledge.pipeline.crawler._make_robots_checker", return_value=RobotsChecker()), \
+                patch("src.integrations.github.storage.get_github_storage_client", return_value=None):
+            pool_cm.return_value.__enter__.return_value = MagicMock()
+            with patch.multiple("src.knowledge.pipeline.crawler", **patches):
+                result = run_crawler(
+                    [(source, check_result) for source in sources],
+                    config,
+                    registry,
+                    scheduler,
+                )
+        return result, registry
+    
+    def test_one_source_per_domain_in_flight(self, tmp_path: Path) -> None:
+        """Domains run side by side, but never two sources of one domain."""
+        import threading
+        import time
+        from datetime import timedelta
+        
+        from src.knowledge.pipeline.config import PipelineConfig, PipelinePoliteness
+        from src.knowledge.pipeline.scheduler import DomainScheduler
+        
+        politeness = PipelinePoliteness(min_domain_interval=timedelta(milliseconds=50))
+        config = PipelineConfig(
+            politeness=politeness,
+            kb_root=tmp_path / "kb",
+            evidence_root=tmp_path / "evidence",
+            crawler_workers=3,
+        )
+        sources = [
+            MockRunSource(name=f"{host}-{n}", url=f"https://{host}/page-{n}")
+            for n in range(3)
+            for host in ("a.example", "b.example", "c.example")
+        ]
+        
+        lock = threading.Lock()
+        spans: list[tuple[str, float, float]] = []
+        
+        def fake_acquire(source, **_kwargs):
+            started = time.monotonic()
+            time.sleep(0.05)
+            with lock:
+                spans.append((_get_domain(source.url), started, time.monotonic()))
+            return AcquisitionResult(source.url, success=True, content_hash="h", pages_acquired=1)
+        
+        result, registry = self._run(
+            tmp_path,
+            sources,
+            config,
+            DomainScheduler(politeness=politeness),
+            acquire_single_page=fake_acquire,
+        )
+        
+        assert result.sources_processed == 9
+        assert len(result.successful) == 9
+        assert registry.save_source.call_count == 9
+        
+        for domain in ("a.example", "b.example", "c.example"):
+            own = sorted((start, end) for name, start, end in spans if name == domain)
+            assert len(own) == 3
+            for (_, previous_end), (next_start, _) in zip(own, own[1:]):
+                assert next_start - previous_end >= 0.04
+        
+        overlapping = any(
+            first[0] != second[0] and first[1] < second[2] and second[1] < first[2]
+            for first in spans
+            for second in spans
+        )
+        assert overlapping
+    
+    def test_page_budgets_are_shared_across_sources(self, tmp_path: Path) -> None:
+        """Crawls share the domain's page budget; the rest wait for the next run."""
+        from datetime import timedelta
+        
+        from src.knowledge.pipeline.config import PipelineConfig, PipelinePoliteness
+        from src.knowledge.pipeline.scheduler import DomainScheduler
+        
+        politeness = PipelinePoliteness(
+            min_domain_interval=timedelta(0),
+            max_domain_requests_per_run=10,
+        )
+        config = PipelineConfig(
+            politeness=politeness,
+            kb_root=tmp_path / "kb",
+            evidence_root=tmp_path / "evidence",
+            max_pages_per_crawl=6,
+        )
+        sources = [
+            MockRunSource(name=f"docs-{n}", url=f"https://docs.example/{n}/", is_crawlable=True)
+            for n in range(3)
+        ]
+        granted: list[int] = []
+        
+        def fake_crawl(source, max_pages, **_kwargs):
+            granted.append(max_pages)
+            return AcquisitionResult(source.url, success=True, pages_acquired=max_pages)
+        
+        result, _registry = self._run(
+            tmp_path,
+            sources,
+            config,
+            DomainScheduler(politeness=politeness),
+            acquire_crawl=fake_crawl,
+        )
+        
+        assert granted == [6, 4]
+        assert result.sources_processed == 2
+        assert result.pages_total == 10
+        assert sources[2].last_checked is None
+    
+    def test_truncated_monitor_hash_becomes_baseline(self, tmp_path: Path) -> None:
+        """A change found by a prefix hash stores that hash for the next check."""
+        from datetime import timedelta
+        
+        from src.knowledge.monitoring import CheckResult
+        from src.knowledge.pipeline.config import PipelineConfig, PipelinePoliteness
+        from src.knowledge.pipeline.scheduler import DomainScheduler
+        
+        politeness = PipelinePoliteness(min_domain_interval=timedelta(0))
+        config = PipelineConfig(
+            politeness=politeness,
+            kb_root=tmp_path / "kb",
+            evidence_root=tmp_path / "evidence",
+        )
+        truncated = MockRunSource(
+            name="big",
+            url="https://big.example/report.pdf",
+            last_content_hash="old-prefix",
+            last_content_hash_bytes=1024,
+        )
+        check_result = CheckResult(
+            source_url=truncated.url,
+            checked_at=datetime.now(timezone.utc),
+            status="changed",
+            content_hash="new-prefix",
+            content_hash_bytes=1024,
+        )
+        
+        def fake_acquire(source, **_kwargs):
+            return AcquisitionResult(source.url, success=True, content_hash="markdown", pages_acquired=1)
+        
+        self._run(
+            tmp_path,
+            [truncated],
+            config,
+            DomainScheduler(politeness=politeness),
+            check_result=check_result,
+            acquire_single_page=fake_acquire,
+        )
+        
+        assert (truncated.last_content_hash, truncated.last_content_hash_bytes) == ("new-prefix", 1024)
+    
+    def test_non_html_source_unchanged_after_acquisition(self, tmp_path: Path) -> None:
+        """Check, acquire, check again: an unedited PDF is not flagged twice."""
+        from datetime import timedelta
+        
+        from src.knowledge.monitoring import SourceMonitor
+        from src.knowledge.pipeline.config import PipelineConfig, PipelinePoliteness
+        from src.knowledge.pipeline.scheduler import DomainScheduler
+        
+        politeness = PipelinePoliteness(min_domain_interval=timedelta(0))
+        config = PipelineConfig(
+            politeness=politeness,
+            kb_root=tmp_path / "kb",
+            evidence_root=tmp_path / "evidence",
+        )
+        source = MockRunSource(
+            name="report",
+            url="https://reports.example/annual.pdf",
+            last_content_hash="markdown-of-last-year",
+        )
+        source.last_etag = source.last_modified_header = None
+        monitor = SourceMonitor(registry=MagicMock())
+        
+        def check():
+            response = MagicMock()
+            response.headers = {"Content-Type": "application/pdf"}
+            response.status_code = 200
+            response.iter_content.return_value = [b"%PDF-1.7 ", b"annual report"]
+            with patch.object(monitor._session, "get", return_value=response):
+                return monitor.check_source(source)
+        
+        def fake_acquire(source, **_kwargs):
+            return AcquisitionResult(source.url, success=True, content_hash="markdown", pages_acquired=1)
+        
+        first = check()
+        self._run(
+            tmp_path,
+            [source],
+            config,
+            DomainScheduler(politeness=politeness),
+            check_result=first,
+            acquire_single_page=fake_acquire,
+        )
+        
+        assert first.status == "changed"
+        assert check().status == "unchanged"
+    
+    def test_fingerprint_prefers_monitor_view(self, tmp_path: Path) -> None:
+        """The crawler's fingerprint is stored unless a check supplied one."""
+        from datetime import timedelta
+        
+        from src.knowledge.monitoring import CheckResult
+        from src.knowledge.pipeline.config import PipelineConfig, PipelinePoliteness
+        from src.knowledge.pipeline.scheduler import DomainScheduler
+        
+        politeness = PipelinePoliteness(min_domain_interval=timedelta(0))
+        config = PipelineConfig(
+            politeness=politeness,
+            kb_root=tmp_path / "kb",
+            evidence_root=tmp_path / "evidence",
+        )
+        
+        def fake_acquire(source, **_kwargs):
+            return AcquisitionResult(
+                source.url, success=True, content_hash="h", content_fingerprint="rendered", pages_acquired=1
+            )
+        
+        initial = MockRunSource(name="new", url="https://new.example/")
+        self._run(tmp_path, [initial], config, DomainScheduler(politeness=politeness), acquire_single_page=fake_acquire)
+        
+        checked = MockRunSource(name="old", url="https://old.example/", last_content_hash="h0")
+        check_result = CheckResult(
+            source_url=checked.url,
+            checked_at=datetime.now(timezone.utc),
+            status="changed",
+            content_fingerprint="static",
+        )
+        self._run(
+            tmp_path,
+            [checked],
+            config,
+            DomainScheduler(politeness=politeness),
+            check_result=check_result,
+            acquire_single_page=fake_acquire,
+        )
+        
+        assert (initial.last_content_fingerprint, checked.last_content_fingerprint) == ("rendered", "static")
@@ -45,6 +45,21 @@ class MockSourceRegistry:
             return [s for s in self._sources if s.status == status]
         return self._sources
     
+    def list_due_sources(
+        self, now: datetime, status: str | None = "active"
+    ) -> list[MockSourceEntry]:
+        return [
+            s for s in self.list_sources(status)
+            if s.next_check_after is None or s.next_check_after <= now
+        ]
+    
+    def list_sources_by_domain(
+        self, domain: str, status: str | None = None
+    ) -> list[MockSourceEntry]:
+        from src.knowledge.pipeline.scheduler import extract_domain
+        
+        return [s for s in self.list_sources(status) if extract_domain(s.url) == domain]
+    
     def save_source(self, source: MockSourceEntry) -> None:
         """Mock save - does nothing."""
         pass
@@ -286,3 +301,206 @@ class TestMonitorIntegration:
         assert initial[0].name == "initial"
         assert len(due) == 1
         assert due[0].name == "due"
+
+
+@dataclass
+class MockCheckedSource(MockSourceEntry):
+    """Mock SourceEntry with the fields an update check writes back."""
+    
+    check_failures: int = 0
+    last_checked: datetime | None = None
+    last_observed_at: datetime | None = None
+    last_etag: str | None = None
+    last_modified_header: str | None = None
+    change_history: list[list[int]] = field(default_factory=list)
+
+
+class TestRunMonitorConcurrency:
+    """run_monitor checks sources in parallel within politeness limits."""
+    
+    @staticmethod
+    def _sources() -> list[MockCheckedSource]:
+        return [
+            MockCheckedSource(
+                name=f"{domain}-{n}",
+                url=f"https://{domain}.example/{n}",
+                last_content_hash="old",
+            )
+            for domain in ("a", "b", "c", "d")
+            for n in range(3)
+        ]
+    
+    @staticmethod
+    def _run(sources, politeness, workers: int):
+        import threading
+        import time
+        
+        from src.knowledge.monitoring import CheckResult
+        from src.knowledge.pipeline.scheduler import DomainScheduler, extract_domain
+        
+        lock = threading.Lock()
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        
+        def check_source(self, source, force_full=False):
+            domain = extract_domain(source.url)
+            with lock:
+                in_flight[domain] = in_flight.get(domain, 0) + 1
+                peak[domain] = max(peak.get(domain, 0), in_flight[domain])
+            time.sleep(0.02)
+            with lock:
+                in_flight[domain] -= 1
+            if source.name.endswith("-2"):
+                raise RuntimeError(f"boom {source.name}")
+            status = "changed" if source.name.endswith("-0") else "unchanged"
+            return CheckResult(
+                source_url=source.url,
+                checked_at=datetime.now(timezone.utc),
+                status=status,
+                etag=f'"{source.name}"',
+                detection_method="content_hash" if status == "changed" else None,
+            )
+        
+        with patch("src.knowledge.pipeline.monitor.SourceMonitor.check_source", check_source):
+            result = run_monitor(
+                MockSourceRegistry(_sources=sources),
+                DomainScheduler(politeness),
+                workers=workers,
+            )
+        return result, peak
+    
+    def test_records_results_as_serial_mode(self):
+        """Outcomes and their order match a serial run, one request per domain at a time."""
+        from src.knowledge.pipeline.config import PipelinePoliteness
+        
+        politeness = PipelinePoliteness(min_domain_interval=timedelta(0), max_sources_per_run=100)
+        serial_sources, concurrent_sources = self._sources(), self._sources()
+        serial, _ = self._run(serial_sources, politeness, workers=1)
+        concurrent, peak = self._run(concurrent_sources, politeness, workers=4)
+        
+        assert concurrent.to_dict() == serial.to_dict()
+        assert [s.name for s, _ in concurrent.updates_needed] == [s.name for s, _ in serial.updates_needed]
+        assert [s.name for s in concurrent.unchanged] == [s.name for s in serial.unchanged]
+        assert [(s.name, e) for s, e in concurrent.errors] == [(s.name, e) for s, e in serial.errors]
+        for before, after in zip(serial_sources, concurrent_sources):
+            assert (after.check_failures, after.last_etag) == (before.check_failures, before.last_etag)
+        assert set(peak.values()) == {1}
+    
+    def test_respects_limits_and_domain_interval(self):
+        """Run limits apply, and same-domain checks are spaced by the interval."""
+        import time
+        
+        from src.knowledge.pipeline.config import PipelinePoliteness
+        
+        politeness = PipelinePoliteness(
+            min_domain_interval=timedelta(seconds=0.2),
+            max_sources_per_run=6,
+            max_domain_requests_per_run=2,
+        )
+        started = time.perf_counter()
+        result, _ = self._run(self._sources(), politeness, workers=4)
+        elapsed = time.perf_counter() - started
+        
+        assert result.sources_checked == 6
+        checked = [s.name for s, _ in result.updates_needed] + [s.name for s in result.unchanged]
+        checked += [s.name for s, _ in result.errors]
+        assert max(sum(name.startswith(d) for name in checked) for d in "abcd") == 2
+        # Second check on a domain waits out the 0.2s interval
+        assert 0.2 <= elapsed < 1.0
+
+
+class TestChangeHistory:
+    """Successful checks feed the adaptive check interval."""
+    
+    @staticmethod
+    def _check(source, status: str, politeness=None) -> None:
+        from src.knowledge.monitoring import CheckResult
+        from src.knowledge.pipeline.config import PipelinePoliteness
+        from src.knowledge.pipeline.monitor import _update_source_after_check
+        from src.knowledge.pipeline.scheduler import DomainScheduler
+        
+        result = CheckResult(
+            source_url=source.url,
+            checked_at=datetime.now(timezone.utc),
+            status=status,
+            error_message="boom" if status == "error" else None,
+        )
+        scheduler = DomainScheduler(politeness or PipelinePoliteness(check_jitter_minutes=0))
+        _update_source_after_check(MockSourceRegistry(), source, result, scheduler)
+    
+    def test_check_appends_observation(self):
+        """A changed or unchanged check records the time since the last one."""
+        two_days_ago = datetime.now(timezone.utc) - timedelta(days=2)
+        source = MockCheckedSource(
+            name="s",
+            url="https://a.example/s",
+            last_checked=two_days_ago,
+            last_observed_at=two_days_ago,
+        )
+        
+        self._check(source, "changed")
+        self._check(source, "unchanged")
+        
+        assert len(source.change_history) == 2
+        assert source.change_history[0][1] == 1
+        assert abs(source.change_history[0][0] - 2 * 86400) < 60
+        assert source.change_history[1] == [0, 0]
+    
+    def test_window_starts_at_last_successful_check(self):
+        """Errors and acquisitions in between do not shorten the observation."""
+        source = MockCheckedSource(
+            name="s",
+            url="https://a.example/s",
+            last_observed_at=datetime.now(timezone.utc) - timedelta(days=3),
+        )
+        
+        self._check(source, "error")
+        # An acquisition also stamps last_checked
+        source.last_checked = datetime.now(timezone.utc) - timedelta(minutes=5)
+        self._check(source, "changed")
+        
+        assert len(source.change_history) == 1
+        assert abs(source.change_history[0][0] - 3 * 86400) < 60
+        assert source.last_observed_at == source.last_checked
+    
+    def test_legacy_history_measured_from_last_check(self):
+        """History stored before last_observed_at existed continues from last_checked."""
+        source = MockCheckedSource(
+            name="s",
+            url="https://a.example/s",
+            last_checked=datetime.now(timezone.utc) - timedelta(days=1),
+            change_history=[[86400, 0]],
+        )
+        
+        self._check(source, "unchanged")
+        
+        assert abs(source.change_history[-1][0] - 86400) < 60
+    
+    def test_first_check_and_errors_not_recorded(self):
+        """Without a previous check, or on failure, the history is unchanged."""
+        source = MockCheckedSource(name="s", url="https://a.example/s")
+        
+        self._check(source, "changed")
+        self._check(source, "error")
+        
+        assert source.change_history == []
+    
+    def test_history_sets_next_check(self):
+        """A source that never changes is scheduled beyond its static interval."""
+        from src.knowledge.pipeline.config import PipelinePoliteness
+        
+        source = MockCheckedSource(
+            name="s",
+            url="https://a.example/s",
+            last_checked=datetime.now(timezone.utc) - timedelta(days=1),
+            change_history=[[86400, 0]] * 10,
+        )
+        
+        self._check(source, "unchanged")
+        adaptive_next = source.next_check_after
+        source.last_observed_at = datetime.now(timezone.utc) - timedelta(days=1)
+        static = PipelinePoliteness(check_jitter_minutes=0, adaptive_check_intervals=False)
+        self._check(source, "unchanged", static)
+        
+        assert adaptive_next - datetime.now(timezone.utc) > timedelta(days=7)
+        assert source.next_check_after - datetime.now(timezone.utc) <= timedelta(days=1)
@@ -150,6 +150,8 @@ class TestRunPipeline:
         
         assert isinstance(result, PipelineResult)
         assert result.completed_at is not None
+        # Registry writes for the whole run are batched
+        mock_registry.batch.assert_called_once()
     
     def test_uses_default_config(self):
         """Uses default config when none provided."""
@@ -215,7 +215,58 @@ class TestDomainScheduler:
         
         cooldown = scheduler.get_domain_cooldown("never-accessed.com")
         assert cooldown == 0.0
-    
+
+    def test_claim_domain_is_exclusive(self) -> None:
+        """Test a claimed domain cannot be claimed again until released."""
+        scheduler = DomainScheduler(politeness=PipelinePoliteness())
+
+        assert scheduler.claim_domain("example.com")
+        assert not scheduler.claim_domain("example.com")
+        assert scheduler.claim_domain("other.org")
+
+        scheduler.release_domain("example.com")
+        assert not scheduler.is_domain_in_flight("example.com")
+        assert scheduler.get_domain_cooldown("example.com") > 1.5
+        assert scheduler.claim_domain("example.com")
+
+    def test_release_without_request_skips_cooldown(self) -> None:
+        """Test releasing an unused claim does not start a cooldown."""
+        scheduler = DomainScheduler(politeness=PipelinePoliteness())
+
+        scheduler.claim_domain("example.com")
+        scheduler.release_domain("example.com", requested=False)
+
+        assert scheduler.get_domain_cooldown("example.com") == 0.0
+
+    def test_crawl_delay_stretches_cooldown(self) -> None:
+        """Test a robots.txt Crawl-delay longer than the interval is honoured."""
+        scheduler = DomainScheduler(politeness=PipelinePoliteness())
+
+        scheduler.set_crawl_delay("example.com", 30)
+        scheduler.record_request("example.com")
+        assert scheduler.get_domain_cooldown("example.com") > 29
+
+        ignoring = DomainScheduler(politeness=PipelinePoliteness(respect_robots_crawl_delay=False))
+        ignoring.set_crawl_delay("example.com", 30)
+        ignoring.record_request("example.com")
+        assert ignoring.get_domain_cooldown("example.com") <= 2.0
+
+    def test_reserve_pages_respects_budgets(self) -> None:
+        """Test page reservations stop at the per-domain and per-run limits."""
+        politeness = PipelinePoliteness(
+            max_domain_requests_per_run=10,
+            max_total_requests_per_run=15,
+        )
+        scheduler = DomainScheduler(politeness=politeness)
+
+        assert scheduler.reserve_pages("example.com", 8) == 8
+        assert scheduler.reserve_pages("example.com", 8) == 2
+        assert scheduler.reserve_pages("other.org", 8) == 5
+        assert scheduler.reserve_pages("third.net", 1) == 0
+
+        scheduler.return_pages("other.org", 3)
+        assert scheduler.reserve_pages("third.net", 5) == 3
+
     def test_domains_with_pending(self) -> None:
         """Test tracking domains with remaining sources."""
         politeness = PipelinePoliteness(
@@ -283,6 +334,7 @@ class TestJitterCalculation:
         """Create a mock SourceEntry."""
         source = MagicMock()
         source.update_frequency = frequency
+        source.change_history = []
         return source
     
     def test_adds_base_interval(self) -> None:
@@ -323,3 +375,30 @@ class TestJitterCalculation:
         
         # Daily should be sooner than weekly
         assert d_result < w_result
+    
+    def test_adaptive_interval_follows_history(self) -> None:
+        """With bounds given, a source that never changes is checked later."""
+        source = self._make_source("daily")
+        source.change_history = [[86400, 0]] * 10
+        bounds = {"min_interval": timedelta(hours=6), "max_interval": timedelta(days=30)}
+        
+        now = datetime.now(timezone.utc)
+        static = calculate_next_check_with_jitter(source, jitter_minutes=0)
+        adaptive = calculate_next_check_with_jitter(source, jitter_minutes=0, **bounds)
+        
+        assert static - now <= timedelta(days=1, minutes=1)
+        assert adaptive - now > timedelta(days=7)
+    
+    def test_adaptive_interval_without_history_is_static(self) -> None:
+        """A source with no history keeps its frequency's interval."""
+        source = self._make_source("weekly")
+        
+        now = datetime.now(timezone.utc)
+        result = calculate_next_check_with_jitter(
+            source,
+            jitter_minutes=0,
+            min_interval=timedelta(hours=6),
+            max_interval=timedelta(days=30),
+        )
+        
+        assert timedelta(days=6, hours=23) <= result - now <= timedelta(days=7, hours=1)
@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -500,48 +507,93 @@ class TestCheckSourceInitialMode:
 class TestCheckSourceUpdateMode:
     """Tests for check_source in update monitoring mode."""
 
-    def test_unchanged_etag_returns_unchanged(
+    def test_sends_stored_validators(
         self,
         mock_registry: MagicMock,
         sample_source: SourceEntry,
     ) -> None:
-        """Matching ETag should return unchanged status."""
+        """The stored ETag and Last-Modified go out as conditional headers."""
         monitor = SourceMonitor(registry=mock_registry)
+        sample_source.last_modified_header = "Wed, 01 Jan 2025 00:00:00 GMT"
         
         mock_response = MagicMock()
-        mock_response.headers = {"ETag": sample_source.last_etag}
-        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.status_code = 304
         
-        with patch.object(monitor._session, "head", return_value=mock_response):
+        with patch.object(monitor._session, "get", return_value=mock_response) as mock_get:
+            monitor.check_source(sample_source)
+            
+            assert mock_get.call_args.kwargs["headers"] == {
+                "If-None-Match": sample_source.last_etag,
+                "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+            }
+
+    def test_not_modified_returns_unchanged(
+        self,
+        mock_registry: MagicMock,
+        sample_source: SourceEntry,
+    ) -> None:
+        """A 304 response is unchanged without reading a body."""
+        monitor = SourceMonitor(registry=mock_registry)
+        
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.status_code = 304
+        
+        with patch.object(monitor._session, "head") as mock_head, \
+                patch.object(monitor._session, "get", return_value=mock_response) as mock_get:
             result = monitor.check_source(sample_source)
             
             assert result.status == "unchanged"
+            assert result.http_status == 304
             assert result.etag == sample_source.last_etag
+            assert result.content_hash is None
+            mock_get.assert_called_once()
+            mock_head.assert_not_called()
 
     def test_changed_etag_triggers_hash_check(
         self,
         mock_registry: MagicMock,
         sample_source: SourceEntry,
     ) -> None:
-        """Changed ETag should trigger content hash verification."""
+        """A full response to a conditional GET is verified by content hash."""
         monitor = SourceMonitor(registry=mock_registry)
         
-        head_response = MagicMock()
-        head_response.headers = {"ETag": '"new-etag"'}
-        head_response.status_code = 200
-        
         get_response = MagicMock()
         get_response.headers = {"ETag": '"new-etag"', "Last-Modified": "new-date"}
         get_response.status_code = 200
-        get_response.content = b"new content here"
+        get_response.iter_content.return_value = [b"new content here"]
         
-        with patch.object(monitor._session, "head", return_value=head_response):
-            with patch.object(monitor._session, "get", return_value=get_response):
-                result = monitor.check_source(sample_source)
-                
-                # Should have done a GET to verify content
-                monitor._session.get.assert_called_once()
-                assert result.content_hash is not None
+        with patch.object(monitor._session, "get", return_value=get_response):
+            result = monitor.check_source(sample_source)
+            
+            # One GET both asks for changes and returns the content to verify
+            monitor._session.get.assert_called_once()
+            assert result.status == "changed"
+            assert result.etag == '"new-etag"'
+            assert result.content_hash is not None
+
+    def test_new_etag_with_same_content_is_unchanged(
+        self,
+        mock_registry: MagicMock,
+        sample_source: SourceEntry,
+    ) -> None:
+        """A changed ETag over identical content is not a change."""
+        from src.parsing import utils
+        
+        monitor = SourceMonitor(registry=mock_registry)
+        sample_source.last_content_hash = utils.sha256_bytes(b"same content")
+        
+        get_response = MagicMock()
+        get_response.headers = {"ETag": '"rotated-etag"'}
+        get_response.status_code = 200
+        get_response.iter_content.return_value = [b"same content"]
+        
+        with patch.object(monitor._session, "get", return_value=get_response):
+            result = monitor.check_source(sample_source)
+            
+            assert result.status == "unchanged"
+            assert result.etag == '"rotated-etag"'
 
     def test_unchanged_content_hash(
         self,
@@ -562,13 +614,14 @@ class TestCheckSourceUpdateMode:
         get_response = MagicMock()
         get_response.headers = {}
         get_response.status_code = 200
-        get_response.content = test_content
+        get_response.iter_content.return_value = [test_content]
         
-        with patch.object(monitor._session, "get", return_value=get_response):
+        with patch.object(monitor._session, "get", return_value=get_response) as mock_get:
             result = monitor.check_source(sample_source, force_full=True)
             
             assert result.status == "unchanged"
             assert result.content_hash == expected_hash
+            assert mock_get.call_args.kwargs["headers"] == {}
 
     def test_changed_content_hash(
         self,
@@ -583,7 +636,7 @@ class TestCheckSourceUpdateMode:
         get_response = MagicMock()
         get_response.headers = {}
         get_response.status_code = 200
-        get_response.content = b"completely different content"
+        get_response.iter_content.return_value = [b"completely different content"]
         
         with patch.object(monitor._session, "get", return_value=get_response):
             result = monitor.check_source(sample_source, force_full=True)
@@ -592,6 +645,230 @@ class TestCheckSourceUpdateMode:
             assert result.detection_method == "content_hash"
 
 
+class TestCheckSourceStreaming:
+    """Tests for streamed, size-capped body hashing."""
+
+    def _response(self, *chunks: bytes) -> MagicMock:
+        response = MagicMock()
+        response.headers = {}
+        response.status_code = 200
+        response.iter_content.return_value = list(chunks)
+        return response
+
+    def test_body_is_streamed_and_closed(
+        self,
+        mock_registry: MagicMock,
+        sample_source: SourceEntry,
+    ) -> None:
+        """The GET streams, chunks are hashed as one body, and the response is closed."""
+        monitor = SourceMonitor(registry=mock_registry)
+        sample_source.last_content_hash = hashlib.sha256(b"abcdef").hexdigest()
+        response = self._response(b"abc", b"def")
+
+        with patch.object(monitor._session, "get", return_value=response) as mock_get:
+            result = monitor.check_source(sample_source)
+
+        assert result.status == "unchanged"
+        assert result.content_hash_bytes is None
+        assert mock_get.call_args.kwargs["stream"] is True
+        response.close.assert_called_once()
+
+    def test_long_body_gets_truncated_hash(
+        self,
+        mock_registry: MagicMock,
+        sample_source: SourceEntry,
+    ) -> None:
+        """Only max_hash_bytes are hashed, and the result says so."""
+        monitor = SourceMonitor(registry=mock_registry, max_hash_bytes=4)
+        response = self._response(b"abc", b"def", b"ghi")
+
+        with patch.object(monitor._session, "get", return_value=response):
+            result = monitor.check_source(sample_source)
+
+        assert result.status == "changed"
+        assert result.content_hash == hashlib.sha256(b"abcd").hexdigest()
+        assert result.content_hash_bytes == 4
+        assert result.to_dict()["content_hash_bytes"] == 4
+
+    def test_truncated_hash_compares_same_prefix(
+        self,
+        mock_registry: MagicMock,
+        sample_source: SourceEntry,
+    ) -> None:
+        """A stored prefix hash is compared over the same number of bytes."""
+        monitor = SourceMonitor(registry=mock_registry)
+        sample_source.last_content_hash = hashlib.sha256(b"abcd").hexdigest()
+        sample_source.last_content_hash_bytes = 4
+        response = self._response(b"abc", b"def-grown-since")
+
+        with patch.object(monitor._session, "get", return_value=response):
+            result = monitor.check_source(sample_source)
+
+        assert result.status == "unchanged"
+        assert result.content_hash_bytes == 4
+
+    def test_trickling_body_hits_deadline(
+        self,
+        mock_registry: MagicMock,
+        sample_source: SourceEntry,
+    ) -> None:
+        """A server trickling bytes is cut off at the deadline, not when it stops."""
+        monitor = SourceMonitor(registry=mock_registry, hash_deadline_seconds=1)
+
+        with _local_server(_TrickleHandler) as base_url:
+            sample_source.url = f"{base_url}/slow"
+            started = time.monotonic()
+            result = monitor.check_source(sample_source)
+            elapsed = time.monotonic() - started
+
+        assert result.status == "error"
+        assert "1s" in result.error_message
+        assert elapsed < 3
+
+    def test_encoded_body_is_hashed_decoded(
+        self,
+        mock_registry: MagicMock,
+        sample_source: SourceEntry,
+    ) -> None:
+        """A gzip-encoded body read from a real server hashes as its content."""
+        monitor = SourceMonitor(registry=mock_registry)
+
+        with _local_server(_GzipHandler) as base_url:
+            sample_source.url = f"{base_url}/report.bin"
+            result = monitor.check_source(sample_source)
+
+        assert result.status == "changed"
+        assert result.content_hash == hashlib.sha256(_GzipHandler.BODY).hexdigest()
+
+
+class _TrickleHandler(BaseHTTPRequestHandler):
+    """Sends one body byte every 250 ms, far slower than the deadline allows."""
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", "100")
+        self.end_headers()
+        try:
+            for _ in range(100):
+                self.wfile.write(b"x")
+                self.wfile.flush()
+                time.sleep(0.25)
+        except OSError:
+            pass
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+
+class _GzipHandler(BaseHTTPRequestHandler):
+    """Serves a fixed body with gzip Content-Encoding."""
+
+    BODY = b"%PDF-1.7 " + b"quarterly figures " * 10_000
+
+    def do_GET(self) -> None:
+        body = gzip.compress(self.BODY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+
+@contextmanager
+def _local_server(handler: type[BaseHTTPRequestHandler]) -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+class TestCheckSourceFingerprint:
+    """Tests for comparing HTML bodies by content fingerprint."""
+
+    PAGE = (
+        "<html><head><script nonce='{nonce}'></script></head><body><main>"
+        "<h1>Release notes</h1><p>Updated {stamp}</p>"
+        "<p>The parser now keeps table captions and drops empty list items "
+        "from the extracted text. Rendering falls back to static HTML when "
+        "the browser is unavailable, and robots rules are cached per host.</p>"
+        "</main></body></html>"
+    )
+
+    def _response(self, html: str) -> MagicMock:
+        response = MagicMock()
+        response.headers = {"Content-Type": "text/html; charset=utf-8"}
+        response.encoding = "utf-8"
+        response.status_code = 200
+        response.iter_content.return_value = [html.encode("utf-8")]
+        return response
+
+    def test_volatile_markup_is_unchanged(
+        self,
+        mock_registry: MagicMock,
+        sample_source: SourceEntry,
+    ) -> None:
+        """A new nonce and timestamp keep the fingerprint, so no change."""
+        from src.parsing.content_fingerprint import html_fingerprint
+
+        monitor = SourceMonitor(registry=mock_registry)
+        stored = self.PAGE.format(nonce="a1b2c3d4e5f6a7b8c9d0", stamp="10:30 am")
+        sample_source.last_content_fingerprint = html_fingerprint(stored, sample_source.url)
+        response = self._response(self.PAGE.format(nonce="0d9c8b7a6f5e4d3c2b1a", stamp="11:45 am"))
+
+        with patch.object(monitor._session, "get", return_value=response):
+            result = monitor.check_source(sample_source)
+
+        assert result.status == "unchanged"
+        assert result.content_fingerprint == sample_source.last_content_fingerprint
+        assert result.content_hash != sample_source.last_content_hash
+
+    def test_text_edit_is_changed(
+        self,
+        mock_registry: MagicMock,
+        sample_source: SourceEntry,
+    ) -> None:
+        """An edit to the main text is detected by fingerprint."""
+        from src.parsing.content_fingerprint import html_fingerprint
+
+        monitor = SourceMonitor(registry=mock_registry)
+        stored = self.PAGE.format(nonce="a1b2c3d4e5f6a7b8c9d0", stamp="10:30 am")
+        sample_source.last_content_fingerprint = html_fingerprint(stored, sample_source.url)
+        response = self._response(stored.replace("table captions", "figure captions"))
+
+        with patch.object(monitor._session, "get", return_value=response):
+            result = monitor.check_source(sample_source)
+
+        assert result.status == "changed"
+        assert result.detection_method == "content_fingerprint"
+
+    def test_without_stored_fingerprint_uses_hash(
+        self,
+        mock_registry: MagicMock,
+        sample_source: SourceEntry,
+    ) -> None:
+        """Sources acquired before fingerprints fall back to the content hash."""
+        monitor = SourceMonitor(registry=mock_registry)
+        response = self._response(self.PAGE.format(nonce="a1b2c3d4e5f6a7b8c9d0", stamp="10:30 am"))
+
+        with patch.object(monitor._session, "get", return_value=response):
+            result = monitor.check_source(sample_source)
+
+        assert result.status == "changed"
+        assert result.detection_method == "content_hash"
+        assert result.content_fingerprint is not None
+
+
 class TestCheckSourceErrors:
     """Tests for error handling in check_source."""
 
@@ -603,7 +880,7 @@ class TestCheckSourceErrors:
         """Timeout should return error status."""
         monitor = SourceMonitor(registry=mock_registry)
         
-        with patch.object(monitor._session, "head", side_effect=requests.Timeout()):
+        with patch.object(monitor._session, "get", side_effect=requests.Timeout()):
             result = monitor.check_source(sample_source)
             
             assert result.status == "error"
@@ -617,7 +894,7 @@ class TestCheckSourceErrors:
         """SSL error should return error status."""
         monitor = SourceMonitor(registry=mock_registry)
         
-        with patch.object(monitor._session, "head", side_effect=SSLError("cert error")):
+        with patch.object(monitor._session, "get", side_effect=SSLError("cert error")):
             result = monitor.check_source(sample_source)
             
             assert result.status == "error"
@@ -632,7 +909,7 @@ class TestCheckSourceErrors:
         monitor = SourceMonitor(registry=mock_registry)
         
         with patch.object(
-            monitor._session, "head",
+            monitor._session, "get",
             side_effect=requests.ConnectionError("connection refused"),
         ):
             result = monitor.check_source(sample_source)
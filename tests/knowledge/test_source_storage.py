@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
@@ -334,22 +334,30 @@ class TestSourceEntryMonitoringFields:
             content_type="pdf",
             update_frequency="weekly",
             last_content_hash="sha256-hash-here",
+            last_content_hash_bytes=4096,
+            last_content_fingerprint="fingerprint-here",
             last_etag='"weak-etag"',
             last_modified_header="Tue, 24 Dec 2025 08:00:00 GMT",
             last_checked=checked_at,
+            last_observed_at=checked_at - timedelta(hours=6),
             check_failures=1,
             next_check_after=next_check,
+            change_history=[[86400, 1], [172800, 0]],
         )
         
         data = original.to_dict()
         restored = SourceEntry.from_dict(data)
         
         assert restored.last_content_hash == original.last_content_hash
+        assert restored.last_content_hash_bytes == 4096
+        assert restored.last_content_fingerprint == "fingerprint-here"
         assert restored.last_etag == original.last_etag
         assert restored.last_modified_header == original.last_modified_header
         assert restored.last_checked == original.last_checked
+        assert restored.last_observed_at == original.last_observed_at
         assert restored.check_failures == original.check_failures
         assert restored.next_check_after == original.next_check_after
+        assert restored.change_history == [[86400, 1], [172800, 0]]
 
     def test_monitoring_fields_backward_compatibility(self) -> None:
         """from_dict should handle legacy payloads without monitoring fields."""
@@ -633,3 +641,232 @@ class TestSourceRegistry:
 
         assert retrieved is not None
         assert retrieved.url == sample_source_entry.url
+
+
+def _make_source(
+    url: str,
+    *,
+    status: str = "active",
+    next_check_after: datetime | None = None,
+) -> SourceEntry:
+    now = datetime(2025, 12, 20, tzinfo=timezone.utc)
+    return SourceEntry(
+        url=url,
+        name=url,
+        source_type="primary",
+        status=status,
+        last_verified=now,
+        added_at=now,
+        added_by="system",
+        proposal_discussion=None,
+        implementation_issue=None,
+        credibility_score=0.5,
+        is_official=False,
+        requires_auth=False,
+        discovered_from=None,
+        parent_source_url=None,
+        content_type="webpage",
+        update_frequency="daily",
+        next_check_after=next_check_after,
+    )
+
+
+class TestSourceRegistrySnapshot:
+    """Tests for the cached, indexed registry snapshot."""
+
+    def test_repeated_listing_reads_files_once(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Source files are parsed once, not on every list_sources call."""
+        writer = SourceRegistry(root=tmp_path)
+        for index in range(5):
+            writer.save_source(_make_source(f"https://site{index}.example/"))
+
+        reader = SourceRegistry(root=tmp_path)
+        reads: list[Path] = []
+        original = SourceRegistry._read_source_file
+
+        def counting(path: Path) -> SourceEntry | None:
+            reads.append(path)
+            return original(path)
+
+        monkeypatch.setattr(SourceRegistry, "_read_source_file", staticmethod(counting))
+        for _ in range(3):
+            assert len(reader.list_sources(status="active")) == 5
+
+        assert len(reads) == 5
+
+    def test_external_write_invalidates_snapshot(self, tmp_path: Path) -> None:
+        """A save from another registry instance is picked up on the next read."""
+        first = SourceRegistry(root=tmp_path)
+        first.save_source(_make_source("https://a.example/"))
+        assert len(first.list_sources()) == 1
+        generation = first.generation
+
+        SourceRegistry(root=tmp_path).save_source(_make_source("https://b.example/"))
+
+        assert {s.url for s in first.list_sources()} == {
+            "https://a.example/",
+            "https://b.example/",
+        }
+        assert first.generation > generation
+
+    def test_returned_entries_are_copies(self, tmp_path: Path) -> None:
+        """Mutating a listed entry does not change the registry until saved."""
+        registry = SourceRegistry(root=tmp_path)
+        registry.save_source(_make_source("https://a.example/"))
+
+        listed = registry.list_sources()[0]
+        listed.status = "deprecated"
+        listed.topics.append("mutated")
+
+        fresh = registry.get_source("https://a.example/")
+        assert fresh.status == "active"
+        assert fresh.topics == []
+        assert registry.list_sources(status="deprecated") == []
+
+    def test_status_index_follows_updates(self, tmp_path: Path) -> None:
+        """Changing status moves a source between status listings, in registry order."""
+        registry = SourceRegistry(root=tmp_path)
+        for name in ("a", "b", "c"):
+            registry.save_source(_make_source(f"https://{name}.example/"))
+        registry.list_sources()
+
+        registry.save_source(_make_source("https://a.example/", status="deprecated"))
+        registry.save_source(_make_source("https://a.example/"))
+
+        assert [s.url for s in registry.list_sources(status="active")] == [
+            "https://a.example/",
+            "https://b.example/",
+            "https://c.example/",
+        ]
+        assert registry.list_sources(status="deprecated") == []
+
+    def test_list_sources_by_domain(self, tmp_path: Path) -> None:
+        """Domain lookups ignore www. and ports, matching the scheduler."""
+        registry = SourceRegistry(root=tmp_path)
+        registry.save_source(_make_source("https://www.example.com/a"))
+        registry.save_source(_make_source("https://example.com:8443/b", status="deprecated"))
+        registry.save_source(_make_source("https://other.org/c"))
+
+        assert len(registry.list_sources_by_domain("example.com")) == 2
+        assert [s.url for s in registry.list_sources_by_domain("example.com", status="active")] == [
+            "https://www.example.com/a"
+        ]
+
+    def test_list_due_sources(self, tmp_path: Path) -> None:
+        """Due sources are those never scheduled or scheduled at or before now."""
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        registry = SourceRegistry(root=tmp_path)
+        registry.save_source(_make_source("https://never.example/"))
+        registry.save_source(
+            _make_source("https://past.example/", next_check_after=now - timedelta(hours=1))
+        )
+        registry.save_source(_make_source("https://exact.example/", next_check_after=now))
+        registry.save_source(
+            _make_source("https://future.example/", next_check_after=now + timedelta(hours=1))
+        )
+        registry.save_source(_make_source("https://inactive.example/", status="deprecated"))
+
+        due = registry.list_due_sources(now)
+
+        assert [s.url for s in due] == [
+            "https://never.example/",
+            "https://past.example/",
+            "https://exact.example/",
+        ]
+
+    def test_delete_updates_indexes(self, tmp_path: Path) -> None:
+        """Deleted sources disappear from every index."""
+        registry = SourceRegistry(root=tmp_path)
+        registry.save_source(_make_source("https://a.example/"))
+        registry.list_sources()
+
+        assert registry.delete_source("https://a.example/")
+
+        assert registry.list_sources() == []
+        assert registry.list_sources_by_domain("a.example") == []
+        assert registry.list_due_sources() == []
+
+
+class TestSourceRegistryBatch:
+    """Tests for buffered registry writes."""
+
+    def test_batch_writes_index_once(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """500 saves inside a batch produce a single registry.json write."""
+        import src.knowledge.storage as storage_module
+
+        renders: list[int] = []
+        original = storage_module._render_registry_index
+
+        def counting(index: dict[str, str]) -> str:
+            renders.append(len(index))
+            return original(index)
+
+        monkeypatch.setattr(storage_module, "_render_registry_index", counting)
+        registry = SourceRegistry(root=tmp_path)
+
+        with registry.batch():
+            for index in range(500):
+                registry.save_source(_make_source(f"https://site{index}.example/"))
+            # Buffered writes are visible to reads but not yet on disk
+            assert len(registry.list_sources()) == 500
+            assert not (tmp_path / "sources" / "registry.json").exists()
+
+        assert renders == [500]
+        reloaded = SourceRegistry(root=tmp_path)
+        assert len(reloaded.list_sources()) == 500
+
+    def test_repeated_saves_write_last_version(self, tmp_path: Path) -> None:
+        """A source saved several times in a batch is written once, as last saved."""
+        registry = SourceRegistry(root=tmp_path)
+        registry.begin_batch()
+        registry.save_source(_make_source("https://a.example/"))
+        registry.save_source(_make_source("https://a.example/", status="deprecated"))
+        registry.flush_all()
+
+        reloaded = SourceRegistry(root=tmp_path)
+        assert [s.status for s in reloaded.list_sources()] == ["deprecated"]
+
+    def test_batch_flushes_when_block_raises(self, tmp_path: Path) -> None:
+        """Progress made before an error is still persisted."""
+        registry = SourceRegistry(root=tmp_path)
+
+        with pytest.raises(RuntimeError):
+            with registry.batch():
+                registry.save_source(_make_source("https://a.example/"))
+                raise RuntimeError("boom")
+
+        assert SourceRegistry(root=tmp_path).source_exists("https://a.example/")
+
+    def test_delete_inside_batch(self, tmp_path: Path) -> None:
+        """Deletes are buffered alongside saves."""
+        registry = SourceRegistry(root=tmp_path)
+        registry.save_source(_make_source("https://a.example/"))
+
+        with registry.batch():
+            assert registry.delete_source("https://a.example/")
+            assert not registry.source_exists("https://a.example/")
+            assert not registry.delete_source("https://a.example/")
+            registry.save_source(_make_source("https://b.example/"))
+
+        reloaded = SourceRegistry(root=tmp_path)
+        assert reloaded.get_all_urls() == ["https://b.example/"]
+        assert not (tmp_path / "sources" / f"{_url_hash('https://a.example/')}.json").exists()
+
+    def test_nested_batches_flush_once(self, tmp_path: Path) -> None:
+        """Inner batch blocks defer to the outer one."""
+        registry = SourceRegistry(root=tmp_path)
+
+        with registry.batch():
+            with registry.batch():
+                registry.save_source(_make_source("https://a.example/"))
+            assert not (tmp_path / "sources" / "registry.json").exists()
+
+        assert (tmp_path / "sources" / "registry.json").exists()
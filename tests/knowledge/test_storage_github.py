@@ -61,6 +61,46 @@ class MockGitHubStorageClient:
 class TestSourceRegistryWithGitHubClient:
     """Tests for SourceRegistry with GitHubStorageClient."""
 
+    def test_batch_makes_single_commit(self, tmp_path: Path):
+        """A batch of saves becomes one commit with every source plus the index."""
+        mock_client = MockGitHubStorageClient()
+        registry = SourceRegistry(
+            root=tmp_path,
+            github_client=mock_client,
+            project_root=tmp_path,
+        )
+        now = datetime.now(timezone.utc)
+
+        with registry.batch():
+            for index in range(500):
+                registry.save_source(
+                    SourceEntry(
+                        url=f"https://example.com/{index}",
+                        name=f"Source {index}",
+                        source_type="derived",
+                        status="active",
+                        last_verified=now,
+                        added_at=now,
+                        added_by="test-user",
+                        proposal_discussion=None,
+                        implementation_issue=None,
+                        credibility_score=0.8,
+                        is_official=False,
+                        requires_auth=False,
+                        discovered_from=None,
+                        parent_source_url=None,
+                        content_type="webpage",
+                        update_frequency=None,
+                    )
+                )
+
+        assert len(mock_client.batch_commits) == 1
+        files, message = mock_client.batch_commits[0]
+        assert len(files) == 501
+        assert "500 changed" in message
+        index_data = json.loads(files[-1][1])
+        assert len(index_data["sources"]) == 500
+
     def test_save_source_uses_github_client_batch(self, tmp_path: Path):
         """Test that save_source uses batch commit when github_client is set."""
         mock_client = MockGitHubStorageClient()
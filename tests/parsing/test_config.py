@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from src import paths
 from src.parsing.config import ParsingConfig, load_parsing_config
 
@@ -60,4 +62,15 @@ def test_load_parsing_config_uses_default_location(monkeypatch, tmp_path) -> Non
 
     config = load_parsing_config(None)
 
-    assert config.output_root == (config_dir / "alt").resolve()
\ No newline at end of file
+    assert config.output_root == (config_dir / "alt").resolve()
+
+
+def test_load_parsing_config_manifest_backend(tmp_path) -> None:
+    yaml_path = tmp_path / "parsing.yaml"
+    yaml_path.write_text("manifest_backend: journal\n", encoding="utf-8")
+
+    assert load_parsing_config(yaml_path).manifest_backend == "journal"
+
+    yaml_path.write_text("manifest_backend: sqlite\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="manifest_backend"):
+        load_parsing_config(yaml_path)
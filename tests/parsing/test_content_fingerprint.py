@@ -0,0 +1,110 @@
+"""Unit tests for normalized content fingerprints."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.parsing.base import ParsedDocument, ParseTarget
+from src.parsing.content_fingerprint import (
+    document_fingerprint,
+    html_fingerprint,
+    normalize_text,
+    text_fingerprint,
+)
+from src.parsing.web import analyze_html
+
+ARTICLE = (
+    "The council approved the new transit budget after a long debate. "
+    "Funding for the northern line extension was increased, while two bus "
+    "routes will be merged next spring. Residents can comment on the plan "
+    "at the public library until the end of the month."
+)
+
+
+def _page(article: str, *, nonce: str, updated: str, ad: str) -> str:
+    return f"""<html><head><title>Transit budget</title>
+<script nonce="{nonce}">window.csrf = "{nonce}";</script></head>
+<body>
+<nav><a href="/">Home</a> <a href="/news">News</a></nav>
+<div class="ad" id="ad-{ad}"><a href="https://ads.example/{ad}">Sponsored offer {ad}</a></div>
+<main><article><h1>Transit budget approved</h1>
+<p>Last updated {updated}</p>
+<p>{article}</p>
+<p>{article}</p>
+</article></main>
+<form><input type="hidden" name="csrf" value="{nonce}"></form>
+<footer>Page generated {updated}</footer>
+</body></html>"""
+
+
+# =============================================================================
+# normalize_text Tests
+# =============================================================================
+
+
+class TestNormalizeText:
+    """Tests for volatile token removal."""
+
+    @pytest.mark.parametrize(
+        "volatile",
+        [
+            "2024-03-05",
+            "2024-03-05T10:30:00Z",
+            "2024-03-05 10:30:00+02:00",
+            "05/03/2024",
+            "March 5, 2024",
+            "5th Mar 2024",
+            "10:32 am",
+            "14:05:59",
+            "3 minutes ago",
+            "1700000000",
+            "3f2a9c1e-77b1-4a0e-9d2f-0b8e5a7c1d2e",
+            "dGhpcyBpcyBhIHNlY3JldCB0b2tlbjEyMw==",
+        ],
+    )
+    def test_volatile_tokens_removed(self, volatile: str) -> None:
+        """Dates, times, ages and opaque identifiers are dropped."""
+        assert normalize_text(f"Updated {volatile} by staff") == "Updated by staff"
+
+    def test_content_kept(self) -> None:
+        """Ordinary words and short numbers survive, whitespace collapses."""
+        assert normalize_text("Version 3.12\n\n  costs $40 in  2024") == "Version 3.12 costs $40 in 2024"
+
+
+# =============================================================================
+# Fingerprint Tests
+# =============================================================================
+
+
+class TestFingerprints:
+    """Tests for text, HTML and document fingerprints."""
+
+    def test_empty_text_has_no_fingerprint(self) -> None:
+        """Nothing to hash gives None."""
+        assert text_fingerprint(None) is None
+        assert text_fingerprint(" 2024-03-05 ") is None
+
+    def test_volatile_markup_does_not_change_fingerprint(self) -> None:
+        """Nonces, timestamps and ads leave the fingerprint alone."""
+        first = _page(ARTICLE, nonce="a1b2c3d4e5f6a7b8c9d0", updated="2024-03-05 10:30", ad="1")
+        second = _page(ARTICLE, nonce="f0e9d8c7b6a5f4e3d2c1", updated="2024-03-06 08:12", ad="2")
+
+        assert first != second
+        assert html_fingerprint(first) == html_fingerprint(second)
+
+    def test_content_edit_changes_fingerprint(self) -> None:
+        """An edit to the main text is a change."""
+        edited = ARTICLE.replace("two bus", "three bus")
+        first = _page(ARTICLE, nonce="a1b2c3d4e5f6a7b8c9d0", updated="2024-03-05 10:30", ad="1")
+        second = _page(edited, nonce="a1b2c3d4e5f6a7b8c9d0", updated="2024-03-05 10:30", ad="1")
+
+        assert html_fingerprint(first) != html_fingerprint(second)
+
+    def test_document_matches_html(self) -> None:
+        """A document split into segments fingerprints like its HTML."""
+        html = _page(ARTICLE, nonce="a1b2c3d4e5f6a7b8c9d0", updated="2024-03-05 10:30", ad="1")
+        document = ParsedDocument(target=ParseTarget(source="page.html"), checksum="x", parser_name="web")
+        text = analyze_html(html).text
+        document.extend_segments(block.strip() for block in text.split("\n\n") if block.strip())
+
+        assert document_fingerprint(document) == html_fingerprint(html)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from src.parsing import utils
+from src.parsing.fingerprints import RACY_WINDOW_NS, FingerprintCache, default_cache_path
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    past = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+def test_checksum_matches_sha256_and_is_cached(tmp_path) -> None:
+    document = tmp_path / "doc.pdf"
+    document.write_bytes(b"%PDF-1.7 sample")
+    _age(document)
+    cache = FingerprintCache(tmp_path / "cache.json")
+
+    first = cache.checksum(document)
+    with patch.object(utils, "sha256_path", side_effect=AssertionError("rehashed")):
+        second = cache.checksum(document)
+
+    assert first == second == utils.sha256_bytes(b"%PDF-1.7 sample")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_persists_across_instances(tmp_path) -> None:
+    document = tmp_path / "doc.pdf"
+    document.write_bytes(b"content")
+    _age(document)
+    cache_path = tmp_path / "cache.json"
+
+    cache = FingerprintCache(cache_path)
+    checksum = cache.checksum(document)
+    cache.save()
+
+    reloaded = FingerprintCache(cache_path)
+    with patch.object(utils, "sha256_path", side_effect=AssertionError("rehashed")):
+        assert reloaded.checksum(document) == checksum
+    assert len(reloaded) == 1
+
+
+def test_changed_file_is_rehashed(tmp_path) -> None:
+    document = tmp_path / "doc.pdf"
+    document.write_bytes(b"before")
+    _age(document, 120)
+    cache = FingerprintCache(None)
+    cache.checksum(document)
+
+    document.write_bytes(b"after!")
+    _age(document, 60)
+
+    assert cache.checksum(document) == utils.sha256_bytes(b"after!")
+    assert cache.misses == 2
+
+
+def test_recently_modified_files_are_not_cached(tmp_path) -> None:
+    document = tmp_path / "doc.pdf"
+    document.write_bytes(b"fresh")
+    cache = FingerprintCache(None)
+
+    cache.checksum(document)
+
+    assert RACY_WINDOW_NS > 0
+    assert len(cache) == 0
+
+
+def test_unreadable_cache_file_is_ignored(tmp_path) -> None:
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text("{not json", encoding="utf-8")
+
+    assert len(FingerprintCache(cache_path)) == 0
+
+
+def test_save_drops_missing_files(tmp_path) -> None:
+    kept, removed = tmp_path / "kept.pdf", tmp_path / "removed.pdf"
+    for document in (kept, removed):
+        document.write_bytes(document.name.encode())
+        _age(document)
+    cache_path = tmp_path / "cache.json"
+    cache = FingerprintCache(cache_path)
+    cache.checksum(kept)
+    cache.checksum(removed)
+    cache.save()
+
+    removed.unlink()
+    reloaded = FingerprintCache(cache_path)
+    reloaded.save()
+
+    assert len(reloaded) == 1
+    assert len(FingerprintCache(cache_path)) == 1
+
+
+def test_default_cache_path_is_outside_output_root(tmp_path) -> None:
+    root = tmp_path / "evidence" / "parsed"
+
+    path = default_cache_path(root)
+
+    assert root not in path.parents
+    assert path == tmp_path / "evidence" / ".parse-cache" / "parsed.fingerprints.json"
+
+
+def test_sha256_path_large_file_matches_chunked_digest(tmp_path) -> None:
+    payload = os.urandom(utils._MMAP_THRESHOLD + 12345)
+    path = tmp_path / "large.bin"
+    path.write_bytes(payload)
+
+    assert utils.sha256_path(path) == utils.sha256_bytes(payload)
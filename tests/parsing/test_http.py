@@ -0,0 +1,88 @@
+"""Tests for pooled static HTTP fetching."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from src.parsing.http import StaticFetchError, fetch_static, get_session
+
+
+def _session_returning(
+    body: bytes,
+    *,
+    status: int = 200,
+    content_type: str = "text/html; charset=utf-8",
+    encoding: str | None = "utf-8",
+) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status
+    response.headers = {"Content-Type": content_type}
+    response.encoding = encoding
+    response.url = "https://example.com/final"
+    response.iter_content.return_value = [body[i:i + 4] for i in range(0, len(body), 4)]
+    session = MagicMock()
+    session.get.return_value = response
+    return session
+
+
+class TestFetchStatic:
+    """Tests for fetch_static."""
+
+    def test_returns_decoded_html(self) -> None:
+        """Successful responses are decoded and closed."""
+        session = _session_returning("<p>café</p>".encode("utf-8"))
+
+        page = fetch_static("https://example.com", user_agent="UA", session=session)
+
+        assert page.html == "<p>café</p>"
+        assert page.final_url == "https://example.com/final"
+        assert page.content_type == "text/html"
+        assert session.get.call_args.kwargs["headers"]["User-Agent"] == "UA"
+        session.get.return_value.close.assert_called_once()
+
+    def test_ignores_default_latin1_without_charset(self) -> None:
+        """UTF-8 bodies decode correctly when no charset is declared."""
+        session = _session_returning(
+            "<p>—</p>".encode("utf-8"), content_type="text/html", encoding="ISO-8859-1"
+        )
+
+        page = fetch_static("https://example.com", user_agent="UA", session=session)
+
+        assert page.html == "<p>—</p>"
+
+    def test_raises_on_http_error(self) -> None:
+        """4xx/5xx responses are reported as StaticFetchError."""
+        session = _session_returning(b"", status=503)
+
+        with pytest.raises(StaticFetchError, match="HTTP 503"):
+            fetch_static("https://example.com", user_agent="UA", session=session)
+
+    def test_rejects_non_html(self) -> None:
+        """Non-HTML content is left to other parsers."""
+        session = _session_returning(b"%PDF", content_type="application/pdf")
+
+        with pytest.raises(StaticFetchError, match="content type"):
+            fetch_static("https://example.com", user_agent="UA", session=session)
+
+    def test_enforces_size_cap(self) -> None:
+        """Bodies over max_bytes are rejected without buffering them all."""
+        session = _session_returning(b"x" * 64)
+
+        with pytest.raises(StaticFetchError, match="exceeds"):
+            fetch_static("https://example.com", user_agent="UA", session=session, max_bytes=16)
+
+    def test_wraps_request_errors(self) -> None:
+        """Connection failures surface as StaticFetchError."""
+        session = MagicMock()
+        session.get.side_effect = requests.ConnectionError("refused")
+
+        with pytest.raises(StaticFetchError, match="refused"):
+            fetch_static("https://example.com", user_agent="UA", session=session)
+
+
+def test_shared_session_is_reused() -> None:
+    """get_session returns one pooled session per process."""
+    assert get_session() is get_session()
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest.mock import MagicMock
+
 import pytest
+import requests
 
 from src.parsing.link_extractor import (
     ExtractedLink,
     LinkExtractor,
     count_links,
     extract_links,
+    extract_links_from_tree,
     extract_title,
+    extract_title_from_tree,
     extract_urls,
     filter_links_by_scope,
 )
@@ -19,6 +29,7 @@ from src.parsing.robots import (
     RobotsTxt,
     RobotsChecker,
     parse_robots_txt,
+    robots_from_response,
 )
 
 
@@ -271,6 +282,37 @@ class TestConvenienceFunctions:
         
         assert title == "Page Title"
 
+    def test_tree_extraction_matches_string_extraction(self) -> None:
+        """Tree-based extraction should agree with the HTMLParser path."""
+        from lxml import html as lxml_html
+
+        html = (
+            '<html><head><title> Tree Title </title><base href="/docs/">'
+            '<link rel="canonical" href="https://example.com/docs/"></head><body>'
+            '<a href="intro">Intro <b>page</b></a>'
+            '<a href="mailto:a@example.com">Mail</a>'
+            '<a href="intro#top">Dup</a>'
+            '<area href="/map"><a rel="nofollow" href="https://other.com/">Out</a>'
+            '</body></html>'
+        )
+        tree = lxml_html.document_fromstring(html)
+
+        from_tree = extract_links_from_tree(tree, "https://example.com/")
+        from_string = extract_links(html, "https://example.com/")
+
+        assert sorted(link.url for link in from_tree) == sorted(link.url for link in from_string)
+        intro = next(link for link in from_tree if link.url.endswith("/docs/intro"))
+        assert intro.anchor_text == "Intro page"
+        assert any(link.is_nofollow for link in from_tree)
+        assert extract_title_from_tree(tree) == "Tree Title"
+
+    def test_extract_title_from_tree_not_found(self) -> None:
+        """extract_title_from_tree should return None if no title."""
+        from lxml import html as lxml_html
+
+        tree = lxml_html.document_fromstring("<html><body><p>x</p></body></html>")
+        assert extract_title_from_tree(tree) is None
+
     def test_filter_links_by_scope(self) -> None:
         """filter_links_by_scope should separate in-scope and out-of-scope."""
         links = [
@@ -408,6 +450,41 @@ class TestRobotRuleset:
         assert ruleset.is_allowed("/admin") is False
 
 
+    def test_compiled_rules_match_rule_by_rule_evaluation(self) -> None:
+        """Indexed lookup agrees with checking every rule in priority order."""
+        rules = [
+            RobotRule(path="/", allowed=True),
+            RobotRule(path="/docs", allowed=False),
+            RobotRule(path="/docs/public", allowed=True),
+            RobotRule(path="/docs/*.pdf", allowed=True),
+            RobotRule(path="/*/private/", allowed=False),
+            RobotRule(path="/docs/public/draft$", allowed=False),
+            RobotRule(path="/search?", allowed=False),
+            RobotRule(path="/a", allowed=True),
+            RobotRule(path="/a", allowed=False),
+        ]
+        ruleset = RobotRuleset(user_agent="*", rules=rules)
+        paths = [
+            "/", "/a", "/ab", "/docs", "/docs/", "/docs/guide.pdf", "/docs/public",
+            "/docs/public/draft", "/docs/public/draft/1", "/x/private/y", "/docs/private/",
+            "/search", "/search?q=1", "/docs/public/private/",
+        ]
+        
+        for path in paths:
+            matching = [rule for rule in rules if rule.matches(path)]
+            expected = max(matching, key=lambda rule: (len(rule.path), rule.allowed)).allowed
+            assert ruleset.is_allowed(path) is expected, path
+
+    def test_rules_appended_after_first_check_are_used(self) -> None:
+        """Rules added after the ruleset was compiled are still applied."""
+        ruleset = RobotRuleset(user_agent="*", rules=[RobotRule(path="/admin", allowed=False)])
+        assert ruleset.is_allowed("/private") is True
+        
+        ruleset.rules.append(RobotRule(path="/private", allowed=False))
+        
+        assert ruleset.is_allowed("/private") is False
+
+
 # =============================================================================
 # parse_robots_txt Tests
 # =============================================================================
@@ -627,3 +704,129 @@ Disallow: /admin
         
         assert checker.is_allowed("https://example.com/mybot-only") is False
         assert checker.is_allowed("https://example.com/admin") is True  # Uses MyBot rules
+
+
+
+# =============================================================================
+# robots.txt Fetching Tests
+# =============================================================================
+
+
+def _session(status: int = 200, content: str = "", error: Exception | None = None) -> MagicMock:
+    """Session whose GET returns one canned robots.txt response."""
+    session = MagicMock()
+    if error is not None:
+        session.get.side_effect = error
+    else:
+        response = MagicMock(status_code=status)
+        response.iter_content.return_value = [content.encode("utf-8")]
+        session.get.return_value = response
+    return session
+
+
+class TestRobotsFetching:
+    """Tests for fetching and caching robots.txt per host."""
+
+    def test_fetches_once_per_host(self) -> None:
+        """robots.txt is downloaded on first use and then reused."""
+        session = _session(200, "User-agent: *\nDisallow: /admin\nCrawl-delay: 3")
+        checker = RobotsChecker("TestBot", fetch=True, session=session)
+        
+        assert checker.is_allowed("https://example.com/admin/x") is False
+        assert checker.is_allowed("https://example.com/page") is True
+        assert checker.get_crawl_delay("https://example.com/") == 3.0
+        session.get.assert_called_once()
+        assert session.get.call_args.args[0] == "https://example.com/robots.txt"
+        assert session.get.call_args.kwargs["headers"]["User-Agent"] == "TestBot"
+
+    def test_concurrent_first_hits_fetch_once(self) -> None:
+        """Threads sharing a checker wait for one fetch of a new host."""
+        session = _session(200, "User-agent: *\nDisallow: /admin")
+        started = threading.Event()
+        
+        def slow_get(*args, **kwargs):
+            started.set()
+            time.sleep(0.1)
+            return session.get.return_value
+        
+        session.get.side_effect = slow_get
+        checker = RobotsChecker(fetch=True, session=session)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            allowed = list(pool.map(checker.is_allowed, ["https://example.com/admin"] * 4))
+        
+        assert started.is_set()
+        assert allowed == [False] * 4
+        session.get.assert_called_once()
+
+    def test_sitemaps_from_fetched_robots(self) -> None:
+        """Sitemap lines of the host's robots.txt are returned."""
+        session = _session(200, "User-agent: *\nDisallow:\nSitemap: https://example.com/sitemap_index.xml")
+        checker = RobotsChecker(fetch=True, session=session)
+        
+        assert checker.get_sitemaps("https://example.com/docs/") == ["https://example.com/sitemap_index.xml"]
+        assert RobotsChecker().get_sitemaps("https://example.com/") == []
+
+    @pytest.mark.parametrize(
+        ("status", "error", "allowed"),
+        [
+            (404, None, True),
+            (403, None, True),
+            (429, None, False),
+            (503, None, False),
+            (200, requests.ConnectionError("refused"), False),
+        ],
+    )
+    def test_status_handling(self, status: int, error: Exception | None, allowed: bool) -> None:
+        """4xx means no rules; 5xx, 429 and network errors disallow all."""
+        checker = RobotsChecker(fetch=True, session=_session(status, error=error))
+        
+        assert checker.is_allowed("https://example.com/page") is allowed
+
+    def test_disk_cache_survives_new_checker(self, tmp_path) -> None:
+        """A fresh on-disk copy is used without fetching again."""
+        first = RobotsChecker(fetch=True, cache_dir=tmp_path, session=_session(200, "User-agent: *\nDisallow: /x"))
+        assert first.is_allowed("https://example.com/x") is False
+        
+        session = _session(200, "")
+        second = RobotsChecker(fetch=True, cache_dir=tmp_path, session=session)
+        
+        assert second.is_allowed("https://example.com/x") is False
+        session.get.assert_not_called()
+
+    def test_expired_cache_is_refetched(self, tmp_path) -> None:
+        """An expired copy is replaced by a new download."""
+        first = RobotsChecker(
+            fetch=True,
+            cache_dir=tmp_path,
+            ttl=timedelta(0),
+            session=_session(200, "User-agent: *\nDisallow: /x"),
+        )
+        first.is_allowed("https://example.com/x")
+        
+        second = RobotsChecker(fetch=True, cache_dir=tmp_path, session=_session(200, "User-agent: *\nDisallow: /y"))
+        
+        assert second.is_allowed("https://example.com/x") is True
+        assert second.is_allowed("https://example.com/y") is False
+        cached = json.loads(next(tmp_path.glob("*.json")).read_text(encoding="utf-8"))
+        assert cached["status"] == 200
+        assert "Disallow: /y" in cached["content"]
+
+    def test_unreachable_host_keeps_stale_copy(self, tmp_path) -> None:
+        """A server error falls back to the last good robots.txt."""
+        first = RobotsChecker(
+            fetch=True,
+            cache_dir=tmp_path,
+            ttl=timedelta(0),
+            session=_session(200, "User-agent: *\nDisallow: /x"),
+        )
+        first.is_allowed("https://example.com/x")
+        
+        second = RobotsChecker(fetch=True, cache_dir=tmp_path, session=_session(500))
+        
+        assert second.is_allowed("https://example.com/x") is False
+        assert second.is_allowed("https://example.com/page") is True
+
+    def test_only_successful_responses_are_parsed(self) -> None:
+        """Only successful responses are parsed."""
+        assert robots_from_response(200, "User-agent: *\nDisallow: /").is_allowed("https://e.com/a") is False
+        assert robots_from_response(410, "User-agent: *\nDisallow: /").is_allowed("https://e.com/a") is True
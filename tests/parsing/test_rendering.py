@@ -8,13 +8,42 @@ import pytest
 
 from src.parsing.rendering import (
     MIN_CONTENT_LENGTH,
+    BrowserPool,
     RenderingError,
     RenderedPage,
     is_playwright_available,
     needs_rendering,
+    render_page,
+    shared_browser_pool,
 )
 
 
+def _fake_playwright(heap_bytes: int = 1024) -> MagicMock:
+    """Build a MagicMock standing in for ``sync_playwright()``."""
+    manager = MagicMock()
+    playwright = manager.start.return_value
+    browser = playwright.chromium.launch.return_value
+    browser.is_connected.return_value = True
+
+    def _new_context(**_kwargs):
+        context = MagicMock()
+
+        def _new_page():
+            page = MagicMock()
+            page.goto.return_value = MagicMock(status=200)
+            page.content.return_value = "<html><body>pooled</body></html>"
+            page.title.return_value = "Pooled"
+            page.url = "https://example.com/final"
+            page.evaluate.return_value = heap_bytes
+            return page
+
+        context.new_page.side_effect = _new_page
+        return context
+
+    browser.new_context.side_effect = _new_context
+    return manager
+
+
 class TestRenderedPage:
     """Tests for the RenderedPage dataclass."""
 
@@ -102,6 +131,22 @@ class TestNeedsRendering:
         long_text = "a" * 600  # Above the 500 SPA threshold
         assert needs_rendering(html, long_text) is False
 
+    def test_detects_noscript_notice(self) -> None:
+        """Returns True when the page asks readers to enable JavaScript."""
+        html = (
+            "<html><body><noscript>Please enable JavaScript to view this site."
+            "</noscript><main>teaser</main></body></html>"
+        )
+        assert needs_rendering(html, "a" * 300) is True
+        assert needs_rendering(html, "a" * 1200) is False
+
+    def test_detects_script_heavy_shell(self) -> None:
+        """Returns True for script-heavy pages with little extracted text."""
+        scripts = "".join(f'<script src="/chunk{i}.js"></script>' for i in range(20))
+        html = f"<html><body><div class='shell'></div>{scripts}</body></html>"
+        assert needs_rendering(html, "a" * 300) is True
+        assert needs_rendering("<html><body><script></script></body></html>", "a" * 300) is False
+
 
 class TestRenderPage:
     """Tests for the render_page function."""
@@ -161,3 +206,144 @@ class TestRenderAndExtractText:
             assert rendered.url == "https://example.com"
             # trafilatura may or may not extract depending on content
             assert isinstance(text, str)
+
+
+class TestBrowserPool:
+    """Tests for the pooled browser used across renders."""
+
+    def test_launches_browser_once_for_many_pages(self) -> None:
+        """Consecutive renders reuse one browser and context."""
+        manager = _fake_playwright()
+        with patch("playwright.sync_api.sync_playwright", return_value=manager):
+            with BrowserPool(recycle_after_pages=10) as pool:
+                for i in range(3):
+                    page = pool.render(f"https://example.com/{i}", user_agent="UA")
+                    assert page.html == "<html><body>pooled</body></html>"
+
+        browser = manager.start.return_value.chromium.launch.return_value
+        assert manager.start.call_count == 1
+        assert browser.new_context.call_count == 1
+        assert pool.pages_rendered == 3
+
+    def test_recycles_context_after_page_limit(self) -> None:
+        """A fresh context is created after recycle_after_pages renders."""
+        manager = _fake_playwright()
+        with patch("playwright.sync_api.sync_playwright", return_value=manager):
+            with BrowserPool(recycle_after_pages=2) as pool:
+                for i in range(5):
+                    pool.render(f"https://example.com/{i}", user_agent="UA")
+
+        browser = manager.start.return_value.chromium.launch.return_value
+        assert browser.new_context.call_count == 3
+        assert pool.contexts_recycled == 2
+
+    def test_recycles_context_over_memory_ceiling(self) -> None:
+        """A context whose JS heap exceeds the ceiling is replaced."""
+        manager = _fake_playwright(heap_bytes=64 * 1024 * 1024)
+        with patch("playwright.sync_api.sync_playwright", return_value=manager):
+            with BrowserPool(recycle_after_pages=100, max_memory_mb=32) as pool:
+                pool.render("https://example.com/a", user_agent="UA")
+                pool.render("https://example.com/b", user_agent="UA")
+
+        browser = manager.start.return_value.chromium.launch.return_value
+        assert browser.new_context.call_count == 2
+
+    def test_relaunches_disconnected_browser(self) -> None:
+        """A crashed browser is replaced on the next render."""
+        manager = _fake_playwright()
+        with patch("playwright.sync_api.sync_playwright", return_value=manager):
+            with BrowserPool() as pool:
+                pool.render("https://example.com/a", user_agent="UA")
+                browser = manager.start.return_value.chromium.launch.return_value
+                browser.is_connected.return_value = False
+                pool.render("https://example.com/b", user_agent="UA")
+
+        assert pool.browser_launches == 2
+
+    def test_http_error_raises_and_keeps_browser(self) -> None:
+        """HTTP errors surface as RenderingError without discarding the browser."""
+        manager = _fake_playwright()
+        browser = manager.start.return_value.chromium.launch.return_value
+        context = MagicMock()
+        page = context.new_page.return_value
+        page.goto.return_value = MagicMock(status=404)
+        browser.new_context.side_effect = None
+        browser.new_context.return_value = context
+
+        with patch("playwright.sync_api.sync_playwright", return_value=manager):
+            with BrowserPool() as pool:
+                with pytest.raises(RenderingError, match="HTTP 404"):
+                    pool.render("https://example.com/missing", user_agent="UA")
+                assert pool.is_running
+
+        page.close.assert_called_once()
+
+    def test_close_is_idempotent_and_blocks_use(self) -> None:
+        """Closing twice is safe and closed pools refuse to render."""
+        manager = _fake_playwright()
+        with patch("playwright.sync_api.sync_playwright", return_value=manager):
+            pool = BrowserPool()
+            pool.render("https://example.com/", user_agent="UA")
+            pool.close()
+            pool.close()
+
+            with pytest.raises(RenderingError, match="closed"):
+                pool.render("https://example.com/", user_agent="UA")
+
+        manager.start.return_value.stop.assert_called_once()
+
+    def test_rejects_use_from_other_thread(self) -> None:
+        """Sync Playwright objects must stay on their owning thread."""
+        import threading
+
+        manager = _fake_playwright()
+        errors: list[Exception] = []
+        with patch("playwright.sync_api.sync_playwright", return_value=manager):
+            with BrowserPool() as pool:
+                pool.render("https://example.com/", user_agent="UA")
+
+                def _worker() -> None:
+                    try:
+                        pool.render("https://example.com/other", user_agent="UA")
+                    except RenderingError as exc:
+                        errors.append(exc)
+
+                thread = threading.Thread(target=_worker)
+                thread.start()
+                thread.join()
+
+        assert errors and "thread" in str(errors[0])
+
+    def test_render_page_delegates_to_pool(self) -> None:
+        """render_page uses the pool instead of launching a browser."""
+        pool = MagicMock()
+        pool.render.return_value = RenderedPage(
+            url="https://example.com", final_url="https://example.com", html="<html></html>"
+        )
+
+        result = render_page("https://example.com", user_agent="UA", pool=pool)
+
+        assert result is pool.render.return_value
+        assert pool.render.call_args.kwargs["user_agent"] == "UA"
+
+
+class TestSharedBrowserPool:
+    """Tests for the shared_browser_pool context manager."""
+
+    def test_closes_pool_on_error(self) -> None:
+        """The pool is closed even when the block raises."""
+        with pytest.raises(ValueError):
+            with shared_browser_pool() as pool:
+                raise ValueError("boom")
+
+        with pytest.raises(RenderingError, match="closed"):
+            pool.render("https://example.com", user_agent="UA")
+
+    def test_restores_sigterm_handler(self) -> None:
+        """SIGTERM handling is only overridden inside the block."""
+        import signal
+
+        before = signal.getsignal(signal.SIGTERM)
+        with shared_browser_pool():
+            assert signal.getsignal(signal.SIGTERM) is not before
+        assert signal.getsignal(signal.SIGTERM) is before
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import sys
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from src.parsing.base import ParseTarget, ParsedDocument
 from src.parsing.registry import ParserRegistry
@@ -170,3 +174,228 @@ def test_scan_and_parse_respects_include_exclude(tmp_path) -> None:
 
     assert len(outcomes) == 1
     assert Path(outcomes[0].source).name == "keep.txt"
+
+
+class SlowTextParser(TextParser):
+    """Text parser that stalls on files whose content is ``hang``."""
+
+    def extract(self, target: ParseTarget) -> ParsedDocument:
+        if target.to_path().read_text(encoding="utf-8") == "hang":
+            import time
+
+            time.sleep(30)
+        return super().extract(target)
+
+
+class CrashingTextParser(TextParser):
+    """Text parser that kills its process on files whose content is ``crash``."""
+
+    def extract(self, target: ParseTarget) -> ParsedDocument:
+        if target.to_path().read_text(encoding="utf-8") == "crash":
+            import os
+
+            os._exit(3)
+        return super().extract(target)
+
+
+def _registry_with(parser: TextParser) -> ParserRegistry:
+    registry = ParserRegistry()
+    registry.register_parser(parser, suffixes=(".txt",), priority=5, replace=True)
+    return registry
+
+
+def test_scan_and_parse_with_workers_matches_sequential(tmp_path) -> None:
+    root = tmp_path / "docs"
+    root.mkdir()
+    for index in range(6):
+        (root / f"doc{index}.txt").write_text(f"document {index}", encoding="utf-8")
+    (root / "dup.txt").write_text("document 0", encoding="utf-8")
+
+    sequential = scan_and_parse(
+        root,
+        storage=ParseStorage(tmp_path / "seq"),
+        registry_override=make_registry(),
+        suffixes=(".txt",),
+    )
+    parallel_storage = ParseStorage(tmp_path / "par")
+    parallel = scan_and_parse(
+        root,
+        storage=parallel_storage,
+        registry_override=make_registry(),
+        suffixes=(".txt",),
+        workers=3,
+    )
+
+    def summary(outcomes):
+        return [(Path(o.source).name, o.status, o.checksum, o.message) for o in outcomes]
+
+    assert summary(parallel) == summary(sequential)
+    assert [o.status for o in parallel].count("skipped") == 1
+    assert len(parallel_storage.manifest().entries) == 6
+
+
+def test_scan_and_parse_with_workers_times_out_slow_documents(tmp_path) -> None:
+    root = tmp_path / "docs"
+    root.mkdir()
+    (root / "a.txt").write_text("fine", encoding="utf-8")
+    (root / "b.txt").write_text("hang", encoding="utf-8")
+    (root / "c.txt").write_text("also fine", encoding="utf-8")
+
+    outcomes = scan_and_parse(
+        root,
+        storage=ParseStorage(tmp_path / "artifacts"),
+        registry_override=_registry_with(SlowTextParser()),
+        suffixes=(".txt",),
+        workers=2,
+        document_timeout=0.5,
+    )
+
+    assert [o.status for o in outcomes] == ["completed", "error", "completed"]
+    assert "timed out" in outcomes[1].error
+
+
+def test_scan_and_parse_with_workers_reports_crashed_worker(tmp_path) -> None:
+    root = tmp_path / "docs"
+    root.mkdir()
+    (root / "a.txt").write_text("crash", encoding="utf-8")
+    (root / "b.txt").write_text("fine", encoding="utf-8")
+
+    outcomes = scan_and_parse(
+        root,
+        storage=ParseStorage(tmp_path / "artifacts"),
+        registry_override=_registry_with(CrashingTextParser()),
+        suffixes=(".txt",),
+        workers=2,
+    )
+
+    assert outcomes[0].status == "error"
+    assert outcomes[0].error == "Worker exited with code 3"
+    assert outcomes[1].status == "completed"
+
+
+def test_run_extractions_stops_starting_jobs_behind_slow_document(tmp_path) -> None:
+    from src.parsing import workers
+    from src.parsing.workers import BUFFERED_RESULTS_PER_WORKER, WorkerJob, run_extractions
+
+    paths = []
+    for index, text in enumerate(["hang"] + ["fine"] * 20):
+        path = tmp_path / f"doc{index}.txt"
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    parser = SlowTextParser()
+    jobs = [WorkerJob(parser=parser, target=ParseTarget(source=str(path))) for path in paths]
+
+    started = []
+    real_start = workers._start
+
+    def counting_start(context, index, job, timeout, memory_limit_mb):
+        started.append(index)
+        return real_start(context, index, job, timeout, memory_limit_mb)
+
+    with patch.object(workers, "_start", counting_start):
+        results = run_extractions(jobs, workers=2, timeout=1.0)
+        first = next(results)
+        started_before_head = len(started)
+        rest = list(results)
+
+    assert "timed out" in first.error
+    # Head of line, the held results, and the one other worker slot
+    assert started_before_head <= 1 + BUFFERED_RESULTS_PER_WORKER * 2 + 1
+    assert all(result.document is not None for result in rest)
+    assert len(rest) == 20
+
+
+class GreedyTextParser(TextParser):
+    """Text parser that allocates far more memory than it needs."""
+
+    def extract(self, target: ParseTarget) -> ParsedDocument:
+        ballast = bytearray(1024 * 1024 * 1024)
+        return super().extract(target) if ballast else None
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Address-space limits need Linux")
+def test_scan_and_parse_with_workers_enforces_memory_limit(tmp_path) -> None:
+    root = tmp_path / "docs"
+    root.mkdir()
+    (root / "a.txt").write_text("big", encoding="utf-8")
+
+    outcomes = scan_and_parse(
+        root,
+        storage=ParseStorage(tmp_path / "artifacts"),
+        registry_override=_registry_with(GreedyTextParser()),
+        suffixes=(".txt",),
+        workers=2,
+        memory_limit_mb=64,
+    )
+
+    assert outcomes[0].status == "error"
+    assert "memory limit" in outcomes[0].error
+
+
+class RecordingTextParser(TextParser):
+    """Text parser that records the checksum it was handed."""
+
+    def __init__(self) -> None:
+        self.received: list[str | None] = []
+
+    def extract(self, target: ParseTarget) -> ParsedDocument:
+        self.received.append(target.checksum)
+        return super().extract(target)
+
+
+def test_parse_single_target_passes_checksum_to_parser(tmp_path) -> None:
+    source = tmp_path / "note.txt"
+    source.write_text("hello", encoding="utf-8")
+    parser = RecordingTextParser()
+
+    outcome = parse_single_target(
+        source,
+        storage=ParseStorage(tmp_path / "artifacts"),
+        registry_override=_registry_with(parser),
+    )
+
+    assert parser.received == [outcome.checksum]
+    assert outcome.checksum == _sha256_path(source)
+
+
+def test_rescan_of_unchanged_tree_reads_no_content(tmp_path) -> None:
+    import builtins
+    import io
+    import os
+    import time
+
+    root = tmp_path / "docs"
+    root.mkdir()
+    past = time.time_ns() - 60 * 1_000_000_000
+    for index in range(3):
+        path = root / f"doc{index}.txt"
+        path.write_text(f"document {index}", encoding="utf-8")
+        os.utime(path, ns=(past, past))
+
+    first = scan_and_parse(
+        root,
+        storage=ParseStorage(tmp_path / "artifacts"),
+        registry_override=make_registry(),
+        suffixes=(".txt",),
+    )
+    assert [o.status for o in first] == ["completed"] * 3
+
+    real_open = io.open
+
+    def guarded_open(file, *args, **kwargs):
+        if str(file).startswith(str(root)):
+            raise AssertionError(f"content read from {file}")
+        return real_open(file, *args, **kwargs)
+
+    storage = ParseStorage(tmp_path / "artifacts")
+    with patch.object(io, "open", guarded_open), patch.object(builtins, "open", guarded_open):
+        second = scan_and_parse(
+            root,
+            storage=storage,
+            registry_override=make_registry(),
+            suffixes=(".txt",),
+        )
+
+    assert [o.status for o in second] == ["skipped"] * 3
+    assert [o.checksum for o in second] == [o.checksum for o in first]
+    assert storage.fingerprints.hits == 3
@@ -0,0 +1,192 @@
+"""Unit tests for sitemap discovery and parsing."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.parsing.sitemap import (
+    SitemapEntry,
+    default_sitemap_url,
+    iter_sitemap_urls,
+    parse_lastmod,
+    parse_sitemap,
+)
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/docs/a</loc><lastmod>2024-03-01</lastmod></url>
+  <url>
+    <loc> https://example.com/docs/b </loc>
+    <changefreq>weekly</changefreq>
+  </url>
+</urlset>
+"""
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-docs.xml.gz</loc></sitemap>
+  <sitemap><loc>https://example.com/sitemap-blog.xml</loc></sitemap>
+</sitemapindex>
+"""
+
+
+def _response(status: int, body: bytes = b"", content_type: str = "application/xml") -> MagicMock:
+    response = MagicMock(status_code=status, headers={"Content-Type": content_type})
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _session(responses: dict[str, MagicMock]) -> MagicMock:
+    """Session serving canned responses by URL (404 for anything else)."""
+    session = MagicMock()
+    session.get.side_effect = lambda url, **kwargs: responses.get(url) or _response(404)
+    return session
+
+
+# =============================================================================
+# parse_lastmod Tests
+# =============================================================================
+
+
+class TestParseLastmod:
+    """Tests for W3C datetime parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2024", datetime(2024, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc)),
+            ("2024-02", datetime(2024, 2, 29, 23, 59, 59, 999999, tzinfo=timezone.utc)),
+            ("2024-12", datetime(2024, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc)),
+            ("2024-03-05", datetime(2024, 3, 5, 23, 59, 59, 999999, tzinfo=timezone.utc)),
+            ("2024-03-05T10:30:00Z", datetime(2024, 3, 5, 10, 30, tzinfo=timezone.utc)),
+            ("2024-03-05T12:30:00+02:00", datetime(2024, 3, 5, 10, 30, tzinfo=timezone.utc)),
+            ("2024-03-05T10:30:00", datetime(2024, 3, 5, 10, 30, tzinfo=timezone.utc)),
+        ],
+    )
+    def test_formats(self, value: str, expected: datetime) -> None:
+        """All W3C precisions parse to UTC; partial dates to their last moment."""
+        assert parse_lastmod(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "", "yesterday", "2024-13-01", "9999"])
+    def test_invalid(self, value: str | None) -> None:
+        """Missing or malformed values give None."""
+        assert parse_lastmod(value) is None
+
+
+# =============================================================================
+# parse_sitemap Tests
+# =============================================================================
+
+
+class TestParseSitemap:
+    """Tests for streaming sitemap parsing."""
+
+    def test_urlset(self) -> None:
+        """Page entries carry their location and lastmod."""
+        entries = list(parse_sitemap(io.BytesIO(URLSET)))
+
+        assert entries == [
+            SitemapEntry("https://example.com/docs/a", datetime(2024, 3, 1, 23, 59, 59, 999999, tzinfo=timezone.utc)),
+            SitemapEntry("https://example.com/docs/b"),
+        ]
+
+    def test_index(self) -> None:
+        """Index entries are flagged as sitemaps."""
+        entries = list(parse_sitemap(io.BytesIO(INDEX)))
+
+        assert [entry.loc for entry in entries] == [
+            "https://example.com/sitemap-docs.xml.gz",
+            "https://example.com/sitemap-blog.xml",
+        ]
+        assert all(entry.is_sitemap for entry in entries)
+
+    def test_without_namespace(self) -> None:
+        """Sitemaps that omit the namespace still parse."""
+        body = b"<urlset><url><loc>https://example.com/x</loc></url></urlset>"
+
+        assert [entry.loc for entry in parse_sitemap(io.BytesIO(body))] == ["https://example.com/x"]
+
+    def test_entries_before_error_are_kept(self) -> None:
+        """A truncated file yields what was read before raising."""
+        body = b"<urlset><url><loc>https://example.com/x</loc></url><url><loc>"
+        parsed = []
+
+        with pytest.raises(ET.ParseError):
+            for entry in parse_sitemap(io.BytesIO(body)):
+                parsed.append(entry.loc)
+
+        assert parsed == ["https://example.com/x"]
+
+
+# =============================================================================
+# iter_sitemap_urls Tests
+# =============================================================================
+
+
+class TestIterSitemapUrls:
+    """Tests for fetching sitemaps and following indexes."""
+
+    def test_default_location(self) -> None:
+        """The fallback sitemap sits at the site root."""
+        assert default_sitemap_url("https://example.com:8080/docs/page") == "https://example.com:8080/sitemap.xml"
+
+    def test_follows_index_and_gzip(self) -> None:
+        """Child sitemaps are fetched, gzipped or not; failures are skipped."""
+        session = _session({
+            "https://example.com/sitemap.xml": _response(200, INDEX),
+            "https://example.com/sitemap-docs.xml.gz": _response(
+                200, gzip.compress(URLSET), content_type="application/x-gzip"
+            ),
+        })
+
+        entries = list(iter_sitemap_urls(
+            ["https://example.com/sitemap.xml"],
+            user_agent="TestBot",
+            session=session,
+        ))
+
+        assert [entry.loc for entry in entries] == ["https://example.com/docs/a", "https://example.com/docs/b"]
+        assert session.get.call_count == 3
+        assert session.get.call_args.kwargs["headers"]["User-Agent"] == "TestBot"
+
+    def test_respects_robots_and_limit(self) -> None:
+        """Disallowed sitemaps are not fetched, and fetching stops at the limit."""
+        session = _session({"https://example.com/sitemap.xml": _response(200, INDEX)})
+
+        list(iter_sitemap_urls(
+            ["https://example.com/private.xml", "https://example.com/sitemap.xml"],
+            user_agent="TestBot",
+            is_allowed=lambda url: "private" not in url,
+            max_sitemaps=2,
+            session=session,
+        ))
+
+        assert [call.args[0] for call in session.get.call_args_list] == [
+            "https://example.com/sitemap.xml",
+            "https://example.com/sitemap-docs.xml.gz",
+        ]
+
+    def test_before_fetch_runs_before_each_request(self) -> None:
+        """The hook sees every requested sitemap, before its request."""
+        session = _session({"https://example.com/sitemap.xml": _response(200, INDEX)})
+        calls: list[tuple[str, int]] = []
+
+        list(iter_sitemap_urls(
+            ["https://example.com/private.xml", "https://example.com/sitemap.xml"],
+            user_agent="TestBot",
+            is_allowed=lambda url: "private" not in url,
+            session=session,
+            before_fetch=lambda url: calls.append((url, session.get.call_count)),
+        ))
+
+        assert calls == [
+            ("https://example.com/sitemap.xml", 0),
+            ("https://example.com/sitemap-docs.xml.gz", 1),
+            ("https://example.com/sitemap-blog.xml", 2),
+        ]
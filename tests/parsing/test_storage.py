@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
+import time
+import tracemalloc
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
 
 from src.parsing.base import ParseTarget, ParsedDocument
-from src.parsing.storage import ManifestEntry, ParseStorage
+from src.parsing.storage import Manifest, ManifestEntry, ParseStorage
 
 
 def test_manifest_roundtrip(tmp_path) -> None:
@@ -138,3 +146,257 @@ def test_batch_mode_defers_manifest_writes(tmp_path) -> None:
         checksum = f"{'e' * 63}{i}"
         assert reloaded.manifest().get(checksum) is not None
         assert not reloaded.should_process(checksum)
+
+
+def test_nested_batches_flush_once_at_the_outermost_level(tmp_path) -> None:
+    """Test that a batch begun inside another only writes when both end."""
+    storage = ParseStorage(tmp_path / "artifacts")
+
+    def persist(i: int) -> None:
+        target = ParseTarget(source=f"evidence/nested{i}.txt", media_type="text/plain")
+        document = ParsedDocument(target=target, checksum=f"{'f' * 63}{i}", parser_name="text")
+        document.add_segment(f"Nested document {i}.")
+        storage.persist_document(document)
+
+    storage.begin_batch()
+    persist(0)
+    storage.begin_batch()
+    persist(1)
+    storage.flush_all()
+
+    assert storage._defer_manifest_writes is True
+    assert storage._pending_content_files
+
+    storage.flush_manifest()
+
+    assert not storage._pending_content_files
+    assert storage._defer_content_writes is False
+    reloaded = ParseStorage(tmp_path / "artifacts")
+    for i in range(2):
+        entry = reloaded.manifest().get(f"{'f' * 63}{i}")
+        assert (tmp_path / "artifacts" / entry.artifact_path).exists()
+
+
+def _web_document(html: str, source: str = "https://example.com/page") -> ParsedDocument:
+    document = ParsedDocument(
+        target=ParseTarget(source=source, is_remote=True, media_type="text/html"),
+        checksum=hashlib.sha256(html.encode("utf-8")).hexdigest(),
+        parser_name="web",
+    )
+    document.add_segment("Body text")
+    document.metadata.update({"title": "Page", "raw_html": html})
+    return document
+
+
+def test_persist_document_stores_raw_html_in_sidecar(tmp_path) -> None:
+    storage = ParseStorage(tmp_path / "artifacts")
+    html = "<html><body><p>Hello sidecar</p></body></html>"
+
+    entry = storage.persist_document(_web_document(html))
+
+    assert "raw_html" not in entry.metadata
+    assert entry.metadata["raw_html_bytes"] == len(html)
+    assert hashlib.sha256(html.encode()).hexdigest() in entry.metadata["raw_html_path"]
+    sidecar = storage.root / entry.metadata["raw_html_path"]
+    assert sidecar.parent == (storage.root / entry.artifact_path).parent
+    assert sidecar.name.endswith(".html.gz")
+    assert gzip.decompress(sidecar.read_bytes()).decode("utf-8") == html
+    assert "Hello sidecar" not in storage.manifest_path.read_text(encoding="utf-8")
+
+    reloaded = ParseStorage(tmp_path / "artifacts")
+    assert reloaded.load_raw_html(reloaded.manifest().get(entry.checksum)) == html
+
+
+def test_persist_document_commits_sidecar_bytes_via_github(tmp_path) -> None:
+    github_client = MagicMock()
+    storage = ParseStorage(tmp_path / "artifacts", github_client=github_client, project_root=tmp_path)
+    html = "<html><body><p>Remote</p></body></html>"
+
+    storage.persist_document(_web_document(html))
+
+    files = github_client.commit_files_batch.call_args.kwargs["files"]
+    sidecars = [content for path, content in files if path.endswith(".html.gz")]
+    assert len(sidecars) == 1
+    assert gzip.decompress(sidecars[0]) == html.encode("utf-8")
+
+
+def test_migrate_raw_html_slims_existing_manifest(tmp_path) -> None:
+    root = tmp_path / "artifacts"
+    storage = ParseStorage(root)
+    html = "<html><body>" + "<p>legacy</p>" * 200 + "</body></html>"
+    artifact = storage.make_artifact_path("https://example.com/old", "c" * 64, suffix="index.md")
+    legacy = ManifestEntry(
+        source="https://example.com/old",
+        checksum="c" * 64,
+        parser="web",
+        artifact_path=storage.relative_artifact_path(artifact),
+        processed_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        metadata={"title": "Old", "raw_html": html},
+    )
+    storage.record_entry(legacy)
+    before = storage.manifest_path.stat().st_size
+
+    dry = ParseStorage(root).migrate_raw_html(dry_run=True)
+    assert dry.entries_migrated == 1
+    assert storage.manifest_path.stat().st_size == before
+
+    result = ParseStorage(root).migrate_raw_html()
+
+    assert result.entries_migrated == 1
+    assert result.manifest_bytes_after < before
+    migrated = ParseStorage(root)
+    entry = migrated.manifest().get("c" * 64)
+    assert "raw_html" not in entry.metadata
+    assert entry.metadata["title"] == "Old"
+    assert migrated.load_raw_html(entry) == html
+    assert migrated.migrate_raw_html().entries_migrated == 0
+
+
+def _load_peak(root) -> tuple[ParseStorage, int, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    storage = ParseStorage(root)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return storage, peak, elapsed
+
+
+def test_loading_large_web_manifest_is_memory_light(tmp_path) -> None:
+    """10k web entries load quickly once raw HTML lives in sidecars."""
+    html = "<html><body>" + "<p>Some crawled paragraph text.</p>" * 60 + "</body></html>"
+    slim_template = ParseStorage(tmp_path / "probe").persist_document(_web_document(html)).metadata
+    inline_template = {key: value for key, value in slim_template.items() if not key.startswith("raw_html")}
+    inline_template["raw_html"] = html
+
+    processed_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for name, template in (("slim", slim_template), ("inline", inline_template)):
+        storage = ParseStorage(tmp_path / name)
+        for i in range(10_000):
+            storage.manifest().upsert(
+                ManifestEntry(
+                    source=f"https://example.com/page/{i}",
+                    checksum=f"{i:064x}",
+                    parser="web",
+                    artifact_path=f"2025/example-com-page-{i}/index.md",
+                    processed_at=processed_at,
+                    metadata=dict(template),
+                )
+            )
+        storage._write_manifest()
+
+    slim, slim_peak, slim_elapsed = _load_peak(tmp_path / "slim")
+    _, inline_peak, _ = _load_peak(tmp_path / "inline")
+
+    assert len(slim.manifest().entries) == 10_000
+    assert slim.manifest_path.stat().st_size < 10_000 * 1024
+    # Peak memory tracks entry count, not page size
+    assert slim_peak < 32 * 1024 * 1024
+    assert slim_peak * 2 < inline_peak
+    assert slim_elapsed < 5.0
+
+
+def _entry(index: int, status: str = "completed") -> ManifestEntry:
+    return ManifestEntry(
+        source=f"evidence/doc-{index}.pdf",
+        checksum=f"{index:064x}",
+        parser="pdf",
+        artifact_path=f"2025/doc-{index}/index.md",
+        processed_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        status=status,
+    )
+
+
+def test_journal_backend_appends_instead_of_rewriting(tmp_path) -> None:
+    storage = ParseStorage(tmp_path / "artifacts", manifest_backend="journal")
+
+    for index in range(5):
+        storage.record_entry(_entry(index))
+
+    assert not storage.manifest_path.exists()
+    journal = storage.manifest_path.with_name("manifest.json.journal")
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 5
+
+    # Readers replay the journal regardless of their own backend
+    reader = ParseStorage(tmp_path / "artifacts")
+    assert len(reader.manifest().entries) == 5
+    assert reader.manifest().get(f"{3:064x}") == _entry(3)
+
+
+def test_journal_backend_compacts_into_json_snapshot(tmp_path) -> None:
+    storage = ParseStorage(
+        tmp_path / "artifacts",
+        manifest_backend="journal",
+        journal_compact_min_records=3,
+    )
+
+    for index in range(3):
+        storage.record_entry(_entry(index))
+
+    journal = storage.manifest_path.with_name("manifest.json.journal")
+    assert not journal.exists()
+    snapshot = json.loads(storage.manifest_path.read_text(encoding="utf-8"))
+    assert len(snapshot["entries"]) == 3
+
+    storage.record_entry(_entry(0, status="empty"))
+    reloaded = ParseStorage(tmp_path / "artifacts")
+    assert reloaded.manifest().get(f"{0:064x}").status == "empty"
+    assert len(reloaded.manifest().entries) == 3
+
+
+def test_journal_replay_ignores_torn_final_record(tmp_path) -> None:
+    storage = ParseStorage(tmp_path / "artifacts", manifest_backend="journal")
+    storage.record_entry(_entry(1))
+    storage.close()
+
+    journal = storage.manifest_path.with_name("manifest.json.journal")
+    with journal.open("ab") as handle:
+        handle.write(b'{"entry": {"source": "evidence/torn')
+
+    recovered = ParseStorage(tmp_path / "artifacts", manifest_backend="journal")
+    assert list(recovered.manifest().entries) == [f"{1:064x}"]
+
+    recovered.record_entry(_entry(2))
+    lines = journal.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert all(json.loads(line)["op"] == "upsert" for line in lines)
+
+
+def test_journal_replay_after_interrupted_compaction(tmp_path) -> None:
+    """A snapshot written before the journal was removed replays idempotently."""
+    root = tmp_path / "artifacts"
+    storage = ParseStorage(root, manifest_backend="journal")
+    for index in range(4):
+        storage.record_entry(_entry(index))
+    storage.close()
+    journal = storage.manifest_path.with_name("manifest.json.journal")
+    leftover = journal.read_bytes()
+
+    storage.compact_manifest()
+    journal.write_bytes(leftover)
+
+    reloaded = ParseStorage(root)
+    assert sorted(reloaded.manifest().entries) == sorted(f"{i:064x}" for i in range(4))
+
+    # A JSON-backend write folds the journal back into the snapshot
+    reloaded.record_entry(_entry(9))
+    assert not journal.exists()
+    assert len(ParseStorage(root).manifest().entries) == 5
+
+
+def test_export_manifest_matches_json_layout(tmp_path) -> None:
+    storage = ParseStorage(tmp_path / "artifacts", manifest_backend="journal")
+    storage.record_entry(_entry(7))
+
+    exported = storage.export_manifest(tmp_path / "export" / "manifest.json")
+
+    payload = json.loads(exported.read_text(encoding="utf-8"))
+    assert payload["version"] == 1
+    assert Manifest.from_dict(payload).get(f"{7:064x}") == _entry(7)
+
+
+def test_manifest_backend_validation(tmp_path) -> None:
+    with pytest.raises(ValueError, match="Invalid manifest backend"):
+        ParseStorage(tmp_path / "a", manifest_backend="sqlite")
+    with pytest.raises(ValueError, match="GitHub"):
+        ParseStorage(tmp_path / "b", manifest_backend="journal", github_client=MagicMock())
@@ -8,8 +8,19 @@ import pytest
 
 from src.parsing import registry
 from src.parsing.base import ParseTarget, ParserError
+from src.parsing.http import FetchedPage, StaticFetchError
 from src.parsing.rendering import RenderedPage, RenderingError
-from src.parsing.web import WebParser, web_parser
+from src.parsing.web import FETCH_RENDERED, FETCH_STATIC, WebParser, analyze_html, web_parser
+
+
+@pytest.fixture(autouse=True)
+def _no_static_network():
+    """Keep tests offline: static fetches fail unless a test overrides them."""
+    with patch(
+        "src.parsing.http.fetch_static",
+        side_effect=StaticFetchError("network disabled in tests"),
+    ) as mock_fetch:
+        yield mock_fetch
 
 
 def _sample_html(title: str = "Sample Title", body: str = "Hello world") -> str:
@@ -26,6 +37,15 @@ def _sample_html(title: str = "Sample Title", body: str = "Hello world") -> str:
     """.strip()
 
 
+def _mock_fetched_page(url: str, html: str) -> FetchedPage:
+    """Create a mock FetchedPage for testing."""
+    return FetchedPage(url=url, final_url=url, html=html, status_code=200, content_type="text/html")
+
+
+def _long_body(label: str) -> str:
+    return " ".join(f"{label} sentence number {i} with enough words to count." for i in range(30))
+
+
 def _mock_rendered_page(url: str, html: str, title: str | None = None) -> RenderedPage:
     """Create a mock RenderedPage for testing."""
     return RenderedPage(
@@ -127,6 +147,82 @@ class TestWebParserRemote:
                 assert call_kwargs["user_agent"] == custom_ua
 
 
+class TestWebParserStaticFirst:
+    """Tests for the static-first fetch path."""
+
+    def test_static_html_skips_rendering(self, _no_static_network) -> None:
+        """Server-rendered pages are parsed without launching a browser."""
+        url = "https://static.example.com/article"
+        html = _sample_html(body=_long_body("Static"))
+        _no_static_network.side_effect = None
+        _no_static_network.return_value = _mock_fetched_page(url, html)
+
+        parser = WebParser()
+        with patch("src.parsing.rendering.render_page") as mock_render:
+            document = parser.extract(ParseTarget(source=url, is_remote=True))
+
+        mock_render.assert_not_called()
+        assert document.metadata["rendered"] is False
+        assert document.metadata["title"] == "Sample Title"
+        assert "Static sentence number 0" in "\n".join(document.segments)
+        assert parser.domain_strategies["static.example.com"] == FETCH_STATIC
+        assert parser.fetch_stats.static_pages == 1
+        assert parser.fetch_stats.rendered_pages == 0
+
+    def test_spa_shell_escalates_and_is_remembered(self, _no_static_network) -> None:
+        """A JS shell is rendered, and later pages on the domain skip the probe."""
+        url = "https://spa.example.com/"
+        shell = '<html><body><div id="root"></div><script src="/app.js"></script></body></html>'
+        _no_static_network.side_effect = None
+        _no_static_network.return_value = _mock_fetched_page(url, shell)
+        rendered_html = _sample_html(body=_long_body("Rendered"))
+
+        parser = WebParser()
+        with patch("src.parsing.rendering.is_playwright_available", return_value=True):
+            with patch(
+                "src.parsing.rendering.render_page",
+                side_effect=lambda u, **_: _mock_rendered_page(u, rendered_html),
+            ) as mock_render:
+                first = parser.extract(ParseTarget(source=url, is_remote=True))
+                parser.extract(ParseTarget(source=url + "page2", is_remote=True))
+
+        assert first.metadata["rendered"] is True
+        assert mock_render.call_count == 2
+        assert _no_static_network.call_count == 1
+        assert parser.domain_strategies["spa.example.com"] == FETCH_RENDERED
+        stats = parser.fetch_stats.to_dict()
+        assert stats["rendered_pages"] == 2
+        assert stats["escalated_pages"] == 1
+
+    def test_falls_back_to_static_when_rendering_unavailable(self, _no_static_network) -> None:
+        """Static HTML is kept, with a warning, if Playwright is missing."""
+        url = "https://spa.example.com/"
+        shell = '<html><body><div id="root">Loading</div></body></html>'
+        _no_static_network.side_effect = None
+        _no_static_network.return_value = _mock_fetched_page(url, shell)
+
+        parser = WebParser()
+        with patch("src.parsing.rendering.is_playwright_available", return_value=False):
+            document = parser.extract(ParseTarget(source=url, is_remote=True))
+
+        assert document.metadata["rendered"] is False
+        assert any("JavaScript rendering" in warning for warning in document.warnings)
+
+    def test_static_first_disabled_always_renders(self, _no_static_network) -> None:
+        """static_first=False goes straight to the browser."""
+        url = "https://example.com/article"
+        mock_rendered = _mock_rendered_page(url, _sample_html())
+
+        parser = WebParser(static_first=False)
+        with patch("src.parsing.rendering.is_playwright_available", return_value=True):
+            with patch("src.parsing.rendering.render_page", return_value=mock_rendered):
+                document = parser.extract(ParseTarget(source=url, is_remote=True))
+
+        _no_static_network.assert_not_called()
+        assert document.metadata["rendered"] is True
+        assert parser.fetch_stats.escalated_pages == 0
+
+
 class TestWebParserLocal:
     """Tests for local HTML file extraction."""
 
@@ -165,6 +261,90 @@ class TestWebParserLocal:
         assert any("No extractable text" in warning for warning in document.warnings)
 
 
+class TestAnalyzeHtml:
+    """Tests for the single-parse HTML pipeline."""
+
+    def test_parses_document_once(self) -> None:
+        """One parse feeds title, links and trafilatura."""
+        from lxml.html import HtmlElement
+
+        from src.parsing import web as web_module
+
+        html = _sample_html(body="Single parse body").replace(
+            "</article>", '<a href="/next">Next</a></article>'
+        )
+
+        with patch("src.parsing.web.load_html", wraps=web_module.load_html) as mock_load:
+            with patch("trafilatura.extract", return_value="text") as mock_extract:
+                analysis = analyze_html(html, "https://example.com/a")
+
+        assert mock_load.call_count == 1
+        assert isinstance(mock_extract.call_args.args[0], HtmlElement)
+        assert analysis.title == "Sample Title"
+        assert [link.url for link in analysis.links] == ["https://example.com/next"]
+
+    def test_rewrites_key_value_tables(self) -> None:
+        """th/td tables become labelled paragraphs and lists."""
+        html = (
+            "<html><head><title>T</title></head><body><article>"
+            "<p>" + "Introductory text for the record. " * 10 + "</p>"
+            "<table><tr><th>Born</th><td>1469</td></tr>"
+            "<tr><th>Works</th><td><span>The Prince</span><span>Discourses</span></td></tr></table>"
+            "</article></body></html>"
+        )
+
+        analysis = analyze_html(html)
+
+        assert "Born: 1469" in analysis.text
+        assert "The Prince" in analysis.text and "Discourses" in analysis.text
+
+    def test_drops_hidden_elements(self) -> None:
+        """aria-hidden and visually-hidden content is not extracted."""
+        body = "Visible paragraph text. " * 10
+        html = (
+            f"<html><body><article><p>{body}</p>"
+            '<p aria-hidden="true">Secret aria text</p>'
+            '<p class="text visually-hidden">Secret class text</p>'
+            "</article></body></html>"
+        )
+
+        analysis = analyze_html(html)
+
+        assert "Visible paragraph" in analysis.text
+        assert "Secret" not in analysis.text
+
+    def test_skips_rewrite_without_hints(self) -> None:
+        """Pages with no tables or hidden markers skip the rewrite stage."""
+        html = _sample_html(body="Plain page")
+
+        with patch("src.parsing.web._rewrite_key_value_tables") as mock_rewrite:
+            analyze_html(html)
+            mock_rewrite.assert_not_called()
+
+            analyze_html(html.replace("</article>", "<table></table></article>"))
+            mock_rewrite.assert_called_once()
+
+    def test_records_stage_timings(self) -> None:
+        """Per-stage durations are accumulated when requested."""
+        timings: dict[str, float] = {}
+
+        analyze_html(_sample_html(), "https://example.com/", timings=timings)
+
+        assert set(timings) == {"parse", "links", "rewrite", "extract"}
+
+    def test_remote_document_exposes_links(self) -> None:
+        """Rendered documents carry the links found in the shared parse."""
+        url = "https://example.com/article"
+        html = _sample_html().replace("</article>", '<a href="/other">Other</a></article>')
+        mock_rendered = _mock_rendered_page(url, html)
+
+        with patch("src.parsing.rendering.is_playwright_available", return_value=True):
+            with patch("src.parsing.rendering.render_page", return_value=mock_rendered):
+                document = WebParser().extract(ParseTarget(source=url, is_remote=True))
+
+        assert document.links == ["https://example.com/other"]
+
+
 class TestWebParserDetection:
     """Tests for file/URL detection logic."""
 